@@ -0,0 +1,68 @@
+"""
+Compare the sync client on a thread pool with the asyncio client when issuing
+many concurrent GETs against a local stub server.
+
+    python benchmarks/async_client.py --requests 500 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from datacrunch_api.v1 import AsyncDataCrunchClient, DataCrunchClient
+from stub_server import StubServer
+
+
+def run_sync(base_url: str, requests: int, threads: int) -> float:
+    with DataCrunchClient("id", "secret", base_url=base_url) as client:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(
+                pool.map(
+                    client.deployments.get_deployment_status,
+                    (f"deployment-{i}" for i in range(requests)),
+                )
+            )
+        return time.perf_counter() - started
+
+
+async def run_async(base_url: str, requests: int, connections: int) -> float:
+    async with AsyncDataCrunchClient(
+        "id", "secret", base_url=base_url, max_connections=connections
+    ) as client:
+        await client.api_session.authenticate()
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(
+                client.deployments.get_deployment_status(f"deployment-{i}")
+                for i in range(requests)
+            )
+        )
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--threads", type=int, default=50)
+    parser.add_argument("--connections", type=int, default=100)
+    args = parser.parse_args()
+
+    with StubServer(latency=args.latency) as server:
+        sync_seconds = run_sync(server.base_url, args.requests, args.threads)
+        async_seconds = asyncio.run(
+            run_async(server.base_url, args.requests, args.connections)
+        )
+
+    print(f"{args.requests} GETs, {args.latency * 1000:.0f} ms server latency")
+    for name, seconds in (
+        (f"sync, {args.threads} threads", sync_seconds),
+        (f"async, {args.connections} connections", async_seconds),
+    ):
+        print(f"  {name:<28} {seconds:7.3f} s  {args.requests / seconds:8.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
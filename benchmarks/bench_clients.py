@@ -0,0 +1,97 @@
+"""
+Per-call overhead of every resource client: encoding, retry and rate limit
+bookkeeping, decoding and validation, with responses replayed in-process.
+"""
+
+import payloads
+import pytest
+import samples
+from datacrunch_api.v1 import (
+    Balance,
+    Images,
+    Instances,
+    Secrets,
+    ServerlessCompute,
+    SSHKeys,
+    StartupScripts,
+    Volumes,
+)
+from datacrunch_api.v1.deployments import Deployments
+
+DEPLOYMENT = samples.vllm_deployment().to_dict()  # type: ignore[attr-defined]
+INSTANCE = payloads.instance(0)
+
+# (client, method, arguments, recorded method, url, response body)
+CALLS = [
+    (Balance, "get_balance", (), "GET", "balance", {"amount": 1000.0}),
+    (Images, "list_images", (), "GET", "images", [{"id": "img", "name": "Ubuntu"}]),
+    (Instances, "get_instance", ("1",), "GET", "instances/1", INSTANCE),
+    (Instances, "list_instances", (), "GET", "instances", payloads.instances(20)),
+    (
+        Instances,
+        "deploy",
+        (samples.samples()["Instance"],),
+        "POST",
+        "instances",
+        INSTANCE["id"],
+    ),
+    (Volumes, "get_volume", ("1",), "GET", "volumes/1", {"id": "1", "size": 100}),
+    (Volumes, "list_trash", (), "GET", "volumes/trash", []),
+    (
+        Deployments,
+        "get_deployment_status",
+        ("vllm",),
+        "GET",
+        "container-deployments/vllm/status",
+        {"status": "healthy"},
+    ),
+    (
+        Deployments,
+        "get_container_deployment",
+        ("vllm",),
+        "GET",
+        "container-deployments/vllm",
+        DEPLOYMENT,
+    ),
+    (
+        Deployments,
+        "create_container_deployment",
+        (samples.vllm_deployment(),),
+        "POST",
+        "container-deployments",
+        DEPLOYMENT,
+    ),
+    (Secrets, "list_secrets", (), "GET", "secrets", [{"name": "hf-token"}]),
+    (SSHKeys, "list_ssh_keys", (), "GET", "sshkeys", [{"id": "1", "name": "k"}]),
+    (
+        StartupScripts,
+        "list_startup_scripts",
+        (),
+        "GET",
+        "scripts",
+        [{"id": "1", "name": "setup"}],
+    ),
+    (
+        ServerlessCompute,
+        "list_serverless_compute_resources",
+        (),
+        "GET",
+        "serverless-compute-resources",
+        [{"name": "H100", "size": 1}],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "client, method, arguments, recorded, url, body",
+    CALLS,
+    ids=[f"{call[0].__name__}.{call[1]}" for call in CALLS],
+)
+def test_client_call(
+    benchmark, replay_session, client, method, arguments, recorded, url, body
+):
+    api_session = replay_session((recorded, url, body))
+    call = getattr(client(api_session=api_session), method)
+    benchmark.group = "client call"
+
+    benchmark(call, *arguments)
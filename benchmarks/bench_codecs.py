@@ -0,0 +1,45 @@
+"""
+Compare the JSON codecs available to ApiSession on API-shaped payloads.
+
+    python benchmarks/bench_codecs.py --instances 2000 --repeat 50
+"""
+
+import argparse
+import timeit
+
+import payloads
+from datacrunch_api.v1 import MsgspecCodec, OrjsonCodec, StdlibCodec
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--instances", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    bodies = {
+        f"list_instances ({args.instances})": payloads.instances(args.instances),
+        "get_price_history": payloads.price_history(),
+    }
+    codecs = []
+    for codec_class in (StdlibCodec, OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            print(f"{codec_class.__name__} skipped, library not installed")
+
+    for name, body in bodies.items():
+        encoded = StdlibCodec().encode(body)
+        print(f"{name}, {len(encoded) / 1024:.0f} KiB")
+        print(f"  {'codec':<10} {'decode ms':>10} {'encode ms':>10}")
+        for codec in codecs:
+            decode = timeit.timeit(lambda: codec.decode(encoded), number=args.repeat)
+            encode = timeit.timeit(lambda: codec.encode(body), number=args.repeat)
+            print(
+                f"  {codec.name:<10} {decode / args.repeat * 1000:>10.2f}"
+                f" {encode / args.repeat * 1000:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Throughput of the sync client on threads sharing one session and of the
+asyncio client with concurrent tasks, against the local stub server. Each round
+sends REQUESTS GETs, so lower times mean higher throughput.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from datacrunch_api.v1 import AsyncDataCrunchClient, DataCrunchClient
+
+REQUESTS = 200
+ROUNDS = 5
+
+
+@pytest.mark.parametrize("threads", (1, 8, 32))
+def test_threads(benchmark, stub_server, threads):
+    client = DataCrunchClient(
+        "id",
+        "secret",
+        base_url=stub_server.base_url,
+        max_connections_per_host=threads,
+        coalesce_gets=False,
+    )
+    names = [f"deployment-{i}" for i in range(REQUESTS)]
+    benchmark.group = f"{REQUESTS} GETs on threads"
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+
+        def run() -> None:
+            list(pool.map(client.deployments.get_deployment_status, names))
+
+        benchmark.pedantic(run, rounds=ROUNDS, warmup_rounds=1)
+    client.close()
+
+
+@pytest.mark.parametrize("tasks", (1, 32, 200))
+def test_asyncio(benchmark, stub_server, tasks):
+    loop = asyncio.new_event_loop()
+    client = AsyncDataCrunchClient(
+        "id", "secret", base_url=stub_server.base_url, coalesce_gets=False
+    )
+    semaphore = asyncio.Semaphore(tasks)
+    benchmark.group = f"{REQUESTS} GETs on asyncio tasks"
+
+    async def get(name: str) -> dict:
+        async with semaphore:
+            return await client.deployments.get_deployment_status(name)
+
+    async def run() -> None:
+        await asyncio.gather(*(get(f"deployment-{i}") for i in range(REQUESTS)))
+
+    benchmark.pedantic(
+        lambda: loop.run_until_complete(run()), rounds=ROUNDS, warmup_rounds=1
+    )
+    loop.run_until_complete(client.aclose())
+    loop.close()
@@ -0,0 +1,94 @@
+"""
+Decoding of large list responses, by each JSON codec alone, through
+ApiSession.get including validation, streamed through ApiSession.iter_items and
+into InstanceInfo models, and scans of the decoded instances.
+"""
+
+import json
+
+import payloads
+import pytest
+from datacrunch_api.v1 import InstanceInfo, MsgspecCodec, OrjsonCodec, StdlibCodec
+
+CODECS = {"json": StdlibCodec, "orjson": OrjsonCodec, "msgspec": MsgspecCodec}
+COUNTS = (1000, 5000)
+
+
+def available_codec(name: str):
+    try:
+        return CODECS[name]()
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+
+@pytest.mark.parametrize("count", COUNTS)
+@pytest.mark.parametrize("codec", sorted(CODECS))
+def test_decode_instances(benchmark, codec, count):
+    decoder = available_codec(codec)
+    content = json.dumps(payloads.instances(count)).encode()
+    benchmark.group = f"decode {count} instances"
+
+    assert len(benchmark(decoder.decode, content)) == count
+
+
+@pytest.mark.parametrize("count", COUNTS)
+@pytest.mark.parametrize("codec", sorted(CODECS))
+def test_list_instances(benchmark, replay_session, codec, count):
+    api_session = replay_session(
+        ("GET", "instances", payloads.instances(count)),
+        codec=available_codec(codec),
+        coalesce_gets=False,
+    )
+    benchmark.group = f"list {count} instances"
+
+    assert len(benchmark(api_session.get, "instances")) == count
+
+
+def test_decode_price_history(benchmark):
+    content = json.dumps(payloads.price_history(365)).encode()
+    benchmark.group = "decode price history"
+
+    benchmark(StdlibCodec().decode, content)
+
+
+@pytest.mark.parametrize("count", COUNTS)
+def test_iter_instances(benchmark, replay_session, count):
+    api_session = replay_session(("GET", "instances", payloads.instances(count)))
+    benchmark.group = f"list {count} instances"
+
+    assert benchmark(lambda: sum(1 for _ in api_session.iter_items("instances"))) == (
+        count
+    )
+
+
+@pytest.mark.parametrize("streamed", [False, True], ids=["get", "iter_items"])
+def test_first_instance(benchmark, replay_session, streamed):
+    api_session = replay_session(
+        ("GET", "instances", payloads.instances(5000)), coalesce_gets=False
+    )
+    benchmark.group = "first of 5000 instances"
+    if streamed:
+        benchmark(lambda: next(api_session.iter_items("instances")))
+    else:
+        benchmark(lambda: api_session.get("instances")[0])
+
+
+@pytest.mark.parametrize("count", COUNTS)
+def test_instance_infos(benchmark, count):
+    data = payloads.instances(count)
+    benchmark.group = f"models of {count} instances"
+
+    assert len(benchmark(InstanceInfo.from_list, data)) == count
+
+
+@pytest.mark.parametrize("model", [False, True], ids=["dict", "InstanceInfo"])
+def test_scan_instances(benchmark, model):
+    data = payloads.instances(5000)
+    if model:
+        items = InstanceInfo.from_list(data)
+        scan = lambda: sum(1 for item in items if item.status == "running")
+    else:
+        scan = lambda: sum(1 for item in data if item["status"] == "running")
+    benchmark.group = "scan 5000 instances"
+
+    benchmark(scan)
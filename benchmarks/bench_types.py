@@ -0,0 +1,67 @@
+"""
+Serialization of every type in datacrunch_api.v1.types to and from dicts, by
+dataclasses_json, by the encoders generated for the request path and through
+the serialization cache, and the vLLM deployment of examples/vllm_endpoint.py
+built and encoded 10,000 times.
+"""
+
+import pytest
+import samples
+from datacrunch_api.v1 import SerializationCache, StdlibCodec
+from datacrunch_api.v1._serialization import to_dict
+
+SAMPLES = samples.samples()
+DEPLOYMENTS = 10_000
+
+
+@pytest.mark.parametrize("name", sorted(SAMPLES))
+def test_to_dict(benchmark, name):
+    sample = SAMPLES[name]
+    benchmark.group = "to_dict"
+
+    benchmark(sample.to_dict)  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("name", sorted(SAMPLES))
+def test_encoder(benchmark, name):
+    sample = SAMPLES[name]
+    benchmark.group = "encoder"
+
+    assert benchmark(to_dict, sample) == sample.to_dict()  # type: ignore
+
+
+@pytest.mark.parametrize("name", sorted(SAMPLES))
+def test_from_dict(benchmark, name):
+    sample = SAMPLES[name]
+    data = sample.to_dict()  # type: ignore[attr-defined]
+    benchmark.group = "from_dict"
+
+    assert benchmark(type(sample).from_dict, data) == sample  # type: ignore
+
+
+@pytest.mark.parametrize("name", sorted(SAMPLES))
+def test_cached(benchmark, name):
+    sample = SAMPLES[name]
+    cache = SerializationCache()
+    codec = StdlibCodec()
+    benchmark.group = "cached bytes"
+
+    assert benchmark(cache.to_bytes, sample, codec) == codec.encode(to_dict(sample))
+
+
+@pytest.mark.parametrize("encoding", ["to_dict", "encoder", "cache"])
+def test_encode_vllm_deployments(benchmark, encoding):
+    codec = StdlibCodec()
+    cache = SerializationCache()
+    encode = {
+        "to_dict": lambda deployment: codec.encode(deployment.to_dict()),
+        "encoder": lambda deployment: codec.encode(to_dict(deployment)),
+        "cache": lambda deployment: cache.to_bytes(deployment, codec),
+    }[encoding]
+
+    def encode_deployments():
+        for index in range(DEPLOYMENTS):
+            encode(samples.vllm_deployment(f"vllm-{index}"))
+
+    benchmark.group = f"build and encode {DEPLOYMENTS} vLLM deployments"
+    benchmark.pedantic(encode_deployments, rounds=3)
@@ -0,0 +1,58 @@
+"""
+Compare shutting down a fleet of instances one request after the other with
+Instances.bulk_action, once with one request per instance sent from a pool of
+threads and once with the multi-ID form, against the local emulator with a
+fixed latency per request.
+
+    python benchmarks/bulk_actions.py --instances 300 --latency 0.05
+"""
+
+import argparse
+import time
+
+from datacrunch_api.testing import EndpointBehavior, FakeServer
+from datacrunch_api.v1 import DataCrunchClient
+from datacrunch_api.v1.types.instance import InstanceAction
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--instances", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    behaviors = {"instances": EndpointBehavior(latency=args.latency)}
+    with FakeServer(behaviors=behaviors) as server:
+        server.populate(instances=args.instances)
+        client = DataCrunchClient("id", "secret", base_url=server.url)
+        instances = client.instances
+        instance_ids = [instance["id"] for instance in instances.list_instances()]
+
+        def serial() -> None:
+            for instance_id in instance_ids:
+                instances.action(InstanceAction(action="shutdown", id=instance_id))
+
+        runs = {
+            "serial": serial,
+            "bulk, 1 per request": lambda: instances.bulk_action(
+                "shutdown", instance_ids, args.concurrency, batch_size=1
+            ),
+            "bulk, multi-ID": lambda: instances.bulk_action(
+                "shutdown", instance_ids, args.concurrency
+            ),
+        }
+        print(
+            f"shutdown of {args.instances} instances, "
+            f"{args.latency * 1000:.0f} ms latency, concurrency {args.concurrency}"
+        )
+        for name, run in runs.items():
+            started = time.perf_counter()
+            run()
+            seconds = time.perf_counter() - started
+            print(f"  {name:<20} {seconds:7.3f} s")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Fixtures of the pytest-benchmark suite. Run it with benchmarks/run.py, or
+with pytest directly:
+
+    pytest benchmarks --benchmark-only
+"""
+
+import json
+from typing import Callable, Iterator
+
+import pytest
+from datacrunch_api.v1 import ApiSession, Cassette, Interaction, ReplayTransport
+from stub_server import StubServer
+
+# Server-side latency of the stub server, low enough to keep the suite short
+# and high enough for concurrency to matter
+STUB_LATENCY = 0.005
+
+
+@pytest.fixture(scope="session")
+def stub_server():
+    with StubServer(latency=STUB_LATENCY) as server:
+        yield server
+
+
+@pytest.fixture
+def replay_session() -> Iterator[Callable[..., ApiSession]]:
+    """
+    Create sessions replaying canned responses, to time the client without
+    any network. Takes (method, url, body) triples and session options.
+    """
+    sessions = []
+
+    def create(*responses: tuple[str, str, object], **options) -> ApiSession:
+        cassette = Cassette(
+            [
+                Interaction(method, f"/v1/{url}", 200, {}, json.dumps(body))
+                for method, url, body in responses
+            ]
+        )
+        options.setdefault("background_refresh", False)
+        session = ApiSession(
+            "id", "secret", transport=ReplayTransport(cassette), **options
+        )
+        sessions.append(session)
+        return session
+
+    yield create
+    for session in sessions:
+        session.close()
@@ -0,0 +1,53 @@
+"""
+Measure sync client throughput against a local stub server as the number of
+threads sharing one session grows, with the requests default of 10 pooled
+connections per host and with a pool sized for the thread count.
+
+    python benchmarks/connection_pool.py --requests 400 --latency 0.02
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from datacrunch_api.v1 import DataCrunchClient
+from stub_server import StubServer
+
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32, 64)
+
+
+def run(base_url: str, requests: int, threads: int, pool_size: int) -> float:
+    with DataCrunchClient(
+        "id", "secret", base_url=base_url, max_connections_per_host=pool_size
+    ) as client:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(
+                pool.map(
+                    client.deployments.get_deployment_status,
+                    (f"deployment-{i}" for i in range(requests)),
+                )
+            )
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    print(f"{args.requests} GETs, {args.latency * 1000:.0f} ms server latency")
+    print(f"  {'threads':>7} {'10 per host':>14} {'sized pool':>14}")
+    with StubServer(latency=args.latency) as server:
+        for threads in THREAD_COUNTS:
+            small = run(server.base_url, args.requests, threads, 10)
+            sized = run(server.base_url, args.requests, threads, max(threads, 10))
+            print(
+                f"  {threads:>7} {args.requests / small:>10.0f} r/s"
+                f" {args.requests / sized:>10.0f} r/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
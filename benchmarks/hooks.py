@@ -0,0 +1,63 @@
+"""
+Measure the per-request overhead of the hook machinery in ApiSession, with no
+hooks, a no-op hook and the Prometheus hook, using an in-process fake HTTP
+session so that only client-side work is timed.
+
+    python benchmarks/hooks.py --requests 20000
+"""
+
+import argparse
+import time
+from unittest import mock
+
+from datacrunch_api.v1 import ApiSession, PrometheusHook, RequestHook
+
+
+class FakeResponse:
+    status_code = 200
+    headers: dict = {}
+    content = b'{"status": "healthy"}'
+
+
+class FakeSession:
+    headers: dict = {}
+
+    def get(self, url, **kwargs):
+        return FakeResponse()
+
+    def post(self, url, **kwargs):
+        response = mock.Mock(status_code=200)
+        response.json.return_value = {"access_token": "token"}
+        return response
+
+    def mount(self, prefix, adapter):
+        pass
+
+
+def per_request_microseconds(hooks: list, requests: int) -> float:
+    with mock.patch("datacrunch_api.v1._api_session.requests.Session", FakeSession):
+        session = ApiSession("id", "secret", coalesce_gets=False)
+    for hook in hooks:
+        session.hooks.add(hook)
+    started = time.perf_counter()
+    for _ in range(requests):
+        session.get("container-deployments/app/status")
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    for name, hooks in (
+        ("no hooks", []),
+        ("no-op hook", [RequestHook()]),
+        ("Prometheus hook", [PrometheusHook()]),
+    ):
+        microseconds = per_request_microseconds(hooks, args.requests)
+        print(f"  {name:<16} {microseconds:7.2f} us per request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Compare HTTP/1.1 and HTTP/2 on a fan-out of concurrent GETs against a local
+stub server speaking both, reporting the throughput and the connections each
+client opened: requests and aiohttp, httpx over HTTP/1.1 and httpx over HTTP/2
+multiplexing every request over a single connection.
+
+    python benchmarks/http2.py --requests 500 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from datacrunch_api.v1 import (
+    AsyncDataCrunchClient,
+    DataCrunchClient,
+    Http2Transport,
+    Transport,
+)
+from stub_server import StubServer
+
+TRANSPORTS = {
+    "default": Transport,
+    "httpx HTTP/1.1": lambda: Http2Transport(http2=False, max_connections=100),
+    "httpx HTTP/2": lambda: Http2Transport(prior_knowledge=True),
+}
+
+
+def run_sync(base_url: str, transport: Transport, requests: int, threads: int):
+    with DataCrunchClient(
+        "id",
+        "secret",
+        base_url=base_url,
+        transport=transport,
+        max_connections_per_host=threads,
+    ) as client:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(
+                pool.map(
+                    client.deployments.get_deployment_status,
+                    (f"deployment-{i}" for i in range(requests)),
+                )
+            )
+        return time.perf_counter() - started
+
+
+async def run_async(base_url: str, transport: Transport, requests: int):
+    async with AsyncDataCrunchClient(
+        "id", "secret", base_url=base_url, transport=transport
+    ) as client:
+        await client.api_session.authenticate()
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(
+                client.deployments.get_deployment_status(f"deployment-{i}")
+                for i in range(requests)
+            )
+        )
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--threads", type=int, default=50)
+    args = parser.parse_args()
+
+    results = []
+    with StubServer(latency=args.latency, http2=True) as server:
+        for name, transport in TRANSPORTS.items():
+            opened = server.connections
+            seconds = run_sync(
+                server.base_url, transport(), args.requests, args.threads
+            )
+            results.append((f"sync {name}", seconds, server.connections - opened))
+        for name, transport in TRANSPORTS.items():
+            opened = server.connections
+            seconds = asyncio.run(
+                run_async(server.base_url, transport(), args.requests)
+            )
+            results.append((f"async {name}", seconds, server.connections - opened))
+
+    print(
+        f"{args.requests} GETs, {args.latency * 1000:.0f} ms server latency, "
+        f"{args.threads} threads"
+    )
+    for name, seconds, connections in results:
+        print(
+            f"  {name:<22} {seconds:7.3f} s  {args.requests / seconds:8.0f} req/s"
+            f"  {connections:4d} connections"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Response bodies shaped like those of the DataCrunch API, sized like a large
+account, for benchmarks that need realistic payloads without network access.
+"""
+
+import random
+
+INSTANCE_TYPES = [
+    f"{count}{gpu}.{vcpus}V"
+    for gpu in ("H200.141S", "H100.80S", "A100.80S", "A100.40S", "L40S.48S")
+    for count, vcpus in ((1, 30), (2, 60), (4, 120), (8, 176))
+] + ["CPU.4V.16G", "CPU.8V.32G", "CPU.16V.64G", "CPU.32V.128G"]
+LOCATIONS = ["FIN-01", "FIN-02", "ICE-01"]
+
+
+def instance(index: int) -> dict:
+    instance_type = INSTANCE_TYPES[index % len(INSTANCE_TYPES)]
+    return {
+        "id": f"{index:08x}-5f1e-4c2a-9b7d-0123456789ab",
+        "ip": f"10.0.{index // 256 % 256}.{index % 256}",
+        "status": "running" if index % 5 else "offline",
+        "created_at": "2025-01-14T09:21:44.612Z",
+        "cpu": {"description": "30 CPU", "number_of_cores": 30},
+        "gpu": {"description": "1x H100 SXM5 80GB", "number_of_gpus": 1},
+        "gpu_memory": {"description": "80GB GPU RAM", "size_in_gigabytes": 80},
+        "memory": {"description": "120GB RAM", "size_in_gigabytes": 120},
+        "storage": {"description": "Dynamic"},
+        "hostname": f"worker-{index}",
+        "description": f"Training worker {index}",
+        "location": LOCATIONS[index % len(LOCATIONS)],
+        "price_per_hour": round(1.5 + (index % 7) * 0.25, 2),
+        "is_spot": index % 3 == 0,
+        "instance_type": instance_type,
+        "image": "ubuntu-24.04-cuda-12.8-open-docker",
+        "os_name": "Ubuntu 24.04",
+        "startup_script_id": None,
+        "ssh_key_ids": [f"key-{index % 4}"],
+        "os_volume_id": f"{index:08x}-aaaa-4bbb-8ccc-0123456789ab",
+        "jupyter_token": None,
+        "contract": "PAY_AS_YOU_GO",
+        "pricing": "DYNAMIC_PRICE",
+    }
+
+
+def instances(count: int = 2000) -> list[dict]:
+    """A list_instances response for an account with count instances"""
+    return [instance(index) for index in range(count)]
+
+
+def price_history(days: int = 365) -> dict:
+    """A price-history response covering every instance type for some days"""
+    generator = random.Random(0)
+    return {
+        instance_type: [
+            {
+                "date": f"2025-{1 + day // 28:02d}-{1 + day % 28:02d}",
+                "fixed_price_per_hour": 2.19,
+                "dynamic_price_per_hour": round(generator.uniform(0.9, 2.2), 4),
+                "currency": "eur",
+            }
+            for day in range(days)
+        ]
+        for instance_type in INSTANCE_TYPES
+    }
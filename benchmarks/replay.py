@@ -0,0 +1,52 @@
+"""
+Replay a cassette of API-shaped responses through the Instances client to
+measure client-side cost end to end, without network, and optionally with the
+recorded latencies.
+
+    python benchmarks/replay.py --instances 200 --requests 2000
+"""
+
+import argparse
+import json
+import time
+
+import payloads
+from datacrunch_api.v1 import Cassette, Instances, Interaction, ReplayTransport
+
+
+def cassette(count: int, latency: float) -> Cassette:
+    body = json.dumps(payloads.instances(count))
+    return Cassette([Interaction("GET", "/v1/instances", 200, {}, body, latency)])
+
+
+def run(transport: ReplayTransport, requests: int) -> float:
+    client = Instances("id", "secret", transport=transport, coalesce_gets=False)
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.list_instances()
+    elapsed = time.perf_counter() - started
+    client.api_session.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--instances", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    recorded = cassette(args.instances, args.latency)
+    for name, factor, requests in (
+        ("full speed", 0.0, args.requests),
+        ("recorded latency", 1.0, max(1, args.requests // 20)),
+    ):
+        elapsed = run(ReplayTransport(recorded, latency=factor), requests)
+        print(
+            f"  {name:<18} {requests / elapsed:9.0f} requests/s "
+            f"{elapsed / requests * 1e3:7.3f} ms per request"
+        )
+
+
+if __name__ == "__main__":
+    main()
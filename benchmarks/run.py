@@ -0,0 +1,71 @@
+"""
+Run the pytest-benchmark suite, store its results as the baseline or compare
+them with the stored baseline, failing when a benchmark got slower than the
+threshold allows.
+
+    python benchmarks/run.py baseline
+    python benchmarks/run.py compare --threshold 10
+    python benchmarks/run.py compare -- -k bench_types
+
+Results are stored in benchmarks/results, one directory per machine and Python
+version, so only runs on comparable machines are compared.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.utils import get_machine_id
+
+DIRECTORY = Path(__file__).resolve().parent
+STORAGE = DIRECTORY / "results"
+
+
+def baselines(machine_id: str) -> list[Path]:
+    """The stored baselines of a machine, oldest first"""
+    return sorted((STORAGE / machine_id).glob("*_baseline.json"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("mode", choices=("baseline", "compare"))
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Slowdown of the median in percent flagged as a regression",
+    )
+    args, pytest_args = parser.parse_known_args()
+    if pytest_args[:1] == ["--"]:
+        pytest_args = pytest_args[1:]
+
+    options = [
+        str(DIRECTORY),
+        "--benchmark-only",
+        f"--benchmark-storage=file://{STORAGE}",
+        "--benchmark-columns=min,median,iqr,ops,rounds",
+        "--benchmark-sort=name",
+        *pytest_args,
+    ]
+    if args.mode == "baseline":
+        options.append("--benchmark-save=baseline")
+    else:
+        machine_id = get_machine_id()
+        stored = baselines(machine_id)
+        if not stored:
+            print(
+                f"No baseline stored for {machine_id}, run with baseline first",
+                file=sys.stderr,
+            )
+            return 2
+        run_id = stored[-1].name.split("_", 1)[0]
+        options += [
+            f"--benchmark-compare={run_id}",
+            f"--benchmark-compare-fail=median:{args.threshold:g}%",
+        ]
+    return pytest.main(options)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
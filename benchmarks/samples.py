@@ -0,0 +1,132 @@
+"""
+One representative instance of every type in datacrunch_api.v1.types, for
+benchmarks of their serialization. The deployment is the one built by
+examples/vllm_endpoint.py.
+"""
+
+from datacrunch_api.v1 import (
+    AutoUpdate,
+    Compute,
+    Container,
+    ContainerRegistrySettings,
+    Credentials,
+    Deployment,
+    EntrypointOverrides,
+    EnvironmentVariable,
+    GpuUtilization,
+    HealthCheck,
+    Instance,
+    QueueLoad,
+    Scaling,
+    ScalingPolicy,
+    ScalingTriggers,
+    Secret,
+    SSHKey,
+    StartupScript,
+    Volume,
+    VolumeAction,
+    VolumeMount,
+)
+from datacrunch_api.v1.types.instance import InstanceAction, OSVolume
+
+
+def vllm_deployment(name: str = "vllm-llama") -> Deployment:
+    """The vLLM deployment of examples/vllm_endpoint.py"""
+    container = Container(
+        name="vllm",
+        image="vllm/vllm-openai:v0.8.5",
+        exposed_port=8000,
+        healthcheck=HealthCheck(enabled=True, port=8000, path="/health"),
+        entrypoint_overrides=EntrypointOverrides(
+            enabled=True,
+            cmd=[
+                "python3",
+                "-m",
+                "vllm.entrypoints.openai.api_server",
+                "--model",
+                "meta-llama/Llama-3.1-8B-Instruct",
+                "--port",
+                "8000",
+            ],
+        ),
+        env=[
+            EnvironmentVariable(
+                name="HF_TOKEN", value_or_reference_to_secret="hf-token", type="secret"
+            ),
+            EnvironmentVariable(
+                name="HF_HOME",
+                value_or_reference_to_secret="/data/.huggingface",
+                type="plain",
+            ),
+            EnvironmentVariable(
+                name="HF_HUB_ENABLE_HF_TRANSFER",
+                value_or_reference_to_secret="1",
+                type="plain",
+            ),
+        ],
+        autoupdate=AutoUpdate(enabled=False, mode="latest"),
+        volume_mounts=[VolumeMount(type="scratch", mount_path="/data/.huggingface")],
+    )
+    return Deployment(
+        name=name,
+        containers=[container],
+        container_registry_settings=ContainerRegistrySettings(
+            is_private=False, credentials=Credentials(name="hf-token")
+        ),
+        compute=Compute(name="L40S"),
+        scaling=Scaling(
+            min_replica_count=1,
+            max_replica_count=1,
+            concurrent_requests_per_replica=10,
+            queue_message_ttl_seconds=3600,
+            scale_down_policy=ScalingPolicy(delay_seconds=300),
+            scale_up_policy=ScalingPolicy(delay_seconds=300),
+            scaling_triggers=ScalingTriggers(
+                queue_load=QueueLoad(threshold=2),
+                gpu_utilization=GpuUtilization(enabled=True, threshold=100),
+            ),
+        ),
+    )
+
+
+def samples() -> dict[str, object]:
+    """A sample of every type, by type name"""
+    deployment = vllm_deployment()
+    container = deployment.containers[0]
+    scaling = deployment.scaling
+    return {
+        "AutoUpdate": container.autoupdate,
+        "Compute": deployment.compute,
+        "Container": container,
+        "ContainerRegistrySettings": deployment.container_registry_settings,
+        "Credentials": deployment.container_registry_settings.credentials,
+        "Deployment": deployment,
+        "EntrypointOverrides": container.entrypoint_overrides,
+        "EnvironmentVariable": container.env[0],
+        "GpuUtilization": scaling.scaling_triggers.gpu_utilization,
+        "HealthCheck": container.healthcheck,
+        "Instance": Instance(
+            description="Training worker",
+            hostname="worker-0",
+            image="ubuntu-24.04-cuda-12.8-open-docker",
+            instance_type="1H100.80S.30V",
+            location_code="FIN-01",
+            os_volume=OSVolume(name="os", size=100),
+            ssh_key_ids=["key-0", "key-1"],
+            volumes=[Volume(name="data", size=1000, type="NVMe")],
+        ),
+        "InstanceAction": InstanceAction(action="shutdown", id="instance-0"),
+        "OSVolume": OSVolume(name="os", size=100),
+        "QueueLoad": scaling.scaling_triggers.queue_load,
+        "Scaling": scaling,
+        "ScalingPolicy": scaling.scale_up_policy,
+        "ScalingTriggers": scaling.scaling_triggers,
+        "Secret": Secret(name="hf-token", value="hf_0123456789"),
+        "SSHKey": SSHKey(name="laptop", key="ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAA"),
+        "StartupScript": StartupScript(name="setup", script="#!/bin/bash\necho hi"),
+        "Volume": Volume(name="data", size=1000, type="NVMe", location_code="FIN-01"),
+        "VolumeAction": VolumeAction(
+            action="attach", id="volume-0", instance_id="instance-0"
+        ),
+        "VolumeMount": container.volume_mounts[0],
+    }
@@ -0,0 +1,71 @@
+"""
+Compare refreshing the status, replicas and scaling of every deployment one
+request after the other with Deployments.snapshot and its asyncio counterpart,
+against the local emulator with a fixed latency per request.
+
+    python benchmarks/snapshot.py --deployments 40 --latency 0.1
+"""
+
+import argparse
+import asyncio
+import time
+
+from datacrunch_api.testing import EndpointBehavior, FakeServer
+from datacrunch_api.v1 import AsyncDataCrunchClient, DataCrunchClient
+
+
+def serial(client: DataCrunchClient) -> None:
+    deployments = client.deployments
+    for deployment in deployments.list_container_deployments():
+        deployments.get_deployment_status(deployment["name"])
+        deployments.get_deployment_replicas(deployment["name"])
+        deployments.get_deployment_scaling(deployment["name"])
+
+
+async def run_async(base_url: str, concurrency: int) -> float:
+    async with AsyncDataCrunchClient("id", "secret", base_url=base_url) as client:
+        await client.api_session.authenticate()
+        started = time.perf_counter()
+        await client.deployments.snapshot(concurrency)
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--deployments", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    behaviors = {"container-deployments": EndpointBehavior(latency=args.latency)}
+    with FakeServer(behaviors=behaviors) as server:
+        server.populate(deployments=args.deployments)
+        client = DataCrunchClient(
+            "id",
+            "secret",
+            base_url=server.url,
+            max_connections_per_host=args.concurrency,
+        )
+        results = []
+        for name, run in {
+            "serial": lambda: serial(client),
+            "snapshot": lambda: client.deployments.snapshot(args.concurrency),
+        }.items():
+            started = time.perf_counter()
+            run()
+            results.append((name, time.perf_counter() - started))
+        client.close()
+        results.append(
+            ("async snapshot", asyncio.run(run_async(server.url, args.concurrency)))
+        )
+
+    print(
+        f"{args.deployments} deployments, {args.latency * 1000:.0f} ms latency, "
+        f"concurrency {args.concurrency}"
+    )
+    for name, seconds in results:
+        print(f"  {name:<16} {seconds:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
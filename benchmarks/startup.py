@@ -0,0 +1,106 @@
+"""
+Measure the import time of the package with python -X importtime, as paid by
+every run of a command line tool, and fail when the import needed by the query
+tool takes longer than the budget.
+
+    python benchmarks/startup.py --budget 350 --runs 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Statements timed, the first one is held to the budget
+STATEMENTS = {
+    "query tool": "import datacrunch_api.tools.query; "
+    "from datacrunch_api.v1 import DataCrunchClient, TokenCache",
+    "package": "import datacrunch_api.v1",
+    "async client": "from datacrunch_api.v1 import AsyncDataCrunchClient; "
+    "import datacrunch_api.v1._async_api_session as s; s._import_aiohttp()",
+    "every attribute": "import datacrunch_api.v1 as v1; "
+    "[getattr(v1, name) for name in v1.__all__]",
+}
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """Cumulative microseconds of every top level import made by a statement"""
+    environment = dict(os.environ, PYTHONPATH=str(ROOT))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=environment,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def startup_milliseconds(statement: str, runs: int) -> tuple[float, dict[str, int]]:
+    """
+    The fastest of several runs of the imports a statement adds to those of
+    the interpreter, with the import times of that run
+    """
+    interpreter = set(import_times("pass"))
+    best, best_times = float("inf"), {}
+    for _ in range(runs):
+        times = {
+            name: value
+            for name, value in import_times(statement).items()
+            if name not in interpreter
+        }
+        total = sum(times.values()) / 1000
+        if total < best:
+            best, best_times = total, times
+    return best, best_times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=350.0,
+        help="Milliseconds the imports of the query tool may take",
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="Slowest imports listed")
+    args = parser.parse_args()
+
+    results = {
+        name: startup_milliseconds(statement, args.runs)
+        for name, statement in STATEMENTS.items()
+    }
+    for name, (milliseconds, _) in results.items():
+        print(f"{name:>16}: {milliseconds:7.1f} ms")
+    name = next(iter(STATEMENTS))
+    milliseconds, times = results[name]
+    print(f"\nSlowest imports of the {name}:")
+    for module, microseconds in sorted(times.items(), key=lambda item: -item[1])[
+        : args.top
+    ]:
+        print(f"{microseconds / 1000:9.1f} ms  {module}")
+    if milliseconds > args.budget:
+        print(
+            f"\nThe {name} imports in {milliseconds:.1f} ms, "
+            f"over the budget of {args.budget:g} ms",
+            file=sys.stderr,
+        )
+        return 1
+    print(f"\nWithin the budget of {args.budget:g} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
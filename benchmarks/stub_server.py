@@ -0,0 +1,181 @@
+"""
+Minimal local stand-in for the DataCrunch API used by the benchmarks.
+
+Every request returns the same canned JSON body after an optional delay, and
+/oauth2/token hands out a long-lived token. The server is a small asyncio
+HTTP/1.1 implementation running in a child process, so it neither competes with
+the client under test for the GIL nor runs out of threads under high
+concurrency. With http2 it also speaks HTTP/2 to clients that open the
+connection with the HTTP/2 preface (h2c with prior knowledge).
+"""
+
+import asyncio
+import json
+import multiprocessing
+import time
+from typing import cast
+
+TOKEN = json.dumps({"access_token": "stub-token", "expires_in": 3600}).encode()
+PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+
+def _response(body: bytes) -> bytes:
+    return (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+    )
+
+
+async def _handle(
+    reader, writer, body: bytes, latency: float, http2: bool, connections
+) -> None:
+    with connections.get_lock():
+        connections.value += 1
+    start = b""
+    if http2:
+        try:
+            start = await reader.readexactly(len(PREFACE))
+        except asyncio.IncompleteReadError:
+            writer.close()
+            return
+        if start == PREFACE:
+            await _handle_http2(reader, writer, body, latency)
+            return
+    await _handle_http1(reader, writer, body, latency, start)
+
+
+async def _handle_http1(
+    reader, writer, body: bytes, latency: float, start: bytes
+) -> None:
+    try:
+        while True:
+            head = start + await reader.readuntil(b"\r\n\r\n")
+            start = b""
+            request_line, *header_lines = head.decode("latin-1").split("\r\n")
+            length = 0
+            for line in header_lines:
+                name, _, value = line.partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            if length:
+                await reader.readexactly(length)
+            if " /v1/oauth2/token " in request_line:
+                writer.write(_response(TOKEN))
+            else:
+                if latency:
+                    await asyncio.sleep(latency)
+                writer.write(_response(body))
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _handle_http2(reader, writer, body: bytes, latency: float) -> None:
+    import h2.config
+    import h2.connection
+    import h2.events
+
+    connection = h2.connection.H2Connection(
+        h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+    )
+    connection.initiate_connection()
+    connection.receive_data(PREFACE)
+    writer.write(connection.data_to_send())
+    paths: dict[int, str] = {}
+    tasks = set()
+
+    async def respond(stream_id: int, path: str) -> None:
+        payload = TOKEN if path.endswith("/oauth2/token") else body
+        if latency and payload is body:
+            await asyncio.sleep(latency)
+        connection.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(payload))),
+            ],
+        )
+        connection.send_data(stream_id, payload, end_stream=True)
+        writer.write(connection.data_to_send())
+
+    try:
+        while data := await reader.read(65536):
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    # Headers are str with header_encoding, unlike h2's annotations
+                    headers = cast(dict[str, str], dict(event.headers))
+                    paths[event.stream_id] = headers[":path"]
+                elif isinstance(event, h2.events.DataReceived):
+                    connection.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id
+                    )
+                elif isinstance(event, h2.events.StreamEnded):
+                    path = paths.pop(event.stream_id)
+                    task = asyncio.create_task(respond(event.stream_id, path))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            writer.write(connection.data_to_send())
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+def _serve(body: bytes, latency: float, http2: bool, port, connections) -> None:
+    async def main() -> None:
+        server = await asyncio.start_server(
+            lambda r, w: _handle(r, w, body, latency, http2, connections),
+            "127.0.0.1",
+            0,
+            backlog=4096,
+        )
+        port.value = server.sockets[0].getsockname()[1]
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+class StubServer:
+    """
+    HTTP server answering every request with a canned JSON body, over HTTP/2
+    too with http2. Usable as a context manager; base_url points at its /v1
+    prefix.
+    """
+
+    def __init__(
+        self, body: object | None = None, latency: float = 0.0, http2: bool = False
+    ):
+        self.body = json.dumps({"status": "healthy"} if body is None else body).encode()
+        self.latency = latency
+        context = multiprocessing.get_context("spawn")
+        self._port = context.Value("i", 0)
+        self._connections = context.Value("i", 0)
+        self._process = context.Process(
+            target=_serve,
+            args=(self.body, latency, http2, self._port, self._connections),
+            daemon=True,
+        )
+
+    @property
+    def connections(self) -> int:
+        """Number of connections accepted so far"""
+        return self._connections.value
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._port.value}/v1"
+
+    def __enter__(self) -> "StubServer":
+        self._process.start()
+        while not self._port.value:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._process.terminate()
+        self._process.join()
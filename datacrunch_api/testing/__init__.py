@@ -0,0 +1,9 @@
+from ._server import EndpointBehavior, FakeServer
+from ._state import FakeState, Transitions
+
+__all__ = [
+    "EndpointBehavior",
+    "FakeServer",
+    "FakeState",
+    "Transitions",
+]
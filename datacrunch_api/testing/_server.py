@@ -0,0 +1,555 @@
+import asyncio
+import random
+import secrets
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+try:
+    from aiohttp import web
+except ImportError:  # pragma: no cover - optional dependency
+    web = None  # type: ignore
+
+from ..v1._codec import default_codec
+from ..v1._hooks import endpoint_template
+from ..v1._rate_limiter import RateLimit, endpoint_family
+from ._state import (
+    IMAGES,
+    INSTANCE_TYPES,
+    LOCATIONS,
+    LONG_TERM_PERIODS,
+    VOLUME_TYPES,
+    FakeState,
+    Transitions,
+)
+
+Handler = Callable[["web.Request"], Awaitable["web.Response"]]
+# The handlers aiohttp hands to middlewares, which may also stream
+StreamHandler = Callable[["web.Request"], Awaitable["web.StreamResponse"]]
+
+
+@dataclass
+class EndpointBehavior:
+    """
+    How the emulator serves the requests of one endpoint family
+
+    Attributes:
+        latency: Seconds every response is delayed by
+        jitter: Maximum extra delay in seconds, drawn uniformly per request
+        error_rate: Share of requests failed with error_status
+        error_status: Status of injected errors
+        rate_limit: Requests per second and burst allowed, over which requests
+            are rejected with 429 and a Retry-After header
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    rate_limit: RateLimit | None = None
+
+
+class _Bucket:
+    def __init__(self, limit: RateLimit):
+        self.limit = limit
+        self.tokens = float(limit.burst)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take a token, returning 0 or the seconds until one is available"""
+        now = time.monotonic()
+        self.tokens = min(
+            self.limit.burst, self.tokens + (now - self.updated) * self.limit.rate
+        )
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.limit.rate
+
+
+class FakeServer:
+    """
+    Local emulator of the DataCrunch API keeping the account state in memory.
+
+    It serves the endpoints used by the clients of this package over HTTP from
+    a background thread, so both ApiSession and AsyncApiSession can point their
+    base_url at server.url. Latency, injected errors and rate limits are
+    configured per endpoint family, e.g. "instances", and resources change
+    status over time as configured by transitions.
+
+        behaviors = {"instances": EndpointBehavior(latency=0.05)}
+        with FakeServer(behaviors) as server:
+            server.populate(instances=5000)
+            client = DataCrunchClient("id", "secret", base_url=server.url)
+    """
+
+    def __init__(
+        self,
+        behaviors: dict[str, EndpointBehavior] | None = None,
+        default: EndpointBehavior | None = None,
+        transitions: Transitions | None = None,
+        balance: float = 1000.0,
+        credentials: tuple[str, str] | None = None,
+        token_lifetime: int = 3600,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Initialize the emulator, which serves once started
+
+        Args:
+            behaviors: Behavior of endpoint families differing from default
+            default: Behavior of all other endpoint families
+            transitions: Seconds resources spend in intermediate states
+            balance: Account balance returned by the balance endpoint
+            credentials: Client ID and secret accepted by the token endpoint,
+                by default any are
+            token_lifetime: Seconds issued access tokens are valid
+            seed: Seed of the random numbers deciding injected errors and jitter
+            host: Address to listen on
+            port: Port to listen on, by default a free one
+        """
+        if web is None:
+            raise ImportError(
+                "FakeServer requires aiohttp, install datacrunch_api[async]"
+            )
+        self.behaviors = behaviors or {}
+        self.default = default or EndpointBehavior()
+        self.state = FakeState(transitions, balance)
+        self.credentials = credentials
+        self.token_lifetime = token_lifetime
+        self.host = host
+        self.port = port
+        self.requests: Counter[str] = Counter()
+        self.throttled = 0
+        self.injected_errors = 0
+        self._random = random.Random(seed)
+        self._buckets: dict[str, _Bucket] = {}
+        self._tokens: dict[str, float] = {}
+        self._codec = default_codec()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._runner: "web.AppRunner | None" = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """The base URL to pass to sessions"""
+        return f"http://{self.host}:{self.port}/v1"
+
+    def __enter__(self) -> "FakeServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> "FakeServer":
+        """Start serving from a background thread"""
+        started = threading.Event()
+        errors: list[BaseException] = []
+
+        def serve() -> None:
+            loop = self._loop = asyncio.new_event_loop()
+            try:
+                runner = loop.run_until_complete(self._start_site())
+            except BaseException as error:
+                errors.append(error)
+                started.set()
+                return
+            started.set()
+            loop.run_forever()
+            loop.run_until_complete(runner.cleanup())
+            loop.close()
+
+        self._thread = threading.Thread(target=serve, name="FakeServer", daemon=True)
+        self._thread.start()
+        started.wait()
+        if errors:
+            raise errors[0]
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and wait for the background thread to end"""
+        loop = self._loop
+        if self._thread is None or loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    def populate(
+        self, instances: int = 0, volumes: int = 0, deployments: int = 0
+    ) -> None:
+        """Add running instances, detached volumes and healthy deployments"""
+        state = self.state
+        for index in range(instances):
+            state.add_instance(
+                {
+                    "instance_type": "1H100.80S.30V",
+                    "image": IMAGES[0]["image_type"],
+                    "hostname": f"instance-{index}",
+                    "description": f"Instance {index}",
+                },
+                status="running",
+            )
+        for index in range(volumes):
+            state.add_volume(
+                {"name": f"volume-{index}", "size": 100, "type": "NVMe"},
+                status="detached",
+            )
+        for index in range(deployments):
+            state.add_deployment(
+                {
+                    "name": f"deployment-{index}",
+                    "containers": [],
+                    "compute": {"name": "H100", "size": 1},
+                    "container_registry_settings": {"is_private": False},
+                    "scaling": {"min_replica_count": 1, "max_replica_count": 1},
+                },
+                status="healthy",
+            )
+
+    def revoke_tokens(self) -> None:
+        """Reject all issued access tokens, as if they had expired"""
+        self._tokens.clear()
+
+    def as_dict(self) -> dict:
+        """A snapshot of the request counters"""
+        return {
+            "requests": dict(self.requests),
+            "throttled": self.throttled,
+            "injected_errors": self.injected_errors,
+        }
+
+    async def _start_site(self) -> "web.AppRunner":
+        @web.middleware
+        async def serve(
+            request: "web.Request", handler: StreamHandler
+        ) -> "web.StreamResponse":
+            return await self._serve(request, handler)
+
+        app = web.Application(middlewares=[serve])
+        self._add_routes(app.router)
+        runner = self._runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, self.host, self.port, backlog=4096)
+        await site.start()
+        self.port = runner.addresses[0][1]
+        return runner
+
+    async def _serve(
+        self, request: "web.Request", handler: StreamHandler
+    ) -> "web.StreamResponse":
+        """
+        Apply the behavior of the endpoint family and authentication before
+        handing the request to its handler
+        """
+        path = request.path.removeprefix("/v1/")
+        family = endpoint_family(path)
+        self.requests[f"{request.method} {endpoint_template(path)}"] += 1
+        behavior = self.behaviors.get(family, self.default)
+        if behavior.rate_limit is not None:
+            bucket = self._buckets.get(family)
+            if bucket is None or bucket.limit is not behavior.rate_limit:
+                bucket = self._buckets[family] = _Bucket(behavior.rate_limit)
+            wait = bucket.take()
+            if wait:
+                self.throttled += 1
+                return self._error(
+                    429, "too_many_requests", "Rate limit exceeded", wait
+                )
+        delay = behavior.latency + self._random.uniform(0, behavior.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if behavior.error_rate and self._random.random() < behavior.error_rate:
+            self.injected_errors += 1
+            return self._error(
+                behavior.error_status, "service_unavailable", "Injected error"
+            )
+        if family != "oauth2" and not self._authorized(request):
+            return self._error(401, "unauthorized_request", "Invalid access token")
+        self.state.settle()
+        try:
+            return await handler(request)
+        except FakeState.NotFound as error:
+            return self._error(404, "not_found", str(error))
+        except FakeState.Conflict as error:
+            return self._error(409, "conflict", str(error))
+        except FakeState.InvalidRequest as error:
+            return self._error(400, "invalid_request", str(error))
+
+    def _authorized(self, request: "web.Request") -> bool:
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        expires_at = self._tokens.get(token)
+        return (
+            scheme == "Bearer"
+            and expires_at is not None
+            and (expires_at > time.monotonic())
+        )
+
+    def _json(self, data: Any, status: int = 200) -> "web.Response":
+        with self.state.lock:
+            body = self._codec.encode(data)
+        return web.Response(body=body, status=status, content_type="application/json")
+
+    def _error(
+        self, status: int, code: str, message: str, retry_after: float | None = None
+    ) -> "web.Response":
+        response = self._json({"code": code, "message": message}, status)
+        if retry_after is not None:
+            response.headers["Retry-After"] = f"{retry_after:.3f}"
+        return response
+
+    async def _body(self, request: "web.Request") -> Any:
+        content = await request.read()
+        if not content:
+            return {}
+        try:
+            return self._codec.decode(content)
+        except ValueError:
+            raise FakeState.InvalidRequest("Request body is not valid JSON")
+
+    def _add_routes(self, router: "web.UrlDispatcher") -> None:
+        state = self.state
+        json = self._json
+
+        def accepted() -> "web.Response":
+            return json({}, 202)
+
+        async def token(request):
+            body = await self._body(request)
+            if (
+                self.credentials is not None
+                and (
+                    body.get("client_id"),
+                    body.get("client_secret"),
+                )
+                != self.credentials
+            ):
+                return self._error(401, "unauthorized_request", "Invalid credentials")
+            access_token = secrets.token_hex(16)
+            self._tokens[access_token] = time.monotonic() + self.token_lifetime
+            return json(
+                {
+                    "access_token": access_token,
+                    "refresh_token": secrets.token_hex(16),
+                    "scope": "fullAccess",
+                    "token_type": "Bearer",
+                    "expires_in": self.token_lifetime,
+                }
+            )
+
+        async def list_instances(request):
+            status = request.query.get("status")
+            return json(
+                [
+                    instance
+                    for instance in state.instances.values()
+                    if status is None or instance["status"] == status
+                ]
+            )
+
+        async def deploy_instance(request):
+            instance = state.add_instance(await self._body(request))
+            return json(instance["id"], 201)
+
+        async def instance_action(request):
+            state.instance_action(await self._body(request))
+            return accepted()
+
+        async def get_instance(request):
+            return json(state.get_instance(request.match_info["id"]))
+
+        async def availabilities(request):
+            return json(state.availabilities(request.query.get("location_code")))
+
+        async def availability(request):
+            return json(request.match_info["type"] in INSTANCE_TYPES)
+
+        async def instance_types(request):
+            return json(state.instance_types(request.query.get("currency", "usd")))
+
+        async def price_history(request):
+            return json({request.match_info["type"]: []})
+
+        async def list_volumes(request):
+            return json(list(state.volumes.values()))
+
+        async def create_volume(request):
+            volume = state.add_volume(await self._body(request))
+            return json(volume["id"], 202)
+
+        async def volume_action(request):
+            state.volume_action(await self._body(request))
+            return accepted()
+
+        async def list_trash(request):
+            return json(list(state.trash.values()))
+
+        async def get_volume(request):
+            return json(state.get_volume(request.match_info["id"]))
+
+        async def delete_volume(request):
+            body = await self._body(request)
+            state.delete_volume(
+                request.match_info["id"], bool(body.get("is_permanent"))
+            )
+            return accepted()
+
+        async def list_deployments(request):
+            return json(list(state.deployments.values()))
+
+        async def create_deployment(request):
+            return json(state.add_deployment(await self._body(request)), 201)
+
+        async def get_deployment(request):
+            return json(state.get_deployment(request.match_info["name"]))
+
+        async def update_deployment(request):
+            name = request.match_info["name"]
+            return json(state.update_deployment(name, await self._body(request)))
+
+        async def delete_deployment(request):
+            state.delete_deployment(request.match_info["name"])
+            return accepted()
+
+        async def deployment_status(request):
+            deployment = state.get_deployment(request.match_info["name"])
+            return json({"status": deployment["status"]})
+
+        async def deployment_action(request):
+            state.deployment_action(
+                request.match_info["name"], request.match_info["action"]
+            )
+            return json({}, 201)
+
+        async def get_scaling(request):
+            return json(state.get_deployment(request.match_info["name"])["scaling"])
+
+        async def update_scaling(request):
+            name = request.match_info["name"]
+            return json(state.update_scaling(name, await self._body(request)))
+
+        async def replicas(request):
+            return json(state.replicas(request.match_info["name"]))
+
+        async def get_environment(request):
+            deployment = state.get_deployment(request.match_info["name"])
+            return json(deployment["environment_variables"])
+
+        async def update_environment(request):
+            deployment = state.get_deployment(request.match_info["name"])
+            deployment["environment_variables"].update(await self._body(request))
+            return json(deployment["environment_variables"], 201)
+
+        async def delete_environment(request):
+            state.get_deployment(request.match_info["name"])[
+                "environment_variables"
+            ] = {}
+            return accepted()
+
+        async def list_secrets(request):
+            return json(list(state.secrets.values()))
+
+        async def create_secret(request):
+            state.add_secret(await self._body(request))
+            return web.Response(status=201)
+
+        async def delete_secret(request):
+            state.delete_items(state.secrets, [request.match_info["name"]])
+            return accepted()
+
+        def named(store: dict[str, dict], field: str, key: str) -> dict:
+            async def list_items(request):
+                return json(list(store.values()))
+
+            async def create_item(request):
+                item_id = state.add_named(store, await self._body(request), field)
+                return web.Response(text=item_id, status=201)
+
+            async def get_item(request):
+                return json(state.get_item(store, request.match_info["id"]))
+
+            async def delete_item(request):
+                state.delete_items(store, [request.match_info["id"]])
+                return accepted()
+
+            async def delete_items(request):
+                state.delete_items(store, (await self._body(request)).get(key, []))
+                return accepted()
+
+            return {
+                "list": list_items,
+                "create": create_item,
+                "get": get_item,
+                "delete": delete_item,
+                "delete_many": delete_items,
+            }
+
+        async def balance(request):
+            return json({"amount": state.balance, "currency": "usd"})
+
+        def static(data: Any) -> Handler:
+            async def handler(request):
+                return json(data)
+
+            return handler
+
+        deployment = "/v1/container-deployments/{name}"
+        router.add_post("/v1/oauth2/token", token)
+        router.add_get("/v1/instances", list_instances)
+        router.add_post("/v1/instances", deploy_instance)
+        router.add_put("/v1/instances", instance_action)
+        router.add_get("/v1/instances/{id}", get_instance)
+        router.add_get("/v1/instance-availability", availabilities)
+        router.add_get("/v1/instance-availability/{type}", availability)
+        router.add_get("/v1/instance-types", instance_types)
+        router.add_get("/v1/price-history/{type}/{currency}", price_history)
+        router.add_get("/v1/locations", static(LOCATIONS))
+        router.add_get("/v1/long-term", static(LONG_TERM_PERIODS))
+        router.add_get("/v1/images", static(IMAGES))
+        router.add_get("/v1/volume-types", static(VOLUME_TYPES))
+        router.add_get("/v1/volumes", list_volumes)
+        router.add_post("/v1/volumes", create_volume)
+        router.add_put("/v1/volumes", volume_action)
+        router.add_get("/v1/volumes/trash", list_trash)
+        router.add_get("/v1/volumes/{id}", get_volume)
+        router.add_delete("/v1/volumes/{id}", delete_volume)
+        router.add_get("/v1/container-deployments", list_deployments)
+        router.add_post("/v1/container-deployments", create_deployment)
+        router.add_get(deployment, get_deployment)
+        router.add_patch(deployment, update_deployment)
+        router.add_delete(deployment, delete_deployment)
+        router.add_get(f"{deployment}/status", deployment_status)
+        router.add_get(f"{deployment}/scaling", get_scaling)
+        router.add_patch(f"{deployment}/scaling", update_scaling)
+        router.add_get(f"{deployment}/replicas", replicas)
+        router.add_get(f"{deployment}/environment-variables", get_environment)
+        router.add_post(f"{deployment}/environment-variables", update_environment)
+        router.add_patch(f"{deployment}/environment-variables", update_environment)
+        router.add_delete(f"{deployment}/environment-variables", delete_environment)
+        router.add_post(
+            deployment + "/{action:restart|pause|resume|purge-queue}",
+            deployment_action,
+        )
+        router.add_get("/v1/secrets", list_secrets)
+        router.add_post("/v1/secrets", create_secret)
+        router.add_delete("/v1/secrets/{name}", delete_secret)
+        for path, store, field, key in (
+            ("/v1/sshkeys", state.ssh_keys, "key", "keys"),
+            ("/v1/scripts", state.startup_scripts, "script", "scripts"),
+        ):
+            handlers = named(store, field, key)
+            router.add_get(path, handlers["list"])
+            router.add_post(path, handlers["create"])
+            router.add_delete(path, handlers["delete_many"])
+            router.add_get(path + "/{id}", handlers["get"])
+            router.add_delete(path + "/{id}", handlers["delete"])
+        router.add_get("/v1/balance", balance)
+        router.add_get(
+            "/v1/serverless-compute-resources",
+            static([{"name": "H100", "size": 1, "is_available": True}]),
+        )
@@ -0,0 +1,482 @@
+import copy
+import heapq
+import itertools
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, TypedDict
+
+LOCATIONS = [
+    {"code": "FIN-01", "name": "Finland 1", "country_code": "FI"},
+    {"code": "FIN-02", "name": "Finland 2", "country_code": "FI"},
+    {"code": "ICE-01", "name": "Iceland 1", "country_code": "IS"},
+]
+
+
+class InstanceTypeSpec(TypedDict):
+    """The hardware and hourly price of an emulated instance type"""
+
+    gpu: str | None
+    cores: int
+    price: float
+
+
+INSTANCE_TYPES: dict[str, InstanceTypeSpec] = {
+    "1H100.80S.30V": {"gpu": "1x H100 SXM5 80GB", "cores": 30, "price": 2.19},
+    "8H100.80S.176V": {"gpu": "8x H100 SXM5 80GB", "cores": 176, "price": 17.52},
+    "1A100.80S.22V": {"gpu": "1x A100 SXM4 80GB", "cores": 22, "price": 1.29},
+    "CPU.4V.16G": {"gpu": None, "cores": 4, "price": 0.03},
+}
+IMAGES = [
+    {
+        "id": "img-ubuntu-24",
+        "image_type": "ubuntu-24.04-cuda-12.8",
+        "name": "Ubuntu 24.04 + CUDA 12.8",
+    },
+    {
+        "id": "img-ubuntu-22",
+        "image_type": "ubuntu-22.04-cuda-12.4",
+        "name": "Ubuntu 22.04 + CUDA 12.4",
+    },
+]
+VOLUME_TYPES = [
+    {"type": "NVMe", "price": {"price_per_month_per_gb": 0.2, "currency": "usd"}},
+    {"type": "HDD", "price": {"price_per_month_per_gb": 0.05, "currency": "usd"}},
+]
+LONG_TERM_PERIODS = [
+    {"code": "3_MONTHS", "name": "3 months", "is_enabled": True, "unit_value": 3},
+    {"code": "12_MONTHS", "name": "12 months", "is_enabled": True, "unit_value": 12},
+]
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class Transitions:
+    """
+    Seconds resources of the emulator spend in intermediate states, e.g. an
+    instance is "ordered" and then "provisioning" for instance_provisioning
+    seconds in total before it is "running"
+    """
+
+    instance_provisioning: float = 1.0
+    instance_shutdown: float = 0.5
+    instance_deletion: float = 0.5
+    volume_creation: float = 0.5
+    volume_attachment: float = 0.5
+    deployment_startup: float = 1.0
+
+
+class FakeState:
+    """
+    In-memory state of the emulated account. Status changes that take time are
+    scheduled and applied lazily the next time the state is accessed.
+    """
+
+    class NotFound(Exception):
+        """Raised when a resource does not exist"""
+
+        pass
+
+    class Conflict(Exception):
+        """Raised when a resource with the same name already exists"""
+
+        pass
+
+    class InvalidRequest(Exception):
+        """Raised when a request body is malformed"""
+
+        pass
+
+    def __init__(
+        self,
+        transitions: Transitions | None = None,
+        balance: float = 1000.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.transitions = transitions or Transitions()
+        self.balance = balance
+        self.clock = clock
+        self.instances: dict[str, dict] = {}
+        self.volumes: dict[str, dict] = {}
+        self.trash: dict[str, dict] = {}
+        self.deployments: dict[str, dict] = {}
+        self.secrets: dict[str, dict] = {}
+        self.ssh_keys: dict[str, dict] = {}
+        self.startup_scripts: dict[str, dict] = {}
+        self.lock = threading.RLock()
+        self._pending: list[tuple[float, int, Callable[[], None]]] = []
+        self._sequence = itertools.count()
+
+    def settle(self) -> None:
+        """Apply every scheduled change that is due"""
+        now = self.clock()
+        with self.lock:
+            while self._pending and self._pending[0][0] <= now:
+                _, _, change = heapq.heappop(self._pending)
+                change()
+
+    def schedule(self, delay: float, change: Callable[[], None]) -> None:
+        """Apply change after delay seconds, immediately if delay is 0"""
+        if delay <= 0:
+            change()
+            return
+        heapq.heappush(
+            self._pending, (self.clock() + delay, next(self._sequence), change)
+        )
+
+    def _set(self, resource: dict, **changes) -> Callable[[], None]:
+        return lambda: resource.update(changes)
+
+    # Instances
+
+    def add_instance(self, body: dict, status: str | None = None) -> dict:
+        """
+        Create an instance from a deploy request body. Without status it goes
+        through provisioning, otherwise it is created in that status.
+        """
+        for name in ("instance_type", "image", "hostname"):
+            if name not in body:
+                raise self.InvalidRequest(f"{name} is required")
+        instance_type = INSTANCE_TYPES.get(body["instance_type"])
+        if instance_type is None:
+            raise self.InvalidRequest(f"Unknown instance type {body['instance_type']}")
+        instance_id = str(uuid.uuid4())
+        instance = {
+            "id": instance_id,
+            "hostname": body["hostname"],
+            "description": body.get("description", ""),
+            "status": status or "ordered",
+            "ip": None,
+            "instance_type": body["instance_type"],
+            "image": body["image"],
+            "location": body.get("location_code", LOCATIONS[0]["code"]),
+            "price_per_hour": instance_type["price"],
+            "is_spot": bool(body.get("is_spot", False)),
+            "contract": body.get("contract", "PAY_AS_YOU_GO"),
+            "pricing": body.get("pricing", "FIXED_PRICE"),
+            "cpu": {"number_of_cores": instance_type["cores"]},
+            "gpu": {"description": instance_type["gpu"]},
+            "ssh_key_ids": list(body.get("ssh_key_ids") or []),
+            "startup_script_id": body.get("startup_script_id"),
+            "os_volume_id": None,
+            "volume_ids": list(body.get("existing_volumes") or []),
+            "created_at": _now_iso(),
+        }
+        with self.lock:
+            self.instances[instance_id] = instance
+            if status == "running":
+                instance["ip"] = self._ip(len(self.instances))
+            elif status is None:
+                provisioning = self.transitions.instance_provisioning
+                self.schedule(
+                    provisioning / 2, self._set(instance, status="provisioning")
+                )
+                self.schedule(
+                    provisioning,
+                    self._set(
+                        instance, status="running", ip=self._ip(len(self.instances))
+                    ),
+                )
+            for volume_id in instance["volume_ids"]:
+                volume = self.volumes.get(volume_id)
+                if volume is not None:
+                    volume.update(status="attached", instance_id=instance_id)
+        return instance
+
+    def get_instance(self, instance_id: str) -> dict:
+        with self.lock:
+            instance = self.instances.get(instance_id)
+            if instance is None:
+                raise self.NotFound(f"Instance {instance_id} not found")
+            return instance
+
+    def instance_action(self, body: dict) -> None:
+        """Apply an action to one instance or a list of instances"""
+        action = body.get("action")
+        ids = body.get("id")
+        if action is None or ids is None:
+            raise self.InvalidRequest("action and id are required")
+        with self.lock:
+            instances = [
+                self.get_instance(instance_id)
+                for instance_id in (ids if isinstance(ids, list) else [ids])
+            ]
+            for instance in instances:
+                self._instance_action(instance, action)
+
+    def _instance_action(self, instance: dict, action: str) -> None:
+        transitions = self.transitions
+        match action:
+            case "shutdown" | "force_shutdown" | "hibernate":
+                delay = (
+                    0 if action == "force_shutdown" else transitions.instance_shutdown
+                )
+                self.schedule(delay, self._set(instance, status="offline"))
+            case "start" | "boot":
+                instance["status"] = "provisioning"
+                self.schedule(
+                    transitions.instance_provisioning / 2,
+                    self._set(instance, status="running"),
+                )
+            case "delete" | "discontinue":
+                instance["status"] = "deleting"
+                self.schedule(
+                    transitions.instance_deletion,
+                    lambda: self._remove_instance(instance["id"]),
+                )
+            case "configure_spot":
+                pass
+            case _:
+                raise self.InvalidRequest(f"Unknown action {action}")
+
+    def _remove_instance(self, instance_id: str) -> None:
+        self.instances.pop(instance_id, None)
+        for volume in self.volumes.values():
+            if volume.get("instance_id") == instance_id:
+                volume.update(status="detached", instance_id=None)
+
+    @staticmethod
+    def _ip(index: int) -> str:
+        return f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}"
+
+    # Volumes
+
+    def add_volume(self, body: dict, status: str | None = None) -> dict:
+        for name in ("name", "size", "type"):
+            if name not in body:
+                raise self.InvalidRequest(f"{name} is required")
+        volume_id = str(uuid.uuid4())
+        instance_id = body.get("instance_id")
+        final = "attached" if instance_id else "detached"
+        volume = {
+            "id": volume_id,
+            "name": body["name"],
+            "size": body["size"],
+            "type": body["type"],
+            "status": status or "ordered",
+            "instance_id": instance_id,
+            "location": body.get("location_code", LOCATIONS[0]["code"]),
+            "is_os_volume": False,
+            "created_at": _now_iso(),
+        }
+        with self.lock:
+            self.volumes[volume_id] = volume
+            if status is None:
+                self.schedule(
+                    self.transitions.volume_creation, self._set(volume, status=final)
+                )
+        return volume
+
+    def get_volume(self, volume_id: str) -> dict:
+        with self.lock:
+            volume = self.volumes.get(volume_id)
+            if volume is None:
+                raise self.NotFound(f"Volume {volume_id} not found")
+            return volume
+
+    def volume_action(self, body: dict) -> None:
+        """Apply an action to one volume or a list of volumes"""
+        action = body.get("action")
+        ids = body.get("id")
+        if action is None or ids is None:
+            raise self.InvalidRequest("action and id are required")
+        with self.lock:
+            for volume_id in ids if isinstance(ids, list) else [ids]:
+                self._volume_action(volume_id, action, body)
+
+    def _volume_action(self, volume_id: str, action: str, body: dict) -> None:
+        delay = self.transitions.volume_attachment
+        if action == "restore":
+            volume = self.trash.pop(volume_id, None)
+            if volume is None:
+                raise self.NotFound(f"Volume {volume_id} not in trash")
+            volume.update(status="detached", deleted_at=None)
+            self.volumes[volume_id] = volume
+            return
+        volume = self.get_volume(volume_id)
+        match action:
+            case "attach":
+                instance_id = (
+                    body.get("instance_id") or (body.get("instance_ids") or [None])[0]
+                )
+                self.get_instance(instance_id)
+                volume["status"] = "attaching"
+                self.schedule(
+                    delay,
+                    self._set(volume, status="attached", instance_id=instance_id),
+                )
+            case "detach":
+                volume["status"] = "detaching"
+                self.schedule(
+                    delay, self._set(volume, status="detached", instance_id=None)
+                )
+            case "delete":
+                self.delete_volume(volume_id, bool(body.get("is_permanent")))
+            case "rename":
+                volume["name"] = body.get("name", volume["name"])
+            case "resize":
+                volume["size"] = body.get("size", volume["size"])
+            case "clone":
+                self.add_volume(
+                    {**volume, "name": f"{volume['name']}-clone", "instance_id": None}
+                )
+            case _:
+                raise self.InvalidRequest(f"Unknown action {action}")
+
+    def delete_volume(self, volume_id: str, permanent: bool = False) -> None:
+        """Move a volume to the trash, or delete it permanently"""
+        with self.lock:
+            volume = self.volumes.pop(volume_id, None)
+            if volume is None:
+                if permanent and self.trash.pop(volume_id, None) is not None:
+                    return
+                raise self.NotFound(f"Volume {volume_id} not found")
+            if not permanent:
+                volume.update(status="deleted", instance_id=None, deleted_at=_now_iso())
+                self.trash[volume_id] = volume
+
+    # Container deployments
+
+    def add_deployment(self, body: dict, status: str | None = None) -> dict:
+        name = body.get("name")
+        if not name or "scaling" not in body:
+            raise self.InvalidRequest("name and scaling are required")
+        with self.lock:
+            if name in self.deployments:
+                raise self.Conflict(f"Deployment {name} already exists")
+            deployment = {
+                **copy.deepcopy(body),
+                "endpoint_base_url": f"https://containers.datacrunch.io/{name}",
+                "created_at": _now_iso(),
+                "status": status or "initializing",
+                "environment_variables": {},
+            }
+            self.deployments[name] = deployment
+            if status is None:
+                self._start_deployment(deployment)
+        return deployment
+
+    def get_deployment(self, name: str) -> dict:
+        with self.lock:
+            deployment = self.deployments.get(name)
+            if deployment is None:
+                raise self.NotFound(f"Deployment {name} not found")
+            return deployment
+
+    def update_deployment(self, name: str, body: dict) -> dict:
+        with self.lock:
+            deployment = self.get_deployment(name)
+            deployment.update(copy.deepcopy(body))
+            self._start_deployment(deployment)
+            return deployment
+
+    def delete_deployment(self, name: str) -> None:
+        with self.lock:
+            self.get_deployment(name)
+            del self.deployments[name]
+
+    def deployment_action(self, name: str, action: str) -> None:
+        with self.lock:
+            deployment = self.get_deployment(name)
+            match action:
+                case "pause":
+                    deployment["status"] = "paused"
+                case "resume" | "restart":
+                    self._start_deployment(deployment)
+                case "purge-queue":
+                    pass
+
+    def update_scaling(self, name: str, body: dict) -> dict:
+        with self.lock:
+            deployment = self.get_deployment(name)
+            deployment["scaling"] = {**deployment["scaling"], **copy.deepcopy(body)}
+            return deployment["scaling"]
+
+    def replicas(self, name: str) -> dict:
+        with self.lock:
+            deployment = self.get_deployment(name)
+            count = (
+                0
+                if deployment["status"] in ("paused", "initializing")
+                else deployment["scaling"].get("min_replica_count", 1)
+            )
+            return {
+                "list": [
+                    {
+                        "id": f"{name}-{index}",
+                        "status": "running",
+                        "started_at": deployment["created_at"],
+                    }
+                    for index in range(count)
+                ]
+            }
+
+    def _start_deployment(self, deployment: dict) -> None:
+        def healthy() -> None:
+            if deployment["status"] == "initializing":
+                deployment["status"] = "healthy"
+
+        deployment["status"] = "initializing"
+        self.schedule(self.transitions.deployment_startup, healthy)
+
+    # Secrets, SSH keys and startup scripts
+
+    def add_secret(self, body: dict) -> None:
+        if "name" not in body or "value" not in body:
+            raise self.InvalidRequest("name and value are required")
+        with self.lock:
+            if body["name"] in self.secrets:
+                raise self.Conflict(f"Secret {body['name']} already exists")
+            self.secrets[body["name"]] = {
+                "name": body["name"],
+                "created_at": _now_iso(),
+            }
+
+    def add_named(self, store: dict[str, dict], body: dict, field: str) -> str:
+        """Add an SSH key or startup script and return its ID"""
+        if "name" not in body or field not in body:
+            raise self.InvalidRequest(f"name and {field} are required")
+        item_id = str(uuid.uuid4())
+        with self.lock:
+            store[item_id] = {"id": item_id, "name": body["name"], field: body[field]}
+        return item_id
+
+    def get_item(self, store: dict[str, dict], item_id: str) -> dict:
+        with self.lock:
+            item = store.get(item_id)
+            if item is None:
+                raise self.NotFound(f"{item_id} not found")
+            return item
+
+    def delete_items(self, store: dict[str, dict], item_ids: list[str]) -> None:
+        with self.lock:
+            for item_id in item_ids:
+                self.get_item(store, item_id)
+            for item_id in item_ids:
+                del store[item_id]
+
+    # Catalogs
+
+    def instance_types(self, currency: str) -> list[dict]:
+        return [
+            {
+                "instance_type": name,
+                "price_per_hour": str(spec["price"]),
+                "currency": currency.lower(),
+                "cpu": {"number_of_cores": spec["cores"]},
+                "gpu": {"description": spec["gpu"]},
+            }
+            for name, spec in INSTANCE_TYPES.items()
+        ]
+
+    def availabilities(self, location_code: str | None) -> list[dict]:
+        return [
+            {"location_code": location["code"], "availabilities": list(INSTANCE_TYPES)}
+            for location in LOCATIONS
+            if location_code is None or location["code"] == location_code
+        ]
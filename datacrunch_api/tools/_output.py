@@ -0,0 +1,15 @@
+import json
+
+
+def show(response: dict | list | None) -> None:
+    """Print a response in a panel, importing rich only when there is one"""
+    from rich import print  # type: ignore
+    from rich.panel import Panel  # type: ignore
+
+    print(
+        Panel.fit(
+            json.dumps(response, indent=2),
+            title="Response",
+            border_style="green",
+        )
+    )
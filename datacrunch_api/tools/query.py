@@ -1,13 +1,6 @@
-import json
-
-from datacrunch_api.v1 import (
-    Deployments,
-    Secrets,
-    ServerlessCompute,
-)
 import typer  # type: ignore
-from rich import print  # type: ignore
-from rich.panel import Panel  # type: ignore
+
+from datacrunch_api.tools._output import show
 
 
 def main(
@@ -15,30 +8,31 @@ def main(
     client_id: str = typer.Option(..., help="DataCrunch client ID"),
     client_secret: str = typer.Option(..., help="DataCrunch client secret"),
     name: str = typer.Option("", help="Name of the query"),
+    token_cache: bool = typer.Option(
+        True, help="Reuse access tokens between runs through an on-disk cache"
+    ),
 ):
+    # Imported here so that --help and option errors skip loading the client
+    from datacrunch_api.v1 import DataCrunchClient, TokenCache
+
     response: dict | list | None = None
+    client = DataCrunchClient(
+        client_id,
+        client_secret,
+        token_cache=TokenCache() if token_cache else None,
+    )
     match action:
         case "list":
-            deployments = Deployments(client_id, client_secret)
-            response = deployments.list_container_deployments()
+            response = client.deployments.list_container_deployments()
         case "status":
-            deployments = Deployments(client_id, client_secret)
-            response = deployments.get_deployment_status(name)
+            response = client.deployments.get_deployment_status(name)
         case "list-secrets":
-            secrets = Secrets(client_id, client_secret)
-            response = secrets.list_secrets()
+            response = client.secrets.list_secrets()
         case "list-serverless-compute":
-            serverless_compute = ServerlessCompute(client_id, client_secret)
-            response = serverless_compute.list_serverless_compute_resources()
+            response = client.serverless_compute.list_serverless_compute_resources()
         case _:
             raise typer.Abort()
-    print(
-        Panel.fit(
-            json.dumps(response, indent=2),
-            title="Response",
-            border_style="green",
-        )
-    )
+    show(response)
 
 
 if __name__ == "__main__":
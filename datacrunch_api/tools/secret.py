@@ -1,9 +1,6 @@
-import json
-
-from datacrunch_api.v1 import Secret, Secrets
 import typer  # type: ignore
-from rich import print  # type: ignore
-from rich.panel import Panel  # type: ignore
+
+from datacrunch_api.tools._output import show
 
 
 def main(
@@ -13,6 +10,9 @@ def main(
     name: str = typer.Option("", help="Name of the secret"),
     value: str = typer.Option("", help="Value of the secret"),
 ):
+    # Imported here so that --help and option errors skip loading the client
+    from datacrunch_api.v1 import Secret, Secrets
+
     api = Secrets(client_id, client_secret)
     match action:
         case "list":
@@ -23,13 +23,7 @@ def main(
             api.delete_secret(name)
         case _:
             raise typer.Abort()
-    print(
-        Panel.fit(
-            json.dumps(response, indent=2),
-            title="Response",
-            border_style="green",
-        )
-    )
+    show(response)
 
 
 if __name__ == "__main__":
@@ -1,37 +1,209 @@
-from .balance import Balance
-from .images import Images
-from .instances import Instances
-from .types.autoupdate import AutoUpdate
-from .types.compute import Compute
-from .types.container import Container
-from .types.container_registry_settings import ContainerRegistrySettings
-from .types.credentials import Credentials
-from .types.deployment import Deployment
-from .deployments import Deployments
-from .types.entrypoint import CommandLine, EntrypointOverrides
-from .types.environment import Environment, EnvironmentVariable
-from .types.healthcheck import HealthCheck
-from .types.instance import Instance
-from .types.scaling import (
-    QueueLoad,
-    Scaling,
-    ScalingPolicy,
-    ScalingTriggers,
-    GpuUtilization,
-)
-from .types.secret import Secret
-from .types.ssh_key import SSHKey
-from .types.startup_script import StartupScript
-from .secrets import Secrets
-from .ssh_keys import SSHKeys
-from .startup_scripts import StartupScripts
-from .serverless_compute import ServerlessCompute
-from .types.volume_mounts import VolumeMount, VolumeMounts
-from .types.volume import Volume, VolumeAction
-from .volumes import Volumes
+"""
+Client of the DataCrunch API. Attributes are imported from their modules on
+first access (PEP 562), so importing the package stays cheap for command line
+tools that only use a few of them.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._api_session import ApiSession
+    from ._async_api_session import AsyncApiSession
+    from ._bulk import ActionResult
+    from .balance import AsyncBalance, Balance
+    from .client import AsyncDataCrunchClient, DataCrunchClient
+    from .images import AsyncImages, Images
+    from .instances import AsyncInstances, Instances
+    from .types.autoupdate import AutoUpdate
+    from .types.compute import Compute
+    from .types.container import Container
+    from .types.container_registry_settings import ContainerRegistrySettings
+    from .types.credentials import Credentials
+    from .types.deployment import Deployment
+    from .deployments import AsyncDeployments, Deployments
+    from .types.entrypoint import CommandLine, EntrypointOverrides
+    from .types.environment import Environment, EnvironmentVariable
+    from .types.healthcheck import HealthCheck
+    from .types.info import (
+        DeploymentInfo,
+        DeploymentStatus,
+        InstanceInfo,
+        InstanceTypeInfo,
+        ReplicaInfo,
+        VolumeInfo,
+    )
+    from .types.instance import Instance
+    from .types.scaling import (
+        QueueLoad,
+        Scaling,
+        ScalingPolicy,
+        ScalingTriggers,
+        GpuUtilization,
+    )
+    from .types.secret import Secret
+    from .types.snapshot import DeploymentSnapshot
+    from .types.ssh_key import SSHKey
+    from .types.startup_script import StartupScript
+    from .secrets import AsyncSecrets, Secrets
+    from .ssh_keys import AsyncSSHKeys, SSHKeys
+    from .startup_scripts import AsyncStartupScripts, StartupScripts
+    from .serverless_compute import AsyncServerlessCompute, ServerlessCompute
+    from .types.volume_mounts import VolumeMount, VolumeMounts
+    from ._cache import ResponseCache
+    from ._circuit_breaker import CircuitBreaker, CircuitState
+    from ._codec import (
+        JsonCodec,
+        MsgspecCodec,
+        OrjsonCodec,
+        StdlibCodec,
+        default_codec,
+    )
+    from ._hooks import Hooks, RequestEvent, RequestHook
+    from ._http2 import Http2Transport
+    from ._rate_limiter import (
+        FileBucketStore,
+        MemoryBucketStore,
+        RateLimit,
+        RateLimiter,
+    )
+    from ._retry import NO_RETRY, RetryPolicy, RetryStats
+    from ._serialization import SerializationCache, serialization_cache
+    from ._single_flight import SingleFlight
+    from ._telemetry import OpenTelemetryHook, PrometheusHook
+    from ._timeout import Timeout
+    from ._token_manager import Token, TokenCache, TokenManager
+    from ._transport import (
+        Cassette,
+        Interaction,
+        RecordingTransport,
+        ReplayTransport,
+        Transport,
+    )
+    from ._waiters import (
+        AsyncGroupWaiter,
+        GroupWaiter,
+        WaitEvent,
+        WaitFailed,
+        WaitPolicy,
+        WaitTimeout,
+    )
+    from .types.volume import Volume, VolumeAction
+    from .volumes import AsyncVolumes, Volumes
+
+# Module of every public attribute, relative to this package
+_EXPORTS = {
+    "ApiSession": "._api_session",
+    "AsyncApiSession": "._async_api_session",
+    "ActionResult": "._bulk",
+    "ResponseCache": "._cache",
+    "CircuitBreaker": "._circuit_breaker",
+    "CircuitState": "._circuit_breaker",
+    "JsonCodec": "._codec",
+    "MsgspecCodec": "._codec",
+    "OrjsonCodec": "._codec",
+    "StdlibCodec": "._codec",
+    "default_codec": "._codec",
+    "Hooks": "._hooks",
+    "Http2Transport": "._http2",
+    "RequestEvent": "._hooks",
+    "RequestHook": "._hooks",
+    "FileBucketStore": "._rate_limiter",
+    "MemoryBucketStore": "._rate_limiter",
+    "RateLimit": "._rate_limiter",
+    "RateLimiter": "._rate_limiter",
+    "NO_RETRY": "._retry",
+    "RetryPolicy": "._retry",
+    "RetryStats": "._retry",
+    "SerializationCache": "._serialization",
+    "serialization_cache": "._serialization",
+    "SingleFlight": "._single_flight",
+    "OpenTelemetryHook": "._telemetry",
+    "PrometheusHook": "._telemetry",
+    "Timeout": "._timeout",
+    "Token": "._token_manager",
+    "TokenCache": "._token_manager",
+    "TokenManager": "._token_manager",
+    "Cassette": "._transport",
+    "Interaction": "._transport",
+    "RecordingTransport": "._transport",
+    "ReplayTransport": "._transport",
+    "Transport": "._transport",
+    "AsyncGroupWaiter": "._waiters",
+    "GroupWaiter": "._waiters",
+    "WaitEvent": "._waiters",
+    "WaitFailed": "._waiters",
+    "WaitPolicy": "._waiters",
+    "WaitTimeout": "._waiters",
+    "AsyncBalance": ".balance",
+    "Balance": ".balance",
+    "AsyncDataCrunchClient": ".client",
+    "DataCrunchClient": ".client",
+    "AsyncDeployments": ".deployments",
+    "Deployments": ".deployments",
+    "AsyncImages": ".images",
+    "Images": ".images",
+    "AsyncInstances": ".instances",
+    "Instances": ".instances",
+    "AsyncSecrets": ".secrets",
+    "Secrets": ".secrets",
+    "AsyncServerlessCompute": ".serverless_compute",
+    "ServerlessCompute": ".serverless_compute",
+    "AsyncSSHKeys": ".ssh_keys",
+    "SSHKeys": ".ssh_keys",
+    "AsyncStartupScripts": ".startup_scripts",
+    "StartupScripts": ".startup_scripts",
+    "AutoUpdate": ".types.autoupdate",
+    "Compute": ".types.compute",
+    "Container": ".types.container",
+    "ContainerRegistrySettings": ".types.container_registry_settings",
+    "Credentials": ".types.credentials",
+    "Deployment": ".types.deployment",
+    "CommandLine": ".types.entrypoint",
+    "EntrypointOverrides": ".types.entrypoint",
+    "Environment": ".types.environment",
+    "EnvironmentVariable": ".types.environment",
+    "HealthCheck": ".types.healthcheck",
+    "DeploymentInfo": ".types.info",
+    "DeploymentStatus": ".types.info",
+    "InstanceInfo": ".types.info",
+    "InstanceTypeInfo": ".types.info",
+    "ReplicaInfo": ".types.info",
+    "VolumeInfo": ".types.info",
+    "Instance": ".types.instance",
+    "QueueLoad": ".types.scaling",
+    "Scaling": ".types.scaling",
+    "ScalingPolicy": ".types.scaling",
+    "ScalingTriggers": ".types.scaling",
+    "GpuUtilization": ".types.scaling",
+    "Secret": ".types.secret",
+    "DeploymentSnapshot": ".types.snapshot",
+    "SSHKey": ".types.ssh_key",
+    "StartupScript": ".types.startup_script",
+    "Volume": ".types.volume",
+    "VolumeAction": ".types.volume",
+    "VolumeMount": ".types.volume_mounts",
+    "VolumeMounts": ".types.volume_mounts",
+    "AsyncVolumes": ".volumes",
+    "Volumes": ".volumes",
+}
 
 __all__ = [
+    "ActionResult",
+    "ApiSession",
+    "AsyncApiSession",
+    "AsyncBalance",
+    "AsyncDataCrunchClient",
+    "AsyncDeployments",
+    "AsyncImages",
+    "AsyncInstances",
+    "AsyncSecrets",
+    "AsyncServerlessCompute",
+    "AsyncSSHKeys",
+    "AsyncStartupScripts",
+    "AsyncVolumes",
     "Balance",
+    "DataCrunchClient",
     "Images",
     "AutoUpdate",
     "CommandLine",
@@ -40,13 +212,19 @@ __all__ = [
     "ContainerRegistrySettings",
     "Credentials",
     "Deployment",
+    "DeploymentInfo",
+    "DeploymentSnapshot",
+    "DeploymentStatus",
     "EntrypointOverrides",
     "Environment",
     "EnvironmentVariable",
     "HealthCheck",
     "Instance",
+    "InstanceInfo",
     "Instances",
+    "InstanceTypeInfo",
     "QueueLoad",
+    "ReplicaInfo",
     "Secret",
     "Secrets",
     "SSHKey",
@@ -57,10 +235,63 @@ __all__ = [
     "ScalingTriggers",
     "VolumeAction",
     "Volume",
+    "VolumeInfo",
     "VolumeMount",
     "VolumeMounts",
     "Volumes",
     "StartupScript",
     "StartupScripts",
     "GpuUtilization",
+    "Cassette",
+    "CircuitBreaker",
+    "CircuitState",
+    "FileBucketStore",
+    "MemoryBucketStore",
+    "Hooks",
+    "Http2Transport",
+    "Interaction",
+    "JsonCodec",
+    "MsgspecCodec",
+    "NO_RETRY",
+    "OpenTelemetryHook",
+    "OrjsonCodec",
+    "PrometheusHook",
+    "RateLimit",
+    "RateLimiter",
+    "RecordingTransport",
+    "ReplayTransport",
+    "RequestEvent",
+    "RequestHook",
+    "ResponseCache",
+    "RetryPolicy",
+    "RetryStats",
+    "SerializationCache",
+    "SingleFlight",
+    "StdlibCodec",
+    "Timeout",
+    "Token",
+    "TokenCache",
+    "TokenManager",
+    "Transport",
+    "AsyncGroupWaiter",
+    "GroupWaiter",
+    "WaitEvent",
+    "WaitFailed",
+    "WaitPolicy",
+    "WaitTimeout",
+    "default_codec",
+    "serialization_cache",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -1,14 +1,45 @@
+import copy
+import time
+from typing import Any, Callable, Iterator, TypeVar
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from ._cache import ResponseCache
+from ._circuit_breaker import CircuitBreaker
+from ._codec import JsonCodec, default_codec
+from ._hooks import Hooks
+from ._rate_limiter import RateLimiter, endpoint_family
+from ._retry import (
+    IDEMPOTENCY_KEY_HEADER,
+    RetryPolicy,
+    RetryStats,
+    is_retryable,
+)
+from ._serialization import serialization_cache
+from ._single_flight import SingleFlight
+from ._streaming import CHUNK_SIZE, JsonArrayParser, next_page
+from ._timeout import SESSION_TIMEOUT, RequestTimeout, Timeout
+from ._transport import Transport
+from ._workers import Workers
+from ._token_manager import DEFAULT_REFRESH_MARGIN, TokenCache, TokenManager
 
 BASE_URL = "https://api.datacrunch.io/v1"
+DEFAULT_POOL_SIZE = 10
+JSON_HEADERS = {"Content-Type": "application/json"}
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 32
 
 
-class ApiSession:
+class SessionBase:
     """
-    Handles authentication and API requests to the DataCrunch API.
-    Provides methods for making HTTP requests and validating responses.
+    The exceptions and response handling shared by ApiSession and
+    AsyncApiSession
     """
 
+    codec: JsonCodec
+    retry_stats: RetryStats
+    timeout: Timeout
+
     class Conflict(Exception):
         """Raised when a request conflicts with an existing resource"""
 
@@ -24,7 +55,123 @@ class ApiSession:
 
         pass
 
-    def __init__(self, client_id: str, client_secret: str, base_url: str = BASE_URL):
+    class CircuitOpen(RequestFailed):
+        """
+        Raised without sending the request while the circuit of its endpoint
+        family is open
+        """
+
+        def __init__(self, family: str, retry_in: float):
+            super().__init__(f"Circuit of {family} is open, retry in {retry_in:.1f} s")
+            self.family = family
+            self.retry_in = retry_in
+
+    def validate_response(self, response: dict) -> dict:
+        """
+        Validate an API response and raise appropriate exceptions if needed.
+
+        Args:
+            response: The JSON response from the API
+
+        Returns:
+            The validated response dict
+
+        Raises:
+            InvalidRequest: If the response indicates an invalid request
+            Conflict: If the response indicates a resource conflict
+        """
+        if not isinstance(response, dict) or "code" not in response:
+            return response
+        match response["code"]:
+            case "invalid_request":
+                raise self.InvalidRequest(response.get("message"))
+            case "conflict":
+                raise self.Conflict(response.get("message"))
+            case _:
+                return response
+
+    def _request_timeout(self, timeout: RequestTimeout) -> Timeout:
+        """The timeout of a request, the one of the session unless given"""
+        return self.timeout if timeout is SESSION_TIMEOUT else Timeout.of(timeout)
+
+    def _array(self, content: bytes) -> list:
+        """Decode a response body that is expected to be an array"""
+        response = self.validate_response(self.codec.decode(content))
+        if not isinstance(response, list):
+            raise self.RequestFailed(response)
+        return response
+
+    def _record_exhausted(self, attempt: int, retryable: bool) -> None:
+        if retryable and attempt > 1:
+            self.retry_stats.record_exhausted()
+
+
+Session = TypeVar("Session", bound=SessionBase)
+
+
+def resolve_session(
+    session_class: Callable[..., Session],
+    api_session: Session | None,
+    client_id: str | None,
+    client_secret: str | None,
+    *args: Any,
+    **session_options: Any,
+) -> Session:
+    """
+    Return the session a client was given, or a new one created from its
+    credentials
+
+    Args:
+        session_class: The class of a new session, ApiSession or AsyncApiSession
+        api_session: Optional existing session, returned as is
+        client_id: The client ID for a new session
+        client_secret: The client secret for a new session
+        args: Further positional arguments for a new session
+        session_options: Keyword arguments for a new session
+
+    Returns:
+        The session
+
+    Raises:
+        ValueError: If there is neither a session nor both credentials
+    """
+    if api_session is not None:
+        return api_session
+    if client_id is None or client_secret is None:
+        raise ValueError(
+            "client_id and client_secret are required without an api_session"
+        )
+    return session_class(client_id, client_secret, *args, **session_options)
+
+
+class ApiSession(SessionBase):
+    """
+    Handles authentication and API requests to the DataCrunch API.
+    Provides methods for making HTTP requests and validating responses.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        base_url: str = BASE_URL,
+        token_cache: TokenCache | None = None,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        background_refresh: bool = True,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: ResponseCache | None = None,
+        codec: JsonCodec | None = None,
+        coalesce_gets: bool = True,
+        coalesce_window: float = 0.0,
+        hooks: Hooks | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        keep_alive: bool = True,
+        timeout: Timeout | float | None = Timeout(),
+        transport: Transport | None = None,
+    ):
         """
         Initialize an API session with client credentials.
 
@@ -32,51 +179,146 @@ class ApiSession:
             client_id: The client ID for authentication
             client_secret: The client secret for authentication
             base_url: Optional custom base URL for the API
+            token_cache: Optional on-disk cache sharing tokens between processes
+            refresh_margin: Seconds before expiry at which tokens are refreshed
+            background_refresh: Refresh tokens from a timer thread before they
+                expire instead of on the next request
+            retry_policy: When to retry failed requests, NO_RETRY disables retries
+            rate_limiter: Optional rate limiter delaying requests over its budget,
+                may be shared with other sessions
+            circuit_breaker: Optional circuit breaker failing requests to an
+                endpoint family fast while it keeps failing or responding slowly
+            response_cache: Optional cache of GET responses, by default of the
+                near-static catalogs such as instance types and locations
+            codec: JSON codec for request and response bodies, by default orjson
+                or msgspec when installed and the json module otherwise
+            coalesce_gets: Share the response of a GET with identical GETs sent
+                while it is in flight instead of sending them too
+            coalesce_window: Seconds a GET response is also shared with
+                identical GETs sent after it completed
+            hooks: Request hooks notified before and after every attempt. More
+                can be added later with api_session.hooks.add().
+            pool_size: Number of hosts to keep connection pools for
+            max_connections_per_host: Connections kept open per host, should be
+                at least the number of threads sharing the session. Bulk
+                operations share as many threads.
+            keep_alive: Reuse connections between requests. When False every
+                request opens a new connection.
+            timeout: Default connect and read timeouts of every request, as a
+                Timeout or a number of seconds used for both. None waits forever.
+            transport: Optional transport sending the requests, e.g. to record
+                or replay them or to send them over HTTP/2, by default they are
+                sent over HTTP/1.1
         """
         self.base_url = base_url
+        self.retry_policy = retry_policy
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.response_cache = response_cache
+        self.codec = codec if codec is not None else default_codec()
+        self.single_flight = SingleFlight(coalesce_window) if coalesce_gets else None
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.timeout = Timeout.of(timeout)
+        self.transport = transport if transport is not None else Transport()
         self.session = requests.Session()
-        self.authenticate(client_id, client_secret)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=max_connections_per_host
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        self.transport.attach(self)
+        # Threads of the bulk operations, so concurrent ones share the bound
+        self.workers = Workers(max_connections_per_host)
+        self.token_manager = TokenManager(
+            client_id,
+            client_secret,
+            self._fetch_token,
+            refresh_margin=refresh_margin,
+            cache=token_cache,
+            background_refresh=background_refresh,
+        )
+        self._access_token: str | None = None
+        self.authenticate()
 
-    def authenticate(self, client_id: str, client_secret: str) -> None:
+    def authenticate(
+        self, client_id: str | None = None, client_secret: str | None = None
+    ) -> None:
         """
         Authenticate with the DataCrunch API using client credentials.
-        Sets the authorization header for subsequent requests.
+        Reuses a still valid token from memory or the token cache, and sets the
+        authorization header for subsequent requests.
 
         Args:
-            client_id: The client ID for authentication
-            client_secret: The client secret for authentication
+            client_id: Optional client ID replacing the one of the session
+            client_secret: Optional client secret replacing the one of the session
         """
-        response = self.session.post(
-            f"{self.base_url}/oauth2/token",
-            json={
-                "grant_type": "client_credentials",
-                "client_id": client_id,
-                "client_secret": client_secret,
-            },
-        )
-        token = response.json()["access_token"]
-        self.session.headers.update({"Authorization": f"Bearer {token}"})
+        if client_id is not None or client_secret is not None:
+            self.token_manager.client_id = client_id or self.token_manager.client_id
+            self.token_manager.client_secret = (
+                client_secret or self.token_manager.client_secret
+            )
+            self._set_access_token(self.token_manager.refresh(stale=self._access_token))
+        else:
+            self._set_access_token(self.token_manager.get())
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release its pooled connections.
+        """
+        self.token_manager.close()
+        self.workers.shutdown()
+        self.transport.close()
+        self.session.close()
 
-    def delete(self, url: str, json: dict | None = None) -> None:
+    def with_timeout(self, timeout: Timeout | float | None) -> "ApiSession":
+        """
+        Return a view of this session using another default timeout.
+        The view shares the connection pool, bulk workers, token, rate limiter
+        and statistics of this session, so closing either closes both.
+
+        Args:
+            timeout: Timeout of requests sent through the view
+
+        Returns:
+            The session view
+        """
+        view = copy.copy(self)
+        view.timeout = Timeout.of(timeout)
+        return view
+
+    def delete(
+        self,
+        url: str,
+        json: dict | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+    ) -> None:
         """
         Send a DELETE request to the API.
 
         Args:
             url: The API endpoint URL
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
 
         Raises:
             RequestFailed: If the request fails
         """
-        response = self.session.delete(f"{self.base_url}/{url}", json=json)
+        response = self._send("delete", url, json=json, timeout=timeout)
         if response.status_code < 200 or response.status_code >= 300:
-            raise self.RequestFailed(response.json())
+            raise self.RequestFailed(self.codec.decode(response.content))
 
-    def get(self, url: str) -> dict | list:
+    def get(self, url: str, timeout: RequestTimeout = SESSION_TIMEOUT) -> dict | list:
         """
-        Send a GET request to the API.
+        Send a GET request to the API. Identical GETs in flight at the same time
+        are sent once and share the response.
 
         Args:
             url: The API endpoint URL
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
 
         Returns:
             The JSON response as a dict or list
@@ -84,17 +326,77 @@ class ApiSession:
         Raises:
             InvalidRequest: If the request is invalid
             Conflict: If there is a resource conflict
+            requests.Timeout: If a shared GET outlasts both phases of the
+                timeout of this call
+        """
+        if self.single_flight is None:
+            content = self._get_content(url, timeout)
+        else:
+            bound = self._request_timeout(timeout)
+            try:
+                content = self.single_flight.do(
+                    url, lambda: self._get_content(url, timeout), bound.total()
+                )
+            except TimeoutError as error:
+                raise requests.Timeout(str(error)) from error
+        return self.validate_response(self.codec.decode(content))
+
+    def iter_items(
+        self, url: str, timeout: RequestTimeout = SESSION_TIMEOUT
+    ) -> Iterator[Any]:
         """
-        response = self.session.get(f"{self.base_url}/{url}")
-        return self.validate_response(response.json())
+        Send a GET request for a JSON array and yield its elements while the
+        response body streams in, each as soon as it is decoded. Paginated
+        responses are followed through the rel="next" links of their Link
+        header.
+
+        Args:
+            url: The API endpoint URL
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
 
-    def patch(self, url: str, json: dict) -> dict:
+        Yields:
+            The elements of the array, page after page
+
+        Raises:
+            InvalidRequest: If the request is invalid
+            Conflict: If there is a resource conflict
+            RequestFailed: If the response is not an array
+        """
+        page: str | None = url
+        while page is not None:
+            response = self._send("get", page, timeout=timeout, stream=True)
+            try:
+                chunks = response.iter_content(CHUNK_SIZE)
+                first = next((chunk for chunk in chunks if chunk), b"")
+                if first.lstrip().startswith(b"["):
+                    parser = JsonArrayParser()
+                    yield from parser.feed(first)
+                    for chunk in chunks:
+                        yield from parser.feed(chunk)
+                    yield from parser.close()
+                else:
+                    yield from self._array(first + b"".join(chunks))
+            finally:
+                response.close()
+            page = next_page(response.headers, self.base_url, page)
+
+    def patch(
+        self,
+        url: str,
+        json: dict,
+        idempotency_key: str | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+    ) -> dict:
         """
         Send a PATCH request to the API.
 
         Args:
             url: The API endpoint URL
             json: The request body as a dict
+            idempotency_key: Optional key allowing the request to be retried
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
 
         Returns:
             The JSON response as a dict
@@ -103,16 +405,27 @@ class ApiSession:
             InvalidRequest: If the request is invalid
             Conflict: If there is a resource conflict
         """
-        response = self.session.patch(f"{self.base_url}/{url}", json=json)
-        return self.validate_response(response.json())
-
-    def post(self, url: str, json: dict) -> dict | str:
+        response = self._send(
+            "patch", url, json=json, idempotency_key=idempotency_key, timeout=timeout
+        )
+        return self.validate_response(self.codec.decode(response.content))
+
+    def post(
+        self,
+        url: str,
+        json: dict,
+        idempotency_key: str | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+    ) -> dict | str:
         """
         Send a POST request to the API and validate the response.
 
         Args:
             url: The API endpoint URL
             json: The request body as a dict
+            idempotency_key: Optional key allowing the request to be retried
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
 
         Returns:
             The validated JSON response as a dict
@@ -121,30 +434,50 @@ class ApiSession:
             InvalidRequest: If the request is invalid
             Conflict: If there is a resource conflict
         """
-        response = self.post_raw(url, json)
-        return self.validate_response(response.json())
-
-    def post_raw(self, url: str, json: dict) -> requests.Response:
+        response = self.post_raw(url, json, idempotency_key, timeout)
+        return self.validate_response(self.codec.decode(response.content))
+
+    def post_raw(
+        self,
+        url: str,
+        json: dict,
+        idempotency_key: str | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+    ) -> requests.Response:
         """
         Send a POST request to the API without validating the response.
 
         Args:
             url: The API endpoint URL
             json: The request body as a dict
+            idempotency_key: Optional key allowing the request to be retried
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
 
         Returns:
             The raw requests.Response object
         """
-        response = self.session.post(f"{self.base_url}/{url}", json=json)
+        response = self._send(
+            "post", url, json=json, idempotency_key=idempotency_key, timeout=timeout
+        )
         return response
 
-    def put(self, url: str, json: dict) -> dict:
+    def put(
+        self,
+        url: str,
+        json: dict,
+        idempotency_key: str | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+    ) -> dict:
         """
         Send a PUT request to the API and validate the response.
 
         Args:
             url: The API endpoint URL
             json: The request body as a dict
+            idempotency_key: Optional key allowing the request to be retried
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
 
         Returns:
             The validated JSON response as a dict
@@ -152,43 +485,190 @@ class ApiSession:
         Raises:
             InvalidRequest: If the request is invalid
         """
-        response = self.session.put(f"{self.base_url}/{url}", json=json)
-        return self.validate_response(response.json())
-
-    def put_raw(self, url: str, json: dict) -> requests.Response:
+        response = self._send(
+            "put", url, json=json, idempotency_key=idempotency_key, timeout=timeout
+        )
+        return self.validate_response(self.codec.decode(response.content))
+
+    def put_raw(
+        self,
+        url: str,
+        json: dict,
+        idempotency_key: str | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+    ) -> requests.Response:
         """
         Send a PUT request to the API without validating the response.
 
         Args:
             url: The API endpoint URL
             json: The request body as a dict
+            idempotency_key: Optional key allowing the request to be retried
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
 
         Returns:
             The raw requests.Response object
         """
-        response = self.session.put(f"{self.base_url}/{url}", json=json)
+        response = self._send(
+            "put", url, json=json, idempotency_key=idempotency_key, timeout=timeout
+        )
         return response
 
-    def validate_response(self, response: dict) -> dict:
+    def _get_content(self, url: str, timeout: RequestTimeout) -> bytes:
+        cache = self.response_cache
+        if cache is not None and cache.cacheable(url):
+            return self._cached_get(cache, url, timeout)
+        return self._send("get", url, timeout=timeout).content
+
+    def _cached_get(
+        self, cache: ResponseCache, url: str, timeout: RequestTimeout
+    ) -> bytes:
         """
-        Validate an API response and raise appropriate exceptions if needed.
+        Return the body of a cacheable GET response, from the cache while it is
+        fresh and revalidating it with its ETag once it has expired
+        """
+        entry = cache.lookup(url)
+        if entry is not None and entry.fresh:
+            return entry.content
+        headers: dict[str, str] = {}
+        if entry is not None and entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        response = self._send("get", url, timeout=timeout, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            return cache.revalidated(url, entry).content
+        if response.status_code == 200:
+            cache.store(url, response.content, response.headers.get("ETag"))
+        return response.content
+
+    def _fetch_token(self, body: dict) -> dict:
+        response = self._request(
+            "post",
+            f"{self.base_url}/oauth2/token",
+            json=body,
+            timeout=self.timeout.as_tuple(),
+        )
+        token = response.json()
+        if "access_token" not in token:
+            raise self.RequestFailed(token)
+        return token
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        idempotency_key: str | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request, retrying failures as allowed by the retry policy.
+        A JSON body is encoded once with the codec, unless the serialization
+        cache holds its bytes, and reused by every attempt, which first waits
+        for the rate limiter, if any, and fails fast while the circuit of the
+        endpoint family is open.
+        Requests with non-idempotent methods are only retried when they carry an
+        idempotency key, which is sent along in the Idempotency-Key header.
+        """
+        body = kwargs.pop("json", None)
+        if body is not None:
+            kwargs["data"] = serialization_cache.encode(body, self.codec)
+            kwargs["headers"] = {**kwargs.get("headers", {}), **JSON_HEADERS}
+        if idempotency_key is not None:
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                IDEMPOTENCY_KEY_HEADER: idempotency_key,
+            }
+        kwargs["timeout"] = self._request_timeout(timeout).as_tuple()
+        retryable = is_retryable(method, idempotency_key)
+        stream = kwargs.get("stream", False)
+        hooks = self.hooks if self.hooks else None
+        breaker = self.circuit_breaker
+        attempt = 0
+        while True:
+            attempt += 1
+            if breaker is not None and not breaker.allow(url):
+                raise self.CircuitOpen(endpoint_family(url), breaker.retry_in(url))
+            if self.rate_limiter is not None:
+                try:
+                    self.rate_limiter.acquire(url)
+                except BaseException:
+                    if breaker is not None:
+                        breaker.release(url)
+                    raise
+            if hooks is not None:
+                event = hooks.before_request(method, url, attempt, kwargs.get("data"))
+            started = time.monotonic()
+            try:
+                response = self._send_authenticated(method, url, **kwargs)
+            except Exception as error:
+                network_error = isinstance(
+                    error, (requests.ConnectionError, requests.Timeout)
+                )
+                if breaker is not None:
+                    breaker.record(url, network_error, time.monotonic() - started)
+                if hooks is not None:
+                    hooks.on_error(event, error)
+                if not network_error:
+                    raise
+                delay = self.retry_policy.delay(attempt, retryable)
+                if delay is None:
+                    self._record_exhausted(attempt, retryable)
+                    raise
+                reason = type(error).__name__
+            except BaseException as error:
+                # Cancellation or an interrupt, never retried
+                if breaker is not None:
+                    breaker.release(url)
+                if hooks is not None:
+                    hooks.on_error(event, error)
+                raise
+            else:
+                if breaker is not None:
+                    breaker.record(
+                        url, response.status_code >= 500, time.monotonic() - started
+                    )
+                if hooks is not None:
+                    size = (
+                        int(response.headers.get("Content-Length", 0))
+                        if stream
+                        else len(response.content)
+                    )
+                    hooks.after_response(event, response.status_code, size)
+                delay = self.retry_policy.delay(
+                    attempt, retryable, response.status_code, response.headers
+                )
+                if delay is None:
+                    if response.status_code in self.retry_policy.retry_statuses:
+                        self._record_exhausted(attempt, retryable)
+                    return response
+                reason = str(response.status_code)
+                if stream:
+                    response.close()
+            self.retry_stats.record_retry(reason, time.monotonic() - started, delay)
+            time.sleep(delay)
+
+    def _send_authenticated(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request with a valid access token. A request rejected with 401 is
+        sent once more after re-authenticating.
+        """
+        self._set_access_token(self.token_manager.get())
+        response = self._request(method, f"{self.base_url}/{url}", **kwargs)
+        if response.status_code == 401:
+            if kwargs.get("stream"):
+                response.close()
+            self._set_access_token(self.token_manager.refresh(stale=self._access_token))
+            response = self._request(method, f"{self.base_url}/{url}", **kwargs)
+        return response
 
-        Args:
-            response: The JSON response from the API
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        return self.transport.send(self._http_request, method, url, **kwargs)
 
-        Returns:
-            The validated response dict
+    def _http_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        return getattr(self.session, method)(url, **kwargs)
 
-        Raises:
-            InvalidRequest: If the response indicates an invalid request
-            Conflict: If the response indicates a resource conflict
-        """
-        if "code" not in response:
-            return response
-        match response["code"]:
-            case "invalid_request":
-                raise self.InvalidRequest(response.get("message"))
-            case "conflict":
-                raise self.Conflict(response.get("message"))
-            case _:
-                return response
+    def _set_access_token(self, token: str) -> None:
+        if token != self._access_token:
+            self.session.headers.update({"Authorization": f"Bearer {token}"})
+            self._access_token = token
@@ -0,0 +1,683 @@
+import asyncio
+import copy
+import json as jsonlib
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Mapping
+
+if TYPE_CHECKING:
+    import aiohttp
+else:
+    aiohttp = None  # Imported by _import_aiohttp when the first session is created
+
+from ._api_session import BASE_URL, JSON_HEADERS, SessionBase
+from ._cache import ResponseCache
+from ._circuit_breaker import CircuitBreaker
+from ._codec import JsonCodec, default_codec
+from ._hooks import Hooks
+from ._rate_limiter import RateLimiter, endpoint_family
+from ._retry import (
+    IDEMPOTENCY_KEY_HEADER,
+    RetryPolicy,
+    RetryStats,
+    is_retryable,
+)
+from ._serialization import serialization_cache
+from ._single_flight import SingleFlight
+from ._streaming import CHUNK_SIZE, JsonArrayParser, next_page
+from ._timeout import SESSION_TIMEOUT, RequestTimeout, Timeout
+from ._transport import Transport
+from ._token_manager import DEFAULT_REFRESH_MARGIN, TokenCache, TokenManager
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 0
+
+
+def _import_aiohttp() -> None:
+    """
+    Import aiohttp, which takes longer to import than the rest of the package,
+    on first use rather than with the package
+    """
+    global aiohttp
+    if aiohttp is None:
+        try:
+            import aiohttp as module
+        except ImportError:  # pragma: no cover - optional dependency
+            raise ImportError(
+                "AsyncApiSession requires aiohttp, install datacrunch_api[async]"
+            ) from None
+        aiohttp = module
+
+
+def _client_timeout(timeout: Timeout) -> "aiohttp.ClientTimeout":
+    return aiohttp.ClientTimeout(sock_connect=timeout.connect, sock_read=timeout.read)
+
+
+@dataclass(frozen=True)
+class AsyncResponse:
+    """
+    A fully read response returned by AsyncApiSession.
+    Exposes the parts of requests.Response the resource clients rely on.
+    Streamed responses leave content empty and are read from stream instead.
+    """
+
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+    stream: "aiohttp.ClientResponse | None" = None
+
+    async def iter_chunks(self, size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Iterate over the body in chunks as it arrives"""
+        if self.stream is None:
+            if self.content:
+                yield self.content
+            return
+        async for chunk in self.stream.content.iter_chunked(size):
+            yield chunk
+
+    def release(self) -> None:
+        """Release the connection of a streamed response"""
+        if self.stream is not None:
+            self.stream.release()
+
+    @property
+    def text(self) -> str:
+        return self.content.decode()
+
+    def json(self) -> Any:
+        return jsonlib.loads(self.content)
+
+
+class AsyncApiSession(SessionBase):
+    """
+    Handles authentication and API requests to the DataCrunch API from asyncio code.
+    Mirrors ApiSession on top of a single pooled aiohttp.ClientSession and raises
+    the same exceptions.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        base_url: str = BASE_URL,
+        token_cache: TokenCache | None = None,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        client: "aiohttp.ClientSession | None" = None,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: ResponseCache | None = None,
+        codec: JsonCodec | None = None,
+        coalesce_gets: bool = True,
+        coalesce_window: float = 0.0,
+        hooks: Hooks | None = None,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        keep_alive: bool = True,
+        timeout: Timeout | float | None = Timeout(),
+        transport: Transport | None = None,
+    ):
+        """
+        Initialize an async API session with client credentials.
+        Authentication happens on the first request.
+
+        Args:
+            client_id: The client ID for authentication
+            client_secret: The client secret for authentication
+            base_url: Optional custom base URL for the API
+            token_cache: Optional on-disk cache sharing tokens between processes
+            refresh_margin: Seconds before expiry at which tokens are refreshed
+            max_connections: Size of the connection pool, 0 for no limit
+            client: Optional preconfigured aiohttp.ClientSession to send requests
+                with. By default one is created on the first request.
+            retry_policy: When to retry failed requests, NO_RETRY disables retries
+            rate_limiter: Optional rate limiter delaying requests over its budget,
+                may be shared with other sessions
+            circuit_breaker: Optional circuit breaker failing requests to an
+                endpoint family fast while it keeps failing or responding slowly
+            response_cache: Optional cache of GET responses, by default of the
+                near-static catalogs such as instance types and locations
+            codec: JSON codec for request and response bodies, by default orjson
+                or msgspec when installed and the json module otherwise
+            coalesce_gets: Share the response of a GET with identical GETs sent
+                while it is in flight instead of sending them too
+            coalesce_window: Seconds a GET response is also shared with
+                identical GETs sent after it completed
+            hooks: Request hooks notified before and after every attempt. More
+                can be added later with api_session.hooks.add().
+            max_connections_per_host: Connections open at once per host, 0 for
+                no limit other than max_connections
+            keep_alive: Reuse connections between requests. When False every
+                request opens a new connection.
+            timeout: Default connect and read timeouts of every request, as a
+                Timeout or a number of seconds used for both. None waits forever.
+            transport: Optional transport sending the requests, e.g. to record
+                or replay them or to send them over HTTP/2, by default they are
+                sent over HTTP/1.1
+        """
+        _import_aiohttp()
+        self.base_url = base_url
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keep_alive = keep_alive
+        self.timeout = Timeout.of(timeout)
+        self.transport = transport if transport is not None else Transport()
+        self.transport.attach(self)
+        self.retry_policy = retry_policy
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.response_cache = response_cache
+        self.codec = codec if codec is not None else default_codec()
+        self.single_flight = SingleFlight(coalesce_window) if coalesce_gets else None
+        self.hooks = hooks if hooks is not None else Hooks()
+        self._client = client
+        self._root = self
+        self.token_manager = TokenManager(
+            client_id,
+            client_secret,
+            refresh_margin=refresh_margin,
+            cache=token_cache,
+            background_refresh=False,
+        )
+        self._auth_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncApiSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def authenticate(
+        self, client_id: str | None = None, client_secret: str | None = None
+    ) -> None:
+        """
+        Authenticate with the DataCrunch API using client credentials.
+        Reuses a still valid token from memory or the token cache.
+
+        Args:
+            client_id: Optional client ID replacing the one of the session
+            client_secret: Optional client secret replacing the one of the session
+        """
+        stale = None
+        if client_id is not None or client_secret is not None:
+            self.token_manager.client_id = client_id or self.token_manager.client_id
+            self.token_manager.client_secret = (
+                client_secret or self.token_manager.client_secret
+            )
+            token = self.token_manager.token
+            stale = token.access_token if token is not None else None
+        await self._access_token(stale)
+
+    async def _access_token(self, stale: str | None = None) -> str:
+        """
+        Return a valid access token, fetching a new one if needed. Concurrent
+        callers share a single token request, and the token cache is read and
+        written from a thread under its inter-process lock, as by TokenManager.
+
+        Args:
+            stale: Optional access token known to be rejected by the API
+        """
+        manager = self.token_manager
+        token = manager.token
+        if token and not token.needs_refresh() and token.access_token != stale:
+            return token.access_token
+        async with self._auth_lock:
+            cache = manager.cache
+            if cache is None:
+                token = manager.current(stale)
+                if token is not None:
+                    return token.access_token
+                return manager.store(await self._fetch_token()).access_token
+            lock = cache.locked(manager.client_id)
+            await asyncio.to_thread(lock.__enter__)
+            try:
+                token = await asyncio.to_thread(manager.current, stale)
+                if token is not None:
+                    return token.access_token
+                body = await self._fetch_token()
+                return (await asyncio.to_thread(manager.store, body)).access_token
+            finally:
+                await asyncio.to_thread(lock.__exit__, None, None, None)
+
+    async def _fetch_token(self) -> dict:
+        response = await self._request(
+            "POST",
+            f"{self.base_url}/oauth2/token",
+            json=self.token_manager.request_body(),
+            timeout=_client_timeout(self.timeout),
+        )
+        body = response.json()
+        if "access_token" not in body:
+            raise self.RequestFailed(body)
+        return body
+
+    @property
+    def client(self) -> "aiohttp.ClientSession":
+        """
+        The pooled aiohttp session, created on first use inside the running loop
+        and shared with every view returned by with_timeout
+        """
+        root = self._root
+        if root._client is None:
+            root._client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_connections_per_host,
+                    force_close=not self.keep_alive,
+                )
+            )
+        return root._client
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client and release its pooled connections.
+        """
+        await self.transport.aclose()
+        if self._root._client is not None:
+            await self._root._client.close()
+
+    def with_timeout(self, timeout: Timeout | float | None) -> "AsyncApiSession":
+        """
+        Return a view of this session using another default timeout.
+        The view shares the connection pool, token, rate limiter and statistics
+        of this session, so closing either closes both.
+
+        Args:
+            timeout: Timeout of requests sent through the view
+
+        Returns:
+            The session view
+        """
+        view = copy.copy(self)
+        view.timeout = Timeout.of(timeout)
+        return view
+
+    async def delete(
+        self,
+        url: str,
+        json: dict | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+    ) -> None:
+        """
+        Send a DELETE request to the API.
+
+        Args:
+            url: The API endpoint URL
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
+
+        Raises:
+            RequestFailed: If the request fails
+        """
+        response = await self._send("DELETE", url, json=json, timeout=timeout)
+        if response.status_code < 200 or response.status_code >= 300:
+            raise self.RequestFailed(self.codec.decode(response.content))
+
+    async def get(
+        self, url: str, timeout: RequestTimeout = SESSION_TIMEOUT
+    ) -> dict | list:
+        """
+        Send a GET request to the API. Identical GETs in flight at the same time
+        are sent once and share the response.
+
+        Args:
+            url: The API endpoint URL
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
+
+        Returns:
+            The JSON response as a dict or list
+
+        Raises:
+            InvalidRequest: If the request is invalid
+            Conflict: If there is a resource conflict
+            TimeoutError: If a shared GET outlasts both phases of the timeout
+                of this call
+        """
+        if self.single_flight is None:
+            content = await self._get_content(url, timeout)
+        else:
+            bound = self._request_timeout(timeout)
+            content = await self.single_flight.do_async(
+                url, lambda: self._get_content(url, timeout), bound.total()
+            )
+        return self.validate_response(self.codec.decode(content))
+
+    async def iter_items(
+        self, url: str, timeout: RequestTimeout = SESSION_TIMEOUT
+    ) -> AsyncIterator[Any]:
+        """
+        Send a GET request for a JSON array and yield its elements while the
+        response body streams in, each as soon as it is decoded. Paginated
+        responses are followed through the rel="next" links of their Link
+        header.
+
+        Args:
+            url: The API endpoint URL
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
+
+        Yields:
+            The elements of the array, page after page
+
+        Raises:
+            InvalidRequest: If the request is invalid
+            Conflict: If there is a resource conflict
+            RequestFailed: If the response is not an array
+        """
+        page: str | None = url
+        while page is not None:
+            response = await self._send("get", page, timeout=timeout, stream=True)
+            try:
+                chunks = response.iter_chunks()
+                first = b""
+                async for first in chunks:
+                    if first:
+                        break
+                if first.lstrip().startswith(b"["):
+                    parser = JsonArrayParser()
+                    for item in parser.feed(first):
+                        yield item
+                    async for chunk in chunks:
+                        for item in parser.feed(chunk):
+                            yield item
+                    for item in parser.close():
+                        yield item
+                else:
+                    rest = [chunk async for chunk in chunks]
+                    for item in self._array(b"".join([first, *rest])):
+                        yield item
+            finally:
+                response.release()
+            page = next_page(response.headers, self.base_url, page)
+
+    async def patch(
+        self,
+        url: str,
+        json: dict,
+        idempotency_key: str | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+    ) -> dict:
+        """
+        Send a PATCH request to the API.
+
+        Args:
+            url: The API endpoint URL
+            json: The request body as a dict
+            idempotency_key: Optional key allowing the request to be retried
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
+
+        Returns:
+            The JSON response as a dict
+
+        Raises:
+            InvalidRequest: If the request is invalid
+            Conflict: If there is a resource conflict
+        """
+        response = await self._send(
+            "PATCH", url, json=json, idempotency_key=idempotency_key, timeout=timeout
+        )
+        return self.validate_response(self.codec.decode(response.content))
+
+    async def post(
+        self,
+        url: str,
+        json: dict,
+        idempotency_key: str | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+    ) -> dict | str:
+        """
+        Send a POST request to the API and validate the response.
+
+        Args:
+            url: The API endpoint URL
+            json: The request body as a dict
+            idempotency_key: Optional key allowing the request to be retried
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
+
+        Returns:
+            The validated JSON response as a dict
+
+        Raises:
+            InvalidRequest: If the request is invalid
+            Conflict: If there is a resource conflict
+        """
+        response = await self.post_raw(url, json, idempotency_key, timeout)
+        return self.validate_response(self.codec.decode(response.content))
+
+    async def post_raw(
+        self,
+        url: str,
+        json: dict,
+        idempotency_key: str | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+    ) -> AsyncResponse:
+        """
+        Send a POST request to the API without validating the response.
+
+        Args:
+            url: The API endpoint URL
+            json: The request body as a dict
+            idempotency_key: Optional key allowing the request to be retried
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
+
+        Returns:
+            The raw AsyncResponse object
+        """
+        return await self._send(
+            "POST", url, json=json, idempotency_key=idempotency_key, timeout=timeout
+        )
+
+    async def put(
+        self,
+        url: str,
+        json: dict,
+        idempotency_key: str | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+    ) -> dict:
+        """
+        Send a PUT request to the API and validate the response.
+
+        Args:
+            url: The API endpoint URL
+            json: The request body as a dict
+            idempotency_key: Optional key allowing the request to be retried
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
+
+        Returns:
+            The validated JSON response as a dict
+
+        Raises:
+            InvalidRequest: If the request is invalid
+        """
+        response = await self._send(
+            "PUT", url, json=json, idempotency_key=idempotency_key, timeout=timeout
+        )
+        return self.validate_response(self.codec.decode(response.content))
+
+    async def put_raw(
+        self,
+        url: str,
+        json: dict,
+        idempotency_key: str | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+    ) -> AsyncResponse:
+        """
+        Send a PUT request to the API without validating the response.
+
+        Args:
+            url: The API endpoint URL
+            json: The request body as a dict
+            idempotency_key: Optional key allowing the request to be retried
+            timeout: Optional timeout replacing the session timeout, None waits
+                forever
+
+        Returns:
+            The raw AsyncResponse object
+        """
+        return await self._send(
+            "PUT", url, json=json, idempotency_key=idempotency_key, timeout=timeout
+        )
+
+    async def _get_content(self, url: str, timeout: RequestTimeout) -> bytes:
+        cache = self.response_cache
+        if cache is not None and cache.cacheable(url):
+            return await self._cached_get(cache, url, timeout)
+        return (await self._send("GET", url, timeout=timeout)).content
+
+    async def _cached_get(
+        self, cache: ResponseCache, url: str, timeout: RequestTimeout
+    ) -> bytes:
+        """
+        Return the body of a cacheable GET response, from the cache while it is
+        fresh and revalidating it with its ETag once it has expired
+        """
+        entry = cache.lookup(url)
+        if entry is not None and entry.fresh:
+            return entry.content
+        headers: dict[str, str] = {}
+        if entry is not None and entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        response = await self._send("GET", url, timeout=timeout, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            return cache.revalidated(url, entry).content
+        if response.status_code == 200:
+            cache.store(url, response.content, response.headers.get("ETag"))
+        return response.content
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        idempotency_key: str | None = None,
+        timeout: RequestTimeout = SESSION_TIMEOUT,
+        **kwargs,
+    ) -> AsyncResponse:
+        """
+        Send a request, retrying failures as allowed by the retry policy.
+        A JSON body is encoded once with the codec, unless the serialization
+        cache holds its bytes, and reused by every attempt, which first waits
+        for the rate limiter, if any, and fails fast while the circuit of the
+        endpoint family is open.
+        Requests with non-idempotent methods are only retried when they carry an
+        idempotency key, which is sent along in the Idempotency-Key header.
+        """
+        body = kwargs.pop("json", None)
+        if body is not None:
+            kwargs["data"] = serialization_cache.encode(body, self.codec)
+            kwargs["headers"] = {**kwargs.get("headers", {}), **JSON_HEADERS}
+        kwargs["timeout"] = _client_timeout(self._request_timeout(timeout))
+        retryable = is_retryable(method, idempotency_key)
+        stream = kwargs.get("stream", False)
+        hooks = self.hooks if self.hooks else None
+        breaker = self.circuit_breaker
+        attempt = 0
+        while True:
+            attempt += 1
+            if breaker is not None and not breaker.allow(url):
+                raise self.CircuitOpen(endpoint_family(url), breaker.retry_in(url))
+            if self.rate_limiter is not None:
+                try:
+                    await self.rate_limiter.acquire_async(url)
+                except BaseException:
+                    if breaker is not None:
+                        breaker.release(url)
+                    raise
+            if hooks is not None:
+                event = hooks.before_request(method, url, attempt, kwargs.get("data"))
+            started = time.monotonic()
+            try:
+                response = await self._send_authenticated(
+                    method, url, idempotency_key, **kwargs
+                )
+            except Exception as error:
+                network_error = isinstance(
+                    error, (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+                )
+                if breaker is not None:
+                    breaker.record(url, network_error, time.monotonic() - started)
+                if hooks is not None:
+                    hooks.on_error(event, error)
+                if not network_error:
+                    raise
+                delay = self.retry_policy.delay(attempt, retryable)
+                if delay is None:
+                    self._record_exhausted(attempt, retryable)
+                    raise
+                reason = type(error).__name__
+            except BaseException as error:
+                # Cancellation or an interrupt, never retried
+                if breaker is not None:
+                    breaker.release(url)
+                if hooks is not None:
+                    hooks.on_error(event, error)
+                raise
+            else:
+                if breaker is not None:
+                    breaker.record(
+                        url, response.status_code >= 500, time.monotonic() - started
+                    )
+                if hooks is not None:
+                    size = (
+                        int(response.headers.get("Content-Length", 0))
+                        if stream
+                        else len(response.content)
+                    )
+                    hooks.after_response(event, response.status_code, size)
+                delay = self.retry_policy.delay(
+                    attempt, retryable, response.status_code, response.headers
+                )
+                if delay is None:
+                    if response.status_code in self.retry_policy.retry_statuses:
+                        self._record_exhausted(attempt, retryable)
+                    return response
+                reason = str(response.status_code)
+                response.release()
+            self.retry_stats.record_retry(reason, time.monotonic() - started, delay)
+            await asyncio.sleep(delay)
+
+    async def _send_authenticated(
+        self, method: str, url: str, idempotency_key: str | None, **kwargs
+    ) -> AsyncResponse:
+        """
+        Send a request with a valid access token. A request rejected with 401 is
+        sent once more after re-authenticating.
+        """
+        token = await self._access_token()
+        headers = {"Authorization": f"Bearer {token}", **kwargs.pop("headers", {})}
+        if idempotency_key is not None:
+            headers[IDEMPOTENCY_KEY_HEADER] = idempotency_key
+        response = await self._request(
+            method, f"{self.base_url}/{url}", headers=headers, **kwargs
+        )
+        if response.status_code == 401:
+            response.release()
+            token = await self._access_token(stale=token)
+            headers["Authorization"] = f"Bearer {token}"
+            response = await self._request(
+                method, f"{self.base_url}/{url}", headers=headers, **kwargs
+            )
+        return response
+
+    async def _request(self, method: str, url: str, **kwargs) -> AsyncResponse:
+        return await self.transport.send_async(
+            self._http_request, method, url, **kwargs
+        )
+
+    async def _http_request(
+        self, method: str, url: str, stream: bool = False, **kwargs
+    ) -> AsyncResponse:
+        if stream:
+            response = await self.client.request(method, url, **kwargs)
+            return AsyncResponse(response.status, response.headers, b"", response)
+        async with self.client.request(method, url, **kwargs) as response:
+            return AsyncResponse(
+                status_code=response.status,
+                headers=response.headers,
+                content=await response.read(),
+            )
@@ -0,0 +1,319 @@
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, Iterator, TypeVar
+
+from ._api_session import SessionBase
+from ._workers import Workers
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_BATCH_SIZE = 50
+
+
+@dataclass(frozen=True)
+class ActionResult:
+    """
+    Outcome of an action on one resource of a bulk action
+
+    Attributes:
+        id: The ID of the resource
+        error: The exception the action failed with, None when it was accepted
+    """
+
+    id: str
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the action was accepted"""
+        return self.error is None
+
+
+Progress = Callable[[ActionResult, int, int], None]
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+
+
+def _batches(ids: list[str], batch_size: int) -> list[list[str]]:
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    return [ids[start : start + batch_size] for start in range(0, len(ids), batch_size)]
+
+
+def _completed(
+    submit: Callable[..., Future],
+    function: Callable[[Any], Any],
+    waiting: deque,
+    concurrency: int,
+) -> Iterator[tuple[Any, Future]]:
+    """
+    Call function with the argument of every (tag, argument) pair waiting, at
+    most concurrency at a time, and yield the tag and future of each call as
+    it completes. Pairs added to waiting meanwhile are called too.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    pending: dict[Future, Any] = {}
+    while waiting or pending:
+        while waiting and len(pending) < concurrency:
+            tag, argument = waiting.popleft()
+            pending[submit(function, argument)] = tag
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future
+
+
+class _Results:
+    """The results of a bulk action, in the order of its IDs"""
+
+    def __init__(self, ids: list[str], on_progress: Progress | None):
+        self.ids = ids
+        self.results: dict[str, ActionResult] = {}
+        self.on_progress = on_progress
+
+    def add(self, batch: list[str], error: Exception | None) -> None:
+        for resource_id in batch:
+            result = ActionResult(resource_id, error)
+            self.results[resource_id] = result
+            if self.on_progress is not None:
+                self.on_progress(result, len(self.results), len(self.ids))
+
+    def ordered(self) -> dict[str, ActionResult]:
+        return {resource_id: self.results[resource_id] for resource_id in self.ids}
+
+
+def run_bulk(
+    send: Callable[[list[str]], None],
+    ids: Iterable[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_progress: Progress | None = None,
+    workers: Workers | None = None,
+) -> dict[str, ActionResult]:
+    """
+    Send an action for batches of IDs from a pool of threads. A batch that
+    fails is sent again one ID at a time, so an ID the action fails for does
+    not keep the others of its batch from being acted on, and gets its own
+    error.
+
+    Args:
+        send: Sends the action for a batch of IDs, raising when it failed
+        ids: The IDs, duplicates are acted on once
+        batch_size: The number of IDs sent in one request
+        concurrency: The number of requests in flight at once
+        on_progress: Called with every result, the number of results so far
+            and the number of IDs
+        workers: Optional pool of threads shared with other bulk operations,
+            by default threads are started for this one
+
+    Returns:
+        The result for every ID, in the order of the IDs
+    """
+    unique = list(dict.fromkeys(ids))
+    waiting = deque((batch, batch) for batch in _batches(unique, batch_size))
+    results = _Results(unique, on_progress)
+
+    def attempt(batch: list[str]) -> Exception | None:
+        try:
+            send(batch)
+        except Exception as error:
+            return error
+        return None
+
+    def run(submit: Callable[..., Future]) -> dict[str, ActionResult]:
+        for batch, future in _completed(submit, attempt, waiting, concurrency):
+            error = future.result()
+            if error is not None and len(batch) > 1:
+                waiting.extend(([resource_id], [resource_id]) for resource_id in batch)
+            else:
+                results.add(batch, error)
+        return results.ordered()
+
+    if workers is not None:
+        return run(workers.submit)
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="bulk-action"
+    ) as executor:
+        return run(executor.submit)
+
+
+async def async_run_bulk(
+    send: Callable[[list[str]], Awaitable[None]],
+    ids: Iterable[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_progress: Progress | None = None,
+) -> dict[str, ActionResult]:
+    """The asyncio counterpart of run_bulk"""
+    unique = list(dict.fromkeys(ids))
+    batches = _batches(unique, batch_size)
+    results = _Results(unique, on_progress)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(batch: list[str]) -> None:
+        async with semaphore:
+            try:
+                await send(batch)
+            except Exception as error:
+                failed: Exception | None = error
+            else:
+                failed = None
+        # Outside of the semaphore, which the single IDs need
+        if failed is not None and len(batch) > 1:
+            await asyncio.gather(*(run([resource_id]) for resource_id in batch))
+        else:
+            results.add(batch, failed)
+
+    await asyncio.gather(*(run(batch) for batch in batches))
+    return results.ordered()
+
+
+def bounded_map(
+    function: Callable[[Item], Result],
+    items: list[Item],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    workers: Workers | None = None,
+) -> list[Result]:
+    """
+    Call function with every item from a pool of threads, at most
+    concurrency at a time
+
+    Args:
+        function: The function to call
+        items: The items to call it with
+        concurrency: The number of calls running at once
+        workers: Optional pool of threads shared with other bulk operations,
+            by default threads are started for this call
+
+    Returns:
+        The results, in the order of the items
+
+    Raises:
+        Exception: The first exception raised by function, in the order of the
+            items
+    """
+    if len(items) <= 1:
+        return [function(item) for item in items]
+
+    def run(submit: Callable[..., Future]) -> list[Result]:
+        waiting = deque(enumerate(items))
+        futures = dict(_completed(submit, function, waiting, concurrency))
+        return [futures[index].result() for index in range(len(items))]
+
+    if workers is not None:
+        return run(workers.submit)
+    with ThreadPoolExecutor(
+        max_workers=min(concurrency, len(items)), thread_name_prefix="bounded-map"
+    ) as executor:
+        return run(executor.submit)
+
+
+async def async_bounded_map(
+    function: Callable[[Item], Awaitable[Result]],
+    items: list[Item],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[Result]:
+    """Await function with every item, at most concurrency at a time"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item: Item) -> Result:
+        async with semaphore:
+            return await function(item)
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+def _found(ids: list[str], responses: list[dict]) -> dict[str, dict]:
+    """
+    The resources of GET responses by ID, without the ones not found
+
+    Raises:
+        RequestFailed: If a response is an error other than not_found
+    """
+    found = {}
+    for resource_id, response in zip(ids, responses):
+        code = response.get("code")
+        if code == "not_found":
+            continue
+        if code is not None:
+            raise SessionBase.RequestFailed(response)
+        found[resource_id] = response
+    return found
+
+
+def _listed(resources: Any, key: str) -> dict[str, dict]:
+    """
+    The resources of a list response by ID
+
+    Raises:
+        RequestFailed: If the response is not a list of resources, e.g. an
+            error body
+    """
+    if not isinstance(resources, list) or not all(
+        isinstance(resource, dict) for resource in resources
+    ):
+        raise SessionBase.RequestFailed(resources)
+    return {resource[key]: resource for resource in resources}
+
+
+def _lists(ids: list[str], concurrency: int, use_list: bool | None) -> bool:
+    # A list is one round trip, as are GETs of up to concurrency IDs in parallel
+    return len(ids) > concurrency if use_list is None else use_list
+
+
+def fetch_many(
+    get: Callable[[str], dict],
+    list_all: Callable[[], list],
+    ids: Iterable[str],
+    key: str = "id",
+    concurrency: int = DEFAULT_CONCURRENCY,
+    use_list: bool | None = None,
+    workers: Workers | None = None,
+) -> list[dict | None]:
+    """
+    Get the resources with the given IDs, either by listing them all once and
+    picking the IDs, or with a GET per ID from a pool of threads
+
+    Args:
+        get: Gets the resource with an ID
+        list_all: Lists all resources, with the same fields as get
+        ids: The IDs of the resources
+        key: The field of the IDs in the resources
+        concurrency: The number of GETs in flight at once
+        use_list: Whether to list the resources, by default when there are
+            more IDs than concurrency
+        workers: Optional pool of threads shared with other bulk operations
+
+    Returns:
+        The resources in the order of the IDs, None for the ones not found
+
+    Raises:
+        RequestFailed: If the list or a GET returned an error other than
+            not_found
+    """
+    ids = list(ids)
+    unique = list(dict.fromkeys(ids))
+    if _lists(unique, concurrency, use_list):
+        by_id = _listed(list_all(), key)
+    else:
+        by_id = _found(unique, bounded_map(get, unique, concurrency, workers))
+    return [by_id.get(resource_id) for resource_id in ids]
+
+
+async def async_fetch_many(
+    get: Callable[[str], Awaitable[dict]],
+    list_all: Callable[[], Awaitable[list]],
+    ids: Iterable[str],
+    key: str = "id",
+    concurrency: int = DEFAULT_CONCURRENCY,
+    use_list: bool | None = None,
+) -> list[dict | None]:
+    """The asyncio counterpart of fetch_many"""
+    ids = list(ids)
+    unique = list(dict.fromkeys(ids))
+    if _lists(unique, concurrency, use_list):
+        by_id = _listed(await list_all(), key)
+    else:
+        by_id = _found(unique, await async_bounded_map(get, unique, concurrency))
+    return [by_id.get(resource_id) for resource_id in ids]
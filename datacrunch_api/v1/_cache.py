@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Mapping
+
+DEFAULT_MAX_ENTRIES = 256
+
+# Near-static catalogs cached by default, in seconds per endpoint
+CATALOG_TTLS: Mapping[str, float] = {
+    "images": 600.0,
+    "instance-types": 600.0,
+    "locations": 3600.0,
+    "long-term": 3600.0,
+    "volume-types": 3600.0,
+}
+
+
+def _path(url: str) -> str:
+    return url.split("?", 1)[0].strip("/")
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """
+    The body of a cached GET response, its ETag if the server sent one and
+    the monotonic time after which it has to be revalidated
+    """
+
+    content: bytes
+    etag: str | None
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+class ResponseCache:
+    """
+    Opt-in cache of GET responses with a TTL per endpoint and an LRU bound.
+
+    Fresh entries are served from memory. Expired entries with an ETag are
+    revalidated with If-None-Match, so an unchanged catalog costs a 304 without
+    a body. Entries are keyed by URL including the query string, so e.g. the
+    instance types are cached once per currency.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] = CATALOG_TTLS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            ttls: Seconds to cache each endpoint for, by endpoint path without
+                query string. Other endpoints are never cached.
+            max_entries: Number of responses kept before the least recently
+                used one is evicted
+        """
+        self.ttls = dict(ttls)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cacheable(self, url: str) -> bool:
+        """Whether responses of an endpoint are cached"""
+        return _path(url) in self.ttls
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        """
+        Return the entry of a URL, fresh or expired, and count a hit if it is
+        fresh
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            self._entries.move_to_end(url)
+            if entry.fresh:
+                self.hits += 1
+            return entry
+
+    def store(self, url: str, content: bytes, etag: str | None) -> CacheEntry:
+        """Record a response fetched in full, which counts as a miss"""
+        entry = CacheEntry(content, etag, time.monotonic() + self.ttls[_path(url)])
+        with self._lock:
+            self.misses += 1
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def revalidated(self, url: str, entry: CacheEntry) -> CacheEntry:
+        """Restart the TTL of an entry the server confirmed as unchanged"""
+        entry = CacheEntry(
+            entry.content, entry.etag, time.monotonic() + self.ttls[_path(url)]
+        )
+        with self._lock:
+            self.revalidations += 1
+            self._entries[url] = entry
+        return entry
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """
+        Drop cached responses
+
+        Args:
+            endpoint: Endpoint path whose responses are dropped for every query
+                string, e.g. "instance-types". Drops everything when None.
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+            endpoint = _path(endpoint)
+            for url in [url for url in self._entries if _path(url) == endpoint]:
+                del self._entries[url]
+
+    def as_dict(self) -> dict:
+        """A snapshot of the hit and miss counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+            }
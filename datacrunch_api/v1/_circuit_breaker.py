@@ -0,0 +1,218 @@
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+
+from ._rate_limiter import endpoint_family
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """State of the circuit of one endpoint family"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class _Circuit:
+    outcomes: deque = field(default_factory=deque)
+    state: CircuitState = CircuitState.CLOSED
+    opened_at: float = 0.0
+    probes: int = 0
+    probe_successes: int = 0
+    rejected: int = 0
+    opened: int = 0
+
+
+class CircuitBreaker:
+    """
+    Per endpoint family circuit breaker.
+
+    Endpoint families are the first path segment of a URL, which is the value
+    of one of the Endpoints enums of the resource modules, e.g.
+    "container-deployments". Each family keeps the outcomes of its last window
+    requests. A family's circuit opens once at least minimum_calls outcomes
+    were recorded and the share of failures, responses with a 5xx status or no
+    response at all, or of slow calls reaches its threshold. While open,
+    requests fail fast. After open_seconds the circuit turns half-open and lets
+    up to half_open_probes requests through. It closes when all of them
+    succeed and opens again on the first failing probe.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float | None = None,
+        slow_call_rate: float = 0.5,
+        window: int = 20,
+        minimum_calls: int = 10,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 3,
+    ):
+        """
+        Initialize the circuit breaker
+
+        Args:
+            failure_rate: Share of failed requests in the window opening the
+                circuit
+            slow_call_seconds: Duration from which a request counts as slow,
+                None to ignore latency
+            slow_call_rate: Share of slow requests in the window opening the
+                circuit
+            window: Number of most recent requests the rates are computed over
+            minimum_calls: Number of requests needed before the circuit opens
+            open_seconds: Seconds the circuit stays open before probing
+            half_open_probes: Requests let through while half-open, all of which
+                must succeed to close the circuit
+        """
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.window = window
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, url: str) -> bool:
+        """
+        Whether a request to an endpoint may be sent. Every allowed request
+        must be followed by a call to record(), or to release() when it ended
+        without an outcome, e.g. because it was cancelled.
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint_family(url))
+            if circuit.state == CircuitState.OPEN:
+                if time.monotonic() - circuit.opened_at < self.open_seconds:
+                    circuit.rejected += 1
+                    return False
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.probes = circuit.probe_successes = 0
+            if circuit.state == CircuitState.HALF_OPEN:
+                if circuit.probes >= self.half_open_probes:
+                    circuit.rejected += 1
+                    return False
+                circuit.probes += 1
+            return True
+
+    def record(self, url: str, failed: bool, duration: float) -> None:
+        """
+        Record the outcome of a request allowed by allow()
+
+        Args:
+            url: The API endpoint URL
+            failed: Whether the request failed, i.e. got no or a 5xx response
+            duration: Seconds the request took
+        """
+        slow = self.slow_call_seconds is not None and duration >= self.slow_call_seconds
+        family = endpoint_family(url)
+        with self._lock:
+            circuit = self._circuit(family)
+            if circuit.state == CircuitState.HALF_OPEN:
+                if failed or slow:
+                    self._open(family, circuit)
+                else:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.half_open_probes:
+                        circuit.state = CircuitState.CLOSED
+                        circuit.outcomes.clear()
+                        logger.info("Circuit of %s closed", family)
+                return
+            if circuit.state == CircuitState.OPEN:
+                return
+            circuit.outcomes.append((failed, slow))
+            if len(circuit.outcomes) > self.window:
+                circuit.outcomes.popleft()
+            if len(circuit.outcomes) < self.minimum_calls:
+                return
+            calls = len(circuit.outcomes)
+            failures = sum(1 for failed, _ in circuit.outcomes if failed)
+            slow_calls = sum(1 for _, slow in circuit.outcomes if slow)
+            if failures and failures >= self.failure_rate * calls:
+                self._open(family, circuit)
+            elif slow_calls and slow_calls >= self.slow_call_rate * calls:
+                self._open(family, circuit)
+
+    def release(self, url: str) -> None:
+        """
+        Give back the probe slot of a request allowed by allow() that ended
+        without an outcome, so a cancelled probe does not keep a half-open
+        circuit from letting other probes through
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint_family(url))
+            if circuit.state == CircuitState.HALF_OPEN and circuit.probes > 0:
+                circuit.probes -= 1
+
+    def state(self, url: str) -> CircuitState:
+        """The state of the circuit of an endpoint or endpoint family"""
+        with self._lock:
+            circuit = self._circuits.get(endpoint_family(url))
+            if circuit is None:
+                return CircuitState.CLOSED
+            if (
+                circuit.state == CircuitState.OPEN
+                and time.monotonic() - circuit.opened_at >= self.open_seconds
+            ):
+                return CircuitState.HALF_OPEN
+            return circuit.state
+
+    def retry_in(self, url: str) -> float:
+        """Seconds until an open circuit lets probe requests through"""
+        with self._lock:
+            circuit = self._circuits.get(endpoint_family(url))
+            if circuit is None or circuit.state != CircuitState.OPEN:
+                return 0.0
+            return max(0.0, circuit.opened_at + self.open_seconds - time.monotonic())
+
+    def reset(self, url: str | None = None) -> None:
+        """Close the circuit of an endpoint family, or of all families"""
+        with self._lock:
+            if url is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(endpoint_family(url), None)
+
+    def as_dict(self) -> dict:
+        """A snapshot of the state and failure rates of every endpoint family"""
+        with self._lock:
+            families = list(self._circuits.items())
+        snapshot = {}
+        for family, circuit in families:
+            outcomes = list(circuit.outcomes)
+            snapshot[family] = {
+                "state": self.state(family).value,
+                "calls": len(outcomes),
+                "failure_rate": (
+                    sum(1 for failed, _ in outcomes if failed) / len(outcomes)
+                    if outcomes
+                    else 0.0
+                ),
+                "slow_call_rate": (
+                    sum(1 for _, slow in outcomes if slow) / len(outcomes)
+                    if outcomes
+                    else 0.0
+                ),
+                "opened": circuit.opened,
+                "rejected": circuit.rejected,
+            }
+        return snapshot
+
+    def _circuit(self, family: str) -> _Circuit:
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            circuit = self._circuits[family] = _Circuit()
+        return circuit
+
+    def _open(self, family: str, circuit: _Circuit) -> None:
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.opened += 1
+        circuit.outcomes.clear()
+        logger.warning("Circuit of %s opened for %.0f s", family, self.open_seconds)
@@ -0,0 +1,88 @@
+import json
+from typing import Any, Protocol
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore
+
+
+class JsonCodec(Protocol):
+    """Encodes request bodies to and decodes response bodies from JSON bytes"""
+
+    name: str
+
+    def encode(self, value: Any) -> bytes: ...
+
+    def decode(self, data: bytes | str) -> Any: ...
+
+
+class StdlibCodec:
+    """JSON codec using the standard library json module"""
+
+    name = "json"
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        )
+
+    def encode(self, value: Any) -> bytes:
+        return self._encoder.encode(value).encode()
+
+    def decode(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """JSON codec using orjson"""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError(
+                "OrjsonCodec requires orjson, install datacrunch_api[fast]"
+            )
+
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def decode(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec:
+    """JSON codec using msgspec"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError(
+                "MsgspecCodec requires msgspec, install datacrunch_api[fast]"
+            )
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+    def decode(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+def default_codec() -> JsonCodec:
+    """
+    The fastest installed codec: orjson, then msgspec, then the standard library
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+    if msgspec is not None:
+        return MsgspecCodec()
+    return StdlibCodec()
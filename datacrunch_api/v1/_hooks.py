@@ -0,0 +1,134 @@
+import logging
+import time
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+# Path segments naming a sub-resource rather than identifying a resource
+STATIC_SEGMENTS = frozenset(
+    {
+        "environment-variables",
+        "pause",
+        "purge-queue",
+        "replicas",
+        "restart",
+        "resume",
+        "scaling",
+        "status",
+        "trash",
+    }
+)
+
+
+def endpoint_template(url: str) -> str:
+    """
+    The endpoint of a URL with identifiers replaced by {id} and without query
+    string, e.g. "container-deployments/{id}/status", to keep metric labels
+    bounded
+    """
+    family, *segments = url.split("?", 1)[0].strip("/").split("/")
+    return "/".join(
+        [family]
+        + [segment if segment in STATIC_SEGMENTS else "{id}" for segment in segments]
+    )
+
+
+@dataclass(slots=True)
+class RequestEvent:
+    """
+    One attempt at sending a request. The same event is passed to
+    before_request and then to either after_response or on_error, so hooks can
+    keep state between them in context.
+    """
+
+    method: str
+    url: str
+    endpoint: str
+    attempt: int
+    request_bytes: int
+    started_at: float
+    status: int | None = None
+    response_bytes: int | None = None
+    duration: float | None = None
+    error: BaseException | None = None
+    context: dict = field(default_factory=dict)
+    _started: float = field(default=0.0, repr=False)
+
+
+class RequestHook:
+    """
+    Base class of request hooks, whose methods do nothing. Subclasses override
+    the events they are interested in.
+    """
+
+    def before_request(self, event: RequestEvent) -> None:
+        """Called before every attempt, including retries"""
+
+    def after_response(self, event: RequestEvent) -> None:
+        """Called when an attempt received a response, whatever its status"""
+
+    def on_error(self, event: RequestEvent) -> None:
+        """
+        Called when an attempt failed without a response, e.g. on a timeout or
+        when it was cancelled
+        """
+
+
+class Hooks:
+    """
+    The request hooks registered with a session. Exceptions raised by hooks
+    are logged and never affect the request. Sessions skip all event handling
+    while no hook is registered.
+    """
+
+    def __init__(self, *hooks: RequestHook):
+        self.hooks: list[RequestHook] = list(hooks)
+
+    def __bool__(self) -> bool:
+        return bool(self.hooks)
+
+    def add(self, hook: RequestHook) -> RequestHook:
+        """Register a hook and return it"""
+        self.hooks.append(hook)
+        return hook
+
+    def remove(self, hook: RequestHook) -> None:
+        """Unregister a hook"""
+        self.hooks.remove(hook)
+
+    def before_request(
+        self, method: str, url: str, attempt: int, body: bytes | None
+    ) -> RequestEvent:
+        event = RequestEvent(
+            method=method.upper(),
+            url=url,
+            endpoint=endpoint_template(url),
+            attempt=attempt,
+            request_bytes=len(body) if body else 0,
+            started_at=time.time(),
+            _started=time.perf_counter(),
+        )
+        self._emit("before_request", event)
+        return event
+
+    def after_response(
+        self, event: RequestEvent, status: int, response_bytes: int
+    ) -> None:
+        event.duration = time.perf_counter() - event._started
+        event.status = status
+        event.response_bytes = response_bytes
+        self._emit("after_response", event)
+
+    def on_error(self, event: RequestEvent, error: BaseException) -> None:
+        event.duration = time.perf_counter() - event._started
+        event.error = error
+        self._emit("on_error", event)
+
+    def _emit(self, name: str, event: RequestEvent) -> None:
+        for hook in self.hooks:
+            try:
+                getattr(hook, name)(event)
+            except Exception:
+                logger.warning(
+                    "Request hook %r failed in %s", hook, name, exc_info=True
+                )
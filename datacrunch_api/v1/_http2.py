@@ -0,0 +1,231 @@
+import asyncio
+import logging
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Mapping
+
+import requests
+
+from ._transport import Transport, _requests_response
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection-specific headers, which HTTP/2 forbids, left out of the headers
+# of the session
+HOP_BY_HOP_HEADERS = frozenset(
+    {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"}
+)
+
+
+def _import_httpx() -> Any:
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover - optional dependency
+        raise ImportError(
+            "Http2Transport requires httpx, install datacrunch_api[http2]"
+        ) from None
+    return httpx
+
+
+def _h2_installed() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:  # pragma: no cover - optional dependency
+        return False
+    return True
+
+
+def _timeout(value: Any) -> "httpx.Timeout":
+    """
+    The httpx timeout of a request timeout of either session, a (connect, read)
+    tuple for ApiSession or an aiohttp.ClientTimeout for AsyncApiSession
+    """
+    httpx = _import_httpx()
+    if value is None:
+        return httpx.Timeout(None)
+    if isinstance(value, tuple):
+        connect, read = value
+    else:
+        connect, read = value.sock_connect, value.sock_read
+    return httpx.Timeout(None, connect=connect, read=read, write=read)
+
+
+class Http2Transport(Transport):
+    """
+    Sends the requests of a session with httpx over HTTP/2, which multiplexes
+    concurrent requests to a host over a single connection instead of opening
+    a connection for each of them. Servers that do not offer HTTP/2 during the
+    TLS handshake are spoken to over HTTP/1.1, as are all servers when the h2
+    package is not installed.
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        prior_knowledge: bool = False,
+        max_connections: int = 10,
+        verify: bool = True,
+    ):
+        """
+        Initialize the transport
+
+        Args:
+            http2: Offer HTTP/2, False sends every request over HTTP/1.1
+            prior_knowledge: Speak HTTP/2 without negotiating it, as needed for
+                plain http:// URLs. Falls back to HTTP/1.1 when the server
+                rejects the first connection.
+            max_connections: Connections kept open, per host with HTTP/1.1 and
+                in total. A single HTTP/2 connection carries many requests.
+            verify: Verify the TLS certificate of the server
+        """
+        self.http2 = http2 and _h2_installed()
+        if http2 and not self.http2:
+            logger.warning("h2 is not installed, sending requests over HTTP/1.1")
+        self.prior_knowledge = self.http2 and prior_knowledge
+        self.max_connections = max_connections
+        self.verify = verify
+        self.http_versions: Counter[str] = Counter()
+        self._headers: Mapping[str, str] = {}
+        self._client: "httpx.Client | None" = None
+        self._async_client: "httpx.AsyncClient | None" = None
+        self._fell_back = False
+        self._lock = threading.Lock()
+
+    def attach(self, session: Any) -> None:
+        # ApiSession keeps the authorization header in its requests session,
+        # AsyncApiSession passes it with every request
+        headers = getattr(getattr(session, "session", None), "headers", None)
+        if headers is not None:
+            self._headers = headers
+
+    @property
+    def client(self) -> "httpx.Client":
+        """The httpx client of ApiSession, created on first use"""
+        with self._lock:
+            if self._client is None:
+                self._client = _import_httpx().Client(**self._client_options())
+            return self._client
+
+    @property
+    def async_client(self) -> "httpx.AsyncClient":
+        """The httpx client of AsyncApiSession, created on first use"""
+        if self._async_client is None:
+            self._async_client = _import_httpx().AsyncClient(**self._client_options())
+        return self._async_client
+
+    def send(self, send: Callable[..., Any], method: str, url: str, **kwargs) -> Any:
+        httpx = _import_httpx()
+        options = self._request_options(kwargs)
+        try:
+            try:
+                response = self.client.request(method, url, **options)
+            except (httpx.ProtocolError, httpx.ReadError, httpx.WriteError):
+                stale = self._fall_back()
+                if stale is None:
+                    raise
+                if stale[0] is not None:
+                    stale[0].close()
+                response = self.client.request(method, url, **options)
+        except httpx.TimeoutException as error:
+            raise requests.Timeout(str(error)) from error
+        except httpx.TransportError as error:
+            raise requests.ConnectionError(str(error)) from error
+        self._count(response.http_version)
+        return _requests_response(
+            url, response.status_code, response.headers, response.content
+        )
+
+    async def send_async(
+        self, send: Callable[..., Awaitable[Any]], method: str, url: str, **kwargs
+    ) -> Any:
+        import aiohttp
+
+        from ._async_api_session import AsyncResponse
+
+        httpx = _import_httpx()
+        options = self._request_options(kwargs)
+        try:
+            try:
+                response = await self.async_client.request(method, url, **options)
+            except (httpx.ProtocolError, httpx.ReadError, httpx.WriteError):
+                stale = self._fall_back()
+                if stale is None:
+                    raise
+                if stale[1] is not None:
+                    await stale[1].aclose()
+                response = await self.async_client.request(method, url, **options)
+        except httpx.TimeoutException as error:
+            raise asyncio.TimeoutError(str(error)) from error
+        except httpx.TransportError as error:
+            raise aiohttp.ClientConnectionError(str(error)) from error
+        self._count(response.http_version)
+        return AsyncResponse(response.status_code, response.headers, response.content)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
+
+    def _client_options(self) -> dict[str, Any]:
+        httpx = _import_httpx()
+        return {
+            "http1": not self.prior_knowledge,
+            "http2": self.http2,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            "verify": self.verify,
+        }
+
+    def _request_options(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        headers = {
+            name: value
+            for name, value in self._headers.items()
+            if name.lower() not in HOP_BY_HOP_HEADERS
+        }
+        headers.update(kwargs.get("headers") or {})
+        return {
+            "headers": headers,
+            "content": kwargs.get("data"),
+            "json": kwargs.get("json"),
+            "timeout": _timeout(kwargs.get("timeout")),
+        }
+
+    def _fall_back(
+        self,
+    ) -> "tuple[httpx.Client | None, httpx.AsyncClient | None] | None":
+        """
+        Switch to HTTP/1.1 after a server rejected HTTP/2 with prior knowledge,
+        by closing the connection or answering in another protocol, before
+        answering any request over it. Returns the clients replaced,
+        to be closed by the caller before resending, or None if the error is
+        not a rejection of HTTP/2. Requests that failed on the replaced
+        clients concurrently are resent too.
+        """
+        with self._lock:
+            if self._fell_back and not self.http_versions["HTTP/1.1"]:
+                return None, None
+            if not self.prior_knowledge or self.http_versions["HTTP/2"]:
+                return None
+            logger.warning("Server rejected HTTP/2, falling back to HTTP/1.1")
+            self.prior_knowledge = False
+            self.http2 = False
+            self._fell_back = True
+            stale = self._client, self._async_client
+            self._client = self._async_client = None
+        return stale
+
+    def _count(self, http_version: str) -> None:
+        with self._lock:
+            self.http_versions[http_version] += 1
@@ -0,0 +1,198 @@
+import asyncio
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping, Protocol
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore
+
+
+def endpoint_family(url: str) -> str:
+    """
+    The family of an endpoint, which is the first segment of its path, e.g.
+    "instances" for both "instances" and "instances/123"
+    """
+    return url.lstrip("/").split("?", 1)[0].split("/", 1)[0]
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    A token bucket refilling at rate requests per second and holding at most
+    burst requests
+    """
+
+    rate: float
+    burst: float = 1.0
+
+    def __post_init__(self):
+        if self.rate <= 0 or self.burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+
+class BucketStore(Protocol):
+    """Where the state of the token buckets of a RateLimiter is kept"""
+
+    def reserve(self, family: str, limit: RateLimit) -> float:
+        """
+        Take one token from the bucket of a family, going into debt if it is
+        empty
+
+        Returns:
+            Seconds the caller has to wait before sending its request
+        """
+        ...
+
+
+def _take(state: list[float] | None, limit: RateLimit, now: float) -> float:
+    """
+    Take one token from a bucket state [tokens, updated_at] in place and return
+    the seconds until that token is available
+    """
+    if state is None:
+        return 0.0
+    tokens, updated_at = state
+    tokens = min(limit.burst, tokens + max(0.0, now - updated_at) * limit.rate) - 1
+    state[:] = [tokens, now]
+    return max(0.0, -tokens / limit.rate)
+
+
+class MemoryBucketStore:
+    """
+    Token buckets held in memory, shared by all threads and event loops using
+    the same RateLimiter
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: dict[str, list[float]] = {}
+
+    def reserve(self, family: str, limit: RateLimit) -> float:
+        now = time.monotonic()
+        with self._lock:
+            state = self._buckets.setdefault(family, [limit.burst, now])
+            return _take(state, limit, now)
+
+
+class FileBucketStore:
+    """
+    Token buckets kept in a file, shared by all processes on one host using
+    the same path. Updates are serialized with an exclusive file lock, which is
+    skipped on platforms without fcntl. The file is not synced to disk, as
+    the state only has to be shared while the processes run.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Initialize the store
+
+        Args:
+            path: File holding the bucket state, created when missing
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def reserve(self, family: str, limit: RateLimit) -> float:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.path, "a+") as file:
+            if fcntl is not None:
+                fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                try:
+                    buckets = json.loads(file.read() or "{}")
+                except ValueError:
+                    buckets = {}
+                # Wall clock time, as monotonic clocks are not comparable
+                # between processes on every platform
+                now = time.time()
+                state = buckets.setdefault(family, [limit.burst, now])
+                delay = _take(state, limit, now)
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps(buckets))
+                file.flush()
+                return delay
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(file, fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    """
+    Client-side token bucket rate limiter with one bucket per endpoint family.
+
+    Requests over the budget are delayed rather than rejected: the caller
+    reserves a token, possibly going into debt, and sleeps until the token is
+    due. Reservations are short critical sections, so one limiter can be shared
+    by threads, event loops and, with a FileBucketStore, processes.
+    """
+
+    def __init__(
+        self,
+        default: RateLimit | None = None,
+        limits: Mapping[str, RateLimit] | None = None,
+        store: BucketStore | None = None,
+    ):
+        """
+        Initialize the rate limiter
+
+        Args:
+            default: Limit of every endpoint family without its own limit.
+                Families are not limited when both are missing.
+            limits: Limits per endpoint family, e.g. {"instances": RateLimit(5)}
+            store: Where bucket state is kept, defaults to a MemoryBucketStore
+        """
+        self.default = default
+        self.limits = dict(limits or {})
+        self.store = store if store is not None else MemoryBucketStore()
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, url: str) -> float:
+        """
+        Reserve a request to an endpoint
+
+        Args:
+            url: The API endpoint URL, relative to the base URL
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        family = endpoint_family(url)
+        limit = self.limits.get(family, self.default)
+        if limit is None:
+            return 0.0
+        delay = self.store.reserve(family, limit)
+        if delay > 0:
+            with self._lock:
+                self.throttled += 1
+                self.throttled_seconds += delay
+        return delay
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to an endpoint may be sent"""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, url: str) -> None:
+        """
+        Wait without blocking the event loop until a request may be sent.
+        Reservations in stores other than a MemoryBucketStore, which may wait
+        for a file lock or do other I/O, are made from the default executor.
+        """
+        if isinstance(self.store, MemoryBucketStore):
+            delay = self.reserve(url)
+        else:
+            delay = await asyncio.get_running_loop().run_in_executor(
+                None, self.reserve, url
+            )
+        if delay > 0:
+            await asyncio.sleep(delay)
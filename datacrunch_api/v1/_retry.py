@@ -0,0 +1,142 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Mapping
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# PUT is deliberately missing: the API uses it for actions such as cloning a
+# volume, which must not be repeated without an idempotency key.
+IDEMPOTENT_METHODS = frozenset({"DELETE", "GET", "HEAD", "OPTIONS"})
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+def retry_after_seconds(headers: Mapping[str, str] | None) -> float | None:
+    """
+    Parse a Retry-After header given either as seconds or as an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    value = (headers or {}).get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    Retries use capped exponential backoff with full jitter, unless the response
+    carries a Retry-After header. Requests with non-idempotent methods are only
+    retried when they carry an idempotency key.
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    max_retry_after: float = 120.0
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Full jitter backoff after the given failed attempt, starting at 1
+        """
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+
+    def delay(
+        self,
+        attempt: int,
+        retryable: bool,
+        status: int | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> float | None:
+        """
+        Decide whether to retry after a failed attempt and for how long to wait.
+
+        Args:
+            attempt: Number of the attempt that just failed, starting at 1
+            retryable: Whether the request may be sent again at all
+            status: Response status, or None if no response was received
+            headers: Response headers, if any
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if not retryable or attempt >= self.max_attempts:
+            return None
+        if status is not None and status not in self.retry_statuses:
+            return None
+        retry_after = retry_after_seconds(headers)
+        if retry_after is None:
+            return self.backoff(attempt)
+        if retry_after > self.max_retry_after:
+            return None
+        return retry_after
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+@dataclass
+class RetryStats:
+    """
+    Thread-safe counters describing how often requests were retried and how
+    much latency the retries added.
+    """
+
+    retries: int = 0
+    exhausted: int = 0
+    backoff_seconds: float = 0.0
+    failed_attempt_seconds: float = 0.0
+    reasons: dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def added_latency_seconds(self) -> float:
+        """Time spent in failed attempts and backoff before the final attempt"""
+        return self.backoff_seconds + self.failed_attempt_seconds
+
+    def record_retry(self, reason: str, attempt_seconds: float, delay: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += delay
+            self.failed_attempt_seconds += attempt_seconds
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+    def as_dict(self) -> dict:
+        """A snapshot of the counters"""
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "backoff_seconds": self.backoff_seconds,
+                "failed_attempt_seconds": self.failed_attempt_seconds,
+                "added_latency_seconds": self.added_latency_seconds,
+                "reasons": dict(self.reasons),
+            }
+
+
+def is_retryable(method: str, idempotency_key: str | None) -> bool:
+    """Whether a request may be sent more than once"""
+    return method.upper() in IDEMPOTENT_METHODS or idempotency_key is not None
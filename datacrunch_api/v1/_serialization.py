@@ -0,0 +1,507 @@
+import copy
+import operator
+import threading
+from collections import OrderedDict
+from collections.abc import Collection, Mapping
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, Callable
+
+from dataclasses_json import cfg  # type: ignore
+
+from ._codec import JsonCodec
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# Values that dataclasses_json copies unchanged, skipped without a call
+_ATOMIC = frozenset({str, int, float, bool, type(None)})
+# Field overrides of dataclasses_json applied by the generated encoders, classes
+# with any other override are encoded by their to_dict
+_SUPPORTED_OVERRIDES = frozenset({"exclude"})
+# Attribute of instances holding their cache entry, along with the items their
+# lists held when the entry is keyed by the contents of lists
+_MEMO = "_serialized"
+# Key of values that cannot be keyed by their contents, which are not cached
+_MUTABLE = object()
+
+
+class _Snapshot(tuple):
+    """
+    Key of a value that may change after it was serialized, such as a list,
+    which identifies its contents at the time it was taken
+    """
+
+
+def _unstable(key: tuple) -> bool:
+    """Whether a key holds the snapshot of a value that may change"""
+    return any(
+        type(part) is _Snapshot or (type(part) is _Entry and not part.stable)
+        for part in key
+    )
+
+
+def _unchanged(guards: tuple) -> bool:
+    """Whether the lists of guards still hold the same items"""
+    return all(
+        len(items) == len(held) and all(map(operator.is_, items, held))
+        for items, held in guards
+    )
+
+
+_encoders: dict[type, Callable[[Any], dict]] = {}
+# Names and exclude predicates of the fields of each class, None for classes
+# encoded by their to_dict
+_specs: dict[type, tuple[tuple[str, Callable[[Any], bool] | None], ...] | None] = {}
+_keyed_encoders: dict[type, Callable[[Any, Callable], tuple[Any, dict]]] = {}
+
+
+def to_dict(value: Any) -> dict:
+    """
+    Convert a dataclass to the dict its to_dict method of dataclasses_json
+    returns, with an encoder generated once per class. The encoder reads each
+    field directly instead of looking up the overrides of the class on every
+    call.
+
+    Args:
+        value: A dataclass instance
+
+    Returns:
+        The dict to send as the JSON body of a request
+    """
+    encoder = _encoders.get(type(value))
+    if encoder is None:
+        encoder = encoder_of(type(value))
+    return encoder(value)
+
+
+def encoder_of(cls: type) -> Callable[[Any], dict]:
+    """
+    The encoder of a dataclass, generated on first use
+
+    Raises:
+        TypeError: If cls is not a dataclass
+    """
+    encoder = _encoders.get(cls)
+    if encoder is None:
+        encoder = _compile(cls)
+        _encoders[cls] = encoder
+    return encoder
+
+
+def _field_specs(
+    cls: type,
+) -> tuple[tuple[str, Callable[[Any], bool] | None], ...] | None:
+    if cls in _specs:
+        return _specs[cls]
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} is not a dataclass")
+    specs: tuple[tuple[str, Callable[[Any], bool] | None], ...] | None = ()
+    if getattr(cls, "dataclass_json_config", None):
+        specs = None
+    for field in fields(cls):
+        overrides = field.metadata.get("dataclasses_json", {})
+        if specs is None or not overrides.keys() <= _SUPPORTED_OVERRIDES:
+            specs = None
+            break
+        specs += ((field.name, overrides.get("exclude")),)
+    _specs[cls] = specs
+    return specs
+
+
+def _compile(cls: type) -> Callable[[Any], dict]:
+    """Generate the source of the encoder of a dataclass and compile it"""
+    specs = _field_specs(cls)
+    if specs is None:
+        return cls.to_dict  # type: ignore[attr-defined]
+    namespace: dict[str, Any] = {"_ATOMIC": _ATOMIC, "_value": _value}
+    lines = ["def encode(obj):", "    data = {}"]
+    for index, (name, exclude) in enumerate(specs):
+        lines += [
+            f"    value = obj.{name}",
+            "    if type(value) not in _ATOMIC:",
+            "        value = _value(value)",
+        ]
+        if exclude is None:
+            lines.append(f"    data[{name!r}] = value")
+        else:
+            namespace[f"exclude_{index}"] = exclude
+            lines += [
+                f"    if not exclude_{index}(value):",
+                f"        data[{name!r}] = value",
+            ]
+    lines.append("    return data")
+    exec("\n".join(lines), namespace)
+    return namespace["encode"]
+
+
+def _compile_keyed(cls: type) -> Callable[[Any, Callable], tuple[Any, dict]]:
+    """
+    Generate an encoder of a frozen dataclass that also returns the structural
+    key of the instance, converting field values other than atomic ones with
+    the convert function of a SerializationCache. The key is _MUTABLE when a
+    field holds a value that cannot be keyed.
+    """
+    specs = _field_specs(cls)
+    if specs is None:
+        # What the overrides of the class do with its fields is not known
+        return lambda obj, convert: (_MUTABLE, cls.to_dict(obj))  # type: ignore
+    namespace: dict[str, Any] = {"_ATOMIC": _ATOMIC, "_MUTABLE": _MUTABLE, "cls": cls}
+    lines = ["def encode(obj, convert):", "    data = {}"]
+    for index, (name, exclude) in enumerate(specs):
+        lines += [
+            f"    value = obj.{name}",
+            "    kind = type(value)",
+            "    if kind is str or value is None:",
+            f"        key_{index} = value",
+            "    elif kind in _ATOMIC:",
+            f"        key_{index} = (kind, value)",
+            "    else:",
+            f"        key_{index}, value = convert(value)",
+        ]
+        if exclude is None:
+            lines.append(f"    data[{name!r}] = value")
+        else:
+            namespace[f"exclude_{index}"] = exclude
+            lines += [
+                f"    if not exclude_{index}(value):",
+                f"        data[{name!r}] = value",
+            ]
+    keys = "".join(f", key_{index}" for index in range(len(specs)))
+    lines += [
+        f"    key = (cls{keys})",
+        "    return (_MUTABLE if _MUTABLE in key else key), data",
+    ]
+    exec("\n".join(lines), namespace)
+    return namespace["encode"]
+
+
+def _value(value: Any) -> Any:
+    """Convert a field value the way dataclasses_json does"""
+    encoder = _encoders.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return encoder_of(type(value))(value)
+    if isinstance(value, Mapping):
+        return {_item(key): _item(item) for key, item in value.items()}
+    if isinstance(value, Collection) and not isinstance(value, (str, bytes, Enum)):
+        return [_item(item) for item in value]
+    encoder = cfg.global_config.encoders.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    return copy.deepcopy(value)
+
+
+def _item(value: Any) -> Any:
+    return value if type(value) in _ATOMIC else _value(value)
+
+
+def _copy(data: Any) -> Any:
+    """A copy of the dicts and lists of a converted value, sharing the rest"""
+    kind = type(data)
+    if kind is dict:
+        return {name: _copy(item) for name, item in data.items()}
+    if kind is list:
+        return [_copy(item) for item in data]
+    return data
+
+
+class _Entry:
+    """
+    The serialized forms of a frozen dataclass and its structural key, stable
+    when the key holds no snapshot, so instances may remember their entry
+    """
+
+    __slots__ = ("key", "data", "encoded", "stable")
+
+    def __init__(self, key: tuple, data: dict):
+        self.key = key
+        self.data = data
+        self.encoded: dict[type, bytes] = {}
+        self.stable = not _unstable(key)
+
+
+class SerializationCache:
+    """
+    Bounded LRU cache of the serialized forms of frozen dataclasses, as a dict
+    and as JSON bytes per codec class.
+
+    Entries are keyed by the contents of a value, so structurally equal values
+    share one entry. Values whose fields hold only atomic values, enums,
+    tuples, frozensets or other such dataclasses cannot change, so each
+    instance remembers its entry and serializing it again costs a lookup.
+    Values with list fields, such as a Deployment, are keyed by the contents
+    of their lists, and an instance remembers its entry along with the items
+    its lists held, so a list modified since leads to another entry rather
+    than to a stale one. Callers get copies of
+    the cached dicts, which they may modify; encode() reuses the cached bytes
+    for a copy that was not. Values of other classes, or holding dicts or
+    other mutable values, and values of classes marked sensitive such as
+    Secret and SSHKey, are converted without caching.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Number of distinct values kept before the least
+                recently used one is evicted
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.encode_hits = 0
+        self.encode_misses = 0
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        # Entries by the id of the copies handed out by to_dict, to find the
+        # bytes of a request body. Ids may be reused once a copy is gone, so
+        # the bytes are only used for a body equal to the entry.
+        self._handed: OrderedDict[int, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        # The lists met by the lookup of a value in progress in each thread,
+        # with the items they held, None while no lookup records them
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def to_dict(self, value: Any) -> dict:
+        """
+        The dict of a dataclass, the same as its to_dict method of
+        dataclasses_json returns
+
+        Args:
+            value: A dataclass instance
+
+        Returns:
+            The dict, owned by the caller
+        """
+        if not self._cached(value):
+            return to_dict(value)
+        entry, data = self._lookup(value)
+        # Even an uncached value holds the shared dicts of cached sub-objects
+        body = _copy(data)
+        if entry is not None:
+            with self._lock:
+                self._handed[id(body)] = entry
+                if len(self._handed) > self.max_entries:
+                    self._handed.popitem(last=False)
+        return body
+
+    def to_bytes(self, value: Any, codec: JsonCodec) -> bytes:
+        """
+        The JSON encoding of a dataclass
+
+        Args:
+            value: A dataclass instance
+            codec: The codec to encode it with
+
+        Returns:
+            The encoded dict of the value, cached per codec class when the
+            value is
+        """
+        if not self._cached(value):
+            return codec.encode(to_dict(value))
+        entry, data = self._lookup(value)
+        if entry is None:
+            return codec.encode(data)
+        return self._encoded(entry, codec)
+
+    def encode(self, body: Any, codec: JsonCodec) -> bytes:
+        """
+        Encode a request body, reusing the bytes of a dict returned by to_dict
+        that was not modified since
+
+        Args:
+            body: A dict, which need not come from the cache, or a dataclass
+            codec: The codec to encode it with
+
+        Returns:
+            The JSON body
+        """
+        if is_dataclass(body):
+            return self.to_bytes(body, codec)
+        with self._lock:
+            entry = self._handed.get(id(body))
+        if entry is None or body != entry.data:
+            return codec.encode(body)
+        return self._encoded(entry, codec)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._handed.clear()
+            self.hits = self.misses = self.evictions = 0
+            self.encode_hits = self.encode_misses = 0
+
+    def as_dict(self) -> dict:
+        """A snapshot of the hit and miss counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "encode_hits": self.encode_hits,
+                "encode_misses": self.encode_misses,
+            }
+
+    def _cached(self, value: Any) -> bool:
+        """Whether a value is of a class the cache keeps"""
+        category = _categories.get(type(value))
+        if category is None and not isinstance(value, type) and is_dataclass(value):
+            category = _categorize(type(value))
+        return category is _FROZEN
+
+    def _lookup(self, value: Any) -> tuple[_Entry | None, dict]:
+        """
+        The entry of a frozen dataclass, counting a hit or a miss, and its
+        dict, which shares the dicts of cached sub-objects. The entry is None
+        when the value holds something that cannot be keyed.
+        """
+        entry, data, found = self._entry(value, remember=True)
+        if found:
+            with self._lock:
+                self.hits += 1
+        return entry, data
+
+    def _encoded(self, entry: _Entry, codec: JsonCodec) -> bytes:
+        encoded = entry.encoded.get(type(codec))
+        if encoded is None:
+            encoded = codec.encode(entry.data)
+            entry.encoded[type(codec)] = encoded
+            with self._lock:
+                self.encode_misses += 1
+        else:
+            with self._lock:
+                self.encode_hits += 1
+        return encoded
+
+    def _entry(
+        self, value: Any, remember: bool = False
+    ) -> tuple[_Entry | None, dict, bool]:
+        """
+        The entry of a frozen dataclass, created along with the entries of its
+        frozen sub-objects, its dict and whether the entry already existed.
+        The entry is None when the value holds something that cannot be keyed.
+
+        Instances remember a stable entry. With remember, an instance also
+        remembers an entry keyed by the contents of lists, along with the
+        items the lists held when they were converted, and the entry is
+        reused while every list still holds the same items.
+        """
+        memo = getattr(value, "__dict__", None)
+        guards: list | None = getattr(self._local, "guards", None)
+        if memo is not None:
+            remembered = memo.get(_MEMO)
+            if type(remembered) is _Entry:
+                return remembered, remembered.data, True
+            if remembered is not None and _unchanged(remembered[1]):
+                if guards is not None:
+                    guards.extend(remembered[1])
+                return remembered[0], remembered[0].data, True
+        keyed = _keyed_encoders.get(type(value))
+        if keyed is None:
+            keyed = _keyed_encoders[type(value)] = _compile_keyed(type(value))
+        if remember:
+            guards = self._local.guards = []
+            try:
+                key, data = keyed(value, self._convert)
+            finally:
+                self._local.guards = None
+        else:
+            key, data = keyed(value, self._convert)
+        if key is _MUTABLE:
+            return None, data, False
+        with self._lock:
+            entry = self._entries.get(key)
+            found = entry is not None
+            if entry is None:
+                self.misses += 1
+                entry = _Entry(key, data)
+                self._entries[key] = entry
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+            else:
+                self._entries.move_to_end(key)
+        if memo is not None:
+            if entry.stable:
+                memo[_MEMO] = entry
+            elif guards is not None and remember and None not in guards:
+                memo[_MEMO] = (entry, tuple(guards))
+        return entry, entry.data, found
+
+    def _convert(self, value: Any) -> tuple[Any, Any]:
+        """
+        The structural key of a field value and its converted form, with the
+        key _MUTABLE for values that cannot be keyed. Frozen sub-objects are
+        represented in keys by their entry, which is shared by all equal
+        sub-objects, so keys stay shallow and quick to hash.
+        """
+        kind = type(value)
+        if kind is str or value is None:
+            return value, value
+        if kind in _ATOMIC:
+            # Keeps True, 1 and 1.0 apart, which are equal but encode differently
+            return (kind, value), value
+        category = _categories.get(kind)
+        if category is None:
+            category = _categorize(kind)
+        if category is _FROZEN:
+            entry, data, _ = self._entry(value)
+            return (_MUTABLE if entry is None else entry), data
+        if category is _LIST:
+            guards = getattr(self._local, "guards", None)
+            if guards is not None and kind is not tuple and kind is not frozenset:
+                # The items converted, which the entry is valid for, None for
+                # collections other than lists, whose changes are not followed
+                held = tuple(value)
+                guards.append((value, held) if kind is list else None)
+                value = held
+            pairs = [self._convert(item) for item in value]
+            items = [item for _, item in pairs]
+            keys = tuple([key for key, _ in pairs])
+            if _MUTABLE in keys:
+                return _MUTABLE, items
+            if kind not in (tuple, frozenset) or _unstable(keys):
+                return _Snapshot((kind, keys)), items
+            return (kind, keys), items
+        if category is _MAPPING:
+            return _MUTABLE, _value(value)
+        data = _value(value)
+        if isinstance(value, Enum):
+            return (kind, value), data
+        return _MUTABLE, data
+
+
+_FROZEN = "frozen"
+_DATACLASS = "dataclass"
+_MAPPING = "mapping"
+_LIST = "list"
+_OTHER = "other"
+# Category of the classes of field values, for _convert
+_categories: dict[type, str] = {}
+
+
+def _categorize(cls: type) -> str:
+    if is_dataclass(cls):
+        frozen = cls.__dataclass_params__.frozen  # type: ignore[attr-defined]
+        # Sensitive values, such as secrets, are never kept in a cache
+        cached = frozen and not getattr(cls, "sensitive", False)
+        category = _FROZEN if cached else _DATACLASS
+    elif issubclass(cls, Mapping):
+        category = _MAPPING
+    elif issubclass(cls, Collection) and not issubclass(cls, (str, bytes, Enum)):
+        category = _LIST
+    else:
+        category = _OTHER
+    _categories[cls] = category
+    return category
+
+
+# Cache of the request bodies sent by every session
+serialization_cache = SerializationCache()
@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """A call in flight, or completed and reusable until expires_at"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+        self.expires_at: float | None = None
+
+
+class _LeaderCancelled(Exception):
+    """Set on a shared asyncio call whose caller running it was cancelled"""
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one.
+
+    The first caller for a key runs the call and every caller arriving while it
+    is in flight waits for and shares its result or exception. With a reuse
+    window, successful results are also handed to callers arriving shortly
+    after completion. Failures are never reused. Synchronous and asyncio calls
+    are tracked separately. When the asyncio caller running a call is
+    cancelled, one of the callers waiting for it runs the call again.
+    """
+
+    def __init__(self, reuse_window: float = 0.0):
+        """
+        Initialize the coalescer
+
+        Args:
+            reuse_window: Seconds a successful result is shared with new
+                callers after the call completed. 0 only shares in-flight calls.
+        """
+        self.reuse_window = reuse_window
+        self.calls = 0
+        self.shared = 0
+        self._lock = threading.Lock()
+        self._sync: dict[str, _Call] = {}
+        self._async: dict[str, tuple[asyncio.Future, float | None]] = {}
+
+    def do(
+        self, key: str, function: Callable[[], T], timeout: float | None = None
+    ) -> T:
+        """
+        Run function unless a call with the same key is in flight or was
+        completed within the reuse window, in which case share its outcome.
+        A caller sharing a call in flight waits for it at most timeout seconds
+        and then raises TimeoutError, while the call itself goes on.
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._sync.get(key)
+            if call is not None and (
+                call.expires_at is None or time.monotonic() < call.expires_at
+            ):
+                self.shared += 1
+                leader = False
+            else:
+                now = time.monotonic()
+                for expired in [
+                    k
+                    for k, c in self._sync.items()
+                    if c.expires_at and c.expires_at <= now
+                ]:
+                    del self._sync[expired]
+                call = self._sync[key] = _Call()
+                leader = True
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(
+                    f"Shared call of {key} still running after {timeout:g} s"
+                )
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                if call.error is None and self.reuse_window > 0:
+                    call.expires_at = time.monotonic() + self.reuse_window
+                elif self._sync.get(key) is call:
+                    del self._sync[key]
+            call.done.set()
+
+    async def do_async(
+        self,
+        key: str,
+        function: Callable[[], Awaitable[T]],
+        timeout: float | None = None,
+    ) -> T:
+        """
+        Await function unless a call with the same key is in flight or was
+        completed within the reuse window, in which case share its outcome,
+        waiting for it at most timeout seconds like do
+        """
+        self.calls += 1
+        while True:
+            entry = self._async.get(key)
+            if entry is None:
+                break
+            future, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                break
+            self.shared += 1
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except _LeaderCancelled:
+                # Run the call again, or share the run of another follower
+                self.shared -= 1
+        now = time.monotonic()
+        for expired in [k for k, (_, e) in self._async.items() if e and e <= now]:
+            del self._async[expired]
+        future = asyncio.get_running_loop().create_future()
+        self._async[key] = (future, None)
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            # Only the caller running the call was cancelled, not its followers
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            self._forget(key, future)
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            # Mark the exception as retrieved when no other caller waits for it
+            future.exception()
+            self._forget(key, future)
+            raise
+        future.set_result(result)
+        if self.reuse_window > 0:
+            self._async[key] = (future, time.monotonic() + self.reuse_window)
+        else:
+            self._forget(key, future)
+        return result
+
+    def as_dict(self) -> dict:
+        """A snapshot of the call counters"""
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared}
+
+    def _forget(self, key: str, future: asyncio.Future) -> None:
+        entry = self._async.get(key)
+        if entry is not None and entry[0] is future:
+            del self._async[key]
@@ -0,0 +1,168 @@
+import codecs
+import json
+from typing import Any, Mapping
+from urllib.parse import urljoin
+
+from requests.utils import parse_header_links
+
+CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARACTERS = "0123456789.eE+-"
+
+
+class JsonArrayParser:
+    """
+    Decodes the elements of a JSON array from chunks of its text as they
+    arrive, so each element is available as soon as it is complete.
+    By default each element is decoded by the C decoder of the json module once
+    it is complete, which is faster than ijson on records of the size the API
+    returns. ijson parses within elements too, which only pays off for
+    elements far larger than a chunk.
+    """
+
+    def __init__(self, use_ijson: bool = False):
+        """
+        Initialize the parser
+
+        Args:
+            use_ijson: Parse with ijson, installed with datacrunch_api[ijson]
+        """
+        if use_ijson:
+            try:
+                import ijson  # type: ignore[import-untyped]
+            except ImportError:  # pragma: no cover - optional dependency
+                raise ImportError(
+                    "JsonArrayParser(use_ijson=True) requires ijson, "
+                    "install datacrunch_api[ijson]"
+                ) from None
+
+            self._error = ijson.common.JSONError
+            self._items: list[Any] = ijson.sendable_list()
+            self._coroutine = ijson.items_coro(self._items, "item", use_float=True)
+            self._started = False
+        else:
+            self._items = []
+            self._coroutine = None
+            self._text = codecs.getincrementaldecoder("utf-8")()
+            self._decoder = json.JSONDecoder()
+            self._buffer = ""
+            self._state = "start"
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Parse the next chunk of the array
+
+        Returns:
+            The elements completed by the chunk
+        """
+        if not chunk:
+            return []
+        if self._coroutine is not None:
+            if not self._started:
+                self._check_start(chunk)
+            try:
+                self._coroutine.send(chunk)
+            except self._error as error:
+                raise ValueError(f"Invalid JSON array: {error}") from error
+        else:
+            self._parse(self._text.decode(chunk), final=False)
+        items = self._items[:]
+        self._items.clear()
+        return items
+
+    def close(self) -> list[Any]:
+        """
+        End the array
+
+        Returns:
+            The last elements
+
+        Raises:
+            ValueError: If the text is not a complete JSON array
+        """
+        if self._coroutine is not None:
+            try:
+                self._coroutine.close()
+            except self._error as error:
+                raise ValueError(f"Incomplete JSON array: {error}") from error
+            if not self._started:
+                raise ValueError("Incomplete JSON array")
+        else:
+            self._parse(self._text.decode(b"", final=True), final=True)
+            if self._state != "end":
+                raise ValueError("Incomplete JSON array")
+        items = self._items[:]
+        self._items.clear()
+        return items
+
+    def _check_start(self, chunk: bytes) -> None:
+        """Reject bodies other than arrays, which ijson would parse as empty"""
+        stripped = chunk.lstrip(_WHITESPACE.encode())
+        if stripped:
+            if not stripped.startswith(b"["):
+                raise ValueError(f"Expected a JSON array, got {stripped[:1]!r}")
+            self._started = True
+
+    def _parse(self, text: str, final: bool) -> None:
+        buffer = self._buffer + text
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position == len(buffer):
+                break
+            character = buffer[position]
+            if self._state == "start":
+                if character != "[":
+                    raise ValueError(f"Expected a JSON array, got {character!r}")
+                self._state = "first"
+                position += 1
+            elif self._state in ("first", "next") and character == "]":
+                self._state = "end"
+                position += 1
+            elif self._state == "next":
+                if character != ",":
+                    raise ValueError(f"Expected ',' or ']', got {character!r}")
+                self._state = "value"
+                position += 1
+            elif self._state in ("first", "value"):
+                try:
+                    item, end = self._decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                # A number or literal running up to the end of the buffer may
+                # continue in the next chunk
+                if not final and character not in '{["':
+                    following = end
+                    while (
+                        following < len(buffer)
+                        and buffer[following] in _NUMBER_CHARACTERS
+                    ):
+                        following += 1
+                    if following == len(buffer):
+                        break
+                self._items.append(item)
+                self._state = "next"
+                position = end
+            else:
+                raise ValueError(f"Unexpected {character!r} after the JSON array")
+        self._buffer = buffer[position:]
+
+
+def next_page(headers: Mapping[str, str], base_url: str, url: str) -> str | None:
+    """
+    The URL relative to base_url of the next page of a paginated response,
+    from the rel="next" link of its Link header, None on the last page
+    """
+    header = headers.get("Link")
+    if not header:
+        return None
+    for link in parse_header_links(header):
+        if link.get("rel") == "next" and link.get("url"):
+            absolute = urljoin(f"{base_url}/{url}", link["url"])
+            if not absolute.startswith(f"{base_url}/"):
+                raise ValueError(f"Next page {absolute} is outside of {base_url}")
+            return absolute[len(base_url) + 1 :]
+    return None
@@ -0,0 +1,137 @@
+from ._hooks import RequestEvent, RequestHook
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+except ImportError:  # pragma: no cover - optional dependency
+    trace = None  # type: ignore
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover - optional dependency
+    prometheus_client = None  # type: ignore
+
+DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+class OpenTelemetryHook(RequestHook):
+    """
+    Records every request attempt as a client span of the current trace, named
+    after the method and endpoint template, e.g. "GET instances/{id}"
+    """
+
+    def __init__(self, tracer_provider: "trace.TracerProvider | None" = None):
+        """
+        Initialize the hook
+
+        Args:
+            tracer_provider: Provider to get the tracer from, defaults to the
+                globally configured one
+        """
+        if trace is None:
+            raise ImportError(
+                "OpenTelemetryHook requires opentelemetry-api, "
+                "install datacrunch_api[opentelemetry]"
+            )
+        self.tracer = trace.get_tracer(
+            "datacrunch_api", tracer_provider=tracer_provider
+        )
+
+    def before_request(self, event: RequestEvent) -> None:
+        event.context["span"] = self.tracer.start_span(
+            f"{event.method} {event.endpoint}",
+            kind=trace.SpanKind.CLIENT,
+            start_time=int(event.started_at * 1e9),
+            attributes={
+                "http.request.method": event.method,
+                "url.path": event.url,
+                "url.template": event.endpoint,
+                "http.request.resend_count": event.attempt - 1,
+                "http.request.body.size": event.request_bytes,
+            },
+        )
+
+    def after_response(self, event: RequestEvent) -> None:
+        span = event.context.pop("span")
+        span.set_attribute("http.response.status_code", event.status)
+        span.set_attribute("http.response.body.size", event.response_bytes)
+        if event.status is not None and event.status >= 400:
+            span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+    def on_error(self, event: RequestEvent) -> None:
+        span = event.context.pop("span")
+        span.record_exception(event.error)
+        span.set_status(Status(StatusCode.ERROR, type(event.error).__name__))
+        span.end()
+
+
+class PrometheusHook(RequestHook):
+    """
+    Records request durations and body sizes in Prometheus histograms and
+    failed attempts in a counter, labelled by method, endpoint template and
+    status
+    """
+
+    def __init__(
+        self,
+        registry: "prometheus_client.CollectorRegistry | None" = None,
+        prefix: str = "datacrunch_api",
+    ):
+        """
+        Initialize the hook and register its metrics
+
+        Args:
+            registry: Registry to register the metrics with, defaults to the
+                global prometheus_client registry
+            prefix: Prefix of the metric names
+        """
+        if prometheus_client is None:
+            raise ImportError(
+                "PrometheusHook requires prometheus-client, "
+                "install datacrunch_api[prometheus]"
+            )
+        registry = registry or prometheus_client.REGISTRY
+        labels = ("method", "endpoint", "status")
+        self.duration = prometheus_client.Histogram(
+            f"{prefix}_request_duration_seconds",
+            "Duration of DataCrunch API request attempts",
+            labels,
+            buckets=DURATION_BUCKETS,
+            registry=registry,
+        )
+        self.request_size = prometheus_client.Histogram(
+            f"{prefix}_request_size_bytes",
+            "Size of DataCrunch API request bodies",
+            labels,
+            buckets=SIZE_BUCKETS,
+            registry=registry,
+        )
+        self.response_size = prometheus_client.Histogram(
+            f"{prefix}_response_size_bytes",
+            "Size of DataCrunch API response bodies",
+            labels,
+            buckets=SIZE_BUCKETS,
+            registry=registry,
+        )
+        self.errors = prometheus_client.Counter(
+            f"{prefix}_request_errors",
+            "DataCrunch API request attempts that received no response",
+            ("method", "endpoint", "error"),
+            registry=registry,
+        )
+
+    def after_response(self, event: RequestEvent) -> None:
+        labels = (event.method, event.endpoint, str(event.status))
+        self.duration.labels(*labels).observe(event.duration or 0.0)
+        self.request_size.labels(*labels).observe(event.request_bytes)
+        self.response_size.labels(*labels).observe(event.response_bytes or 0)
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.duration.labels(event.method, event.endpoint, "error").observe(
+            event.duration or 0.0
+        )
+        self.errors.labels(
+            event.method, event.endpoint, type(event.error).__name__
+        ).inc()
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Literal
+
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 60.0
+
+
+@dataclass(frozen=True)
+class Timeout:
+    """
+    Seconds to wait for a connection to be established and for the server to
+    send data. None waits forever.
+    """
+
+    connect: float | None = DEFAULT_CONNECT_TIMEOUT
+    read: float | None = DEFAULT_READ_TIMEOUT
+
+    @classmethod
+    def of(cls, value: "Timeout | float | None") -> "Timeout":
+        """
+        Build a timeout from a Timeout, a number of seconds used for both phases
+        or None, which disables both timeouts
+        """
+        if isinstance(value, Timeout):
+            return value
+        return cls(connect=value, read=value)
+
+    def as_tuple(self) -> tuple[float | None, float | None]:
+        """The (connect, read) tuple accepted by requests"""
+        return (self.connect, self.read)
+
+    def total(self) -> float | None:
+        """The sum of both timeouts, None if either waits forever"""
+        if self.connect is None or self.read is None:
+            return None
+        return self.connect + self.read
+
+
+class _SessionTimeout(Enum):
+    SESSION_TIMEOUT = "session timeout"
+
+
+# Default of the timeout argument of requests, standing for the timeout of the
+# session, so that passing None disables the timeouts of a single request
+SESSION_TIMEOUT: Literal[_SessionTimeout.SESSION_TIMEOUT] = (
+    _SessionTimeout.SESSION_TIMEOUT
+)
+RequestTimeout = Timeout | float | None | Literal[_SessionTimeout.SESSION_TIMEOUT]
@@ -0,0 +1,308 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_MARGIN = 60.0
+
+
+def default_cache_directory() -> Path:
+    """Directory used for the token cache unless another one is given"""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "datacrunch_api"
+
+
+@dataclass(frozen=True)
+class Token:
+    """
+    An access token and the wall clock times at which it expires and at which
+    it should be refreshed. Times are None for tokens without a known expiry.
+    """
+
+    access_token: str
+    expires_at: float | None = None
+    refresh_at: float | None = None
+
+    @classmethod
+    def from_response(
+        cls,
+        response: dict,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        now: float | None = None,
+    ) -> "Token":
+        """
+        Build a token from an /oauth2/token response.
+
+        The refresh margin is capped at half the token lifetime, so short lived
+        tokens are still used for a while before being refreshed.
+
+        Args:
+            response: The JSON response from the token endpoint
+            refresh_margin: Seconds before expiry at which to refresh
+            now: Current wall clock time, defaults to time.time()
+        """
+        expires_in = response.get("expires_in")
+        if expires_in is None:
+            return cls(access_token=response["access_token"])
+        now = time.time() if now is None else now
+        lifetime = float(expires_in)
+        return cls(
+            access_token=response["access_token"],
+            expires_at=now + lifetime,
+            refresh_at=now + lifetime - min(refresh_margin, lifetime / 2),
+        )
+
+    def needs_refresh(self, now: float | None = None) -> bool:
+        """True once the token is within its refresh margin of expiring"""
+        if self.refresh_at is None:
+            return False
+        return (time.time() if now is None else now) >= self.refresh_at
+
+
+class TokenCache:
+    """
+    On-disk token cache shared between processes.
+    Tokens are stored per client ID in files readable only by the current user,
+    and access is serialized with an exclusive file lock, so parallel processes
+    fetch one token between them instead of one each.
+    """
+
+    def __init__(self, directory: str | Path | None = None):
+        """
+        Initialize the cache
+
+        Args:
+            directory: Optional cache directory, defaults to
+                $XDG_CACHE_HOME/datacrunch_api or ~/.cache/datacrunch_api
+        """
+        self.directory = Path(directory) if directory else default_cache_directory()
+
+    def path(self, client_id: str) -> Path:
+        """Path of the cache file holding the token for a client ID"""
+        key = hashlib.sha256(client_id.encode()).hexdigest()[:32]
+        return self.directory / f"token-{key}.json"
+
+    @contextmanager
+    def locked(self, client_id: str) -> Iterator[None]:
+        """
+        Hold an exclusive inter-process lock on the cache entry of a client ID.
+        Locking is skipped on platforms without fcntl.
+        """
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        lock_path = self.path(client_id).with_suffix(".lock")
+        with open(lock_path, "a+") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def load(self, client_id: str) -> Token | None:
+        """
+        Read the cached token of a client ID
+
+        Returns:
+            The cached token, or None if there is no readable entry
+        """
+        try:
+            data = json.loads(self.path(client_id).read_text())
+            return Token(
+                access_token=data["access_token"],
+                expires_at=data.get("expires_at"),
+                refresh_at=data.get("refresh_at"),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def store(self, client_id: str, token: Token) -> None:
+        """
+        Atomically replace the cached token of a client ID
+        """
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path = self.path(client_id)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as file:
+            json.dump(
+                {
+                    "access_token": token.access_token,
+                    "expires_at": token.expires_at,
+                    "refresh_at": token.refresh_at,
+                },
+                file,
+            )
+        os.replace(temporary, path)
+
+
+class TokenManager:
+    """
+    Keeps a valid access token for a set of client credentials.
+    Tracks token expiry, refreshes in a background thread shortly before the
+    token expires and optionally shares tokens between processes through a
+    TokenCache.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        fetch: Callable[[dict], dict] | None = None,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        cache: TokenCache | None = None,
+        background_refresh: bool = True,
+    ):
+        """
+        Initialize the token manager
+
+        Args:
+            client_id: The client ID for authentication
+            client_secret: The client secret for authentication
+            fetch: Callable posting a token request body to /oauth2/token and
+                returning the JSON response. Without it, tokens must be fetched
+                by the caller and recorded with store(), as AsyncApiSession does.
+            refresh_margin: Seconds before expiry at which tokens are refreshed
+            cache: Optional on-disk cache shared with other processes
+            background_refresh: Refresh tokens from a timer thread instead of
+                waiting for the next request to notice the expiry
+        """
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.fetch = fetch
+        self.refresh_margin = refresh_margin
+        self.cache = cache
+        self.background_refresh = background_refresh
+        self._lock = threading.RLock()
+        self._token: Token | None = None
+        self._timer: threading.Timer | None = None
+
+    @property
+    def token(self) -> Token | None:
+        """The token currently held in memory, if any"""
+        return self._token
+
+    def request_body(self) -> dict:
+        """Body of a client credentials request to /oauth2/token"""
+        return {
+            "grant_type": "client_credentials",
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+        }
+
+    def current(self, stale: str | None = None) -> Token | None:
+        """
+        Return a token that does not need refreshing yet, without fetching one.
+        Falls back to the on-disk cache when the in-memory token is missing or
+        expiring.
+
+        Args:
+            stale: Optional access token known to be rejected by the API
+        """
+        token = self._token
+        if token and not token.needs_refresh() and token.access_token != stale:
+            return token
+        if self.cache is None:
+            return None
+        cached = self.cache.load(self.client_id)
+        if cached and not cached.needs_refresh() and cached.access_token != stale:
+            self._adopt(cached)
+            return cached
+        return None
+
+    def store(self, response: dict) -> Token:
+        """
+        Record a token response, write it to the cache and schedule its refresh
+
+        Args:
+            response: The JSON response from the token endpoint
+
+        Returns:
+            The recorded token
+        """
+        token = Token.from_response(response, self.refresh_margin)
+        if self.cache is not None:
+            self.cache.store(self.client_id, token)
+        self._adopt(token)
+        return token
+
+    def get(self) -> str:
+        """
+        Return a valid access token, fetching a new one if needed
+        """
+        token = self._token
+        if token and not token.needs_refresh():
+            return token.access_token
+        return self.refresh(stale=None)
+
+    def refresh(self, stale: str | None = None) -> str:
+        """
+        Fetch a new access token unless another thread or process already has.
+
+        Args:
+            stale: Optional access token known to be rejected by the API. A new
+                token is always obtained when the current one equals it.
+
+        Returns:
+            A valid access token
+        """
+        with self._lock:
+            token = self.current(stale)
+            if token is not None:
+                return token.access_token
+            if self.cache is None:
+                return self._fetch()
+            with self.cache.locked(self.client_id):
+                token = self.current(stale)
+                if token is not None:
+                    return token.access_token
+                return self._fetch()
+
+    def close(self) -> None:
+        """Cancel any scheduled background refresh"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _adopt(self, token: Token) -> None:
+        with self._lock:
+            self._token = token
+            if not self.background_refresh or token.refresh_at is None:
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(
+                max(0.0, token.refresh_at - time.time()),
+                self._refresh_in_background,
+                args=(token.access_token,),
+            )
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _fetch(self) -> str:
+        if self.fetch is None:
+            raise RuntimeError("TokenManager has no fetch callable to get tokens with")
+        return self.store(self.fetch(self.request_body())).access_token
+
+    def _refresh_in_background(self, access_token: str) -> None:
+        try:
+            self.refresh(stale=access_token)
+        except Exception:
+            logger.warning(
+                "Background token refresh failed, retrying on next request",
+                exc_info=True,
+            )
@@ -0,0 +1,286 @@
+import asyncio
+import base64
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Mapping
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+CASSETTE_VERSION = 1
+TOKEN_PATH = "/oauth2/token"
+REPLAY_TOKEN = {"access_token": "replay", "token_type": "Bearer", "expires_in": 3600}
+# Response headers left out of cassettes, as they are either sensitive or
+# describe the recorded connection rather than the response
+SKIPPED_HEADERS = frozenset(
+    {"connection", "content-encoding", "date", "set-cookie", "transfer-encoding"}
+)
+
+
+def _request_key(method: str, url: str) -> str:
+    """The method and the path and query of a URL, e.g. "GET /v1/instances" """
+    parts = urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    return f"{method.upper()} {path}"
+
+
+def _requests_response(
+    url: str, status: int, headers: Mapping[str, str], content: bytes
+) -> requests.Response:
+    """A requests.Response with the given status, headers and body"""
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = url
+    response.encoding = "utf-8"
+    response._content = content
+    # Makes iter_content slice the body instead of reading the missing raw
+    # stream, the attribute is not part of the typeshed stubs of requests
+    response._content_consumed = True  # type: ignore[attr-defined]
+    return response
+
+
+@dataclass(frozen=True)
+class Interaction:
+    """A recorded request and its response"""
+
+    method: str
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: str
+    latency: float = 0.0
+    binary: bool = False
+
+    @property
+    def key(self) -> str:
+        return f"{self.method} {self.url}"
+
+    @property
+    def content(self) -> bytes:
+        if self.binary:
+            return base64.b64decode(self.body)
+        return self.body.encode()
+
+
+@dataclass
+class Cassette:
+    """
+    Interactions recorded in a JSON file, which is gzip compressed when its
+    name ends with .gz. Request bodies and headers, and thereby credentials,
+    are never stored.
+    """
+
+    interactions: list[Interaction] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        """Load a cassette saved with save()"""
+        path = Path(path)
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')}")
+        return cls([Interaction(**item) for item in data["interactions"]])
+
+    def save(self, path: str | Path) -> None:
+        """Write the cassette to a file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        opener = gzip.open if path.suffix == ".gz" else open
+        data = {
+            "version": CASSETTE_VERSION,
+            "interactions": [asdict(item) for item in self.interactions],
+        }
+        with opener(path, "wt", encoding="utf-8") as file:
+            json.dump(data, file, separators=(",", ":"), ensure_ascii=False)
+
+    def record(
+        self, method: str, url: str, response: Any, latency: float
+    ) -> Interaction:
+        """Append the response to a request, as returned by a session transport"""
+        content = response.content
+        try:
+            body, binary = content.decode(), False
+        except UnicodeDecodeError:
+            body, binary = base64.b64encode(content).decode(), True
+        method, url = _request_key(method, url).split(" ", 1)
+        interaction = Interaction(
+            method=method,
+            url=url,
+            status=response.status_code,
+            headers={
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in SKIPPED_HEADERS
+            },
+            body=body,
+            latency=round(latency, 6),
+            binary=binary,
+        )
+        self.interactions.append(interaction)
+        return interaction
+
+
+class Transport:
+    """
+    Sends the requests of a session. Transports wrap the HTTP call of the
+    session, which they may call, observe or replace. This base class sends
+    every request unchanged.
+    """
+
+    def attach(self, session: Any) -> None:
+        """Called by the ApiSession or AsyncApiSession the transport is passed to"""
+
+    def send(self, send: Callable[..., Any], method: str, url: str, **kwargs) -> Any:
+        """Send a request of an ApiSession, returning a requests.Response"""
+        return send(method, url, **kwargs)
+
+    async def send_async(
+        self, send: Callable[..., Awaitable[Any]], method: str, url: str, **kwargs
+    ) -> Any:
+        """Send a request of an AsyncApiSession, returning an AsyncResponse"""
+        return await send(method, url, **kwargs)
+
+    def close(self) -> None:
+        """Called when the session is closed"""
+
+    async def aclose(self) -> None:
+        """Called when the AsyncApiSession is closed"""
+        self.close()
+
+
+class RecordingTransport(Transport):
+    """
+    Sends requests to the API and records their responses and latencies in a
+    cassette, which is saved when the session is closed. Token requests are
+    sent but not recorded.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Initialize the transport
+
+        Args:
+            path: File to save the cassette to, gzip compressed if it ends
+                with .gz
+        """
+        self.path = Path(path)
+        self.cassette = Cassette()
+        self._lock = threading.Lock()
+
+    def send(self, send: Callable[..., Any], method: str, url: str, **kwargs) -> Any:
+        # Streamed responses are read in full to record them
+        kwargs.pop("stream", None)
+        started = time.perf_counter()
+        response = send(method, url, **kwargs)
+        self._record(method, url, response, time.perf_counter() - started)
+        return response
+
+    async def send_async(
+        self, send: Callable[..., Awaitable[Any]], method: str, url: str, **kwargs
+    ) -> Any:
+        kwargs.pop("stream", None)
+        started = time.perf_counter()
+        response = await send(method, url, **kwargs)
+        self._record(method, url, response, time.perf_counter() - started)
+        return response
+
+    def save(self) -> None:
+        """Write the interactions recorded so far to the cassette file"""
+        with self._lock:
+            self.cassette.save(self.path)
+
+    def close(self) -> None:
+        self.save()
+
+    def _record(self, method: str, url: str, response: Any, latency: float) -> None:
+        if urlsplit(url).path.endswith(TOKEN_PATH):
+            return
+        with self._lock:
+            self.cassette.record(method, url, response, latency)
+
+
+class ReplayTransport(Transport):
+    """
+    Serves requests from a cassette without any network access. Responses to
+    the same method and URL are replayed in recorded order, and the last one is
+    repeated once they are used up. Token requests are always granted.
+    """
+
+    class Unrecorded(LookupError):
+        """Raised for a request that has no recorded response"""
+
+        pass
+
+    def __init__(
+        self,
+        cassette: Cassette | str | Path,
+        latency: float = 0.0,
+        repeat: bool = True,
+    ):
+        """
+        Initialize the transport
+
+        Args:
+            cassette: The cassette or the path of a cassette file to replay
+            latency: Factor the recorded latencies are multiplied with before
+                delaying each response, 0 replays at full speed
+            repeat: Repeat the last response to a request once all its recorded
+                responses were replayed, instead of raising Unrecorded
+        """
+        if not isinstance(cassette, Cassette):
+            cassette = Cassette.load(cassette)
+        self.cassette = cassette
+        self.latency = latency
+        self.repeat = repeat
+        self._queues: dict[str, deque[Interaction]] = {}
+        for interaction in cassette.interactions:
+            self._queues.setdefault(interaction.key, deque()).append(interaction)
+        self._lock = threading.Lock()
+
+    def send(self, send: Callable[..., Any], method: str, url: str, **kwargs) -> Any:
+        interaction = self._next(method, url)
+        if interaction is None:
+            return _requests_response(url, 200, {}, json.dumps(REPLAY_TOKEN).encode())
+        if self.latency and interaction.latency:
+            time.sleep(interaction.latency * self.latency)
+        return _requests_response(
+            url, interaction.status, interaction.headers, interaction.content
+        )
+
+    async def send_async(
+        self, send: Callable[..., Awaitable[Any]], method: str, url: str, **kwargs
+    ) -> Any:
+        from ._async_api_session import AsyncResponse
+
+        interaction = self._next(method, url)
+        if interaction is None:
+            return AsyncResponse(200, {}, json.dumps(REPLAY_TOKEN).encode())
+        if self.latency and interaction.latency:
+            await asyncio.sleep(interaction.latency * self.latency)
+        return AsyncResponse(
+            interaction.status,
+            CaseInsensitiveDict(interaction.headers),
+            interaction.content,
+        )
+
+    def _next(self, method: str, url: str) -> Interaction | None:
+        """The interaction to replay, None for token requests"""
+        if urlsplit(url).path.endswith(TOKEN_PATH):
+            return None
+        key = _request_key(method, url)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise self.Unrecorded(key)
+            if len(queue) == 1 and self.repeat:
+                return queue[0]
+            return queue.popleft()
@@ -0,0 +1,456 @@
+import asyncio
+import math
+import random
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+
+from ._api_session import SessionBase
+
+# Statuses after which a resource will not reach the awaited one by itself
+DEPLOYMENT_FAILURE_STATUSES = frozenset({"error", "paused", "quota_reached"})
+INSTANCE_FAILURE_STATUSES = frozenset(
+    {"deleting", "discontinued", "error", "installation_failed", "no_capacity"}
+)
+VOLUME_FAILURE_STATUSES = frozenset({"canceled", "canceling", "deleted", "deleting"})
+# Errors of a list request that sending it again will not fix
+PERMANENT_LIST_ERRORS = (SessionBase.InvalidRequest, SessionBase.Conflict)
+
+
+class WaitFailed(Exception):
+    """
+    Raised when a resource reached a state from which it will not reach the
+    awaited one, or no longer exists
+    """
+
+    def __init__(self, message: str, state: dict):
+        super().__init__(message)
+        self.state = state
+
+
+class WaitTimeout(TimeoutError):
+    """Raised when a resource did not reach the awaited state in time"""
+
+    def __init__(self, message: str, state: dict):
+        super().__init__(message)
+        self.state = state
+
+
+@dataclass(frozen=True)
+class WaitPolicy:
+    """
+    How often to poll a resource while waiting for a state change, and for how
+    long. Polls start base_delay apart and back off exponentially up to
+    max_delay, each delay shortened by up to jitter of itself so waiters
+    started together spread out. The last poll happens at the deadline.
+    """
+
+    base_delay: float = 1.0
+    max_delay: float = 15.0
+    timeout: float = 900.0
+    jitter: float = 0.2
+
+    def delay(self, poll: int) -> float:
+        """Seconds to wait after the given poll, starting at 1"""
+        delay = min(self.max_delay, self.base_delay * 2 ** (poll - 1))
+        return random.uniform(delay * (1 - self.jitter), delay)
+
+
+DEFAULT_WAIT_POLICY = WaitPolicy()
+
+
+def _not_found(state: dict) -> bool:
+    return state.get("code") == "not_found"
+
+
+def _listed(response: Any) -> list[dict]:
+    """
+    The resources of a list response
+
+    Raises:
+        RequestFailed: If the response is not a list of resources, e.g. an
+            error body
+    """
+    if not isinstance(response, list) or not all(
+        isinstance(resource, dict) for resource in response
+    ):
+        raise SessionBase.RequestFailed(response)
+    return response
+
+
+class _Wait:
+    """The state of one wait, shared by wait_for and async_wait_for"""
+
+    def __init__(
+        self,
+        description: str,
+        done: Callable[[dict], bool],
+        failed: Callable[[dict], bool],
+        policy: WaitPolicy,
+        timeout: float | None,
+    ):
+        self.description = description
+        self.done = done
+        self.failed = failed
+        self.policy = policy
+        self.timeout = policy.timeout if timeout is None else timeout
+        self.deadline = time.monotonic() + self.timeout
+        self.polls = 0
+
+    def next_delay(self, state: dict) -> float | None:
+        """
+        Seconds to wait before polling again, None when state is the awaited
+        one
+
+        Raises:
+            WaitFailed: If the state is a failure or the resource is gone
+            WaitTimeout: If the deadline has passed
+        """
+        self.polls += 1
+        if _not_found(state) or self.failed(state):
+            raise WaitFailed(
+                f"{self.description} failed: {state.get('status', state)}", state
+            )
+        if self.done(state):
+            return None
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise WaitTimeout(
+                f"{self.description} timed out after {self.timeout:g} s in "
+                f"{state.get('status')}",
+                state,
+            )
+        return min(self.policy.delay(self.polls), remaining)
+
+
+def wait_for(
+    poll: Callable[[], dict],
+    description: str,
+    done: Callable[[dict], bool],
+    failed: Callable[[dict], bool],
+    policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+    timeout: float | None = None,
+) -> dict:
+    """
+    Poll a resource with exponential backoff until it is done
+
+    Args:
+        poll: Returns the current state of the resource
+        description: What is awaited, for the messages of the exceptions
+        done: Whether a state is the awaited one
+        failed: Whether a state will not lead to the awaited one
+        policy: The delays between polls and the timeout
+        timeout: Optional seconds replacing the timeout of the policy
+
+    Returns:
+        The awaited state
+
+    Raises:
+        WaitFailed: If the resource failed or is gone
+        WaitTimeout: If the resource was not done in time
+    """
+    wait = _Wait(description, done, failed, policy, timeout)
+    while True:
+        state = poll()
+        delay = wait.next_delay(state)
+        if delay is None:
+            return state
+        time.sleep(delay)
+
+
+async def async_wait_for(
+    poll: Callable[[], Awaitable[dict]],
+    description: str,
+    done: Callable[[dict], bool],
+    failed: Callable[[dict], bool],
+    policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+    timeout: float | None = None,
+) -> dict:
+    """The asyncio counterpart of wait_for"""
+    wait = _Wait(description, done, failed, policy, timeout)
+    while True:
+        state = await poll()
+        delay = wait.next_delay(state)
+        if delay is None:
+            return state
+        await asyncio.sleep(delay)
+
+
+@dataclass(frozen=True)
+class WaitEvent:
+    """
+    Outcome of the wait for one resource of a group
+
+    Attributes:
+        id: The ID of the resource
+        state: The last state of the resource, None when it was not listed
+        error: WaitFailed, WaitTimeout or the exception of a list request that
+            cannot succeed, None when the resource reached the awaited state.
+            A WaitTimeout after list requests kept failing until the deadline
+            has the last of their exceptions as its __cause__.
+    """
+
+    id: str
+    state: dict | None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the resource reached the awaited state"""
+        return self.error is None
+
+
+class _GroupWait:
+    """The state of a group wait, shared by GroupWaiter and AsyncGroupWaiter"""
+
+    def __init__(
+        self,
+        ids: Iterable[str],
+        description: str,
+        done: Callable[[dict], bool],
+        failed: Callable[[dict], bool],
+        key: str,
+        policy: WaitPolicy,
+        timeout: float | None,
+    ):
+        self.ids = list(dict.fromkeys(ids))
+        self.pending = set(self.ids)
+        self.futures: dict[str, Future[dict]] = {
+            resource_id: Future() for resource_id in self.ids
+        }
+        self.events: dict[str, WaitEvent] = {}
+        self.states: dict[str, dict] = {}
+        self.description = description
+        self.done = done
+        self.failed = failed
+        self.key = key
+        self.policy = policy
+        self.timeout = policy.timeout if timeout is None else timeout
+        # Set by start() on the first poll, not when the waiter is created
+        self.deadline = math.inf
+        self.polls = 0
+
+    def start(self) -> None:
+        """Start the timeout, unless an earlier iteration already has"""
+        if self.deadline == math.inf:
+            self.deadline = time.monotonic() + self.timeout
+
+    def update(self, resources: list[dict]) -> list[WaitEvent]:
+        """Resolve the resources that are done or failed in a list response"""
+        self.polls += 1
+        by_id = {resource.get(self.key): resource for resource in resources}
+        events = []
+        for resource_id in self.ids:
+            if resource_id not in self.pending:
+                continue
+            state = by_id.get(resource_id)
+            description = self.description.format(id=resource_id)
+            if state is not None:
+                self.states[resource_id] = state
+            if state is None:
+                error: Exception | None = WaitFailed(
+                    f"{description} failed: not found", {"code": "not_found"}
+                )
+            elif self.failed(state):
+                error = WaitFailed(
+                    f"{description} failed: {state.get('status')}", state
+                )
+            elif self.done(state):
+                error = None
+            elif time.monotonic() >= self.deadline:
+                error = WaitTimeout(
+                    f"{description} timed out after {self.timeout:g} s in "
+                    f"{state.get('status')}",
+                    state,
+                )
+            else:
+                continue
+            events.append(self._resolve(resource_id, state, error))
+        return events
+
+    def fail(self, error: Exception) -> list[WaitEvent]:
+        """
+        Handle a failed list request. Errors other than permanent ones are
+        retried until the deadline, after which every pending resource times
+        out with the error as the cause.
+        """
+        self.polls += 1
+        permanent = isinstance(error, PERMANENT_LIST_ERRORS)
+        if not permanent and time.monotonic() < self.deadline:
+            return []
+        events = []
+        for resource_id in self.ids:
+            if resource_id not in self.pending:
+                continue
+            state = self.states.get(resource_id)
+            resolved = error
+            if not permanent:
+                resolved = WaitTimeout(
+                    f"{self.description.format(id=resource_id)} timed out after "
+                    f"{self.timeout:g} s, listing failed: {error}",
+                    state or {},
+                )
+                resolved.__cause__ = error
+            events.append(self._resolve(resource_id, state, resolved))
+        return events
+
+    def abandon(self) -> None:
+        """Cancel the futures of the pending resources, once iteration stopped"""
+        for resource_id in self.pending:
+            self.futures[resource_id].cancel()
+
+    def next_delay(self) -> float | None:
+        """Seconds to wait before the next list request, None when all are done"""
+        if not self.pending:
+            return None
+        remaining = self.deadline - time.monotonic()
+        return max(0.0, min(self.policy.delay(self.polls), remaining))
+
+    def ordered(self) -> dict[str, WaitEvent]:
+        return {resource_id: self.events[resource_id] for resource_id in self.ids}
+
+    def _resolve(
+        self, resource_id: str, state: dict | None, error: Exception | None
+    ) -> WaitEvent:
+        self.pending.discard(resource_id)
+        event = WaitEvent(resource_id, state, error)
+        self.events[resource_id] = event
+        future = self.futures[resource_id]
+        if future.cancelled():
+            # Abandoned by an iteration that stopped early
+            pass
+        elif error is None:
+            future.set_result(state)  # type: ignore[arg-type]
+        else:
+            future.set_exception(error)
+        return event
+
+
+class GroupWaiter:
+    """
+    Waits for a group of resources to reach a state with one list request per
+    tick, however many resources there are. Iterating over the waiter sends
+    the list requests, backing off like wait_for, and yields a WaitEvent as
+    soon as a resource is done, failed or out of time, so work on it can
+    start while the others are still pending. A resource missing from the
+    list has failed.
+
+    A list request that fails, or returns something other than a list of
+    resources, is sent again with the same backoff until the deadline, unless
+    its error is permanent, such as InvalidRequest, which fails every pending
+    resource at once.
+
+    futures holds a Future per ID, resolved with the awaited state or the
+    error of its event, for threads waiting on single resources while another
+    one iterates or calls wait(). Nothing polls otherwise, so the futures only
+    resolve while the waiter is iterated, and the timeout starts with the
+    first list request. The futures of resources still pending when an
+    iteration stops early, e.g. on a break, are cancelled.
+    """
+
+    def __init__(
+        self,
+        list_all: Callable[[], list],
+        ids: Iterable[str],
+        description: str,
+        done: Callable[[dict], bool],
+        failed: Callable[[dict], bool],
+        key: str = "id",
+        policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+        timeout: float | None = None,
+    ):
+        """
+        Initialize the waiter
+
+        Args:
+            list_all: Lists all resources
+            ids: The IDs of the resources to wait for
+            description: What is awaited, with an {id} placeholder, for the
+                messages of the exceptions
+            done: Whether a state is the awaited one
+            failed: Whether a state will not lead to the awaited one
+            key: The field of the IDs in the resources
+            policy: The delays between list requests and the timeout
+            timeout: Optional seconds replacing the timeout of the policy
+        """
+        self._list_all = list_all
+        self._group = _GroupWait(ids, description, done, failed, key, policy, timeout)
+        self.futures = self._group.futures
+
+    def __iter__(self) -> Iterator[WaitEvent]:
+        group = self._group
+        group.start()
+        try:
+            while group.pending:
+                try:
+                    resources = _listed(self._list_all())
+                except Exception as error:
+                    yield from group.fail(error)
+                else:
+                    yield from group.update(resources)
+                delay = group.next_delay()
+                if delay is not None:
+                    time.sleep(delay)
+        finally:
+            group.abandon()
+
+    def wait(self) -> dict[str, WaitEvent]:
+        """
+        Wait for all resources
+
+        Returns:
+            The event of every resource, in the order of the IDs
+        """
+        for _ in self:
+            pass
+        return self._group.ordered()
+
+
+class AsyncGroupWaiter:
+    """
+    The asyncio counterpart of GroupWaiter, iterated with async for. Await
+    asyncio.wrap_future(waiter.futures[id]) to wait on a single resource
+    while another task iterates.
+    """
+
+    def __init__(
+        self,
+        list_all: Callable[[], Awaitable[list]],
+        ids: Iterable[str],
+        description: str,
+        done: Callable[[dict], bool],
+        failed: Callable[[dict], bool],
+        key: str = "id",
+        policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+        timeout: float | None = None,
+    ):
+        """Initialize the waiter, see GroupWaiter"""
+        self._list_all = list_all
+        self._group = _GroupWait(ids, description, done, failed, key, policy, timeout)
+        self.futures = self._group.futures
+
+    async def __aiter__(self) -> AsyncIterator[WaitEvent]:
+        group = self._group
+        group.start()
+        try:
+            while group.pending:
+                try:
+                    resources = _listed(await self._list_all())
+                except Exception as error:
+                    events = group.fail(error)
+                else:
+                    events = group.update(resources)
+                for event in events:
+                    yield event
+                delay = group.next_delay()
+                if delay is not None:
+                    await asyncio.sleep(delay)
+        finally:
+            group.abandon()
+
+    async def wait(self) -> dict[str, WaitEvent]:
+        """Wait for all resources, see GroupWaiter.wait"""
+        async for _ in self:
+            pass
+        return self._group.ordered()
@@ -0,0 +1,42 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class Workers:
+    """
+    A pool of threads shared by the bulk operations of a session, so that
+    operations running at the same time send at most max_workers requests
+    together instead of each starting threads of its own. The threads are
+    started on first use.
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        Initialize the pool
+
+        Args:
+            max_workers: The number of threads, and so of requests in flight
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, function: Callable[..., Any], *args: Any) -> Future:
+        """Call function with args from a thread of the pool"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="bulk"
+                )
+            executor = self._executor
+        return executor.submit(function, *args)
+
+    def shutdown(self) -> None:
+        """Stop the threads once the calls submitted so far are done"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
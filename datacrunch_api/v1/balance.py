@@ -1,6 +1,8 @@
 from enum import Enum
+from typing import Any
 
-from ._api_session import ApiSession
+from ._api_session import ApiSession, resolve_session
+from ._async_api_session import AsyncApiSession
 
 
 class Endpoints(str, Enum):
@@ -15,15 +17,27 @@ class Balance:
         Provides methods for getting the balance for the authenticated account.
     """
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: ApiSession | None = None,
+        **session_options: Any,
+    ):
         """
-        Initialize balance client with API credentials
+        Initialize balance client with API credentials or a shared session
 
         Args:
             client_id: The client ID for authentication
             client_secret: The client secret for authentication
+            api_session: Optional session shared with other clients. When
+                given, client_id and client_secret are not used.
+            session_options: Additional keyword arguments for the session, such
+                as timeout or max_connections_per_host
         """
-        self.api_session = ApiSession(client_id, client_secret)
+        self.api_session = resolve_session(
+            ApiSession, api_session, client_id, client_secret, **session_options
+        )
 
     def get_balance(self) -> dict:
         """
@@ -33,3 +47,41 @@ class Balance:
             Balance for the authenticated account
         """
         return dict(self.api_session.get(Endpoints.BALANCE.value))
+
+
+class AsyncBalance:
+    """
+    Asyncio client for managing balance in the DataCrunch API.
+        Provides methods for getting the balance for the authenticated account.
+    """
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: AsyncApiSession | None = None,
+        **session_options: Any,
+    ):
+        """
+        Initialize balance client with API credentials or a shared session
+
+        Args:
+            client_id: The client ID for authentication
+            client_secret: The client secret for authentication
+            api_session: Optional session shared with other clients. When
+                given, client_id and client_secret are not used.
+            session_options: Additional keyword arguments for the session, such
+                as timeout or max_connections_per_host
+        """
+        self.api_session = resolve_session(
+            AsyncApiSession, api_session, client_id, client_secret, **session_options
+        )
+
+    async def get_balance(self) -> dict:
+        """
+        Get the balance for the authenticated account
+
+        Returns:
+            Balance for the authenticated account
+        """
+        return dict(await self.api_session.get(Endpoints.BALANCE.value))
@@ -0,0 +1,225 @@
+from functools import cached_property
+from typing import Any
+
+from ._api_session import ApiSession, BASE_URL, resolve_session
+from ._async_api_session import AsyncApiSession
+from ._timeout import Timeout
+from .balance import AsyncBalance, Balance
+from .deployments import AsyncDeployments, Deployments
+from .images import AsyncImages, Images
+from .instances import AsyncInstances, Instances
+from .secrets import AsyncSecrets, Secrets
+from .serverless_compute import AsyncServerlessCompute, ServerlessCompute
+from .ssh_keys import AsyncSSHKeys, SSHKeys
+from .startup_scripts import AsyncStartupScripts, StartupScripts
+from .volumes import AsyncVolumes, Volumes
+
+
+class DataCrunchClient:
+    """
+    Entry point to every DataCrunch API resource.
+    Owns a single ApiSession, so all resource clients share one token and one
+    connection pool. Resource clients are created on first access.
+    """
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        base_url: str = BASE_URL,
+        api_session: ApiSession | None = None,
+        **session_options: Any,
+    ):
+        """
+        Initialize the client with API credentials or an existing session
+
+        Args:
+            client_id: The client ID for authentication
+            client_secret: The client secret for authentication
+            base_url: Optional custom base URL for the API
+            api_session: Optional existing session. When given, client_id,
+                client_secret, base_url and session_options are not used.
+            session_options: Additional keyword arguments for ApiSession, such
+                as token_cache
+        """
+        self.api_session = resolve_session(
+            ApiSession,
+            api_session,
+            client_id,
+            client_secret,
+            base_url,
+            **session_options,
+        )
+
+    def __enter__(self) -> "DataCrunchClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the shared session
+        """
+        self.api_session.close()
+
+    def with_timeout(self, timeout: Timeout | float | None) -> "DataCrunchClient":
+        """
+        Return a client sending requests with another timeout over the same
+        session, e.g. client.with_timeout(300).volumes.list_volumes()
+
+        Args:
+            timeout: A Timeout or a number of seconds used for connecting and
+                reading. None waits forever.
+        """
+        return DataCrunchClient(api_session=self.api_session.with_timeout(timeout))
+
+    @cached_property
+    def balance(self) -> Balance:
+        """Balance client sharing this client's session"""
+        return Balance(api_session=self.api_session)
+
+    @cached_property
+    def deployments(self) -> Deployments:
+        """Container deployments client sharing this client's session"""
+        return Deployments(api_session=self.api_session)
+
+    @cached_property
+    def images(self) -> Images:
+        """Images client sharing this client's session"""
+        return Images(api_session=self.api_session)
+
+    @cached_property
+    def instances(self) -> Instances:
+        """Instances client sharing this client's session"""
+        return Instances(api_session=self.api_session)
+
+    @cached_property
+    def secrets(self) -> Secrets:
+        """Secrets client sharing this client's session"""
+        return Secrets(api_session=self.api_session)
+
+    @cached_property
+    def serverless_compute(self) -> ServerlessCompute:
+        """Serverless compute client sharing this client's session"""
+        return ServerlessCompute(api_session=self.api_session)
+
+    @cached_property
+    def ssh_keys(self) -> SSHKeys:
+        """SSH keys client sharing this client's session"""
+        return SSHKeys(api_session=self.api_session)
+
+    @cached_property
+    def startup_scripts(self) -> StartupScripts:
+        """Startup scripts client sharing this client's session"""
+        return StartupScripts(api_session=self.api_session)
+
+    @cached_property
+    def volumes(self) -> Volumes:
+        """Volumes client sharing this client's session"""
+        return Volumes(api_session=self.api_session)
+
+
+class AsyncDataCrunchClient:
+    """
+    Asyncio entry point to every DataCrunch API resource.
+    Owns a single AsyncApiSession, so all resource clients share one token and
+    one connection pool. Resource clients are created on first access.
+    """
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        base_url: str = BASE_URL,
+        api_session: AsyncApiSession | None = None,
+        **session_options: Any,
+    ):
+        """
+        Initialize the client with API credentials or an existing session
+
+        Args:
+            client_id: The client ID for authentication
+            client_secret: The client secret for authentication
+            base_url: Optional custom base URL for the API
+            api_session: Optional existing session. When given, client_id,
+                client_secret, base_url and session_options are not used.
+            session_options: Additional keyword arguments for AsyncApiSession,
+                such as token_cache or max_connections
+        """
+        self.api_session = resolve_session(
+            AsyncApiSession,
+            api_session,
+            client_id,
+            client_secret,
+            base_url,
+            **session_options,
+        )
+
+    async def __aenter__(self) -> "AsyncDataCrunchClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the shared session
+        """
+        await self.api_session.aclose()
+
+    def with_timeout(self, timeout: Timeout | float | None) -> "AsyncDataCrunchClient":
+        """
+        Return a client sending requests with another timeout over the same
+        session, e.g. client.with_timeout(300).volumes.list_volumes()
+
+        Args:
+            timeout: A Timeout or a number of seconds used for connecting and
+                reading. None waits forever.
+        """
+        return AsyncDataCrunchClient(api_session=self.api_session.with_timeout(timeout))
+
+    @cached_property
+    def balance(self) -> AsyncBalance:
+        """Balance client sharing this client's session"""
+        return AsyncBalance(api_session=self.api_session)
+
+    @cached_property
+    def deployments(self) -> AsyncDeployments:
+        """Container deployments client sharing this client's session"""
+        return AsyncDeployments(api_session=self.api_session)
+
+    @cached_property
+    def images(self) -> AsyncImages:
+        """Images client sharing this client's session"""
+        return AsyncImages(api_session=self.api_session)
+
+    @cached_property
+    def instances(self) -> AsyncInstances:
+        """Instances client sharing this client's session"""
+        return AsyncInstances(api_session=self.api_session)
+
+    @cached_property
+    def secrets(self) -> AsyncSecrets:
+        """Secrets client sharing this client's session"""
+        return AsyncSecrets(api_session=self.api_session)
+
+    @cached_property
+    def serverless_compute(self) -> AsyncServerlessCompute:
+        """Serverless compute client sharing this client's session"""
+        return AsyncServerlessCompute(api_session=self.api_session)
+
+    @cached_property
+    def ssh_keys(self) -> AsyncSSHKeys:
+        """SSH keys client sharing this client's session"""
+        return AsyncSSHKeys(api_session=self.api_session)
+
+    @cached_property
+    def startup_scripts(self) -> AsyncStartupScripts:
+        """Startup scripts client sharing this client's session"""
+        return AsyncStartupScripts(api_session=self.api_session)
+
+    @cached_property
+    def volumes(self) -> AsyncVolumes:
+        """Volumes client sharing this client's session"""
+        return AsyncVolumes(api_session=self.api_session)
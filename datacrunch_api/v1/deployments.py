@@ -1,9 +1,27 @@
-import requests
+import time
 from enum import Enum
-
-from ._api_session import ApiSession
+from typing import Any, AsyncIterator, Iterable, Iterator
+
+from ._api_session import ApiSession, resolve_session
+from ._async_api_session import AsyncApiSession
+from ._bulk import (
+    DEFAULT_CONCURRENCY,
+    async_bounded_map,
+    async_fetch_many,
+    bounded_map,
+    fetch_many,
+)
+from ._serialization import serialization_cache
+from ._waiters import (
+    DEFAULT_WAIT_POLICY,
+    DEPLOYMENT_FAILURE_STATUSES,
+    WaitPolicy,
+    async_wait_for,
+    wait_for,
+)
 from .types.deployment import Deployment
-
+from .types.info import DeploymentInfo, DeploymentStatus, ReplicaInfo
+from .types.snapshot import DeploymentSnapshot
 
 BASE_URL = "https://api.datacrunch.io/v1"
 
@@ -22,6 +40,59 @@ class Endpoints(str, Enum):
     STATUS = "status"
 
 
+# Endpoints fetched for every deployment of a snapshot
+SNAPSHOT_PARTS = (Endpoints.STATUS, Endpoints.REPLICAS, Endpoints.SCALING)
+# The response or the exception of a part, and when it arrived
+_Part = tuple[dict | None, Exception | None, float]
+
+
+def _listed(response: Any) -> list[dict]:
+    """
+    The deployments of a list response
+
+    Raises:
+        RequestFailed: If the response is not a list of deployments, e.g. an
+            error body
+    """
+    if not isinstance(response, list) or not all(
+        isinstance(deployment, dict) for deployment in response
+    ):
+        raise Deployments.RequestFailed(response)
+    return response
+
+
+def _part(response: Any) -> dict:
+    """
+    The response of a part of a snapshot
+
+    Raises:
+        RequestFailed: If the response is an error body
+    """
+    if not isinstance(response, dict) or "code" in response:
+        raise Deployments.RequestFailed(response)
+    return response
+
+
+def _snapshots(deployments: list, parts: list[_Part]) -> list[DeploymentSnapshot]:
+    """Put the parts fetched for every deployment together"""
+    snapshots = []
+    for index, deployment in enumerate(deployments):
+        start = index * len(SNAPSHOT_PARTS)
+        fetched = parts[start : start + len(SNAPSHOT_PARTS)]
+        snapshot = DeploymentSnapshot(
+            name=deployment["name"],
+            deployment=deployment,
+            fetched_at=max(arrived for _, _, arrived in fetched),
+        )
+        for part, (response, error, _) in zip(SNAPSHOT_PARTS, fetched):
+            if error is None:
+                setattr(snapshot, part.value, response)
+            else:
+                snapshot.errors[part.value] = error
+        snapshots.append(snapshot)
+    return snapshots
+
+
 class Deployments:
     """
     Client for managing container deployments and their configurations.
@@ -33,20 +104,31 @@ class Deployments:
 
         pass
 
-    class RequestFailed(Exception):
-        """Raised when an API request fails for any other reason"""
-
-        pass
-
-    def __init__(self, client_id: str, client_secret: str):
+    # The exception of the session, so that failures of the session and of
+    # the bulk operations, snapshots and models are caught alike
+    RequestFailed = ApiSession.RequestFailed
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: ApiSession | None = None,
+        **session_options: Any,
+    ):
         """
-        Initialize deployments client with API credentials
+        Initialize deployments client with API credentials or a shared session
 
         Args:
             client_id: The client ID for authentication
             client_secret: The client secret for authentication
+            api_session: Optional session shared with other clients. When
+                given, client_id and client_secret are not used.
+            session_options: Additional keyword arguments for the session, such
+                as timeout or max_connections_per_host
         """
-        self.api_session = ApiSession(client_id, client_secret)
+        self.api_session = resolve_session(
+            ApiSession, api_session, client_id, client_secret, **session_options
+        )
 
     # Container Deployments
     def list_container_deployments(self) -> list:
@@ -58,19 +140,93 @@ class Deployments:
         """
         return list(self.api_session.get(Endpoints.CONTAINER_DEPLOYMENTS.value))
 
-    def create_container_deployment(self, deployment_config: Deployment) -> dict:
+    def list_container_deployments_info(self) -> list[DeploymentInfo]:
+        """
+        Get all container deployments for the authenticated account as
+        DeploymentInfos
+
+        Returns:
+            List of deployments
+        """
+        return DeploymentInfo.from_list(
+            self.api_session.get(Endpoints.CONTAINER_DEPLOYMENTS.value)
+        )
+
+    def iter_container_deployments(self) -> Iterator[dict]:
+        """
+        Iterate over all container deployments as the response streams in,
+        decoding each one as soon as it arrives instead of loading the whole
+        list
+
+        Returns:
+            Iterator of deployment objects
+        """
+        return self.api_session.iter_items(Endpoints.CONTAINER_DEPLOYMENTS.value)
+
+    def snapshot(
+        self, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> list[DeploymentSnapshot]:
+        """
+        Get every container deployment with its status, replicas and scaling.
+        After listing the deployments, the requests for their parts are sent
+        concurrency at a time. A part that fails, or whose response is an
+        error, is recorded in the errors of its snapshot instead of failing
+        the others.
+
+        Args:
+            concurrency: The number of requests in flight at once
+
+        Returns:
+            A snapshot of every deployment, in the order of the list
+
+        Raises:
+            RequestFailed: If the deployments could not be listed
+        """
+        deployments = _listed(
+            self.api_session.get(Endpoints.CONTAINER_DEPLOYMENTS.value)
+        )
+
+        def fetch(request: tuple[str, Endpoints]) -> _Part:
+            name, part = request
+            try:
+                response = _part(
+                    self.api_session.get(
+                        f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{name}/{part.value}"
+                    )
+                )
+            except Exception as error:
+                return None, error, time.time()
+            return response, None, time.time()
+
+        requests = [
+            (deployment["name"], part)
+            for deployment in deployments
+            for part in SNAPSHOT_PARTS
+        ]
+        return _snapshots(
+            deployments,
+            bounded_map(fetch, requests, concurrency, self.api_session.workers),
+        )
+
+    def create_container_deployment(
+        self, deployment_config: Deployment, idempotency_key: str | None = None
+    ) -> dict:
         """
         Create a new container deployment with the given configuration
 
         Args:
             deployment_config: Deployment configuration object
+            idempotency_key: Optional unique key for this deployment. With it,
+                the request is retried on transient failures without risking a
+                duplicate deployment.
 
         Returns:
             Created deployment details
         """
-        return self.api_session.post(
+        return self.api_session.post(  # type: ignore
             Endpoints.CONTAINER_DEPLOYMENTS.value,
-            json=deployment_config.to_dict(),  # type: ignore
+            json=serialization_cache.to_dict(deployment_config),
+            idempotency_key=idempotency_key,
         )
 
     def get_container_deployment(self, deployment_name: str) -> dict:
@@ -89,6 +245,52 @@ class Deployments:
             )
         )
 
+    def get_many(
+        self,
+        deployment_names: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_list: bool | None = None,
+    ) -> list[dict | None]:
+        """
+        Get several deployments. With more names than concurrency they are
+        picked from a single list of all deployments, which returns the same
+        fields, otherwise each is fetched with a GET, concurrency at a time.
+
+        Args:
+            deployment_names: The names of the deployments
+            concurrency: The number of GETs in flight at once
+            use_list: Whether to pick the deployments from the list, instead of
+                deciding by the number of names
+
+        Returns:
+            The deployments in the order of the names, None for the ones not found
+        """
+        return fetch_many(
+            self.get_container_deployment,
+            self.list_container_deployments,
+            deployment_names,
+            key="name",
+            concurrency=concurrency,
+            use_list=use_list,
+            workers=self.api_session.workers,
+        )
+
+    def get_container_deployment_info(self, deployment_name: str) -> DeploymentInfo:
+        """
+        Get details of a specific container deployment as a DeploymentInfo
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            Deployment details
+        """
+        return DeploymentInfo.from_dict(
+            self.api_session.get(
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}"
+            )
+        )
+
     def update_container_deployment(
         self, deployment_name: str, deployment_config: Deployment
     ) -> dict:
@@ -104,7 +306,7 @@ class Deployments:
         """
         return self.api_session.patch(
             f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}",
-            json=deployment_config.to_dict(),  # type: ignore
+            json=serialization_cache.to_dict(deployment_config),
         )
 
     def delete_container_deployment(self, deployment_name: str) -> None:
@@ -134,6 +336,55 @@ class Deployments:
             )
         )
 
+    def get_deployment_status_info(self, deployment_name: str) -> DeploymentStatus:
+        """
+        Get current status of a container deployment as a DeploymentStatus
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            Deployment status information
+        """
+        return DeploymentStatus.from_dict(
+            self.api_session.get(
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.STATUS.value}"
+            )
+        )
+
+    def wait_until_deployment_healthy(
+        self,
+        deployment_name: str,
+        timeout: float | None = None,
+        wait_policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+    ) -> dict:
+        """
+        Wait until a container deployment is healthy, polling its status with
+        exponential backoff
+
+        Args:
+            deployment_name: Name/ID of the deployment
+            timeout: Optional seconds to wait at most, replacing the timeout
+                of wait_policy
+            wait_policy: The delays between polls and the timeout
+
+        Returns:
+            The healthy deployment status
+
+        Raises:
+            WaitFailed: If the deployment is paused, out of quota, failed or
+                does not exist
+            WaitTimeout: If the deployment was not healthy in time
+        """
+        return wait_for(
+            lambda: self.get_deployment_status(deployment_name),
+            f"Waiting for deployment {deployment_name} to become healthy",
+            lambda state: state.get("status") == "healthy",
+            lambda state: state.get("status") in DEPLOYMENT_FAILURE_STATUSES,
+            wait_policy,
+            timeout,
+        )
+
     def restart_deployment(self, deployment_name: str) -> None:
         """
         Restart a container deployment
@@ -201,6 +452,26 @@ class Deployments:
             )
         )
 
+    def get_deployment_replicas_info(self, deployment_name: str) -> list[ReplicaInfo]:
+        """
+        Get the replicas of a deployment as ReplicaInfos
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            List of replicas
+
+        Raises:
+            RequestFailed: If the response is an error body
+        """
+        response = self.api_session.get(
+            f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.REPLICAS.value}"
+        )
+        if not isinstance(response, dict) or "list" not in response:
+            raise self.RequestFailed(response)
+        return ReplicaInfo.from_list(response["list"])
+
     def purge_deployment_queue(self, deployment_name: str) -> dict:
         """
         Purge the queue of a deployment
@@ -340,3 +611,465 @@ class Deployments:
                 raise self.InvalidRequest(response.get("message"))
             case _:
                 return response
+
+
+class AsyncDeployments:
+    """
+    Asyncio client for managing container deployments and their configurations.
+    Provides methods for CRUD operations on deployments, scaling, environment variables etc.
+    """
+
+    InvalidRequest = Deployments.InvalidRequest
+    RequestFailed = Deployments.RequestFailed
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: AsyncApiSession | None = None,
+        **session_options: Any,
+    ):
+        """
+        Initialize deployments client with API credentials or a shared session
+
+        Args:
+            client_id: The client ID for authentication
+            client_secret: The client secret for authentication
+            api_session: Optional session shared with other clients. When
+                given, client_id and client_secret are not used.
+            session_options: Additional keyword arguments for the session, such
+                as timeout or max_connections_per_host
+        """
+        self.api_session = resolve_session(
+            AsyncApiSession, api_session, client_id, client_secret, **session_options
+        )
+
+    # Container Deployments
+    async def list_container_deployments(self) -> list:
+        """
+        Get all container deployments for the authenticated account
+
+        Returns:
+            List of deployment objects
+        """
+        return list(await self.api_session.get(Endpoints.CONTAINER_DEPLOYMENTS.value))
+
+    async def list_container_deployments_info(self) -> list[DeploymentInfo]:
+        """
+        Get all container deployments for the authenticated account as
+        DeploymentInfos
+
+        Returns:
+            List of deployments
+        """
+        return DeploymentInfo.from_list(
+            await self.api_session.get(Endpoints.CONTAINER_DEPLOYMENTS.value)
+        )
+
+    def iter_container_deployments(self) -> AsyncIterator[dict]:
+        """
+        Iterate over all container deployments as the response streams in,
+        decoding each one as soon as it arrives instead of loading the whole
+        list
+
+        Returns:
+            Iterator of deployment objects
+        """
+        return self.api_session.iter_items(Endpoints.CONTAINER_DEPLOYMENTS.value)
+
+    async def snapshot(
+        self, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> list[DeploymentSnapshot]:
+        """
+        Get every container deployment with its status, replicas and scaling,
+        see Deployments.snapshot
+        """
+        deployments = _listed(
+            await self.api_session.get(Endpoints.CONTAINER_DEPLOYMENTS.value)
+        )
+
+        async def fetch(request: tuple[str, Endpoints]) -> _Part:
+            name, part = request
+            try:
+                response = _part(
+                    await self.api_session.get(
+                        f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{name}/{part.value}"
+                    )
+                )
+            except Exception as error:
+                return None, error, time.time()
+            return response, None, time.time()
+
+        requests = [
+            (deployment["name"], part)
+            for deployment in deployments
+            for part in SNAPSHOT_PARTS
+        ]
+        return _snapshots(
+            deployments, await async_bounded_map(fetch, requests, concurrency)
+        )
+
+    async def create_container_deployment(
+        self, deployment_config: Deployment, idempotency_key: str | None = None
+    ) -> dict:
+        """
+        Create a new container deployment with the given configuration
+
+        Args:
+            deployment_config: Deployment configuration object
+            idempotency_key: Optional unique key for this deployment. With it,
+                the request is retried on transient failures without risking a
+                duplicate deployment.
+
+        Returns:
+            Created deployment details
+        """
+        return await self.api_session.post(  # type: ignore
+            Endpoints.CONTAINER_DEPLOYMENTS.value,
+            json=serialization_cache.to_dict(deployment_config),
+            idempotency_key=idempotency_key,
+        )
+
+    async def get_container_deployment(self, deployment_name: str) -> dict:
+        """
+        Get details of a specific container deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            Deployment details
+        """
+        return dict(
+            await self.api_session.get(
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}"
+            )
+        )
+
+    async def get_many(
+        self,
+        deployment_names: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_list: bool | None = None,
+    ) -> list[dict | None]:
+        """
+        Get several deployments, see Deployments.get_many
+        """
+        return await async_fetch_many(
+            self.get_container_deployment,
+            self.list_container_deployments,
+            deployment_names,
+            key="name",
+            concurrency=concurrency,
+            use_list=use_list,
+        )
+
+    async def get_container_deployment_info(
+        self, deployment_name: str
+    ) -> DeploymentInfo:
+        """
+        Get details of a specific container deployment as a DeploymentInfo
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            Deployment details
+        """
+        return DeploymentInfo.from_dict(
+            await self.api_session.get(
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}"
+            )
+        )
+
+    async def update_container_deployment(
+        self, deployment_name: str, deployment_config: Deployment
+    ) -> dict:
+        """
+        Update an existing container deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment to update
+            deployment_config: New deployment configuration
+
+        Returns:
+            Updated deployment details
+        """
+        return await self.api_session.patch(
+            f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}",
+            json=serialization_cache.to_dict(deployment_config),
+        )
+
+    async def delete_container_deployment(self, deployment_name: str) -> None:
+        """
+        Delete a container deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment to delete
+        """
+        await self.api_session.delete(
+            f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}"
+        )
+
+    async def get_deployment_status(self, deployment_name: str) -> dict:
+        """
+        Get current status of a container deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            Deployment status information
+        """
+        return dict(
+            await self.api_session.get(
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.STATUS.value}"
+            )
+        )
+
+    async def get_deployment_status_info(
+        self, deployment_name: str
+    ) -> DeploymentStatus:
+        """
+        Get current status of a container deployment as a DeploymentStatus
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            Deployment status information
+        """
+        return DeploymentStatus.from_dict(
+            await self.api_session.get(
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.STATUS.value}"
+            )
+        )
+
+    async def wait_until_deployment_healthy(
+        self,
+        deployment_name: str,
+        timeout: float | None = None,
+        wait_policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+    ) -> dict:
+        """
+        Wait until a container deployment is healthy, see
+        Deployments.wait_until_deployment_healthy
+        """
+        return await async_wait_for(
+            lambda: self.get_deployment_status(deployment_name),
+            f"Waiting for deployment {deployment_name} to become healthy",
+            lambda state: state.get("status") == "healthy",
+            lambda state: state.get("status") in DEPLOYMENT_FAILURE_STATUSES,
+            wait_policy,
+            timeout,
+        )
+
+    async def restart_deployment(self, deployment_name: str) -> None:
+        """
+        Restart a container deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment to restart
+
+        Raises:
+            RequestFailed: If restart operation fails
+        """
+        response = await self.api_session.post_raw(
+            f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.RESTART.value}",
+            json={},
+        )
+        if response.status_code != 201:
+            raise self.RequestFailed(response.json())
+
+    async def get_deployment_scaling(self, deployment_name: str) -> dict:
+        """
+        Get scaling configuration of a deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            Scaling configuration details
+        """
+        return dict(
+            await self.api_session.get(
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.SCALING.value}"
+            )
+        )
+
+    async def update_deployment_scaling(
+        self, deployment_name: str, scaling_config: dict
+    ) -> dict:
+        """
+        Update scaling configuration of a deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment
+            scaling_config: New scaling configuration
+
+        Returns:
+            Updated scaling configuration
+        """
+        return await self.api_session.patch(
+            f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.SCALING.value}",
+            json=scaling_config,
+        )
+
+    async def get_deployment_replicas(self, deployment_name: str) -> dict:
+        """
+        Get information about deployment replicas
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            Replicas information
+        """
+        return dict(
+            await self.api_session.get(
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.REPLICAS.value}"
+            )
+        )
+
+    async def get_deployment_replicas_info(
+        self, deployment_name: str
+    ) -> list[ReplicaInfo]:
+        """
+        Get the replicas of a deployment as ReplicaInfos
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            List of replicas
+
+        Raises:
+            RequestFailed: If the response is an error body
+        """
+        response = await self.api_session.get(
+            f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.REPLICAS.value}"
+        )
+        if not isinstance(response, dict) or "list" not in response:
+            raise self.RequestFailed(response)
+        return ReplicaInfo.from_list(response["list"])
+
+    async def purge_deployment_queue(self, deployment_name: str) -> dict:
+        """
+        Purge the queue of a deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            Response from purge operation
+        """
+        return dict(
+            await self.api_session.post(  # type: ignore
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.PURGE_QUEUE.value}",
+                json={},
+            )
+        )
+
+    async def pause_deployment(self, deployment_name: str) -> dict:
+        """
+        Pause a running deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            Response from pause operation
+        """
+        return dict(
+            await self.api_session.post(  # type: ignore
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.PAUSE.value}",
+                json={},
+            )
+        )
+
+    async def resume_deployment(self, deployment_name: str) -> dict:
+        """
+        Resume a paused deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            Response from resume operation
+        """
+        return dict(
+            await self.api_session.post(  # type: ignore
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.RESUME.value}",
+                json={},
+            )
+        )
+
+    # Environment Variables
+    async def get_environment_variables(self, deployment_name: str) -> dict:
+        """
+        Get environment variables of a deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment
+
+        Returns:
+            Environment variables configuration
+        """
+        return dict(
+            await self.api_session.get(
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.ENVIRONMENT_VARIABLES.value}"
+            )
+        )
+
+    async def create_environment_variables(
+        self, deployment_name: str, variables: dict
+    ) -> dict:
+        """
+        Create environment variables for a deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment
+            variables: Dictionary of environment variables to create
+
+        Returns:
+            Created environment variables
+        """
+        return dict(
+            await self.api_session.post(  # type: ignore
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.ENVIRONMENT_VARIABLES.value}",
+                json=variables,
+            )
+        )
+
+    async def update_environment_variables(
+        self, deployment_name: str, variables: dict
+    ) -> dict:
+        """
+        Update environment variables of a deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment
+            variables: Dictionary of environment variables to update
+
+        Returns:
+            Updated environment variables
+        """
+        return dict(
+            await self.api_session.patch(
+                f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.ENVIRONMENT_VARIABLES.value}",
+                json=variables,
+            )
+        )
+
+    async def delete_environment_variables(self, deployment_name: str) -> None:
+        """
+        Delete all environment variables of a deployment
+
+        Args:
+            deployment_name: Name/ID of the deployment
+        """
+        await self.api_session.delete(
+            f"{Endpoints.CONTAINER_DEPLOYMENTS.value}/{deployment_name}/{Endpoints.ENVIRONMENT_VARIABLES.value}"
+        )
+
+    validate_response = Deployments.validate_response
@@ -1,6 +1,8 @@
 from enum import Enum
+from typing import Any, AsyncIterator, Iterator
 
-from ._api_session import ApiSession
+from ._api_session import ApiSession, resolve_session
+from ._async_api_session import AsyncApiSession
 
 
 class Endpoints(str, Enum):
@@ -14,14 +16,62 @@ class Images:
     Client for managing images in the DataCrunch API.
     """
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: ApiSession | None = None,
+        **session_options: Any,
+    ):
         """
-        Initialize images client with API credentials
+        Initialize images client with API credentials or a shared api_session
         """
-        self.api_session = ApiSession(client_id, client_secret)
+        self.api_session = resolve_session(
+            ApiSession, api_session, client_id, client_secret, **session_options
+        )
+
+    def iter_images(self) -> Iterator[dict]:
+        """
+        Iterate over all images as the response streams in, decoding each one
+        as soon as it arrives instead of loading the whole list
+        """
+        return self.api_session.iter_items(Endpoints.IMAGES.value)
 
     def list_images(self) -> list:
         """
         List all images
         """
         return list(self.api_session.get(Endpoints.IMAGES.value))
+
+
+class AsyncImages:
+    """
+    Asyncio client for managing images in the DataCrunch API.
+    """
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: AsyncApiSession | None = None,
+        **session_options: Any,
+    ):
+        """
+        Initialize images client with API credentials or a shared api_session
+        """
+        self.api_session = resolve_session(
+            AsyncApiSession, api_session, client_id, client_secret, **session_options
+        )
+
+    def iter_images(self) -> AsyncIterator[dict]:
+        """
+        Iterate over all images as the response streams in, decoding each one
+        as soon as it arrives instead of loading the whole list
+        """
+        return self.api_session.iter_items(Endpoints.IMAGES.value)
+
+    async def list_images(self) -> list:
+        """
+        List all images
+        """
+        return list(await self.api_session.get(Endpoints.IMAGES.value))
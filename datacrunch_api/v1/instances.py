@@ -1,7 +1,37 @@
 from enum import Enum
+from typing import Any, AsyncIterator, Iterable, Iterator
 from urllib.parse import urlencode
-from ._api_session import ApiSession
-from .types.instance import Currency, DEFAULT_CURRENCY, Instance, InstanceAction
+from ._api_session import ApiSession, resolve_session
+from ._async_api_session import AsyncApiSession
+from ._bulk import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENCY,
+    ActionResult,
+    Progress,
+    async_fetch_many,
+    async_run_bulk,
+    fetch_many,
+    run_bulk,
+)
+from ._serialization import serialization_cache
+from ._waiters import (
+    DEFAULT_WAIT_POLICY,
+    AsyncGroupWaiter,
+    GroupWaiter,
+    INSTANCE_FAILURE_STATUSES,
+    WaitPolicy,
+    async_wait_for,
+    wait_for,
+)
+from .types.info import InstanceInfo, InstanceTypeInfo
+from .types.instance import (
+    Action,
+    Currency,
+    DEFAULT_CURRENCY,
+    Instance,
+    InstanceAction,
+    InstancesAction,
+)
 
 
 class Endpoints(str, Enum):
@@ -21,36 +51,100 @@ class Instances:
     Client for managing instances in the DataCrunch API.
     """
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: ApiSession | None = None,
+        **session_options: Any,
+    ):
         """
-        Initialize instances client with API credentials
+        Initialize instances client with API credentials or a shared api_session
         """
-        self.api_session = ApiSession(client_id, client_secret)
+        self.api_session = resolve_session(
+            ApiSession, api_session, client_id, client_secret, **session_options
+        )
 
-    def action(self, action: InstanceAction) -> None:
+    def action(self, action: InstanceAction | InstancesAction) -> None:
         """
-        Perform an action on an instance
+        Perform an action on an instance, or on several with InstancesAction
         """
         response = self.api_session.put_raw(
-            Endpoints.INSTANCES.value, json=action.to_dict()  # type: ignore
+            Endpoints.INSTANCES.value, json=serialization_cache.to_dict(action)
         )
         if response.status_code != 202:
             raise self.api_session.RequestFailed(response.json())
 
+    def bulk_action(
+        self,
+        action: Action,
+        instance_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        volume_ids: list[str] | None = None,
+        on_progress: Progress | None = None,
+    ) -> dict[str, ActionResult]:
+        """
+        Perform an action on many instances without stopping at the first
+        failure. The instances are sent in batches of batch_size IDs per
+        request, several requests at once. A batch the API rejects is sent
+        again one instance at a time, so every instance gets its own result.
+
+        Args:
+            action: The action to perform
+            instance_ids: The IDs of the instances
+            concurrency: The number of requests in flight at once
+            batch_size: The number of instances per request, 1 to send one
+                request per instance
+            volume_ids: Optional volumes the action applies to
+            on_progress: Optional callable called with every result, the number
+                of results so far and the number of instances
+
+        Returns:
+            The result for every instance ID, in the order of the IDs
+        """
+
+        def send(batch: list[str]) -> None:
+            if len(batch) == 1:
+                self.action(
+                    InstanceAction(action=action, id=batch[0], volume_ids=volume_ids)
+                )
+            else:
+                self.action(
+                    InstancesAction(action=action, id=batch, volume_ids=volume_ids)
+                )
+
+        return run_bulk(
+            send,
+            instance_ids,
+            batch_size,
+            concurrency,
+            on_progress,
+            self.api_session.workers,
+        )
+
     def delete_instance(self, instance_id: str) -> None:
         """
         Delete an instance
         """
-        action = InstanceAction(action="delete", instance_id=instance_id)
+        action = InstanceAction(action="delete", id=instance_id)
         self.action(action)
 
-    def deploy(self, instance: Instance) -> str:
+    def deploy(self, instance: Instance, idempotency_key: str | None = None) -> str:
         """
         Deploy a new instance
+
+        Args:
+            instance: The instance to deploy
+            idempotency_key: Optional unique key for this deployment. With it,
+                the request is retried on transient failures without risking a
+                duplicate instance.
         """
         return str(
             self.api_session.post(
-                Endpoints.INSTANCES.value, json=instance.to_dict()  # type: ignore
+                Endpoints.INSTANCES.value,
+                json=serialization_cache.to_dict(instance),
+                idempotency_key=idempotency_key,
             )
         )
 
@@ -60,6 +154,112 @@ class Instances:
         """
         return dict(self.api_session.get(f"{Endpoints.INSTANCES.value}/{instance_id}"))
 
+    def get_many(
+        self,
+        instance_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_list: bool | None = None,
+    ) -> list[dict | None]:
+        """
+        Get several instances. With more IDs than concurrency they are
+        picked from a single list of all instances, which returns the same
+        fields, otherwise each is fetched with a GET, concurrency at a time.
+
+        Args:
+            instance_ids: The IDs of the instances
+            concurrency: The number of GETs in flight at once
+            use_list: Whether to pick the instances from the list, instead of
+                deciding by the number of IDs
+
+        Returns:
+            The instances in the order of the IDs, None for the ones not found
+        """
+        return fetch_many(
+            self.get_instance,
+            self.list_instances,
+            instance_ids,
+            concurrency=concurrency,
+            use_list=use_list,
+            workers=self.api_session.workers,
+        )
+
+    def get_instance_info(self, instance_id: str) -> InstanceInfo:
+        """
+        Get an instance by ID as an InstanceInfo
+        """
+        return InstanceInfo.from_dict(
+            self.api_session.get(f"{Endpoints.INSTANCES.value}/{instance_id}")
+        )
+
+    def wait_for_instance_status(
+        self,
+        instance_id: str,
+        status: str = "running",
+        timeout: float | None = None,
+        wait_policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+    ) -> dict:
+        """
+        Wait until an instance has the given status, polling it with
+        exponential backoff
+
+        Args:
+            instance_id: The ID of the instance
+            status: The awaited status, such as "running" or "offline"
+            timeout: Optional seconds to wait at most, replacing the timeout
+                of wait_policy
+            wait_policy: The delays between polls and the timeout
+
+        Returns:
+            The instance with the awaited status
+
+        Raises:
+            WaitFailed: If the instance failed, is being deleted or does not
+                exist, unless that is the awaited status
+            WaitTimeout: If the instance did not have the status in time
+        """
+        failures = INSTANCE_FAILURE_STATUSES - {status}
+        return wait_for(
+            lambda: self.get_instance(instance_id),
+            f"Waiting for instance {instance_id} to be {status}",
+            lambda state: state.get("status") == status,
+            lambda state: state.get("status") in failures,
+            wait_policy,
+            timeout,
+        )
+
+    def wait_for_instances(
+        self,
+        instance_ids: Iterable[str],
+        status: str = "running",
+        timeout: float | None = None,
+        wait_policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+    ) -> GroupWaiter:
+        """
+        Wait until a group of instances have the given status, listing all
+        instances once per poll instead of getting each of them
+
+        Args:
+            instance_ids: The IDs of the instances
+            status: The awaited status, such as "running" or "offline"
+            timeout: Optional seconds to wait at most, replacing the timeout
+                of wait_policy
+            wait_policy: The delays between polls and the timeout
+
+        Returns:
+            A waiter yielding an event per instance as soon as it has the
+            status, failed or timed out when iterated, see GroupWaiter
+        """
+        failures = INSTANCE_FAILURE_STATUSES - {status}
+        return GroupWaiter(
+            self.list_instances,
+            instance_ids,
+            f"Waiting for instance {{id}} to be {status}",
+            lambda state: state.get("status") == status,
+            lambda state: state.get("status") in failures,
+            policy=wait_policy,
+            timeout=timeout,
+        )
+
     def get_instance_type_availabilities(
         self,
         is_spot: bool | None = None,
@@ -159,12 +359,38 @@ class Instances:
             )
         )
 
+    def list_instance_types_info(
+        self, currency: Currency | None = None
+    ) -> list[InstanceTypeInfo]:
+        """
+        Get all instance types as InstanceTypeInfos
+        """
+        actual_currency = currency or DEFAULT_CURRENCY
+        return InstanceTypeInfo.from_list(
+            self.api_session.get(
+                f"{Endpoints.INSTANCE_TYPES.value}?currency={actual_currency}"
+            )
+        )
+
+    def iter_instances(self) -> Iterator[dict]:
+        """
+        Iterate over all instances as the response streams in, decoding each one
+        as soon as it arrives instead of loading the whole list
+        """
+        return self.api_session.iter_items(Endpoints.INSTANCES.value)
+
     def list_instances(self) -> list[dict]:
         """
         List all instances
         """
         return list(self.api_session.get(Endpoints.INSTANCES.value))
 
+    def list_instances_info(self) -> list[InstanceInfo]:
+        """
+        List all instances as InstanceInfos
+        """
+        return InstanceInfo.from_list(self.api_session.get(Endpoints.INSTANCES.value))
+
     def list_locations(self) -> list[dict[str, str]]:
         """
         List all locations
@@ -176,3 +402,309 @@ class Instances:
         List all long-term periods
         """
         return list(self.api_session.get(Endpoints.LONG_TERM.value))
+
+
+class AsyncInstances:
+    """
+    Asyncio client for managing instances in the DataCrunch API.
+    """
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: AsyncApiSession | None = None,
+        **session_options: Any,
+    ):
+        """
+        Initialize instances client with API credentials or a shared api_session
+        """
+        self.api_session = resolve_session(
+            AsyncApiSession, api_session, client_id, client_secret, **session_options
+        )
+
+    async def action(self, action: InstanceAction | InstancesAction) -> None:
+        """
+        Perform an action on an instance, or on several with InstancesAction
+        """
+        response = await self.api_session.put_raw(
+            Endpoints.INSTANCES.value, json=serialization_cache.to_dict(action)
+        )
+        if response.status_code != 202:
+            raise self.api_session.RequestFailed(response.json())
+
+    async def bulk_action(
+        self,
+        action: Action,
+        instance_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        volume_ids: list[str] | None = None,
+        on_progress: Progress | None = None,
+    ) -> dict[str, ActionResult]:
+        """
+        Perform an action on many instances without stopping at the first
+        failure, see Instances.bulk_action
+        """
+
+        async def send(batch: list[str]) -> None:
+            if len(batch) == 1:
+                await self.action(
+                    InstanceAction(action=action, id=batch[0], volume_ids=volume_ids)
+                )
+            else:
+                await self.action(
+                    InstancesAction(action=action, id=batch, volume_ids=volume_ids)
+                )
+
+        return await async_run_bulk(
+            send, instance_ids, batch_size, concurrency, on_progress
+        )
+
+    async def delete_instance(self, instance_id: str) -> None:
+        """
+        Delete an instance
+        """
+        action = InstanceAction(action="delete", id=instance_id)
+        await self.action(action)
+
+    async def deploy(
+        self, instance: Instance, idempotency_key: str | None = None
+    ) -> str:
+        """
+        Deploy a new instance
+
+        Args:
+            instance: The instance to deploy
+            idempotency_key: Optional unique key for this deployment. With it,
+                the request is retried on transient failures without risking a
+                duplicate instance.
+        """
+        return str(
+            await self.api_session.post(
+                Endpoints.INSTANCES.value,
+                json=serialization_cache.to_dict(instance),
+                idempotency_key=idempotency_key,
+            )
+        )
+
+    async def get_instance(self, instance_id: str) -> dict:
+        """
+        Get an instance by ID
+        """
+        return dict(
+            await self.api_session.get(f"{Endpoints.INSTANCES.value}/{instance_id}")
+        )
+
+    async def get_many(
+        self,
+        instance_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_list: bool | None = None,
+    ) -> list[dict | None]:
+        """
+        Get several instances, see Instances.get_many
+        """
+        return await async_fetch_many(
+            self.get_instance,
+            self.list_instances,
+            instance_ids,
+            concurrency=concurrency,
+            use_list=use_list,
+        )
+
+    async def get_instance_info(self, instance_id: str) -> InstanceInfo:
+        """
+        Get an instance by ID as an InstanceInfo
+        """
+        return InstanceInfo.from_dict(
+            await self.api_session.get(f"{Endpoints.INSTANCES.value}/{instance_id}")
+        )
+
+    async def wait_for_instance_status(
+        self,
+        instance_id: str,
+        status: str = "running",
+        timeout: float | None = None,
+        wait_policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+    ) -> dict:
+        """
+        Wait until an instance has the given status, see
+        Instances.wait_for_instance_status
+        """
+        failures = INSTANCE_FAILURE_STATUSES - {status}
+        return await async_wait_for(
+            lambda: self.get_instance(instance_id),
+            f"Waiting for instance {instance_id} to be {status}",
+            lambda state: state.get("status") == status,
+            lambda state: state.get("status") in failures,
+            wait_policy,
+            timeout,
+        )
+
+    def wait_for_instances(
+        self,
+        instance_ids: Iterable[str],
+        status: str = "running",
+        timeout: float | None = None,
+        wait_policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+    ) -> AsyncGroupWaiter:
+        """
+        Wait until a group of instances have the given status, see
+        Instances.wait_for_instances
+        """
+        failures = INSTANCE_FAILURE_STATUSES - {status}
+        return AsyncGroupWaiter(
+            self.list_instances,
+            instance_ids,
+            f"Waiting for instance {{id}} to be {status}",
+            lambda state: state.get("status") == status,
+            lambda state: state.get("status") in failures,
+            policy=wait_policy,
+            timeout=timeout,
+        )
+
+    async def get_instance_type_availabilities(
+        self,
+        is_spot: bool | None = None,
+        location_code: str | None = None,
+    ) -> list[dict] | bool:
+        """
+        Get the availability information for instance types.
+
+        Args:
+            instance_type: Optional specific instance type to check availability for.
+                         If None, returns availability for all instance types.
+            is_spot: Optional filter for spot instances.
+                    If True, only returns spot instance availability.
+                    If False, only returns on-demand instance availability.
+                    If None, returns both spot and on-demand availability.
+            location_code: Optional location code to filter availability by region.
+                         If None, returns availability across all regions.
+
+        Returns:
+            A list of dictionaries containing availability information for the requested
+            instance types, including details like capacity and pricing.
+
+        Raises:
+            InvalidRequest: If the request parameters are invalid
+            RequestFailed: If the API request fails
+        """
+        params: dict[str, str | bool] = {}
+        if is_spot is not None:
+            params["is_spot"] = is_spot
+        if location_code is not None:
+            params["location_code"] = location_code
+        return list(
+            await self.api_session.get(
+                f"{Endpoints.INSTANCE_AVAILABILITY.value}?{urlencode(params)}"
+            )
+        )
+
+    async def get_instance_type_availability(
+        self,
+        instance_type: str,
+        is_spot: bool | None = None,
+        location_code: str | None = None,
+    ) -> list[dict] | bool:
+        """
+        Get the availability information for instance types.
+
+        Args:
+            instance_type: Optional specific instance type to check availability for.
+                         If None, returns availability for all instance types.
+            is_spot: Optional filter for spot instances.
+                    If True, only returns spot instance availability.
+                    If False, only returns on-demand instance availability.
+                    If None, returns both spot and on-demand availability.
+            location_code: Optional location code to filter availability by region.
+                         If None, returns availability across all regions.
+
+        Returns:
+            A list of dictionaries containing availability information for the requested
+            instance types, including details like capacity and pricing.
+
+        Raises:
+            InvalidRequest: If the request parameters are invalid
+            RequestFailed: If the API request fails
+        """
+        params: dict[str, str | bool] = {}
+        if is_spot is not None:
+            params["is_spot"] = is_spot
+        if location_code is not None:
+            params["location_code"] = location_code
+        return bool(
+            await self.api_session.get(
+                f"{Endpoints.INSTANCE_AVAILABILITY.value}/{instance_type}?{urlencode(params)}"
+            )
+        )
+
+    async def get_price_history(
+        self, instance_type: str, currency: Currency | None = None
+    ) -> dict[str, list[dict]]:
+        """
+        Get the price history for an instance type
+        """
+        actual_currency = currency or DEFAULT_CURRENCY
+        return dict(
+            await self.api_session.get(
+                f"{Endpoints.PRICE_HISTORY.value}/{instance_type}/{actual_currency}"
+            )
+        )
+
+    async def list_instance_types(self, currency: Currency | None = None) -> list[dict]:
+        """
+        Get all instance types
+        """
+        actual_currency = currency or DEFAULT_CURRENCY
+        return list(
+            await self.api_session.get(
+                f"{Endpoints.INSTANCE_TYPES.value}?currency={actual_currency}"
+            )
+        )
+
+    async def list_instance_types_info(
+        self, currency: Currency | None = None
+    ) -> list[InstanceTypeInfo]:
+        """
+        Get all instance types as InstanceTypeInfos
+        """
+        actual_currency = currency or DEFAULT_CURRENCY
+        return InstanceTypeInfo.from_list(
+            await self.api_session.get(
+                f"{Endpoints.INSTANCE_TYPES.value}?currency={actual_currency}"
+            )
+        )
+
+    def iter_instances(self) -> AsyncIterator[dict]:
+        """
+        Iterate over all instances as the response streams in, decoding each one
+        as soon as it arrives instead of loading the whole list
+        """
+        return self.api_session.iter_items(Endpoints.INSTANCES.value)
+
+    async def list_instances(self) -> list[dict]:
+        """
+        List all instances
+        """
+        return list(await self.api_session.get(Endpoints.INSTANCES.value))
+
+    async def list_instances_info(self) -> list[InstanceInfo]:
+        """
+        List all instances as InstanceInfos
+        """
+        return InstanceInfo.from_list(
+            await self.api_session.get(Endpoints.INSTANCES.value)
+        )
+
+    async def list_locations(self) -> list[dict[str, str]]:
+        """
+        List all locations
+        """
+        return list(await self.api_session.get(Endpoints.LOCATIONS.value))
+
+    async def list_long_term_periods(self) -> list[dict[str, bool | int | str]]:
+        """
+        List all long-term periods
+        """
+        return list(await self.api_session.get(Endpoints.LONG_TERM.value))
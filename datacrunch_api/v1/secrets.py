@@ -1,6 +1,9 @@
 from enum import Enum
+from typing import Any
 
-from ._api_session import ApiSession
+from ._api_session import ApiSession, resolve_session
+from ._async_api_session import AsyncApiSession
+from ._serialization import to_dict
 from .types.secret import Secret
 
 
@@ -26,15 +29,27 @@ class Secrets:
 
         pass
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: ApiSession | None = None,
+        **session_options: Any,
+    ):
         """
-        Initialize secrets client with API credentials
+        Initialize secrets client with API credentials or a shared session
 
         Args:
             client_id: The client ID for authentication
             client_secret: The client secret for authentication
+            api_session: Optional session shared with other clients. When
+                given, client_id and client_secret are not used.
+            session_options: Additional keyword arguments for the session, such
+                as timeout or max_connections_per_host
         """
-        self.api_session = ApiSession(client_id, client_secret)
+        self.api_session = resolve_session(
+            ApiSession, api_session, client_id, client_secret, **session_options
+        )
 
     def list_secrets(self) -> list:
         """
@@ -56,7 +71,7 @@ class Secrets:
             RequestFailed: If the secret creation fails
         """
         response = self.api_session.post_raw(
-            Endpoints.SECRETS.value, json=secret.to_dict()  # type: ignore
+            Endpoints.SECRETS.value, json=to_dict(secret)
         )
         if response.status_code != 201:
             raise self.RequestFailed(response.json())
@@ -72,3 +87,72 @@ class Secrets:
             RequestFailed: If the secret deletion fails
         """
         self.api_session.delete(f"{Endpoints.SECRETS.value}/{secret_name}")
+
+
+class AsyncSecrets:
+    """
+    Asyncio client for managing secrets in the DataCrunch API.
+    Provides methods for creating, listing and deleting secrets.
+    """
+
+    InvalidRequest = Secrets.InvalidRequest
+    RequestFailed = Secrets.RequestFailed
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: AsyncApiSession | None = None,
+        **session_options: Any,
+    ):
+        """
+        Initialize secrets client with API credentials or a shared session
+
+        Args:
+            client_id: The client ID for authentication
+            client_secret: The client secret for authentication
+            api_session: Optional session shared with other clients. When
+                given, client_id and client_secret are not used.
+            session_options: Additional keyword arguments for the session, such
+                as timeout or max_connections_per_host
+        """
+        self.api_session = resolve_session(
+            AsyncApiSession, api_session, client_id, client_secret, **session_options
+        )
+
+    async def list_secrets(self) -> list:
+        """
+        Get all secrets for the authenticated account
+
+        Returns:
+            List of secrets
+        """
+        return list(await self.api_session.get(Endpoints.SECRETS.value))
+
+    async def create_secret(self, secret: Secret) -> None:
+        """
+        Create a new secret
+
+        Args:
+            secret: The secret object containing name and value
+
+        Raises:
+            RequestFailed: If the secret creation fails
+        """
+        response = await self.api_session.post_raw(
+            Endpoints.SECRETS.value, json=to_dict(secret)
+        )
+        if response.status_code != 201:
+            raise self.RequestFailed(response.json())
+
+    async def delete_secret(self, secret_name: str) -> None:
+        """
+        Delete a secret by name
+
+        Args:
+            secret_name: Name of the secret to delete
+
+        Raises:
+            RequestFailed: If the secret deletion fails
+        """
+        await self.api_session.delete(f"{Endpoints.SECRETS.value}/{secret_name}")
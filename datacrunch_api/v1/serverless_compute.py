@@ -1,6 +1,8 @@
 from enum import Enum
+from typing import Any
 
-from ._api_session import ApiSession
+from ._api_session import ApiSession, resolve_session
+from ._async_api_session import AsyncApiSession
 
 
 class Endpoints(str, Enum):
@@ -25,15 +27,27 @@ class ServerlessCompute:
 
         pass
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: ApiSession | None = None,
+        **session_options: Any,
+    ):
         """
-        Initialize serverless compute client with API credentials
+        Initialize serverless compute client with API credentials or a shared session
 
         Args:
             client_id: The client ID for authentication
             client_secret: The client secret for authentication
+            api_session: Optional session shared with other clients. When
+                given, client_id and client_secret are not used.
+            session_options: Additional keyword arguments for the session, such
+                as timeout or max_connections_per_host
         """
-        self.api_session = ApiSession(client_id, client_secret)
+        self.api_session = resolve_session(
+            ApiSession, api_session, client_id, client_secret, **session_options
+        )
 
     def list_serverless_compute_resources(self) -> list:
         """
@@ -43,3 +57,44 @@ class ServerlessCompute:
             List of serverless compute resources
         """
         return list(self.api_session.get(Endpoints.SERVERLESS_COMPUTE.value))
+
+
+class AsyncServerlessCompute:
+    """
+    Asyncio client for managing serverless compute resources in the DataCrunch API.
+    Provides methods for listing and managing serverless compute instances.
+    """
+
+    InvalidRequest = ServerlessCompute.InvalidRequest
+    RequestFailed = ServerlessCompute.RequestFailed
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: AsyncApiSession | None = None,
+        **session_options: Any,
+    ):
+        """
+        Initialize serverless compute client with API credentials or a shared session
+
+        Args:
+            client_id: The client ID for authentication
+            client_secret: The client secret for authentication
+            api_session: Optional session shared with other clients. When
+                given, client_id and client_secret are not used.
+            session_options: Additional keyword arguments for the session, such
+                as timeout or max_connections_per_host
+        """
+        self.api_session = resolve_session(
+            AsyncApiSession, api_session, client_id, client_secret, **session_options
+        )
+
+    async def list_serverless_compute_resources(self) -> list:
+        """
+        Get all serverless compute resources for the authenticated account
+
+        Returns:
+            List of serverless compute resources
+        """
+        return list(await self.api_session.get(Endpoints.SERVERLESS_COMPUTE.value))
@@ -1,6 +1,9 @@
 from enum import Enum
+from typing import Any
 
-from ._api_session import ApiSession
+from ._api_session import ApiSession, resolve_session
+from ._async_api_session import AsyncApiSession
+from ._serialization import to_dict
 from .types.ssh_key import SSHKey
 
 
@@ -16,15 +19,27 @@ class SSHKeys:
     Provides methods for creating, listing and deleting SSH keys.
     """
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: ApiSession | None = None,
+        **session_options: Any,
+    ):
         """
-        Initialize SSH keys client with API credentials
+        Initialize SSH keys client with API credentials or a shared session
 
         Args:
             client_id: The client ID for authentication
             client_secret: The client secret for authentication
+            api_session: Optional session shared with other clients. When
+                given, client_id and client_secret are not used.
+            session_options: Additional keyword arguments for the session, such
+                as timeout or max_connections_per_host
         """
-        self.api_session = ApiSession(client_id, client_secret)
+        self.api_session = resolve_session(
+            ApiSession, api_session, client_id, client_secret, **session_options
+        )
 
     def add_ssh_key(self, ssh_key: SSHKey) -> str:
         """
@@ -37,7 +52,7 @@ class SSHKeys:
             RequestFailed: If the SSH key creation fails
         """
         response = self.api_session.post_raw(
-            Endpoints.SSH_KEYS.value, json=ssh_key.to_dict()  # type: ignore
+            Endpoints.SSH_KEYS.value, json=to_dict(ssh_key)
         )
         if response.status_code != 201:
             raise self.api_session.RequestFailed(response.json())
@@ -77,3 +92,84 @@ class SSHKeys:
             List of SSH keys
         """
         return list(self.api_session.get(Endpoints.SSH_KEYS.value))
+
+
+class AsyncSSHKeys:
+    """
+    Asyncio client for managing SSH keys in the DataCrunch API.
+    Provides methods for creating, listing and deleting SSH keys.
+    """
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: AsyncApiSession | None = None,
+        **session_options: Any,
+    ):
+        """
+        Initialize SSH keys client with API credentials or a shared session
+
+        Args:
+            client_id: The client ID for authentication
+            client_secret: The client secret for authentication
+            api_session: Optional session shared with other clients. When
+                given, client_id and client_secret are not used.
+            session_options: Additional keyword arguments for the session, such
+                as timeout or max_connections_per_host
+        """
+        self.api_session = resolve_session(
+            AsyncApiSession, api_session, client_id, client_secret, **session_options
+        )
+
+    async def add_ssh_key(self, ssh_key: SSHKey) -> str:
+        """
+        Create a new SSH key
+
+        Args:
+            ssh_key: The SSH key object containing name and value
+
+        Raises:
+            RequestFailed: If the SSH key creation fails
+        """
+        response = await self.api_session.post_raw(
+            Endpoints.SSH_KEYS.value, json=to_dict(ssh_key)
+        )
+        if response.status_code != 201:
+            raise self.api_session.RequestFailed(response.json())
+        return str(response.text)
+
+    async def delete_ssh_key(self, key_id: str) -> None:
+        """
+        Delete an SSH key by ID
+        """
+        await self.api_session.delete(f"{Endpoints.SSH_KEYS.value}/{key_id}")
+
+    async def delete_ssh_keys(self, keys: list[str]) -> None:
+        """
+        Delete an SSH key by name
+
+        Args:
+            ssh_key_name: Name of the SSH key to delete
+
+        Raises:
+            RequestFailed: If the SSH key deletion fails
+        """
+        await self.api_session.delete(
+            f"{Endpoints.SSH_KEYS.value}", json={"keys": keys}  # type: ignore
+        )
+
+    async def get_ssh_key(self, key_id: str) -> dict[str, str]:
+        """
+        Get an SSH key by ID
+        """
+        return dict(await self.api_session.get(f"{Endpoints.SSH_KEYS.value}/{key_id}"))
+
+    async def list_ssh_keys(self) -> list:
+        """
+        Get all SSH keys for the authenticated account
+
+        Returns:
+            List of SSH keys
+        """
+        return list(await self.api_session.get(Endpoints.SSH_KEYS.value))
@@ -1,6 +1,10 @@
 from enum import Enum
+from typing import Any, Iterable
 
-from ._api_session import ApiSession
+from ._api_session import ApiSession, resolve_session
+from ._async_api_session import AsyncApiSession
+from ._bulk import DEFAULT_CONCURRENCY, async_fetch_many, fetch_many
+from ._serialization import serialization_cache
 from .types.startup_script import StartupScript
 
 
@@ -15,11 +19,19 @@ class StartupScripts:
     Client for managing startup scripts in the DataCrunch API.
     """
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: ApiSession | None = None,
+        **session_options: Any,
+    ):
         """
-        Initialize startup scripts client with API credentials
+        Initialize startup scripts client with API credentials or a shared api_session
         """
-        self.api_session = ApiSession(client_id, client_secret)
+        self.api_session = resolve_session(
+            ApiSession, api_session, client_id, client_secret, **session_options
+        )
 
     def add_startup_script(self, startup_script: StartupScript) -> str:
         """
@@ -35,7 +47,8 @@ class StartupScripts:
             RequestFailed: If the startup script creation fails
         """
         response = self.api_session.post_raw(
-            Endpoints.STARTUP_SCRIPTS.value, json=startup_script.to_dict()  # type: ignore
+            Endpoints.STARTUP_SCRIPTS.value,
+            json=serialization_cache.to_dict(startup_script),
         )
         if response.status_code != 201:
             raise self.api_session.RequestFailed(response.json())
@@ -67,8 +80,127 @@ class StartupScripts:
             )
         )
 
+    def get_many(
+        self,
+        startup_script_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_list: bool | None = None,
+    ) -> list[dict | None]:
+        """
+        Get several startup scripts. With more IDs than concurrency they are
+        picked from a single list of all startup scripts, which returns the same
+        fields, otherwise each is fetched with a GET, concurrency at a time.
+
+        Args:
+            startup_script_ids: The IDs of the startup scripts
+            concurrency: The number of GETs in flight at once
+            use_list: Whether to pick the startup scripts from the list, instead of
+                deciding by the number of IDs
+
+        Returns:
+            The startup scripts in the order of the IDs, None for the ones not found
+        """
+        return fetch_many(
+            self.get_startup_script,
+            self.list_startup_scripts,
+            startup_script_ids,
+            concurrency=concurrency,
+            use_list=use_list,
+            workers=self.api_session.workers,
+        )
+
     def list_startup_scripts(self) -> list[dict[str, str]]:
         """
         Get all startup scripts
         """
         return list(self.api_session.get(Endpoints.STARTUP_SCRIPTS.value))
+
+
+class AsyncStartupScripts:
+    """
+    Asyncio client for managing startup scripts in the DataCrunch API.
+    """
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: AsyncApiSession | None = None,
+        **session_options: Any,
+    ):
+        """
+        Initialize startup scripts client with API credentials or a shared api_session
+        """
+        self.api_session = resolve_session(
+            AsyncApiSession, api_session, client_id, client_secret, **session_options
+        )
+
+    async def add_startup_script(self, startup_script: StartupScript) -> str:
+        """
+        Create a new startup script
+
+        Args:
+            startup_script: The StartupScript object containing name and script content
+
+        Returns:
+            The ID of the created startup script
+
+        Raises:
+            RequestFailed: If the startup script creation fails
+        """
+        response = await self.api_session.post_raw(
+            Endpoints.STARTUP_SCRIPTS.value,
+            json=serialization_cache.to_dict(startup_script),
+        )
+        if response.status_code != 201:
+            raise self.api_session.RequestFailed(response.json())
+        return str(response.text)
+
+    async def delete_startup_script(self, startup_script_id: str) -> None:
+        """
+        Delete a startup script by ID
+        """
+        await self.api_session.delete(
+            f"{Endpoints.STARTUP_SCRIPTS.value}/{startup_script_id}"
+        )
+
+    async def delete_startup_scripts(self, startup_script_ids: list[str]) -> None:
+        """
+        Delete multiple startup scripts by ID
+        """
+        await self.api_session.delete(
+            f"{Endpoints.STARTUP_SCRIPTS.value}", json={"scripts": startup_script_ids}  # type: ignore
+        )
+
+    async def get_startup_script(self, startup_script_id: str) -> dict:
+        """
+        Get a startup script by ID
+        """
+        return dict(
+            await self.api_session.get(
+                f"{Endpoints.STARTUP_SCRIPTS.value}/{startup_script_id}"
+            )
+        )
+
+    async def get_many(
+        self,
+        startup_script_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_list: bool | None = None,
+    ) -> list[dict | None]:
+        """
+        Get several startup scripts, see StartupScripts.get_many
+        """
+        return await async_fetch_many(
+            self.get_startup_script,
+            self.list_startup_scripts,
+            startup_script_ids,
+            concurrency=concurrency,
+            use_list=use_list,
+        )
+
+    async def list_startup_scripts(self) -> list[dict[str, str]]:
+        """
+        Get all startup scripts
+        """
+        return list(await self.api_session.get(Endpoints.STARTUP_SCRIPTS.value))
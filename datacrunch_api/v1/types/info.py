@@ -0,0 +1,161 @@
+"""
+Models of the resources returned by the API. Unlike the request types they are
+slotted, so a fleet-wide scan keeps no per-record dict around, and decoding
+copies the known fields once without validating them. They are not frozen,
+which would make decoding several times slower by setting every field through
+object.__setattr__. Fields the models do not know, such as ones added to the
+API later, are kept in extra.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Self
+
+from .._api_session import SessionBase
+
+
+@dataclass(slots=True, kw_only=True)
+class Info:
+    """Base of the response models"""
+
+    _names: ClassVar[frozenset[str]] = frozenset()
+
+    extra: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    def __init_subclass__(cls):
+        # Without super(), which slots=True breaks in the methods of the class
+        cls._names = frozenset(cls.__annotations__) - {"_names", "extra"}
+
+    @classmethod
+    def from_dict(cls, data: Any) -> Self:
+        """
+        Create the model from a decoded response
+
+        Args:
+            data: The response object
+
+        Returns:
+            The model, with the fields it does not know in extra
+
+        Raises:
+            RequestFailed: If the response is not an object, e.g. an error body
+        """
+        if not isinstance(data, dict) or "code" in data:
+            raise SessionBase.RequestFailed(data)
+        names = cls._names
+        if data.keys() <= names:
+            return cls(**data)
+        known = {}
+        extra = {}
+        for name, value in data.items():
+            if name in names:
+                known[name] = value
+            else:
+                extra[name] = value
+        return cls(**known, extra=extra)
+
+    @classmethod
+    def from_list(cls, data: Any) -> list[Self]:
+        """
+        Create a model for each object of a decoded response
+
+        Raises:
+            RequestFailed: If the response is not a list of objects
+        """
+        if not isinstance(data, list):
+            raise SessionBase.RequestFailed(data)
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in data]
+
+    def to_dict(self) -> dict[str, Any]:
+        """The response object, without the fields that are None"""
+        data = {
+            name: value
+            for name in self._names
+            if (value := getattr(self, name)) is not None
+        }
+        data.update(self.extra)
+        return data
+
+
+@dataclass(slots=True, kw_only=True)
+class InstanceInfo(Info):
+    id: str
+    hostname: str | None = None
+    description: str | None = None
+    status: str | None = None
+    ip: str | None = None
+    instance_type: str | None = None
+    image: str | None = None
+    os_name: str | None = None
+    location: str | None = None
+    price_per_hour: float | None = None
+    is_spot: bool | None = None
+    contract: str | None = None
+    pricing: str | None = None
+    cpu: dict[str, Any] | None = None
+    gpu: dict[str, Any] | None = None
+    memory: dict[str, Any] | None = None
+    gpu_memory: dict[str, Any] | None = None
+    storage: dict[str, Any] | None = None
+    ssh_key_ids: list[str] | None = None
+    startup_script_id: str | None = None
+    os_volume_id: str | None = None
+    volume_ids: list[str] | None = None
+    jupyter_token: str | None = None
+    created_at: str | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class InstanceTypeInfo(Info):
+    instance_type: str
+    id: str | None = None
+    description: str | None = None
+    price_per_hour: str | None = None
+    spot_price: str | None = None
+    currency: str | None = None
+    cpu: dict[str, Any] | None = None
+    gpu: dict[str, Any] | None = None
+    memory: dict[str, Any] | None = None
+    gpu_memory: dict[str, Any] | None = None
+    storage: dict[str, Any] | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class VolumeInfo(Info):
+    id: str
+    name: str | None = None
+    size: int | None = None
+    type: str | None = None
+    status: str | None = None
+    instance_id: str | None = None
+    location: str | None = None
+    is_os_volume: bool | None = None
+    target: str | None = None
+    ssh_key_ids: list[str] | None = None
+    created_at: str | None = None
+    deleted_at: str | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class DeploymentInfo(Info):
+    name: str
+    status: str | None = None
+    is_spot: bool | None = None
+    endpoint_base_url: str | None = None
+    created_at: str | None = None
+    compute: dict[str, Any] | None = None
+    scaling: dict[str, Any] | None = None
+    containers: list[dict[str, Any]] | None = None
+    container_registry_settings: dict[str, Any] | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class DeploymentStatus(Info):
+    status: str
+
+
+@dataclass(slots=True, kw_only=True)
+class ReplicaInfo(Info):
+    id: str
+    status: str | None = None
+    started_at: str | None = None
@@ -68,7 +68,19 @@ class Instance:
 @dataclass(frozen=True)
 class InstanceAction:
     action: Action
-    instance_id: str
+    id: str
+    volume_ids: list[str] | None = field(
+        default=None, metadata=config(exclude=lambda f: f is None)  # type: ignore
+    )
+
+
+@dataclass_json
+@dataclass(frozen=True)
+class InstancesAction:
+    """An action on several instances in one request"""
+
+    action: Action
+    id: list[str]
     volume_ids: list[str] | None = field(
         default=None, metadata=config(exclude=lambda f: f is None)  # type: ignore
     )
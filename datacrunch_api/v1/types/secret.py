@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import ClassVar
 from dataclasses_json import dataclass_json  # type: ignore
 
 
@@ -7,3 +8,6 @@ from dataclasses_json import dataclass_json  # type: ignore
 class Secret:
     name: str
     value: str
+
+    # Never kept in the serialization cache
+    sensitive: ClassVar[bool] = True
@@ -0,0 +1,33 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True, kw_only=True)
+class DeploymentSnapshot:
+    """
+    State of a container deployment, put together from its record in the list
+    of deployments and the responses of its status, replicas and scaling
+    endpoints
+
+    Attributes:
+        name: The name of the deployment
+        deployment: The deployment as listed
+        fetched_at: Wall clock time the last of its responses arrived at
+        status: The status response, None when it failed
+        replicas: The replicas response, None when it failed
+        scaling: The scaling response, None when it failed
+        errors: The exception of every part that failed, by part name
+    """
+
+    name: str
+    deployment: dict[str, Any]
+    fetched_at: float
+    status: dict[str, Any] | None = None
+    replicas: dict[str, Any] | None = None
+    scaling: dict[str, Any] | None = None
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        """Whether every part was fetched"""
+        return not self.errors
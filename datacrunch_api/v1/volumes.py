@@ -1,6 +1,20 @@
 from enum import Enum
+from typing import Any, AsyncIterator, Iterable, Iterator
 
-from ._api_session import ApiSession
+from ._api_session import ApiSession, resolve_session
+from ._async_api_session import AsyncApiSession
+from ._bulk import DEFAULT_CONCURRENCY, async_fetch_many, fetch_many
+from ._serialization import serialization_cache
+from ._waiters import (
+    DEFAULT_WAIT_POLICY,
+    AsyncGroupWaiter,
+    GroupWaiter,
+    VOLUME_FAILURE_STATUSES,
+    WaitPolicy,
+    async_wait_for,
+    wait_for,
+)
+from .types.info import VolumeInfo
 from .types.volume import Volume, VolumeAction
 
 
@@ -12,34 +26,57 @@ class Endpoints(str, Enum):
     VOLUMES = "volumes"
 
 
+def _attached(volume: dict, instance_id: str | None) -> bool:
+    """Whether a volume is attached, to the given instance if any"""
+    return volume.get("status") == "attached" and (
+        instance_id is None or volume.get("instance_id") == instance_id
+    )
+
+
 class Volumes:
     """
     Client for managing volumes in the DataCrunch API.
     """
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: ApiSession | None = None,
+        **session_options: Any,
+    ):
         """
-        Initialize volumes client with API credentials
+        Initialize volumes client with API credentials or a shared api_session
         """
-        self.api_session = ApiSession(client_id, client_secret)
+        self.api_session = resolve_session(
+            ApiSession, api_session, client_id, client_secret, **session_options
+        )
 
     def action(self, action: VolumeAction) -> dict:
         """
         Perform an action on a volume
         """
         response = self.api_session.put_raw(
-            Endpoints.VOLUMES.value, json=action.to_dict()  # type: ignore
+            Endpoints.VOLUMES.value, json=serialization_cache.to_dict(action)
         )
         if response.status_code != 202:
             raise self.api_session.RequestFailed(response.json())
         return response.json()
 
-    def create(self, volume: Volume) -> dict:
+    def create(self, volume: Volume, idempotency_key: str | None = None) -> dict:
         """
         Create a new volume
+
+        Args:
+            volume: The volume to create
+            idempotency_key: Optional unique key for this volume. With it, the
+                request is retried on transient failures without risking a
+                duplicate volume.
         """
-        return self.api_session.post(
-            Endpoints.VOLUMES.value, json=volume.to_dict()  # type: ignore
+        return self.api_session.post(  # type: ignore
+            Endpoints.VOLUMES.value,
+            json=serialization_cache.to_dict(volume),
+            idempotency_key=idempotency_key,
         )
 
     def delete(self, volume_id: str) -> None:
@@ -54,18 +91,140 @@ class Volumes:
         """
         return dict(self.api_session.get(f"{Endpoints.VOLUMES.value}/{volume_id}"))
 
+    def get_many(
+        self,
+        volume_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_list: bool | None = None,
+    ) -> list[dict | None]:
+        """
+        Get several volumes. With more IDs than concurrency they are
+        picked from a single list of all volumes, which returns the same
+        fields, otherwise each is fetched with a GET, concurrency at a time.
+
+        Args:
+            volume_ids: The IDs of the volumes
+            concurrency: The number of GETs in flight at once
+            use_list: Whether to pick the volumes from the list, instead of
+                deciding by the number of IDs
+
+        Returns:
+            The volumes in the order of the IDs, None for the ones not found
+        """
+        return fetch_many(
+            self.get_volume,
+            self.list_volumes,
+            volume_ids,
+            concurrency=concurrency,
+            use_list=use_list,
+            workers=self.api_session.workers,
+        )
+
+    def get_volume_info(self, volume_id: str) -> VolumeInfo:
+        """
+        Get a volume by ID as a VolumeInfo
+        """
+        return VolumeInfo.from_dict(
+            self.api_session.get(f"{Endpoints.VOLUMES.value}/{volume_id}")
+        )
+
+    def wait_for_volume_attached(
+        self,
+        volume_id: str,
+        instance_id: str | None = None,
+        timeout: float | None = None,
+        wait_policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+    ) -> dict:
+        """
+        Wait until a volume is attached, polling it with exponential backoff
+
+        Args:
+            volume_id: The ID of the volume
+            instance_id: Optional instance the volume has to be attached to
+            timeout: Optional seconds to wait at most, replacing the timeout
+                of wait_policy
+            wait_policy: The delays between polls and the timeout
+
+        Returns:
+            The attached volume
+
+        Raises:
+            WaitFailed: If the volume is deleted, canceled or does not exist
+            WaitTimeout: If the volume was not attached in time
+        """
+        return wait_for(
+            lambda: self.get_volume(volume_id),
+            f"Waiting for volume {volume_id} to be attached",
+            lambda state: _attached(state, instance_id),
+            lambda state: state.get("status") in VOLUME_FAILURE_STATUSES,
+            wait_policy,
+            timeout,
+        )
+
+    def wait_for_volumes_attached(
+        self,
+        volume_ids: Iterable[str],
+        timeout: float | None = None,
+        wait_policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+    ) -> GroupWaiter:
+        """
+        Wait until a group of volumes are attached, listing all volumes once
+        per poll instead of getting each of them
+
+        Args:
+            volume_ids: The IDs of the volumes
+            timeout: Optional seconds to wait at most, replacing the timeout
+                of wait_policy
+            wait_policy: The delays between polls and the timeout
+
+        Returns:
+            A waiter yielding an event per volume as soon as it is attached,
+            failed or timed out when iterated, see GroupWaiter
+        """
+        return GroupWaiter(
+            self.list_volumes,
+            volume_ids,
+            "Waiting for volume {id} to be attached",
+            lambda state: _attached(state, None),
+            lambda state: state.get("status") in VOLUME_FAILURE_STATUSES,
+            policy=wait_policy,
+            timeout=timeout,
+        )
+
     def get_volume_types(self) -> list[dict]:
         """
         Get all volume types
         """
         return list(self.api_session.get(Endpoints.VOLUME_TYPES.value))
 
+    def iter_trash(self) -> Iterator[dict]:
+        """
+        Iterate over all volumes in the trash as the response streams in,
+        decoding each one as soon as it arrives instead of loading the whole list
+        """
+        return self.api_session.iter_items(
+            f"{Endpoints.VOLUMES.value}/{Endpoints.TRASH.value}"
+        )
+
+    def iter_volumes(self) -> Iterator[dict]:
+        """
+        Iterate over all volumes as the response streams in, decoding each one
+        as soon as it arrives instead of loading the whole list
+        """
+        return self.api_session.iter_items(Endpoints.VOLUMES.value)
+
     def list_volumes(self) -> list[dict]:
         """
         List all volumes
         """
         return list(self.api_session.get(Endpoints.VOLUMES.value))
 
+    def list_volumes_info(self) -> list[VolumeInfo]:
+        """
+        List all volumes as VolumeInfos
+        """
+        return VolumeInfo.from_list(self.api_session.get(Endpoints.VOLUMES.value))
+
     def list_trash(self) -> list[dict]:
         """
         List all volumes in the trash
@@ -73,3 +232,172 @@ class Volumes:
         return list(
             self.api_session.get(f"{Endpoints.VOLUMES.value}/{Endpoints.TRASH.value}")
         )
+
+
+class AsyncVolumes:
+    """
+    Asyncio client for managing volumes in the DataCrunch API.
+    """
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        api_session: AsyncApiSession | None = None,
+        **session_options: Any,
+    ):
+        """
+        Initialize volumes client with API credentials or a shared api_session
+        """
+        self.api_session = resolve_session(
+            AsyncApiSession, api_session, client_id, client_secret, **session_options
+        )
+
+    async def action(self, action: VolumeAction) -> dict:
+        """
+        Perform an action on a volume
+        """
+        response = await self.api_session.put_raw(
+            Endpoints.VOLUMES.value, json=serialization_cache.to_dict(action)
+        )
+        if response.status_code != 202:
+            raise self.api_session.RequestFailed(response.json())
+        return response.json()
+
+    async def create(self, volume: Volume, idempotency_key: str | None = None) -> dict:
+        """
+        Create a new volume
+
+        Args:
+            volume: The volume to create
+            idempotency_key: Optional unique key for this volume. With it, the
+                request is retried on transient failures without risking a
+                duplicate volume.
+        """
+        return await self.api_session.post(  # type: ignore
+            Endpoints.VOLUMES.value,
+            json=serialization_cache.to_dict(volume),
+            idempotency_key=idempotency_key,
+        )
+
+    async def delete(self, volume_id: str) -> None:
+        """
+        Delete a volume by ID
+        """
+        await self.api_session.delete(f"{Endpoints.VOLUMES.value}/{volume_id}")
+
+    async def get_volume(self, volume_id: str) -> dict:
+        """
+        Get a volume by ID
+        """
+        return dict(
+            await self.api_session.get(f"{Endpoints.VOLUMES.value}/{volume_id}")
+        )
+
+    async def get_many(
+        self,
+        volume_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_list: bool | None = None,
+    ) -> list[dict | None]:
+        """
+        Get several volumes, see Volumes.get_many
+        """
+        return await async_fetch_many(
+            self.get_volume,
+            self.list_volumes,
+            volume_ids,
+            concurrency=concurrency,
+            use_list=use_list,
+        )
+
+    async def get_volume_info(self, volume_id: str) -> VolumeInfo:
+        """
+        Get a volume by ID as a VolumeInfo
+        """
+        return VolumeInfo.from_dict(
+            await self.api_session.get(f"{Endpoints.VOLUMES.value}/{volume_id}")
+        )
+
+    async def wait_for_volume_attached(
+        self,
+        volume_id: str,
+        instance_id: str | None = None,
+        timeout: float | None = None,
+        wait_policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+    ) -> dict:
+        """
+        Wait until a volume is attached, see Volumes.wait_for_volume_attached
+        """
+        return await async_wait_for(
+            lambda: self.get_volume(volume_id),
+            f"Waiting for volume {volume_id} to be attached",
+            lambda state: _attached(state, instance_id),
+            lambda state: state.get("status") in VOLUME_FAILURE_STATUSES,
+            wait_policy,
+            timeout,
+        )
+
+    def wait_for_volumes_attached(
+        self,
+        volume_ids: Iterable[str],
+        timeout: float | None = None,
+        wait_policy: WaitPolicy = DEFAULT_WAIT_POLICY,
+    ) -> AsyncGroupWaiter:
+        """
+        Wait until a group of volumes are attached, see
+        Volumes.wait_for_volumes_attached
+        """
+        return AsyncGroupWaiter(
+            self.list_volumes,
+            volume_ids,
+            "Waiting for volume {id} to be attached",
+            lambda state: _attached(state, None),
+            lambda state: state.get("status") in VOLUME_FAILURE_STATUSES,
+            policy=wait_policy,
+            timeout=timeout,
+        )
+
+    async def get_volume_types(self) -> list[dict]:
+        """
+        Get all volume types
+        """
+        return list(await self.api_session.get(Endpoints.VOLUME_TYPES.value))
+
+    def iter_trash(self) -> AsyncIterator[dict]:
+        """
+        Iterate over all volumes in the trash as the response streams in,
+        decoding each one as soon as it arrives instead of loading the whole list
+        """
+        return self.api_session.iter_items(
+            f"{Endpoints.VOLUMES.value}/{Endpoints.TRASH.value}"
+        )
+
+    def iter_volumes(self) -> AsyncIterator[dict]:
+        """
+        Iterate over all volumes as the response streams in, decoding each one
+        as soon as it arrives instead of loading the whole list
+        """
+        return self.api_session.iter_items(Endpoints.VOLUMES.value)
+
+    async def list_volumes(self) -> list[dict]:
+        """
+        List all volumes
+        """
+        return list(await self.api_session.get(Endpoints.VOLUMES.value))
+
+    async def list_volumes_info(self) -> list[VolumeInfo]:
+        """
+        List all volumes as VolumeInfos
+        """
+        return VolumeInfo.from_list(await self.api_session.get(Endpoints.VOLUMES.value))
+
+    async def list_trash(self) -> list[dict]:
+        """
+        List all volumes in the trash
+        """
+        return list(
+            await self.api_session.get(
+                f"{Endpoints.VOLUMES.value}/{Endpoints.TRASH.value}"
+            )
+        )
@@ -15,6 +15,14 @@ setup(
         "typer",
         "rich",
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "fast": ["orjson"],
+        "http2": ["httpx[http2]"],
+        "ijson": ["ijson"],
+        "opentelemetry": ["opentelemetry-api"],
+        "prometheus": ["prometheus-client"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -1,6 +1,16 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import requests
+from datacrunch_api.v1._circuit_breaker import CircuitBreaker
+from datacrunch_api.v1._codec import StdlibCodec
 from datacrunch_api.v1._api_session import ApiSession
+from datacrunch_api.v1._rate_limiter import RateLimiter
+from datacrunch_api.v1._retry import NO_RETRY
+from datacrunch_api.v1._timeout import Timeout
 
 
 @pytest.fixture
@@ -17,38 +27,46 @@ def test_delete(mocker, api_session):
     mock_session.delete.return_value.status_code = 200
     api_session.delete("dummy_url")
     mock_session.delete.assert_called_once_with(
-        f"{api_session.base_url}/dummy_url", json=None
+        f"{api_session.base_url}/dummy_url", timeout=(10.0, 60.0)
     )
 
 
 def test_get(mocker, api_session):
-    expected_response = {"dummy_response"}
+    expected_response = {"dummy_response": "value"}
     mock_session = mocker.patch.object(api_session, "session")
-    mock_session.get.return_value.json.return_value = expected_response
+    mock_session.get.return_value.content = b'{"dummy_response": "value"}'
     response = api_session.get("dummy_url")
     assert response == expected_response
-    mock_session.get.assert_called_once_with(f"{api_session.base_url}/dummy_url")
+    mock_session.get.assert_called_once_with(
+        f"{api_session.base_url}/dummy_url", timeout=(10.0, 60.0)
+    )
 
 
 def test_post(mocker, api_session):
-    expected_response = {"dummy_response"}
+    expected_response = {"dummy_response": "value"}
     mock_session = mocker.patch.object(api_session, "session")
-    mock_session.post.return_value.json.return_value = expected_response
+    mock_session.post.return_value.content = b'{"dummy_response": "value"}'
     response = api_session.post("dummy_url", {"dummy_data": "dummy_value"})
     assert response == expected_response
     mock_session.post.assert_called_once_with(
-        f"{api_session.base_url}/dummy_url", json={"dummy_data": "dummy_value"}
+        f"{api_session.base_url}/dummy_url",
+        data=api_session.codec.encode({"dummy_data": "dummy_value"}),
+        headers={"Content-Type": "application/json"},
+        timeout=(10.0, 60.0),
     )
 
 
 def test_patch(mocker, api_session):
-    expected_response = {"dummy_response"}
+    expected_response = {"dummy_response": "value"}
     mock_session = mocker.patch.object(api_session, "session")
-    mock_session.patch.return_value.json.return_value = expected_response
+    mock_session.patch.return_value.content = b'{"dummy_response": "value"}'
     response = api_session.patch("dummy_url", {"dummy_data": "dummy_value"})
     assert response == expected_response
     mock_session.patch.assert_called_once_with(
-        f"{api_session.base_url}/dummy_url", json={"dummy_data": "dummy_value"}
+        f"{api_session.base_url}/dummy_url",
+        data=api_session.codec.encode({"dummy_data": "dummy_value"}),
+        headers={"Content-Type": "application/json"},
+        timeout=(10.0, 60.0),
     )
 
 
@@ -67,3 +85,269 @@ def test_validate_response_conflict(api_session):
     response = {"code": "conflict", "message": "Conflict"}
     with pytest.raises(ApiSession.Conflict):
         api_session.validate_response(response)
+
+
+def test_authenticate_records_expiry(mocker):
+    mock_session = mocker.patch("datacrunch_api.v1._api_session.requests.Session")
+    mock_session.return_value.post.return_value.json.return_value = {
+        "access_token": "dummy_access_token",
+        "expires_in": 3600,
+    }
+    api_session = ApiSession(
+        "dummy_client_id", "dummy_client_secret", background_refresh=False
+    )
+    assert api_session.token_manager.token.expires_at is not None
+    mock_session.return_value.headers.update.assert_called_once_with(
+        {"Authorization": "Bearer dummy_access_token"}
+    )
+
+
+def test_reauthenticates_and_replays_on_unauthorized(mocker, api_session):
+    mocker.patch.object(
+        api_session.token_manager,
+        "fetch",
+        return_value={"access_token": "new_access_token"},
+    )
+    mock_session = mocker.patch.object(api_session, "session")
+    unauthorized = mocker.Mock(status_code=401)
+    ok = mocker.Mock(status_code=200, content=b'{"id": "123"}')
+    mock_session.get.side_effect = [unauthorized, ok]
+
+    assert api_session.get("dummy_url") == {"id": "123"}
+    assert mock_session.get.call_count == 2
+    mock_session.headers.update.assert_called_with(
+        {"Authorization": "Bearer new_access_token"}
+    )
+
+
+def test_unauthorized_is_replayed_only_once(mocker, api_session):
+    mocker.patch.object(
+        api_session.token_manager,
+        "fetch",
+        return_value={"access_token": "new_access_token"},
+    )
+    mock_session = mocker.patch.object(api_session, "session")
+    mock_session.delete.return_value.status_code = 401
+    mock_session.delete.return_value.content = b'{"code": "unauthorized"}'
+
+    with pytest.raises(ApiSession.RequestFailed):
+        api_session.delete("dummy_url")
+    assert mock_session.delete.call_count == 2
+
+
+def response(mocker, status_code: int, body=None, headers=None):
+    return mocker.Mock(
+        status_code=status_code,
+        headers=headers or {},
+        content=json.dumps(body if body is not None else {}).encode(),
+    )
+
+
+def test_get_retries_server_errors(mocker, api_session):
+    sleep = mocker.patch("datacrunch_api.v1._api_session.time.sleep")
+    mock_session = mocker.patch.object(api_session, "session")
+    mock_session.get.side_effect = [
+        response(mocker, 503),
+        response(mocker, 429, headers={"Retry-After": "2"}),
+        response(mocker, 200, {"id": "123"}),
+    ]
+
+    assert api_session.get("dummy_url") == {"id": "123"}
+    assert mock_session.get.call_count == 3
+    assert sleep.call_args_list[1] == mocker.call(2.0)
+    assert api_session.retry_stats.retries == 2
+    assert api_session.retry_stats.reasons == {"503": 1, "429": 1}
+
+
+def test_get_retries_connection_errors(mocker, api_session):
+    mocker.patch("datacrunch_api.v1._api_session.time.sleep")
+    mock_session = mocker.patch.object(api_session, "session")
+    mock_session.get.side_effect = [
+        requests.ConnectionError("Connection reset by peer"),
+        response(mocker, 200, {"id": "123"}),
+    ]
+
+    assert api_session.get("dummy_url") == {"id": "123"}
+    assert api_session.retry_stats.reasons == {"ConnectionError": 1}
+
+
+def test_retries_give_up_after_max_attempts(mocker, api_session):
+    mocker.patch("datacrunch_api.v1._api_session.time.sleep")
+    mock_session = mocker.patch.object(api_session, "session")
+    mock_session.get.return_value = response(mocker, 503, {"code": "unavailable"})
+
+    assert api_session.get("dummy_url") == {"code": "unavailable"}
+    assert mock_session.get.call_count == api_session.retry_policy.max_attempts
+    assert api_session.retry_stats.exhausted == 1
+
+
+def test_post_is_not_retried_without_idempotency_key(mocker, api_session):
+    mocker.patch("datacrunch_api.v1._api_session.time.sleep")
+    mock_session = mocker.patch.object(api_session, "session")
+    mock_session.post.return_value = response(mocker, 503)
+
+    api_session.post_raw("dummy_url", {})
+    mock_session.post.assert_called_once()
+
+
+def test_post_is_retried_with_idempotency_key(mocker, api_session):
+    mocker.patch("datacrunch_api.v1._api_session.time.sleep")
+    mock_session = mocker.patch.object(api_session, "session")
+    mock_session.post.side_effect = [
+        requests.ConnectionError(),
+        response(mocker, 201, {"id": "123"}),
+    ]
+
+    assert api_session.post("dummy_url", {}, idempotency_key="key-1") == {"id": "123"}
+    assert mock_session.post.call_count == 2
+    mock_session.post.assert_called_with(
+        f"{api_session.base_url}/dummy_url",
+        data=b"{}",
+        headers={"Content-Type": "application/json", "Idempotency-Key": "key-1"},
+        timeout=(10.0, 60.0),
+    )
+
+
+def test_every_attempt_waits_for_rate_limiter(mocker, api_session):
+    mocker.patch("datacrunch_api.v1._api_session.time.sleep")
+    api_session.rate_limiter = mocker.Mock(spec=RateLimiter)
+    api_session.session.get.side_effect = [
+        response(mocker, 429),
+        response(mocker, 200, {"id": "123"}),
+    ]
+
+    api_session.get("instances/123")
+
+    assert (
+        api_session.rate_limiter.acquire.call_args_list
+        == [mocker.call("instances/123")] * 2
+    )
+
+
+def test_open_circuit_fails_fast(mocker, api_session):
+    mocker.patch("datacrunch_api.v1._api_session.time.sleep")
+    api_session.retry_policy = NO_RETRY
+    api_session.circuit_breaker = CircuitBreaker(window=2, minimum_calls=2)
+    api_session.session.get.side_effect = [
+        response(mocker, 503),
+        requests.ConnectionError(),
+    ]
+    api_session.get("instances")
+    with pytest.raises(requests.ConnectionError):
+        api_session.get("instances/123")
+
+    with pytest.raises(ApiSession.CircuitOpen) as error:
+        api_session.get("instances")
+
+    assert error.value.family == "instances"
+    assert api_session.session.get.call_count == 2
+
+
+def test_session_configures_connection_pool(mocker):
+    mock_session = mocker.patch("datacrunch_api.v1._api_session.requests.Session")
+    mock_session.return_value.post.return_value.json.return_value = {
+        "access_token": "dummy_access_token"
+    }
+    mock_session.return_value.headers = {}
+
+    api_session = ApiSession(
+        "dummy_client_id",
+        "dummy_client_secret",
+        pool_size=4,
+        max_connections_per_host=64,
+        keep_alive=False,
+    )
+
+    adapter = mock_session.return_value.mount.call_args.args[1]
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 64
+    assert api_session.session.headers["Connection"] == "close"
+
+
+def test_per_call_timeout_overrides_session_timeout(mocker, api_session):
+    mock_session = mocker.patch.object(api_session, "session")
+    mock_session.get.return_value = response(mocker, 200)
+    mock_session.post.return_value = response(mocker, 200)
+
+    api_session.get("dummy_url", timeout=Timeout(connect=1, read=300))
+    api_session.post("dummy_url", {}, timeout=5)
+
+    assert mock_session.get.call_args.kwargs["timeout"] == (1, 300)
+    assert mock_session.post.call_args.kwargs["timeout"] == (5, 5)
+    api_session.get("dummy_url", timeout=None)
+    assert mock_session.get.call_args.kwargs["timeout"] == (None, None)
+    api_session.get("dummy_url")
+    assert mock_session.get.call_args.kwargs["timeout"] == (10.0, 60.0)
+
+
+def test_with_timeout_shares_session(mocker, api_session):
+    mock_session = mocker.patch.object(api_session, "session")
+    mock_session.get.return_value = response(mocker, 200)
+
+    view = api_session.with_timeout(Timeout(read=None))
+    view.get("dummy_url")
+
+    assert view.session is api_session.session
+    assert view.token_manager is api_session.token_manager
+    assert mock_session.get.call_args.kwargs["timeout"] == (10.0, None)
+    assert api_session.timeout == Timeout()
+
+
+def test_request_bodies_are_encoded_once_with_the_codec(mocker, api_session):
+    mocker.patch("datacrunch_api.v1._api_session.time.sleep")
+    api_session.codec = mocker.Mock(wraps=StdlibCodec())
+    mock_session = mocker.patch.object(api_session, "session")
+    mock_session.put.side_effect = [
+        response(mocker, 503),
+        response(mocker, 200, {"id": "123"}),
+    ]
+
+    result = api_session.put("dummy_url", {"name": "é"}, idempotency_key="key-1")
+
+    assert result == {"id": "123"}
+    api_session.codec.encode.assert_called_once_with({"name": "é"})
+    assert mock_session.put.call_args.kwargs["data"] == '{"name":"é"}'.encode()
+
+
+def test_identical_concurrent_gets_are_sent_once(mocker, api_session):
+    release = threading.Event()
+
+    def get(*args, **kwargs):
+        release.wait(5)
+        return response(mocker, 200, [{"id": "1"}])
+
+    mock_session = mocker.patch.object(api_session, "session")
+    mock_session.get.side_effect = get
+
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(api_session.get, "instances") for _ in range(4)]
+        while api_session.single_flight.calls < 4:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert mock_session.get.call_count == 1
+    assert results == [[{"id": "1"}]] * 4
+    assert results[0] is not results[1]
+
+
+def test_coalesced_gets_wait_at_most_their_timeout(mocker, api_session):
+    started = threading.Event()
+    release = threading.Event()
+
+    def get(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return response(mocker, 200, [{"id": "1"}])
+
+    mock_session = mocker.patch.object(api_session, "session")
+    mock_session.get.side_effect = get
+
+    with ThreadPoolExecutor(1) as pool:
+        leader = pool.submit(api_session.get, "instances")
+        started.wait(5)
+        with pytest.raises(requests.Timeout):
+            api_session.get("instances", timeout=0.01)
+        release.set()
+        assert leader.result() == [{"id": "1"}]
+    assert mock_session.get.call_count == 1
@@ -0,0 +1,359 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from datacrunch_api.v1 import (
+    NO_RETRY,
+    ApiSession,
+    AsyncApiSession,
+    CircuitBreaker,
+    RequestHook,
+    ResponseCache,
+    RetryPolicy,
+    Timeout,
+    TokenCache,
+)
+
+
+def run_with_server(handler, scenario, **options):
+    """
+    Serve every request with handler and run scenario(session) against it.
+    Token requests are answered unless the handler handles them itself.
+    """
+
+    async def dispatch(request: web.Request) -> web.Response:
+        response = await handler(request)
+        if response is None and request.path == "/oauth2/token":
+            return web.json_response({"access_token": "dummy_access_token"})
+        return response
+
+    async def run():
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", dispatch)
+        async with TestServer(app) as server:
+            base_url = str(server.make_url("")).rstrip("/")
+            async with AsyncApiSession(
+                "dummy_client_id", "dummy_client_secret", base_url=base_url, **options
+            ) as session:
+                return await scenario(session)
+
+    return asyncio.run(run())
+
+
+def test_get():
+    requests = []
+
+    async def handler(request):
+        if request.path == "/dummy_url":
+            requests.append(request)
+            return web.json_response({"id": "123"})
+
+    result = run_with_server(handler, lambda session: session.get("dummy_url"))
+
+    assert result == {"id": "123"}
+    assert requests[0].headers["Authorization"] == "Bearer dummy_access_token"
+
+
+def test_post_sends_json():
+    async def handler(request):
+        if request.path == "/dummy_url":
+            return web.json_response(await request.json(), status=201)
+
+    result = run_with_server(
+        handler, lambda session: session.post("dummy_url", {"dummy_data": "value"})
+    )
+
+    assert result == {"dummy_data": "value"}
+
+
+def test_post_raw_returns_response():
+    async def handler(request):
+        if request.path == "/dummy_url":
+            return web.Response(text="new-id", status=201)
+
+    response = run_with_server(
+        handler, lambda session: session.post_raw("dummy_url", {})
+    )
+
+    assert response.status_code == 201
+    assert response.text == "new-id"
+
+
+def test_delete_raises_on_failure():
+    async def handler(request):
+        if request.path == "/dummy_url":
+            return web.json_response({"code": "not_found"}, status=404)
+
+    with pytest.raises(ApiSession.RequestFailed):
+        run_with_server(handler, lambda session: session.delete("dummy_url"))
+
+
+def test_validate_response_conflict():
+    async def handler(request):
+        if request.path == "/dummy_url":
+            return web.json_response({"code": "conflict", "message": "Conflict"})
+
+    with pytest.raises(AsyncApiSession.Conflict):
+        run_with_server(handler, lambda session: session.patch("dummy_url", {}))
+
+
+def test_concurrent_requests_share_one_token_request():
+    token_requests = []
+
+    async def handler(request):
+        if request.path == "/oauth2/token":
+            token_requests.append(request)
+            await asyncio.sleep(0.01)
+            return web.json_response({"access_token": "dummy_access_token"})
+        return web.json_response([])
+
+    async def scenario(session):
+        await asyncio.gather(*(session.get("dummy_url") for _ in range(20)))
+
+    run_with_server(handler, scenario)
+    assert len(token_requests) == 1
+
+
+def test_reauthenticates_and_replays_on_unauthorized():
+    tokens = iter(["first_token", "second_token"])
+
+    async def handler(request):
+        if request.path == "/oauth2/token":
+            return web.json_response({"access_token": next(tokens)})
+        if request.headers["Authorization"] == "Bearer first_token":
+            return web.json_response({"code": "unauthorized"}, status=401)
+        return web.json_response({"id": "123"})
+
+    result = run_with_server(handler, lambda session: session.get("dummy_url"))
+
+    assert result == {"id": "123"}
+
+
+def test_authenticate_shares_tokens_through_the_cache(tmp_path):
+    token_requests = []
+
+    async def handler(request):
+        if request.path == "/oauth2/token":
+            token_requests.append(await request.json())
+            return web.json_response(
+                {"access_token": f"token-{len(token_requests)}", "expires_in": 3600}
+            )
+
+    async def scenario(session):
+        await session.authenticate()
+        return session.token_manager.token.access_token
+
+    cache = TokenCache(tmp_path)
+    assert run_with_server(handler, scenario, token_cache=cache) == "token-1"
+    assert run_with_server(handler, scenario, token_cache=cache) == "token-1"
+    assert len(token_requests) == 1
+    assert cache.load("dummy_client_id").access_token == "token-1"
+
+
+def test_authenticate_with_new_credentials_fetches_a_token():
+    token_requests = []
+
+    async def handler(request):
+        if request.path == "/oauth2/token":
+            token_requests.append(await request.json())
+            return web.json_response({"access_token": f"token-{len(token_requests)}"})
+
+    async def scenario(session):
+        await session.authenticate()
+        await session.authenticate("other_client_id", "other_secret")
+        return session.token_manager.token.access_token
+
+    assert run_with_server(handler, scenario) == "token-2"
+    assert token_requests[1]["client_id"] == "other_client_id"
+    assert token_requests[1]["client_secret"] == "other_secret"
+
+
+def test_get_retries_server_errors():
+    statuses = iter([503, 200])
+
+    async def handler(request):
+        if request.path == "/dummy_url":
+            status = next(statuses)
+            return web.json_response({"status": status}, status=status)
+
+    async def scenario(session):
+        session.retry_policy = RetryPolicy(base_delay=0.01)
+        return await session.get("dummy_url"), session.retry_stats.retries
+
+    assert run_with_server(handler, scenario) == ({"status": 200}, 1)
+
+
+def test_post_is_not_retried_without_idempotency_key():
+    calls = []
+
+    async def handler(request):
+        if request.path == "/dummy_url":
+            calls.append(request)
+            return web.json_response({}, status=503)
+
+    async def scenario(session):
+        session.retry_policy = RetryPolicy(base_delay=0.01)
+        return await session.post_raw("dummy_url", {})
+
+    assert run_with_server(handler, scenario).status_code == 503
+    assert len(calls) == 1
+
+
+def test_requests_wait_for_rate_limiter():
+    waited = []
+
+    class Limiter:
+        async def acquire_async(self, url):
+            waited.append(url)
+
+    async def handler(request):
+        if request.path == "/instances":
+            return web.json_response([])
+
+    async def scenario(session):
+        session.rate_limiter = Limiter()
+        return await session.get("instances")
+
+    assert run_with_server(handler, scenario) == []
+    assert waited == ["instances"]
+
+
+def test_open_circuit_fails_fast():
+    calls = []
+
+    async def handler(request):
+        if request.path.startswith("/volumes"):
+            calls.append(request)
+            return web.json_response({}, status=500)
+
+    async def scenario(session):
+        session.retry_policy = NO_RETRY
+        session.circuit_breaker = CircuitBreaker(window=1, minimum_calls=1)
+        await session.get("volumes")
+        with pytest.raises(AsyncApiSession.CircuitOpen):
+            await session.get("volumes/123")
+
+    run_with_server(handler, scenario)
+    assert len(calls) == 1
+
+
+def test_cancelled_probe_releases_half_open_circuit():
+    async def handler(request):
+        if request.path == "/volumes":
+            await asyncio.sleep(1)
+            return web.json_response([])
+
+    async def scenario(session):
+        breaker = CircuitBreaker(
+            window=1, minimum_calls=1, open_seconds=0.0, half_open_probes=1
+        )
+        breaker.record("volumes", True, 0.1)
+        session.circuit_breaker = breaker
+        task = asyncio.create_task(session.get("volumes"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return breaker.allow("volumes")
+
+    assert run_with_server(handler, scenario)
+
+
+def test_cancelled_request_is_reported_to_hooks():
+    errors = []
+
+    class Recorder(RequestHook):
+        def on_error(self, event):
+            errors.append(type(event.error).__name__)
+
+    async def handler(request):
+        if request.path == "/slow":
+            await asyncio.sleep(1)
+            return web.json_response({})
+
+    async def scenario(session):
+        session.hooks.add(Recorder())
+        task = asyncio.create_task(session.get("slow"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    run_with_server(handler, scenario)
+    assert errors == ["CancelledError"]
+
+
+def test_read_timeout_can_be_overridden_per_call():
+    async def handler(request):
+        if request.path == "/slow":
+            await asyncio.sleep(0.2)
+            return web.json_response({"id": "123"})
+
+    async def scenario(session):
+        session.retry_policy = NO_RETRY
+        with pytest.raises(asyncio.TimeoutError):
+            await session.get("slow", timeout=Timeout(read=0.05))
+        return await session.with_timeout(Timeout(read=1)).get("slow")
+
+    assert run_with_server(handler, scenario) == {"id": "123"}
+
+
+def test_timeouts_can_be_disabled_per_call():
+    async def handler(request):
+        if request.path == "/slow":
+            await asyncio.sleep(0.2)
+            return web.json_response({"id": "123"})
+
+    async def scenario(session):
+        session.retry_policy = NO_RETRY
+        view = session.with_timeout(Timeout(read=0.05))
+        with pytest.raises(asyncio.TimeoutError):
+            await view.get("slow")
+        return await view.get("slow", timeout=None)
+
+    assert run_with_server(handler, scenario) == {"id": "123"}
+
+
+def test_async_api_session_revalidates_with_etag():
+    requests = []
+
+    async def handler(request):
+        if request.path == "/volume-types":
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return web.json_response([{"type": "NVMe"}], headers={"ETag": '"v1"'})
+
+    async def scenario(session):
+        session.response_cache = ResponseCache(ttls={"volume-types": 0})
+        first = await session.get("volume-types")
+        second = await session.get("volume-types")
+        return first, second, session.response_cache.as_dict()
+
+    first, second, stats = run_with_server(handler, scenario)
+
+    assert first == second == [{"type": "NVMe"}]
+    assert len(requests) == 2
+    assert stats["misses"] == 1
+    assert stats["revalidations"] == 1
+
+
+def test_identical_concurrent_gets_are_sent_once():
+    requests = []
+
+    async def handler(request):
+        if request.path == "/instances":
+            requests.append(request)
+            await asyncio.sleep(0.05)
+            return web.json_response([{"id": "1"}])
+
+    async def scenario(session):
+        results = await asyncio.gather(*(session.get("instances") for _ in range(10)))
+        results[0][0]["id"] = "changed"
+        return results
+
+    results = run_with_server(handler, scenario)
+
+    assert len(requests) == 1
+    assert results[1:] == [[{"id": "1"}]] * 9
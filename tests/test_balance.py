@@ -1,5 +1,7 @@
+import asyncio
+
 import pytest
-from datacrunch_api.v1 import Balance
+from datacrunch_api.v1 import AsyncBalance, Balance
 
 
 @pytest.fixture
@@ -14,3 +16,17 @@ def test_get_balance(mocker, balance):
     result = balance.get_balance()
     assert result == {"balance": 100}
     mock_session.get.assert_called_once_with("balance")
+
+
+@pytest.fixture
+def async_balance(mocker):
+    mocker.patch("datacrunch_api.v1.balance.AsyncApiSession")
+    return AsyncBalance("dummy_client_id", "dummy_client_secret")
+
+
+def test_async_get_balance(mocker, async_balance):
+    mock_session = mocker.patch.object(async_balance, "api_session")
+    mock_session.get = mocker.AsyncMock(return_value={"balance": 100})
+    result = asyncio.run(async_balance.get_balance())
+    assert result == {"balance": 100}
+    mock_session.get.assert_awaited_once_with("balance")
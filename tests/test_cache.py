@@ -0,0 +1,127 @@
+import pytest
+from datacrunch_api.v1 import Images, Instances, ResponseCache
+from datacrunch_api.v1._api_session import ApiSession
+
+
+def response(mocker, status_code=200, content=b"[]", etag=None):
+    headers = {"ETag": etag} if etag else {}
+    return mocker.Mock(status_code=status_code, content=content, headers=headers)
+
+
+@pytest.fixture
+def api_session(mocker) -> ApiSession:
+    mock_session = mocker.patch("datacrunch_api.v1._api_session.requests.Session")
+    mock_session.return_value.post.return_value.json.return_value = {
+        "access_token": "dummy_access_token"
+    }
+    return ApiSession(
+        "dummy_client_id", "dummy_client_secret", response_cache=ResponseCache()
+    )
+
+
+def test_catalogs_are_cacheable():
+    cache = ResponseCache()
+
+    assert cache.cacheable("instance-types?currency=usd")
+    assert cache.cacheable("locations")
+    assert cache.cacheable("long-term")
+    assert cache.cacheable("volume-types")
+    assert cache.cacheable("images")
+    assert not cache.cacheable("instances")
+    assert not cache.cacheable("images/123")
+
+
+def test_store_and_lookup(mocker):
+    monotonic = mocker.patch("datacrunch_api.v1._cache.time.monotonic")
+    monotonic.return_value = 100.0
+    cache = ResponseCache(ttls={"images": 10})
+    cache.store("images", b"[]", '"v1"')
+
+    assert cache.lookup("images").fresh
+    monotonic.return_value = 111.0
+    entry = cache.lookup("images")
+
+    assert not entry.fresh
+    assert entry.etag == '"v1"'
+    assert cache.revalidated("images", entry).fresh
+    assert cache.as_dict() == {
+        "entries": 1,
+        "hits": 1,
+        "misses": 1,
+        "revalidations": 1,
+        "evictions": 0,
+    }
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(ttls={"instance-types": 10}, max_entries=2)
+    cache.store("instance-types?currency=usd", b"1", None)
+    cache.store("instance-types?currency=eur", b"2", None)
+    cache.lookup("instance-types?currency=usd")
+    cache.store("instance-types?currency=gbp", b"3", None)
+
+    assert cache.lookup("instance-types?currency=eur") is None
+    assert cache.lookup("instance-types?currency=usd") is not None
+    assert cache.evictions == 1
+
+
+def test_invalidate():
+    cache = ResponseCache()
+    cache.store("instance-types?currency=usd", b"1", None)
+    cache.store("instance-types?currency=eur", b"2", None)
+    cache.store("locations", b"3", None)
+
+    cache.invalidate("instance-types")
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_api_session_serves_catalogs_from_cache(mocker, api_session):
+    api_session.session.get.return_value = response(mocker, content=b'[{"id": 1}]')
+    instances = Instances(api_session=api_session)
+
+    assert instances.list_locations() == [{"id": 1}]
+    assert instances.list_locations() == [{"id": 1}]
+
+    api_session.session.get.assert_called_once()
+    assert api_session.response_cache.hits == 1
+    assert api_session.response_cache.misses == 1
+
+
+def test_cached_responses_are_not_shared_between_callers(mocker, api_session):
+    api_session.session.get.return_value = response(mocker, content=b'[{"id": 1}]')
+    images = Images(api_session=api_session)
+
+    images.list_images()[0]["id"] = 2
+
+    assert images.list_images() == [{"id": 1}]
+
+
+def test_api_session_revalidates_with_etag(mocker, api_session):
+    monotonic = mocker.patch("datacrunch_api.v1._cache.time.monotonic")
+    monotonic.return_value = 100.0
+    api_session.response_cache = ResponseCache(ttls={"images": 10})
+    api_session.session.get.side_effect = [
+        response(mocker, content=b'["ubuntu"]', etag='"v1"'),
+        response(mocker, status_code=304, content=b""),
+    ]
+
+    api_session.get("images")
+    monotonic.return_value = 200.0
+
+    assert api_session.get("images") == ["ubuntu"]
+    assert api_session.session.get.call_args.kwargs["headers"] == {
+        "If-None-Match": '"v1"'
+    }
+    assert api_session.response_cache.revalidations == 1
+
+
+def test_uncached_endpoints_are_always_fetched(mocker, api_session):
+    api_session.session.get.return_value = response(mocker)
+
+    api_session.get("instances")
+    api_session.get("instances")
+
+    assert api_session.session.get.call_count == 2
+    assert len(api_session.response_cache) == 0
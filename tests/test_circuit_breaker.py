@@ -0,0 +1,139 @@
+import pytest
+from datacrunch_api.v1 import CircuitBreaker, CircuitState
+
+
+@pytest.fixture
+def monotonic(mocker):
+    monotonic = mocker.patch("datacrunch_api.v1._circuit_breaker.time.monotonic")
+    monotonic.return_value = 100.0
+    return monotonic
+
+
+def test_opens_on_failure_rate(monotonic):
+    breaker = CircuitBreaker(failure_rate=0.5, window=4, minimum_calls=4)
+    for failed in (False, True, False):
+        assert breaker.allow("instances")
+        breaker.record("instances", failed, 0.1)
+    assert breaker.state("instances") == CircuitState.CLOSED
+
+    breaker.record("instances/123", True, 0.1)
+
+    assert breaker.state("instances") == CircuitState.OPEN
+    assert not breaker.allow("instances/456")
+    assert breaker.retry_in("instances") == 30.0
+
+
+def test_families_are_independent(monotonic):
+    breaker = CircuitBreaker(window=2, minimum_calls=2)
+    for _ in range(2):
+        breaker.record("volumes", True, 0.1)
+
+    assert not breaker.allow("volumes/123")
+    assert breaker.allow("instances")
+    assert breaker.state("container-deployments/x/status") == CircuitState.CLOSED
+
+
+def test_opens_on_slow_call_rate(monotonic):
+    breaker = CircuitBreaker(slow_call_seconds=1.0, window=2, minimum_calls=2)
+    breaker.record("images", False, 0.5)
+    breaker.record("images", False, 1.5)
+
+    assert breaker.state("images") == CircuitState.OPEN
+
+
+def test_latency_is_ignored_without_threshold(monotonic):
+    breaker = CircuitBreaker(window=2, minimum_calls=2)
+    breaker.record("images", False, 60.0)
+    breaker.record("images", False, 60.0)
+
+    assert breaker.state("images") == CircuitState.CLOSED
+
+
+def test_window_forgets_old_outcomes(monotonic):
+    breaker = CircuitBreaker(failure_rate=0.5, window=3, minimum_calls=3)
+    for failed in (True, False, False, False, True):
+        breaker.record("secrets", failed, 0.1)
+
+    assert breaker.state("secrets") == CircuitState.CLOSED
+
+
+def test_half_open_probes_close_the_circuit(monotonic):
+    breaker = CircuitBreaker(
+        window=1, minimum_calls=1, open_seconds=10.0, half_open_probes=2
+    )
+    breaker.record("sshkeys", True, 0.1)
+    monotonic.return_value = 110.0
+
+    assert breaker.state("sshkeys") == CircuitState.HALF_OPEN
+    assert breaker.allow("sshkeys")
+    assert breaker.allow("sshkeys")
+    assert not breaker.allow("sshkeys")
+    breaker.record("sshkeys", False, 0.1)
+    breaker.record("sshkeys", False, 0.1)
+
+    assert breaker.state("sshkeys") == CircuitState.CLOSED
+    assert breaker.allow("sshkeys")
+
+
+def test_failed_probe_reopens_the_circuit(monotonic):
+    breaker = CircuitBreaker(window=1, minimum_calls=1, open_seconds=10.0)
+    breaker.record("scripts", True, 0.1)
+    monotonic.return_value = 110.0
+    assert breaker.allow("scripts")
+
+    breaker.record("scripts", True, 0.1)
+
+    assert breaker.state("scripts") == CircuitState.OPEN
+    assert breaker.retry_in("scripts") == 10.0
+
+
+def test_released_probe_lets_another_probe_through(monotonic):
+    breaker = CircuitBreaker(
+        window=1, minimum_calls=1, open_seconds=10.0, half_open_probes=1
+    )
+    breaker.record("volumes", True, 0.1)
+    monotonic.return_value = 110.0
+    assert breaker.allow("volumes")
+    assert not breaker.allow("volumes")
+
+    breaker.release("volumes")
+
+    assert breaker.allow("volumes")
+    breaker.record("volumes", False, 0.1)
+    assert breaker.state("volumes") == CircuitState.CLOSED
+
+
+def test_reset_closes_the_circuit(monotonic):
+    breaker = CircuitBreaker(window=1, minimum_calls=1)
+    breaker.record("balance", True, 0.1)
+
+    breaker.reset("balance")
+
+    assert breaker.allow("balance")
+
+
+def test_as_dict(monotonic):
+    breaker = CircuitBreaker(window=4, minimum_calls=2)
+    breaker.record("instances", False, 0.1)
+    breaker.record("volumes", True, 0.1)
+    breaker.record("volumes", True, 0.1)
+    breaker.allow("volumes")
+
+    assert breaker.as_dict() == {
+        "instances": {
+            "state": "closed",
+            "calls": 1,
+            "failure_rate": 0.0,
+            "slow_call_rate": 0.0,
+            "opened": 0,
+            "rejected": 0,
+        },
+        "volumes": {
+            "state": "open",
+            "calls": 0,
+            "failure_rate": 0.0,
+            "slow_call_rate": 0.0,
+            "opened": 1,
+            "rejected": 1,
+        },
+    }
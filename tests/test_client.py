@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from datacrunch_api.v1 import (
+    AsyncDataCrunchClient,
+    DataCrunchClient,
+    Deployments,
+    Instances,
+    Volumes,
+)
+
+
+@pytest.fixture
+def api_session_class(mocker):
+    return mocker.patch("datacrunch_api.v1.client.ApiSession")
+
+
+def test_client_creates_one_session(api_session_class):
+    client = DataCrunchClient("dummy_client_id", "dummy_client_secret")
+
+    api_session_class.assert_called_once_with(
+        "dummy_client_id", "dummy_client_secret", "https://api.datacrunch.io/v1"
+    )
+    assert client.api_session is api_session_class.return_value
+
+
+def test_resources_share_session(api_session_class):
+    client = DataCrunchClient("dummy_client_id", "dummy_client_secret")
+
+    resources = [
+        client.balance,
+        client.deployments,
+        client.images,
+        client.instances,
+        client.secrets,
+        client.serverless_compute,
+        client.ssh_keys,
+        client.startup_scripts,
+        client.volumes,
+    ]
+
+    assert all(r.api_session is client.api_session for r in resources)
+    api_session_class.assert_called_once()
+
+
+def test_resources_are_created_lazily_and_once(mocker, api_session_class):
+    deployments_class = mocker.patch("datacrunch_api.v1.client.Deployments")
+    client = DataCrunchClient("dummy_client_id", "dummy_client_secret")
+    deployments_class.assert_not_called()
+
+    assert client.deployments is client.deployments
+    deployments_class.assert_called_once_with(api_session=client.api_session)
+
+
+def test_client_with_injected_session(mocker, api_session_class):
+    api_session = mocker.Mock()
+    client = DataCrunchClient(api_session=api_session)
+
+    assert client.instances.api_session is api_session
+    api_session_class.assert_not_called()
+
+
+def test_client_close(mocker, api_session_class):
+    with DataCrunchClient("dummy_client_id", "dummy_client_secret") as client:
+        pass
+    client.api_session.close.assert_called_once()
+
+
+def test_resource_with_injected_session(mocker):
+    api_session_class = mocker.patch("datacrunch_api.v1.instances.ApiSession")
+    api_session = mocker.Mock()
+    instances = Instances(api_session=api_session)
+
+    assert instances.api_session is api_session
+    api_session_class.assert_not_called()
+
+
+def test_resource_forwards_session_options(mocker):
+    api_session_class = mocker.patch("datacrunch_api.v1.volumes.ApiSession")
+
+    Volumes("dummy_client_id", "dummy_client_secret", timeout=5, keep_alive=False)
+
+    api_session_class.assert_called_once_with(
+        "dummy_client_id", "dummy_client_secret", timeout=5, keep_alive=False
+    )
+
+
+def test_client_with_timeout_shares_session(mocker, api_session_class):
+    client = DataCrunchClient("dummy_client_id", "dummy_client_secret")
+
+    slow = client.with_timeout(300)
+
+    client.api_session.with_timeout.assert_called_once_with(300)
+    assert slow.api_session is client.api_session.with_timeout.return_value
+    assert slow.volumes.api_session is slow.api_session
+
+
+def test_resource_requires_credentials_or_session():
+    with pytest.raises(ValueError):
+        Deployments()
+
+
+def test_async_resources_share_session(mocker):
+    api_session_class = mocker.patch("datacrunch_api.v1.client.AsyncApiSession")
+    api_session_class.return_value.aclose = mocker.AsyncMock()
+
+    async def run():
+        async with AsyncDataCrunchClient(
+            "dummy_client_id", "dummy_client_secret"
+        ) as client:
+            assert client.deployments.api_session is client.api_session
+            assert client.instances.api_session is client.api_session
+            assert client.volumes is client.volumes
+        return client
+
+    client = asyncio.run(run())
+    api_session_class.assert_called_once()
+    client.api_session.aclose.assert_awaited_once()
@@ -0,0 +1,51 @@
+import pytest
+from datacrunch_api.v1 import MsgspecCodec, OrjsonCodec, StdlibCodec, default_codec
+
+PAYLOAD = {
+    "id": "instance-1",
+    "hostname": "gpu-01",
+    "price_per_hour": 1.99,
+    "is_spot": False,
+    "ssh_key_ids": ["key-1", "key-2"],
+    "os_volume_id": None,
+    "description": "Ünïcode ✓",
+}
+
+CODECS = [StdlibCodec, OrjsonCodec, MsgspecCodec]
+
+
+@pytest.mark.parametrize("codec_class", CODECS)
+def test_round_trip(codec_class):
+    codec = codec_class()
+
+    assert codec.decode(codec.encode(PAYLOAD)) == PAYLOAD
+    assert codec.decode(codec.encode([PAYLOAD])) == [PAYLOAD]
+
+
+@pytest.mark.parametrize("codec_class", CODECS)
+def test_codecs_produce_identical_bytes(codec_class):
+    assert codec_class().encode(PAYLOAD) == StdlibCodec().encode(PAYLOAD)
+
+
+@pytest.mark.parametrize("codec_class", CODECS)
+def test_decode_accepts_str(codec_class):
+    assert codec_class().decode('{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+def test_default_codec_prefers_orjson():
+    assert default_codec().name == "orjson"
+
+
+def test_default_codec_falls_back(mocker):
+    mocker.patch("datacrunch_api.v1._codec.orjson", None)
+    assert default_codec().name == "msgspec"
+
+    mocker.patch("datacrunch_api.v1._codec.msgspec", None)
+    assert default_codec().name == "json"
+
+
+def test_missing_codec_library(mocker):
+    mocker.patch("datacrunch_api.v1._codec.orjson", None)
+
+    with pytest.raises(ImportError):
+        OrjsonCodec()
@@ -1,20 +1,29 @@
+import asyncio
+
 import pytest
 from datacrunch_api.v1 import (
+    AsyncDeployments,
     AutoUpdate,
     Compute,
     Container,
     ContainerRegistrySettings,
     Deployments,
     Deployment,
+    DeploymentInfo,
+    DeploymentSnapshot,
+    DeploymentStatus,
     Environment,
     HealthCheck,
     QueueLoad,
+    ReplicaInfo,
     Scaling,
     ScalingPolicy,
     ScalingTriggers,
     VolumeMounts,
     GpuUtilization,
 )
+from datacrunch_api.v1._api_session import ApiSession
+from datacrunch_api.v1._workers import Workers
 
 
 @pytest.fixture
@@ -101,6 +110,14 @@ def test_list_container_deployments(mocker, deployments):
     mock_session.get.assert_called_once_with("container-deployments")
 
 
+def test_iter_container_deployments(mocker, deployments):
+    mock_session = mocker.patch.object(deployments, "api_session")
+    mock_session.iter_items.return_value = iter([{"id": "deploy-1"}])
+
+    assert list(deployments.iter_container_deployments()) == [{"id": "deploy-1"}]
+    mock_session.iter_items.assert_called_once_with("container-deployments")
+
+
 def test_get_container_deployment(mocker, deployments):
     deployment_id = "test-deploy-id"
     expected_response = {
@@ -118,6 +135,94 @@ def test_get_container_deployment(mocker, deployments):
     mock_session.get.assert_called_once_with(f"container-deployments/{deployment_id}")
 
 
+def test_get_many(mocker, deployments):
+    mock_session = mocker.patch.object(deployments, "api_session")
+    mock_session.workers = Workers(2)
+    mock_session.get.side_effect = lambda url: {"name": url.split("/")[1]}
+
+    result = deployments.get_many(["a", "b"])
+
+    assert result == [{"name": "a"}, {"name": "b"}]
+    assert mock_session.get.call_count == 2
+    mock_session.get.side_effect = None
+    mock_session.get.return_value = [{"name": "a"}, {"name": "b"}]
+    assert deployments.get_many(["b", "c"], use_list=True) == [{"name": "b"}, None]
+    mock_session.get.assert_called_with("container-deployments")
+
+
+def test_bulk_errors_are_caught_as_request_failed(mocker, deployments):
+    error = {"code": "service_unavailable", "message": "Try again"}
+    mock_session = mocker.patch.object(deployments, "api_session")
+    mock_session.workers = Workers(2)
+    mock_session.get.return_value = error
+
+    with pytest.raises(deployments.RequestFailed):
+        deployments.get_many(["a", "b"])
+    with pytest.raises(deployments.RequestFailed):
+        deployments.get_many(["a"], use_list=True)
+    with pytest.raises(deployments.RequestFailed):
+        deployments.snapshot()
+    assert Deployments.RequestFailed is ApiSession.RequestFailed
+
+
+def test_snapshot(mocker, deployments):
+    def get(url):
+        if url == "container-deployments":
+            return [{"name": "a"}, {"name": "b"}]
+        if url == "container-deployments/b/replicas":
+            raise deployments.RequestFailed("unavailable")
+        return {"url": url}
+
+    mock_session = mocker.patch.object(deployments, "api_session")
+    mock_session.workers = Workers(2)
+    mock_session.get.side_effect = get
+    mocker.patch("datacrunch_api.v1.deployments.time.time", return_value=12.5)
+
+    first, second = deployments.snapshot(concurrency=2)
+
+    assert first == DeploymentSnapshot(
+        name="a",
+        deployment={"name": "a"},
+        fetched_at=12.5,
+        status={"url": "container-deployments/a/status"},
+        replicas={"url": "container-deployments/a/replicas"},
+        scaling={"url": "container-deployments/a/scaling"},
+    )
+    assert first.complete and not second.complete
+    assert second.replicas is None
+    assert second.scaling == {"url": "container-deployments/b/scaling"}
+    assert isinstance(second.errors["replicas"], deployments.RequestFailed)
+    assert mock_session.get.call_count == 7
+
+
+def test_snapshot_records_error_bodies(mocker, deployments):
+    def get(url):
+        if url == "container-deployments":
+            return [{"name": "a"}]
+        if url == "container-deployments/a/scaling":
+            return {"code": "service_unavailable", "message": "Try again"}
+        return {"url": url}
+
+    mock_session = mocker.patch.object(deployments, "api_session")
+    mock_session.workers = Workers(2)
+    mock_session.get.side_effect = get
+
+    (snapshot,) = deployments.snapshot()
+
+    assert snapshot.scaling is None and not snapshot.complete
+    assert isinstance(snapshot.errors["scaling"], deployments.RequestFailed)
+    assert snapshot.status == {"url": "container-deployments/a/status"}
+
+
+def test_snapshot_raises_when_list_fails(mocker, deployments):
+    mock_session = mocker.patch.object(deployments, "api_session")
+    mock_session.get.return_value = {"code": "unauthorized_request"}
+
+    with pytest.raises(Deployments.RequestFailed):
+        deployments.snapshot()
+    mock_session.get.assert_called_once_with("container-deployments")
+
+
 def test_create_container_deployment(mocker, deployments, deployment):
     expected_response = {
         "id": "new-deploy-id",
@@ -131,7 +236,20 @@ def test_create_container_deployment(mocker, deployments, deployment):
 
     assert result == expected_response
     mock_session.post.assert_called_once_with(
-        "container-deployments", json=deployment.to_dict()
+        "container-deployments", json=deployment.to_dict(), idempotency_key=None
+    )
+
+
+def test_create_container_deployment_with_idempotency_key(
+    mocker, deployments, deployment
+):
+    mock_session = mocker.patch.object(deployments, "api_session")
+    mock_session.post.return_value = {"id": "new-deploy-id"}
+
+    deployments.create_container_deployment(deployment, idempotency_key="key-1")
+
+    mock_session.post.assert_called_once_with(
+        "container-deployments", json=deployment.to_dict(), idempotency_key="key-1"
     )
 
 
@@ -192,6 +310,27 @@ def test_get_deployment_status(mocker, deployments):
     )
 
 
+def test_deployment_info(mocker, deployments):
+    mock_session = mocker.patch.object(deployments, "api_session")
+    mock_session.get.return_value = {"name": "test-deployment", "status": "healthy"}
+
+    result = deployments.get_container_deployment_info("test-deployment")
+
+    assert result == DeploymentInfo(name="test-deployment", status="healthy")
+    mock_session.get.assert_called_once_with("container-deployments/test-deployment")
+    mock_session.get.return_value = {"status": "healthy"}
+    assert deployments.get_deployment_status_info("test-deployment") == (
+        DeploymentStatus(status="healthy")
+    )
+    mock_session.get.return_value = {"list": [{"id": "1", "status": "running"}]}
+    assert deployments.get_deployment_replicas_info("test-deployment") == [
+        ReplicaInfo(id="1", status="running")
+    ]
+    mock_session.get.assert_called_with(
+        "container-deployments/test-deployment/replicas"
+    )
+
+
 def test_get_deployment_scaling(mocker, deployments):
     deployment_id = "test-deploy-id"
     expected_scaling = {"status": "running"}
@@ -347,3 +486,78 @@ def test_validate_response(deployments):
 
     success_response = {"code": "success", "status": "updating"}
     assert deployments.validate_response(success_response) == success_response
+
+
+@pytest.fixture
+def async_deployments(mocker):
+    mocker.patch("datacrunch_api.v1.deployments.AsyncApiSession")
+    return AsyncDeployments("dummy_client_id", "dummy_client_secret")
+
+
+def test_async_get_deployment_status(mocker, async_deployments):
+    mock_session = mocker.patch.object(async_deployments, "api_session")
+    mock_session.get = mocker.AsyncMock(return_value={"status": "running"})
+
+    result = asyncio.run(async_deployments.get_deployment_status("test-deploy-id"))
+
+    assert result == {"status": "running"}
+    mock_session.get.assert_awaited_once_with(
+        "container-deployments/test-deploy-id/status"
+    )
+
+
+def test_async_create_container_deployment(mocker, async_deployments, deployment):
+    mock_session = mocker.patch.object(async_deployments, "api_session")
+    mock_session.post = mocker.AsyncMock(return_value={"id": "new-deploy-id"})
+
+    result = asyncio.run(async_deployments.create_container_deployment(deployment))
+
+    assert result == {"id": "new-deploy-id"}
+    mock_session.post.assert_awaited_once_with(
+        "container-deployments", json=deployment.to_dict(), idempotency_key=None
+    )
+
+
+def test_async_restart_deployment_failure(mocker, async_deployments):
+    mock_session = mocker.patch.object(async_deployments, "api_session")
+    mock_session.post_raw = mocker.AsyncMock(return_value=mocker.Mock(status_code=500))
+
+    with pytest.raises(Deployments.RequestFailed):
+        asyncio.run(async_deployments.restart_deployment("test-deploy-id"))
+
+
+def test_async_info_raises_on_error_bodies(mocker, async_deployments):
+    mock_session = mocker.patch.object(async_deployments, "api_session")
+    mock_session.get = mocker.AsyncMock(return_value={"code": "not_found"})
+
+    with pytest.raises(Deployments.RequestFailed):
+        asyncio.run(async_deployments.get_deployment_replicas_info("test-deploy-id"))
+    with pytest.raises(Deployments.RequestFailed):
+        asyncio.run(async_deployments.get_container_deployment_info("test-deploy-id"))
+    mock_session.get = mocker.AsyncMock(return_value={"list": None})
+    with pytest.raises(Deployments.RequestFailed):
+        asyncio.run(async_deployments.get_deployment_replicas_info("test-deploy-id"))
+
+
+def test_async_snapshot(mocker, async_deployments):
+    async def get(url):
+        if url == "container-deployments":
+            return [{"name": "a"}]
+        return {"status": "healthy"}
+
+    mock_session = mocker.patch.object(async_deployments, "api_session")
+    mock_session.get = mocker.AsyncMock(side_effect=get)
+
+    (snapshot,) = asyncio.run(async_deployments.snapshot())
+
+    assert snapshot.name == "a" and snapshot.complete
+    assert snapshot.status == {"status": "healthy"}
+    assert mock_session.get.await_count == 4
+
+
+def test_async_snapshot_raises_when_list_fails(mocker, async_deployments):
+    mock_session = mocker.patch.object(async_deployments, "api_session")
+    mock_session.get = mocker.AsyncMock(return_value={"code": "service_unavailable"})
+
+    with pytest.raises(Deployments.RequestFailed):
+        asyncio.run(async_deployments.snapshot())
@@ -0,0 +1,294 @@
+import asyncio
+import time
+
+import pytest
+from datacrunch_api.testing import EndpointBehavior, FakeServer, Transitions
+from datacrunch_api.v1 import (
+    NO_RETRY,
+    ApiSession,
+    AsyncApiSession,
+    AsyncDeployments,
+    AsyncInstances,
+    Instance,
+    Instances,
+    RateLimit,
+    Volume,
+    VolumeAction,
+    Volumes,
+    WaitFailed,
+    WaitPolicy,
+)
+from datacrunch_api.v1.deployments import Deployments
+from datacrunch_api.v1.types.instance import InstanceAction
+
+FAST = Transitions(
+    instance_provisioning=0.1,
+    instance_shutdown=0.05,
+    instance_deletion=0.05,
+    volume_creation=0.05,
+    volume_attachment=0.05,
+    deployment_startup=0.05,
+)
+POLLING = WaitPolicy(base_delay=0.01, max_delay=0.05, timeout=5.0)
+INSTANCE = Instance(
+    description="test", hostname="test", image="ubuntu", instance_type="1H100.80S.30V"
+)
+
+
+@pytest.fixture
+def server():
+    with FakeServer(transitions=FAST, seed=1) as server:
+        yield server
+
+
+@pytest.fixture
+def api_session(server):
+    api_session = ApiSession(
+        "dummy_client_id", "dummy_client_secret", base_url=server.url
+    )
+    yield api_session
+    api_session.close()
+
+
+def test_instance_lifecycle(api_session):
+    instances = Instances(api_session=api_session)
+    instance_id = instances.deploy(INSTANCE)
+    assert instances.get_instance(instance_id)["status"] == "ordered"
+
+    time.sleep(0.15)
+    assert instances.get_instance(instance_id)["status"] == "running"
+
+    instances.action(InstanceAction(action="shutdown", id=instance_id))
+    time.sleep(0.1)
+    assert instances.get_instance(instance_id)["status"] == "offline"
+
+    instances.delete_instance(instance_id)
+    assert instances.get_instance(instance_id)["status"] == "deleting"
+    time.sleep(0.1)
+    assert instances.list_instances() == []
+
+
+def test_instance_action_requires_id(api_session):
+    instance_id = Instances(api_session=api_session).deploy(INSTANCE)
+
+    response = api_session.put_raw(
+        "instances", json={"action": "shutdown", "instance_id": instance_id}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["code"] == "invalid_request"
+
+
+def test_bulk_instance_action(server, api_session):
+    server.populate(instances=300)
+    instances = Instances(api_session=api_session)
+    instance_ids = [instance["id"] for instance in instances.list_instances()]
+
+    results = instances.bulk_action("force_shutdown", instance_ids + ["missing"])
+
+    assert not results.pop("missing").ok
+    assert all(result.ok for result in results.values())
+    statuses = {instance["status"] for instance in instances.list_instances()}
+    assert statuses == {"offline"}
+
+
+def test_get_many(server, api_session):
+    server.populate(instances=40, volumes=5)
+    instances = Instances(api_session=api_session)
+    listed = instances.list_instances()
+    instance_ids = [instance["id"] for instance in reversed(listed)] + ["missing"]
+
+    assert instances.get_many(instance_ids) == listed[::-1] + [None]
+    assert instances.get_many(instance_ids[:3] + ["missing"]) == listed[:-4:-1] + [None]
+    volumes = Volumes(api_session=api_session)
+    volume_ids = [volume["id"] for volume in volumes.list_volumes()]
+    assert volumes.get_many(volume_ids, use_list=False) == volumes.list_volumes()
+
+
+def test_volume_attach_and_trash(api_session):
+    instance_id = Instances(api_session=api_session).deploy(INSTANCE)
+    volumes = Volumes(api_session=api_session)
+    volume_id = volumes.create(Volume(name="data", size=100, type="NVMe"))
+    time.sleep(0.1)
+
+    volumes.action(VolumeAction(action="attach", id=volume_id, instance_id=instance_id))
+    assert volumes.get_volume(volume_id)["status"] == "attaching"
+    time.sleep(0.1)
+    assert volumes.get_volume(volume_id)["instance_id"] == instance_id
+
+    volumes.delete(volume_id)
+    assert volumes.list_volumes() == []
+    assert [volume["id"] for volume in volumes.list_trash()] == [volume_id]
+
+
+def test_deployment_subresources(server, api_session):
+    server.populate(deployments=1)
+    deployments = Deployments(api_session=api_session)
+
+    assert deployments.get_deployment_status("deployment-0") == {"status": "healthy"}
+    assert len(deployments.get_deployment_replicas("deployment-0")["list"]) == 1
+
+    deployments.update_deployment_scaling("deployment-0", {"min_replica_count": 2})
+    deployments.pause_deployment("deployment-0")
+    assert deployments.get_deployment_status("deployment-0") == {"status": "paused"}
+    assert deployments.get_deployment_replicas("deployment-0") == {"list": []}
+
+    deployments.resume_deployment("deployment-0")
+    time.sleep(0.1)
+    assert len(deployments.get_deployment_replicas("deployment-0")["list"]) == 2
+
+
+def test_deployment_snapshot(server, api_session):
+    server.populate(deployments=3)
+    deployments = Deployments(api_session=api_session)
+
+    snapshots = deployments.snapshot()
+
+    assert [snapshot.name for snapshot in snapshots] == [
+        "deployment-0",
+        "deployment-1",
+        "deployment-2",
+    ]
+    for snapshot in snapshots:
+        assert snapshot.complete
+        assert snapshot.status == {"status": "healthy"}
+        assert snapshot.scaling == deployments.get_deployment_scaling(snapshot.name)
+        assert len(snapshot.replicas["list"]) >= 1
+
+
+def test_waiters(server, api_session):
+    server.populate(deployments=1)
+    instances = Instances(api_session=api_session)
+    volumes = Volumes(api_session=api_session)
+    deployments = Deployments(api_session=api_session)
+    instance_id = instances.deploy(INSTANCE)
+    volume_id = volumes.create(Volume(name="data", size=100, type="NVMe"))
+
+    running = instances.wait_for_instance_status(instance_id, wait_policy=POLLING)
+    assert running["status"] == "running"
+    volumes.action(VolumeAction(action="attach", id=volume_id, instance_id=instance_id))
+    attached = volumes.wait_for_volume_attached(
+        volume_id, instance_id, wait_policy=POLLING
+    )
+    assert attached["instance_id"] == instance_id
+
+    deployments.restart_deployment("deployment-0")
+    assert deployments.wait_until_deployment_healthy(
+        "deployment-0", wait_policy=POLLING
+    ) == {"status": "healthy"}
+    deployments.pause_deployment("deployment-0")
+    with pytest.raises(WaitFailed, match="paused"):
+        deployments.wait_until_deployment_healthy("deployment-0", wait_policy=POLLING)
+
+    instances.delete_instance(instance_id)
+    with pytest.raises(WaitFailed, match="deleting"):
+        instances.wait_for_instance_status(instance_id, "offline", wait_policy=POLLING)
+    with pytest.raises(WaitFailed):
+        volumes.wait_for_volume_attached("missing", wait_policy=POLLING)
+
+
+def test_group_waiters(server, api_session):
+    instances = Instances(api_session=api_session)
+    volumes = Volumes(api_session=api_session)
+    instance_ids = [instances.deploy(INSTANCE) for _ in range(20)]
+    volume_ids = []
+
+    for event in instances.wait_for_instances(instance_ids, wait_policy=POLLING):
+        assert event.ok
+        volume_id = volumes.create(Volume(name=event.id, size=100, type="NVMe"))
+        volume_ids.append(volume_id)
+        volumes.action(
+            VolumeAction(action="attach", id=volume_id, instance_id=event.id)
+        )
+    results = volumes.wait_for_volumes_attached(volume_ids, wait_policy=POLLING).wait()
+
+    assert all(event.ok for event in results.values())
+    assert server.requests["GET instances/{id}"] == 0
+    assert 1 <= server.requests["GET instances"] <= 10
+    assert 1 <= server.requests["GET volumes"] <= 10
+
+
+def test_missing_resource_is_not_found(api_session):
+    assert Instances(api_session=api_session).get_instance("missing") == {
+        "code": "not_found",
+        "message": "Instance missing not found",
+    }
+
+
+def test_injected_errors(server, api_session):
+    server.behaviors["balance"] = EndpointBehavior(error_rate=1.0, error_status=503)
+    api_session.retry_policy = NO_RETRY
+
+    assert api_session.get("balance")["code"] == "service_unavailable"
+    assert api_session.get("instances") == []
+    assert server.injected_errors == 1
+
+
+def test_rate_limit_rejects_with_retry_after(server, api_session):
+    server.behaviors["instances"] = EndpointBehavior(
+        rate_limit=RateLimit(rate=1, burst=2)
+    )
+    api_session.retry_policy = NO_RETRY
+
+    responses = [api_session._send("get", "instances") for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [200, 200, 429]
+    assert float(responses[2].headers["Retry-After"]) > 0
+    assert server.throttled == 1
+
+
+def test_latency(server, api_session):
+    server.behaviors["instances"] = EndpointBehavior(latency=0.1)
+    started = time.monotonic()
+
+    api_session.get("instances")
+
+    assert time.monotonic() - started >= 0.1
+
+
+def test_revoked_tokens_are_refreshed(server, api_session):
+    server.revoke_tokens()
+
+    assert api_session.get("instances") == []
+    assert server.requests["POST oauth2/{id}"] == 2
+
+
+def test_credentials_are_checked():
+    with FakeServer(credentials=("id", "secret")) as server:
+        with pytest.raises(ApiSession.RequestFailed):
+            ApiSession("id", "wrong", base_url=server.url)
+
+
+def test_async_clients(server):
+    server.populate(instances=100)
+
+    async def scenario():
+        async with AsyncApiSession(
+            "dummy_client_id", "dummy_client_secret", base_url=server.url
+        ) as api_session:
+            return await AsyncInstances(api_session=api_session).list_instances()
+
+    assert len(asyncio.run(scenario())) == 100
+
+
+def test_async_waiters(server):
+    server.populate(deployments=1)
+
+    async def scenario():
+        async with AsyncApiSession(
+            "dummy_client_id", "dummy_client_secret", base_url=server.url
+        ) as api_session:
+            instances = AsyncInstances(api_session=api_session)
+            deployments = AsyncDeployments(api_session=api_session)
+            instance_id = await instances.deploy(INSTANCE)
+            await deployments.restart_deployment("deployment-0")
+            return await asyncio.gather(
+                instances.wait_for_instance_status(instance_id, wait_policy=POLLING),
+                deployments.wait_until_deployment_healthy(
+                    "deployment-0", wait_policy=POLLING
+                ),
+            )
+
+    instance, status = asyncio.run(scenario())
+    assert instance["status"] == "running"
+    assert status == {"status": "healthy"}
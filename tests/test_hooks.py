@@ -0,0 +1,192 @@
+from typing import Any
+
+import pytest
+import requests
+from datacrunch_api.v1 import (
+    Hooks,
+    OpenTelemetryHook,
+    PrometheusHook,
+    RequestEvent,
+    RequestHook,
+)
+from datacrunch_api.v1._api_session import ApiSession
+from datacrunch_api.v1._hooks import endpoint_template
+
+
+class Recorder(RequestHook):
+    def __init__(self):
+        self.events = []
+
+    def before_request(self, event):
+        self.events.append(("before_request", event.attempt, event.status))
+
+    def after_response(self, event):
+        self.events.append(("after_response", event.attempt, event.status))
+
+    def on_error(self, event):
+        self.events.append(("on_error", event.attempt, type(event.error).__name__))
+
+
+@pytest.fixture
+def api_session(mocker) -> ApiSession:
+    mock_session = mocker.patch("datacrunch_api.v1._api_session.requests.Session")
+    mock_session.return_value.post.return_value.json.return_value = {
+        "access_token": "dummy_access_token"
+    }
+    return ApiSession("dummy_client_id", "dummy_client_secret")
+
+
+def event(**kwargs: Any) -> RequestEvent:
+    values: dict[str, Any] = {
+        "method": "GET",
+        "url": "instances/123",
+        "endpoint": "instances/{id}",
+        "attempt": 1,
+        "request_bytes": 0,
+        "started_at": 1700000000.0,
+        "status": 200,
+        "response_bytes": 512,
+        "duration": 0.12,
+    }
+    return RequestEvent(**(values | kwargs))
+
+
+def test_endpoint_template():
+    assert endpoint_template("instances") == "instances"
+    assert endpoint_template("instances/abc-123") == "instances/{id}"
+    assert endpoint_template("volumes/trash") == "volumes/trash"
+    assert (
+        endpoint_template("container-deployments/my-app/status")
+        == "container-deployments/{id}/status"
+    )
+    assert endpoint_template("instance-types?currency=usd") == "instance-types"
+    assert endpoint_template("price-history/1H100.80S.30V/EUR") == (
+        "price-history/{id}/{id}"
+    )
+
+
+def test_empty_hooks_are_falsy():
+    assert not Hooks()
+    assert Hooks(RequestHook())
+
+
+def test_events_of_a_successful_request(mocker, api_session):
+    events = []
+
+    class Capture(RequestHook):
+        def after_response(self, event):
+            events.append(event)
+
+    api_session.hooks.add(Capture())
+    api_session.session.post.return_value = mocker.Mock(
+        status_code=201, content=b'{"id": "123"}', headers={}
+    )
+
+    api_session.post("instances", {"hostname": "worker"})
+
+    [event] = events
+    assert event.method == "POST"
+    assert event.endpoint == "instances"
+    assert event.status == 201
+    assert event.request_bytes == len(b'{"hostname":"worker"}')
+    assert event.response_bytes == len(b'{"id": "123"}')
+    assert event.duration >= 0
+
+
+def test_every_attempt_is_reported(mocker, api_session):
+    mocker.patch("datacrunch_api.v1._api_session.time.sleep")
+    recorder = api_session.hooks.add(Recorder())
+    api_session.session.get.side_effect = [
+        requests.ConnectionError(),
+        mocker.Mock(status_code=503, content=b"{}", headers={}),
+        mocker.Mock(status_code=200, content=b"[]", headers={}),
+    ]
+
+    api_session.get("instances")
+
+    assert recorder.events == [
+        ("before_request", 1, None),
+        ("on_error", 1, "ConnectionError"),
+        ("before_request", 2, None),
+        ("after_response", 2, 503),
+        ("before_request", 3, None),
+        ("after_response", 3, 200),
+    ]
+
+
+def test_failing_hooks_do_not_affect_requests(mocker, api_session):
+    hook = api_session.hooks.add(RequestHook())
+    mocker.patch.object(hook, "before_request", side_effect=RuntimeError)
+    api_session.session.get.return_value = mocker.Mock(
+        status_code=200, content=b"[]", headers={}
+    )
+
+    assert api_session.get("instances") == []
+
+
+def test_no_events_without_hooks(mocker, api_session):
+    before_request = mocker.spy(Hooks, "before_request")
+    api_session.session.get.return_value = mocker.Mock(
+        status_code=200, content=b"[]", headers={}
+    )
+
+    api_session.get("instances")
+
+    before_request.assert_not_called()
+
+
+def test_prometheus_hook():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    hook = PrometheusHook(registry=registry)
+
+    hook.after_response(event())
+    hook.on_error(event(status=None, error=TimeoutError()))
+
+    labels = {"method": "GET", "endpoint": "instances/{id}", "status": "200"}
+    assert (
+        registry.get_sample_value(
+            "datacrunch_api_request_duration_seconds_count", labels
+        )
+        == 1
+    )
+    assert (
+        registry.get_sample_value("datacrunch_api_response_size_bytes_sum", labels)
+        == 512
+    )
+    assert (
+        registry.get_sample_value(
+            "datacrunch_api_request_errors_total",
+            {"method": "GET", "endpoint": "instances/{id}", "error": "TimeoutError"},
+        )
+        == 1
+    )
+
+
+def test_open_telemetry_hook():
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    hook = OpenTelemetryHook(tracer_provider=provider)
+
+    ok = event(status=None)
+    hook.before_request(ok)
+    ok.status = 404
+    hook.after_response(ok)
+    failed = event(status=None)
+    hook.before_request(failed)
+    failed.error = TimeoutError()
+    hook.on_error(failed)
+
+    first, second = exporter.get_finished_spans()
+    assert first.name == "GET instances/{id}"
+    assert first.attributes["http.response.status_code"] == 404
+    assert not first.status.is_ok
+    assert second.events[0].name == "exception"
@@ -0,0 +1,119 @@
+import asyncio
+
+import aiohttp
+import pytest
+import requests
+from datacrunch_api.testing import FakeServer
+from datacrunch_api.v1 import (
+    NO_RETRY,
+    ApiSession,
+    AsyncApiSession,
+    AsyncVolumes,
+    Http2Transport,
+    Volumes,
+)
+from datacrunch_api.v1._http2 import _timeout
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeServer(seed=1) as server:
+        yield server
+
+
+def test_uses_http1_when_server_offers_no_http2(server):
+    transport = Http2Transport()
+    volumes = Volumes(
+        "dummy_client_id",
+        "dummy_client_secret",
+        base_url=server.url,
+        transport=transport,
+    )
+
+    assert volumes.list_volumes() == []
+    assert transport.http_versions["HTTP/1.1"] == 2
+    volumes.api_session.close()
+    assert transport._client is None
+
+
+def test_prior_knowledge_falls_back_to_http1(server):
+    transport = Http2Transport(prior_knowledge=True)
+    volumes = Volumes(
+        "dummy_client_id",
+        "dummy_client_secret",
+        base_url=server.url,
+        transport=transport,
+    )
+
+    assert volumes.list_volumes() == []
+    assert not transport.prior_knowledge
+    assert set(transport.http_versions) == {"HTTP/1.1"}
+    volumes.api_session.close()
+
+
+def test_async_session(server):
+    transport = Http2Transport(prior_knowledge=True)
+
+    async def list_volumes():
+        async with AsyncApiSession(
+            "dummy_client_id",
+            "dummy_client_secret",
+            base_url=server.url,
+            coalesce_gets=False,
+            transport=transport,
+        ) as api_session:
+            volumes = AsyncVolumes(api_session=api_session)
+            return await asyncio.gather(*(volumes.list_volumes() for _ in range(10)))
+
+    assert asyncio.run(list_volumes()) == [[]] * 10
+    assert transport.http_versions["HTTP/1.1"] == 11
+    assert transport._async_client is None
+
+
+def test_connection_errors_are_network_errors():
+    with pytest.raises(requests.ConnectionError):
+        ApiSession(
+            "dummy_client_id",
+            "dummy_client_secret",
+            base_url="http://127.0.0.1:1/v1",
+            retry_policy=NO_RETRY,
+            transport=Http2Transport(),
+        )
+
+    async def connect():
+        async with AsyncApiSession(
+            "dummy_client_id",
+            "dummy_client_secret",
+            base_url="http://127.0.0.1:1/v1",
+            retry_policy=NO_RETRY,
+            transport=Http2Transport(),
+        ) as api_session:
+            await api_session.authenticate()
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        asyncio.run(connect())
+
+
+def test_sends_session_headers_except_hop_by_hop(mocker):
+    transport = Http2Transport()
+    session = mocker.Mock()
+    session.session.headers = {"Authorization": "Bearer token", "Connection": "close"}
+    transport.attach(session)
+
+    options = transport._request_options(
+        {"headers": {"Idempotency-Key": "key"}, "data": b"{}", "timeout": (1, 2)}
+    )
+
+    assert options["headers"] == {
+        "Authorization": "Bearer token",
+        "Idempotency-Key": "key",
+    }
+    assert options["content"] == b"{}"
+    assert options["timeout"].connect == 1
+    assert options["timeout"].read == 2
+
+
+def test_converts_session_timeouts():
+    assert _timeout(None).read is None
+    timeout = _timeout(aiohttp.ClientTimeout(sock_connect=3, sock_read=4))
+    assert (timeout.connect, timeout.read, timeout.pool) == (3, 4, None)
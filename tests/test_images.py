@@ -1,5 +1,7 @@
+import asyncio
+
 import pytest
-from datacrunch_api.v1 import Images
+from datacrunch_api.v1 import AsyncImages, Images
 
 
 @pytest.fixture
@@ -20,3 +22,37 @@ def test_list_images(mocker, images):
         {"id": "456", "name": "image2"},
     ]
     mock_session.get.assert_called_once_with("images")
+
+
+def test_iter_images(mocker, images):
+    mock_session = mocker.patch.object(images, "api_session")
+    mock_session.iter_items.return_value = iter([{"id": "123"}])
+
+    assert list(images.iter_images()) == [{"id": "123"}]
+    mock_session.iter_items.assert_called_once_with("images")
+
+
+def test_async_list_images(mocker):
+    mocker.patch("datacrunch_api.v1.images.AsyncApiSession")
+    images = AsyncImages("dummy_client_id", "dummy_client_secret")
+    mock_session = mocker.patch.object(images, "api_session")
+    mock_session.get = mocker.AsyncMock(return_value=[{"id": "123"}])
+    result = asyncio.run(images.list_images())
+    assert result == [{"id": "123"}]
+    mock_session.get.assert_awaited_once_with("images")
+
+
+def test_async_iter_images(mocker):
+    mocker.patch("datacrunch_api.v1.images.AsyncApiSession")
+    images = AsyncImages("dummy_client_id", "dummy_client_secret")
+    mock_session = mocker.patch.object(images, "api_session")
+
+    async def iter_items(url):
+        yield {"url": url}
+
+    mock_session.iter_items = iter_items
+
+    async def collect():
+        return [image async for image in images.iter_images()]
+
+    assert asyncio.run(collect()) == [{"url": "images"}]
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import datacrunch_api.v1 as v1
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def loaded_modules(statement: str) -> set[str]:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement}; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize("name", v1.__all__ + ["Deployments", "AsyncDeployments"])
+def test_every_attribute_resolves(name):
+    assert getattr(v1, name) is not None
+    assert name in dir(v1)
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="NotAnAttribute"):
+        v1.NotAnAttribute
+
+
+def test_package_import_is_lazy():
+    modules = loaded_modules("import datacrunch_api.v1")
+
+    assert "datacrunch_api.v1" in modules
+    assert not {"requests", "aiohttp", "dataclasses_json"} & modules
+
+
+def test_sync_client_does_not_import_aiohttp():
+    modules = loaded_modules("from datacrunch_api.v1 import DataCrunchClient")
+
+    assert "requests" in modules
+    assert "aiohttp" not in modules
+
+
+def test_tools_defer_client_and_rich():
+    modules = loaded_modules(
+        "import datacrunch_api.tools.query, datacrunch_api.tools.secret"
+    )
+
+    assert not {"rich", "requests"} & modules
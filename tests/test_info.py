@@ -0,0 +1,118 @@
+import pytest
+from datacrunch_api.testing import FakeServer
+from datacrunch_api.v1 import (
+    ApiSession,
+    Deployments,
+    DeploymentStatus,
+    Instance,
+    InstanceInfo,
+    Instances,
+    InstanceTypeInfo,
+    ReplicaInfo,
+    VolumeInfo,
+)
+
+
+def test_keeps_unknown_fields_in_extra():
+    data = {"id": "123", "status": "running", "gpu": {"count": 1}, "new": [1]}
+
+    info = InstanceInfo.from_dict(data)
+
+    assert info.id == "123"
+    assert info.status == "running"
+    assert info.gpu == {"count": 1}
+    assert info.hostname is None
+    assert info.extra == {"new": [1]}
+    assert info.to_dict() == data
+
+
+def test_extra_is_not_a_field():
+    info = VolumeInfo.from_dict({"id": "123", "extra": "value"})
+
+    assert info.extra == {"extra": "value"}
+    assert info.to_dict() == {"id": "123", "extra": "value"}
+
+
+def test_is_slotted():
+    info = ReplicaInfo.from_dict({"id": "1", "status": "running"})
+
+    assert not hasattr(info, "__dict__")
+    with pytest.raises(AttributeError):
+        info.unknown = 1  # type: ignore[attr-defined]
+
+
+def test_requires_identifier():
+    with pytest.raises(TypeError):
+        InstanceInfo.from_dict({"status": "running"})
+
+
+def test_from_list():
+    assert DeploymentStatus.from_list([{"status": "healthy"}]) == [
+        DeploymentStatus(status="healthy")
+    ]
+
+
+@pytest.mark.parametrize(
+    "data", [{"code": "not_found", "message": "Not found"}, [{"id": "1"}], None]
+)
+def test_rejects_error_bodies(data):
+    with pytest.raises(ApiSession.RequestFailed):
+        InstanceInfo.from_dict(data)
+
+
+def test_rejects_error_bodies_in_lists():
+    with pytest.raises(ApiSession.RequestFailed):
+        VolumeInfo.from_list({"code": "unauthorized_request", "message": "Denied"})
+    with pytest.raises(ApiSession.RequestFailed):
+        VolumeInfo.from_list([{"id": "1"}, {"code": "not_found"}])
+
+
+def test_raises_on_server_errors():
+    with FakeServer(seed=1) as server:
+        server.populate(deployments=1)
+        instances = Instances("id", "secret", base_url=server.url)
+        with pytest.raises(ApiSession.RequestFailed, match="not_found"):
+            instances.get_instance_info("missing")
+        instances.api_session.close()
+
+        deployments = Deployments("id", "secret", base_url=server.url)
+        with pytest.raises(Deployments.RequestFailed, match="not_found"):
+            deployments.get_deployment_status_info("missing")
+        with pytest.raises(Deployments.RequestFailed, match="not_found"):
+            deployments.get_deployment_replicas_info("missing")
+        deployments.api_session.close()
+
+
+def test_decodes_server_responses():
+    with FakeServer(seed=1) as server:
+        server.populate(instances=3, deployments=1)
+        instances = Instances("id", "secret", base_url=server.url)
+        instance_id = instances.deploy(
+            Instance(
+                description="test",
+                hostname="test",
+                image="ubuntu",
+                instance_type="1H100.80S.30V",
+            )
+        )
+
+        listed = instances.list_instances_info()
+        assert [info.to_dict() for info in listed] == [
+            {name: value for name, value in instance.items() if value is not None}
+            for instance in instances.list_instances()
+        ]
+        assert all(info.extra == {} for info in listed)
+        info = instances.get_instance_info(instance_id)
+        assert (info.id, info.hostname) == (instance_id, "test")
+        assert isinstance(instances.list_instance_types_info()[0], InstanceTypeInfo)
+        instances.api_session.close()
+
+        deployments = Deployments("id", "secret", base_url=server.url)
+        (deployment,) = deployments.list_container_deployments_info()
+        assert deployment.name == "deployment-0"
+        assert deployment.extra == {"environment_variables": {}}
+        status = deployments.get_deployment_status_info("deployment-0")
+        assert status == DeploymentStatus(status="healthy")
+        replicas = deployments.get_deployment_replicas_info("deployment-0")
+        assert [replica.id for replica in replicas] == ["deployment-0-0"]
+        deployments.api_session.close()
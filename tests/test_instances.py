@@ -1,5 +1,15 @@
+import asyncio
+
 import pytest
-from datacrunch_api.v1 import Instance, Instances
+from datacrunch_api.v1 import (
+    AsyncInstances,
+    Instance,
+    InstanceInfo,
+    Instances,
+    InstanceTypeInfo,
+)
+from datacrunch_api.v1._api_session import ApiSession
+from datacrunch_api.v1._workers import Workers
 
 
 @pytest.fixture
@@ -27,7 +37,7 @@ def test_delete_instance(mocker, instances):
 
     mock_session.put_raw.assert_called_once_with(
         f"instances",
-        json={"action": "delete", "instance_id": instance_id},
+        json={"action": "delete", "id": instance_id},
     )
 
 
@@ -44,7 +54,9 @@ def test_deploy_instance(mocker, instances):
 
     result = instances.deploy(instance)
     assert result == "123"
-    mock_session.post.assert_called_once_with("instances", json=instance.to_dict())
+    mock_session.post.assert_called_once_with(
+        "instances", json=instance.to_dict(), idempotency_key=None
+    )
 
 
 def test_get_instance_availabilities(mocker, instances):
@@ -117,6 +129,14 @@ def test_list_instances(mocker, instances):
     mock_session.get.assert_called_once_with("instances")
 
 
+def test_iter_instances(mocker, instances):
+    mock_session = mocker.patch.object(instances, "api_session")
+    mock_session.iter_items.return_value = iter([{"id": "123"}, {"id": "456"}])
+
+    assert list(instances.iter_instances()) == [{"id": "123"}, {"id": "456"}]
+    mock_session.iter_items.assert_called_once_with("instances")
+
+
 def test_list_locations(mocker, instances):
     mock_session = mocker.patch.object(instances, "api_session")
     mock_session.get.return_value = [
@@ -143,3 +163,199 @@ def test_list_long_term_periods(mocker, instances):
         {"id": "123", "name": "period1"},
         {"id": "456", "name": "period2"},
     ]
+
+
+@pytest.fixture
+def async_instances(mocker):
+    mocker.patch("datacrunch_api.v1.instances.AsyncApiSession")
+    return AsyncInstances("dummy_client_id", "dummy_client_secret")
+
+
+def test_async_get_instance(mocker, async_instances):
+    mock_session = mocker.patch.object(async_instances, "api_session")
+    mock_session.get = mocker.AsyncMock(return_value={"id": "123"})
+
+    result = asyncio.run(async_instances.get_instance("123"))
+    assert result == {"id": "123"}
+    mock_session.get.assert_awaited_once_with("instances/123")
+
+
+def test_async_list_instances(mocker, async_instances):
+    mock_session = mocker.patch.object(async_instances, "api_session")
+    mock_session.get = mocker.AsyncMock(return_value=[{"id": "123"}])
+
+    result = asyncio.run(async_instances.list_instances())
+    assert result == [{"id": "123"}]
+    mock_session.get.assert_awaited_once_with("instances")
+
+
+def test_async_delete_instance(mocker, async_instances):
+    mock_session = mocker.patch.object(async_instances, "api_session")
+    mock_session.put_raw = mocker.AsyncMock(return_value=mocker.Mock(status_code=202))
+
+    asyncio.run(async_instances.delete_instance("123"))
+    mock_session.put_raw.assert_awaited_once_with(
+        "instances", json={"action": "delete", "id": "123"}
+    )
+
+
+def test_instance_info(mocker, instances):
+    mock_session = mocker.patch.object(instances, "api_session")
+    mock_session.get.return_value = {"id": "123", "status": "running", "new": 1}
+
+    info = instances.get_instance_info("123")
+
+    assert info == InstanceInfo(id="123", status="running", extra={"new": 1})
+    mock_session.get.assert_called_once_with("instances/123")
+    mock_session.get.return_value = [{"id": "123"}, {"id": "456"}]
+    assert [info.id for info in instances.list_instances_info()] == ["123", "456"]
+    mock_session.get.return_value = [{"instance_type": "1H100.80S.30V"}]
+    assert instances.list_instance_types_info("USD") == [
+        InstanceTypeInfo(instance_type="1H100.80S.30V")
+    ]
+    mock_session.get.assert_called_with("instance-types?currency=USD")
+
+
+def test_bulk_action_sends_batches(mocker, instances):
+    mock_session = mocker.patch.object(instances, "api_session")
+    mock_session.workers = Workers(2)
+    mock_session.put_raw.return_value.status_code = 202
+    progress = []
+
+    results = instances.bulk_action(
+        "shutdown",
+        ["1", "2", "3", "2", "4", "5"],
+        batch_size=2,
+        on_progress=lambda result, done, total: progress.append((done, total)),
+    )
+
+    assert list(results) == ["1", "2", "3", "4", "5"]
+    assert all(result.ok for result in results.values())
+    assert sorted(progress) == [(done, 5) for done in range(1, 6)]
+    bodies = [call.kwargs["json"] for call in mock_session.put_raw.call_args_list]
+    assert sorted(bodies, key=str) == [
+        {"action": "shutdown", "id": "5"},
+        {"action": "shutdown", "id": ["1", "2"]},
+        {"action": "shutdown", "id": ["3", "4"]},
+    ]
+
+
+def test_bulk_action_retries_failed_batches_per_instance(mocker, instances):
+    def put_raw(url, json):
+        ids = json["id"] if isinstance(json["id"], list) else [json["id"]]
+        failed = "bad" in ids
+        return mocker.Mock(status_code=404 if failed else 202, json=lambda: "missing")
+
+    mock_session = mocker.patch.object(instances, "api_session")
+    mock_session.workers = Workers(2)
+    mock_session.put_raw.side_effect = put_raw
+    mock_session.RequestFailed = RuntimeError
+
+    results = instances.bulk_action(
+        "hibernate", ["1", "bad", "3", "4"], batch_size=3, concurrency=2
+    )
+
+    assert [result.ok for result in results.values()] == [True, False, True, True]
+    assert isinstance(results["bad"].error, RuntimeError)
+    # The failed batch, then its three instances, and the last batch
+    assert mock_session.put_raw.call_count == 5
+    with pytest.raises(ValueError):
+        instances.bulk_action("hibernate", ["1"], batch_size=0)
+
+
+def test_async_bulk_action(mocker, async_instances):
+    async def put_raw(url, json):
+        failed = json["id"] == "bad" or "bad" in json["id"]
+        return mocker.Mock(status_code=400 if failed else 202, json=lambda: "invalid")
+
+    mock_session = mocker.patch.object(async_instances, "api_session")
+    mock_session.put_raw = mocker.AsyncMock(side_effect=put_raw)
+    mock_session.RequestFailed = RuntimeError
+    progress = []
+
+    results = asyncio.run(
+        async_instances.bulk_action(
+            "delete",
+            ["1", "2", "bad"],
+            batch_size=2,
+            concurrency=1,
+            on_progress=lambda result, done, total: progress.append(result.id),
+        )
+    )
+
+    assert {id: result.ok for id, result in results.items()} == {
+        "1": True,
+        "2": True,
+        "bad": False,
+    }
+    assert sorted(progress) == ["1", "2", "bad"]
+    assert mock_session.put_raw.await_count == 2
+
+
+def test_get_many(mocker, instances):
+    def get(url):
+        if url == "instances":
+            return [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+        if url == "instances/missing":
+            return {"code": "not_found", "message": "Instance missing not found"}
+        return {"id": url.split("/")[1]}
+
+    mock_session = mocker.patch.object(instances, "api_session")
+    mock_session.workers = Workers(2)
+    mock_session.get.side_effect = get
+
+    assert instances.get_many(["2", "missing", "1", "2"]) == [
+        {"id": "2"},
+        None,
+        {"id": "1"},
+        {"id": "2"},
+    ]
+    assert sorted(call.args[0] for call in mock_session.get.call_args_list) == [
+        "instances/1",
+        "instances/2",
+        "instances/missing",
+    ]
+
+    mock_session.get.reset_mock()
+    assert instances.get_many(["3", "missing", "1"], concurrency=2) == [
+        {"id": "3"},
+        None,
+        {"id": "1"},
+    ]
+    mock_session.get.assert_called_once_with("instances")
+    assert instances.get_many(["3"], use_list=True) == [{"id": "3"}]
+
+
+def test_get_many_raises_on_errors(mocker, instances):
+    error = {"code": "unauthorized_request", "message": "Access token is invalid"}
+    mock_session = mocker.patch.object(instances, "api_session")
+    mock_session.workers = Workers(2)
+    mock_session.get.return_value = error
+
+    with pytest.raises(ApiSession.RequestFailed):
+        instances.get_many(["1", "2"])
+    with pytest.raises(ApiSession.RequestFailed):
+        instances.get_many(["1"], use_list=True)
+    mock_session.get.return_value = ["1"]
+    with pytest.raises(ApiSession.RequestFailed):
+        instances.get_many(["1"], use_list=True)
+
+
+def test_async_get_many(mocker, async_instances):
+    mock_session = mocker.patch.object(async_instances, "api_session")
+    mock_session.get = mocker.AsyncMock(side_effect=lambda url: {"id": url[10:]})
+
+    result = asyncio.run(async_instances.get_many(["1", "2"], use_list=False))
+
+    assert result == [{"id": "1"}, {"id": "2"}]
+    assert mock_session.get.await_count == 2
+
+
+def test_async_get_many_raises_on_list_error(mocker, async_instances):
+    mock_session = mocker.patch.object(async_instances, "api_session")
+    mock_session.get = mocker.AsyncMock(
+        return_value={"code": "service_unavailable", "message": "Try again"}
+    )
+
+    with pytest.raises(ApiSession.RequestFailed):
+        asyncio.run(async_instances.get_many(["1"], use_list=True))
@@ -0,0 +1,155 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from datacrunch_api.v1 import (
+    FileBucketStore,
+    MemoryBucketStore,
+    RateLimit,
+    RateLimiter,
+)
+from datacrunch_api.v1._rate_limiter import endpoint_family
+
+
+def test_endpoint_family():
+    assert endpoint_family("instances") == "instances"
+    assert endpoint_family("instances/123") == "instances"
+    assert endpoint_family("/container-deployments/x/status") == (
+        "container-deployments"
+    )
+    assert endpoint_family("volumes?status=attached") == "volumes"
+
+
+def test_rate_limit_validation():
+    with pytest.raises(ValueError):
+        RateLimit(rate=0)
+    with pytest.raises(ValueError):
+        RateLimit(rate=1, burst=0)
+
+
+def test_burst_then_waits_at_rate(mocker):
+    mocker.patch("datacrunch_api.v1._rate_limiter.time.monotonic", return_value=100.0)
+    limiter = RateLimiter(default=RateLimit(rate=2, burst=3))
+
+    delays = [limiter.reserve("instances") for _ in range(5)]
+
+    assert delays == [0.0, 0.0, 0.0, 0.5, 1.0]
+    assert limiter.throttled == 2
+    assert limiter.throttled_seconds == 1.5
+
+
+def test_bucket_refills_over_time(mocker):
+    monotonic = mocker.patch("datacrunch_api.v1._rate_limiter.time.monotonic")
+    monotonic.return_value = 100.0
+    limiter = RateLimiter(default=RateLimit(rate=2, burst=1))
+    assert limiter.reserve("volumes") == 0.0
+    assert limiter.reserve("volumes") == 0.5
+
+    monotonic.return_value = 102.0
+
+    assert limiter.reserve("volumes") == 0.0
+
+
+def test_families_have_separate_buckets(mocker):
+    mocker.patch("datacrunch_api.v1._rate_limiter.time.monotonic", return_value=100.0)
+    limiter = RateLimiter(
+        default=RateLimit(rate=1), limits={"instances": RateLimit(rate=10)}
+    )
+
+    assert limiter.reserve("instances") == 0.0
+    assert limiter.reserve("volumes") == 0.0
+    assert limiter.reserve("instances/1") == pytest.approx(0.1)
+    assert limiter.reserve("volumes/1") == pytest.approx(1.0)
+
+
+def test_unlimited_without_default():
+    limiter = RateLimiter(limits={"instances": RateLimit(rate=1)})
+
+    assert [limiter.reserve("volumes") for _ in range(10)] == [0.0] * 10
+
+
+def test_acquire_sleeps(mocker):
+    sleep = mocker.patch("datacrunch_api.v1._rate_limiter.time.sleep")
+    limiter = RateLimiter(default=RateLimit(rate=1))
+    mocker.patch.object(limiter, "reserve", side_effect=[0.0, 0.75])
+
+    limiter.acquire("instances")
+    limiter.acquire("instances")
+
+    sleep.assert_called_once_with(0.75)
+
+
+def test_acquire_async_awaits(mocker):
+    sleep = mocker.patch(
+        "datacrunch_api.v1._rate_limiter.asyncio.sleep", new=mocker.AsyncMock()
+    )
+    limiter = RateLimiter(default=RateLimit(rate=1))
+    mocker.patch.object(limiter, "reserve", return_value=0.25)
+
+    asyncio.run(limiter.acquire_async("instances"))
+
+    sleep.assert_awaited_once_with(0.25)
+
+
+def test_acquire_async_reserves_file_store_off_the_loop(tmp_path, mocker):
+    store = FileBucketStore(tmp_path / "buckets.json")
+    limiter = RateLimiter(default=RateLimit(rate=1000), store=store)
+    threads = []
+    reserve = store.reserve
+
+    def record_thread(family, limit):
+        threads.append(threading.get_ident())
+        return reserve(family, limit)
+
+    mocker.patch.object(store, "reserve", side_effect=record_thread)
+
+    asyncio.run(limiter.acquire_async("instances"))
+
+    assert len(threads) == 1 and threads[0] != threading.get_ident()
+
+
+def test_memory_store_is_thread_safe(mocker):
+    mocker.patch("datacrunch_api.v1._rate_limiter.time.monotonic", return_value=100.0)
+    store = MemoryBucketStore()
+    limit = RateLimit(rate=100, burst=1)
+
+    with ThreadPoolExecutor(8) as pool:
+        delays = list(pool.map(lambda _: store.reserve("x", limit), range(200)))
+
+    assert sorted(delays) == pytest.approx([i / 100 for i in range(200)])
+
+
+def test_file_store_persists_state(tmp_path, mocker):
+    mocker.patch("datacrunch_api.v1._rate_limiter.time.time", return_value=100.0)
+    path = tmp_path / "buckets.json"
+    limit = RateLimit(rate=1, burst=2)
+
+    assert FileBucketStore(path).reserve("instances", limit) == 0.0
+    assert FileBucketStore(path).reserve("instances", limit) == 0.0
+    assert FileBucketStore(path).reserve("instances", limit) == 1.0
+
+
+def _reserve_many(path, count, queue):
+    store = FileBucketStore(path)
+    limit = RateLimit(rate=0.001, burst=1)
+    queue.put([store.reserve("instances", limit) for _ in range(count)])
+
+
+def test_file_store_shares_budget_between_processes(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    path = tmp_path / "buckets.json"
+    processes = [
+        context.Process(target=_reserve_many, args=(path, 5, queue)) for _ in range(3)
+    ]
+    for process in processes:
+        process.start()
+    delays = sorted(sum((queue.get(timeout=30) for _ in processes), []))
+    for process in processes:
+        process.join()
+
+    # One free token, then 14 more each a further 1000 seconds away
+    assert delays[0] == 0.0
+    assert [round(delay / 1000) for delay in delays] == list(range(15))
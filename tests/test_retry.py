@@ -0,0 +1,74 @@
+from email.utils import formatdate
+import time
+
+from datacrunch_api.v1 import NO_RETRY, RetryPolicy, RetryStats
+from datacrunch_api.v1._retry import is_retryable, retry_after_seconds
+
+
+def test_backoff_is_capped_full_jitter(mocker):
+    uniform = mocker.patch("datacrunch_api.v1._retry.random.uniform", return_value=1.0)
+    policy = RetryPolicy(base_delay=0.5, max_delay=3.0)
+
+    assert policy.backoff(1) == 1.0
+    uniform.assert_called_with(0, 0.5)
+    policy.backoff(3)
+    uniform.assert_called_with(0, 2.0)
+    policy.backoff(10)
+    uniform.assert_called_with(0, 3.0)
+
+
+def test_delay_retries_retryable_statuses():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.delay(1, True, 503) is not None
+    assert policy.delay(1, True, 429) is not None
+    assert policy.delay(1, True, None) is not None
+    assert policy.delay(1, True, 400) is None
+    assert policy.delay(1, True, 200) is None
+
+
+def test_delay_stops_after_max_attempts():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.delay(2, True, 503) is not None
+    assert policy.delay(3, True, 503) is None
+    assert NO_RETRY.delay(1, True, 503) is None
+
+
+def test_delay_requires_retryable_request():
+    assert RetryPolicy().delay(1, False, 503) is None
+
+
+def test_delay_honors_retry_after():
+    policy = RetryPolicy(max_retry_after=60)
+    assert policy.delay(1, True, 429, {"Retry-After": "7"}) == 7.0
+    assert policy.delay(1, True, 429, {"Retry-After": "600"}) is None
+
+
+def test_retry_after_http_date():
+    seconds = retry_after_seconds({"Retry-After": formatdate(time.time() + 30)})
+    assert 28 <= seconds <= 30
+    assert retry_after_seconds({"Retry-After": "soon"}) is None
+    assert retry_after_seconds({}) is None
+
+
+def test_is_retryable():
+    assert is_retryable("get", None)
+    assert is_retryable("DELETE", None)
+    assert not is_retryable("post", None)
+    assert not is_retryable("put", None)
+    assert is_retryable("post", "key-1")
+
+
+def test_stats():
+    stats = RetryStats()
+    stats.record_retry("503", 0.25, 1.0)
+    stats.record_retry("ConnectionError", 0.5, 2.0)
+    stats.record_exhausted()
+
+    assert stats.as_dict() == {
+        "retries": 2,
+        "exhausted": 1,
+        "backoff_seconds": 3.0,
+        "failed_attempt_seconds": 0.75,
+        "added_latency_seconds": 3.75,
+        "reasons": {"503": 1, "ConnectionError": 1},
+    }
@@ -1,5 +1,7 @@
+import asyncio
+
 import pytest
-from datacrunch_api.v1 import Secret, Secrets
+from datacrunch_api.v1 import AsyncSecrets, Secret, Secrets
 
 
 @pytest.fixture
@@ -40,3 +42,27 @@ def test_delete_secret(mocker, secrets):
     secrets.delete_secret(secret_id)
 
     mock_session.delete.assert_called_once_with(f"secrets/{secret_id}")
+
+
+@pytest.fixture
+def async_secrets(mocker):
+    mocker.patch("datacrunch_api.v1.secrets.AsyncApiSession")
+    return AsyncSecrets("dummy_client_id", "dummy_client_secret")
+
+
+def test_async_create_secret(mocker, async_secrets):
+    secret = Secret(name="new-secret", value="secret-value")
+    mock_session = mocker.patch.object(async_secrets, "api_session")
+    mock_session.post_raw = mocker.AsyncMock(return_value=mocker.Mock(status_code=201))
+
+    asyncio.run(async_secrets.create_secret(secret))
+
+    mock_session.post_raw.assert_awaited_once_with("secrets", json=secret.to_dict())
+
+
+def test_async_create_secret_failure(mocker, async_secrets):
+    mock_session = mocker.patch.object(async_secrets, "api_session")
+    mock_session.post_raw = mocker.AsyncMock(return_value=mocker.Mock(status_code=400))
+
+    with pytest.raises(Secrets.RequestFailed):
+        asyncio.run(async_secrets.create_secret(Secret(name="n", value="v")))
@@ -0,0 +1,322 @@
+import dataclasses
+import datetime
+import json
+
+import pytest
+from dataclasses_json import LetterCase, config, dataclass_json  # type: ignore
+from datacrunch_api.v1 import (
+    AutoUpdate,
+    Compute,
+    Container,
+    ContainerRegistrySettings,
+    Credentials,
+    Deployment,
+    EntrypointOverrides,
+    EnvironmentVariable,
+    GpuUtilization,
+    HealthCheck,
+    Instance,
+    QueueLoad,
+    Scaling,
+    ScalingPolicy,
+    ScalingTriggers,
+    Secret,
+    SerializationCache,
+    SSHKey,
+    StartupScript,
+    StdlibCodec,
+    Volume,
+    VolumeAction,
+    VolumeMount,
+)
+from datacrunch_api.v1._serialization import encoder_of, to_dict
+from datacrunch_api.v1.types.instance import InstanceAction, OSVolume
+
+
+def deployment(**container_options) -> Deployment:
+    return Deployment(
+        name="vllm",
+        containers=[
+            Container(
+                autoupdate=AutoUpdate(enabled=False, mode="latest"),
+                env=[
+                    EnvironmentVariable(
+                        name="HF_TOKEN",
+                        value_or_reference_to_secret="hf-token",
+                        type="secret",
+                    )
+                ],
+                exposed_port=8000,
+                healthcheck=HealthCheck(enabled=True, port=8000, path="/health"),
+                image="vllm/vllm-openai:v0.8.5",
+                name="vllm",
+                volume_mounts=[VolumeMount(type="scratch", mount_path="/data")],
+                **container_options,
+            )
+        ],
+        container_registry_settings=ContainerRegistrySettings(
+            is_private=True, credentials=Credentials(name="registry")
+        ),
+        compute=Compute(name="L40S"),
+        scaling=Scaling(
+            min_replica_count=1,
+            max_replica_count=2,
+            queue_message_ttl_seconds=3600,
+            concurrent_requests_per_replica=10,
+            scale_down_policy=ScalingPolicy(delay_seconds=300),
+            scale_up_policy=ScalingPolicy(delay_seconds=60),
+            scaling_triggers=ScalingTriggers(
+                queue_load=QueueLoad(threshold=2),
+                gpu_utilization=GpuUtilization(enabled=True, threshold=90),
+            ),
+        ),
+    )
+
+
+SAMPLES = [
+    deployment(),
+    deployment(
+        entrypoint_overrides=EntrypointOverrides(enabled=True, cmd=["python3", "-m"])
+    ),
+    Instance(description="test", hostname="test", image="ubuntu", instance_type="1V"),
+    Instance(
+        description="test",
+        hostname="test",
+        image="ubuntu",
+        instance_type="1V",
+        is_spot=False,
+        os_volume=OSVolume(name="os", size=100),
+        ssh_key_ids=["key-1"],
+        volumes=[Volume(name="data", size=10, type="NVMe", instance_ids=[])],
+    ),
+    InstanceAction(action="delete", id="1", volume_ids=["2"]),
+    Volume(name="data", size=10, type="NVMe"),
+    VolumeAction(action="attach", id="1", instance_id="2", is_permanent=False),
+    Secret(name="token", value="ü"),
+    SSHKey(name="laptop", key="ssh-ed25519 AAAA"),
+    StartupScript(name="setup", script="#!/bin/bash"),
+]
+
+
+@pytest.mark.parametrize("sample", SAMPLES, ids=lambda sample: type(sample).__name__)
+def test_matches_dataclasses_json(sample):
+    expected = sample.to_dict()
+
+    assert to_dict(sample) == expected
+    assert json.dumps(to_dict(sample)) == json.dumps(expected)
+
+
+def test_copies_mutable_values():
+    volume = Volume(name="data", size=10, type="NVMe", instance_ids=["1"])
+
+    data = to_dict(volume)
+    data["instance_ids"].append("2")
+
+    assert volume.instance_ids == ["1"]
+
+
+def test_converts_collections_and_other_values():
+    @dataclass_json
+    @dataclasses.dataclass(frozen=True)
+    class Values:
+        labels: dict
+        ports: tuple
+        created: datetime.date
+
+    values = Values({"a": Compute(name="L40S")}, (1, 2), datetime.date(2025, 1, 1))
+
+    assert to_dict(values) == values.to_dict()
+    assert to_dict(values) == {
+        "labels": {"a": {"name": "L40S"}},
+        "ports": [1, 2],
+        "created": datetime.date(2025, 1, 1),
+    }
+
+
+def test_falls_back_to_dataclasses_json_for_other_overrides():
+    @dataclass_json(letter_case=LetterCase.CAMEL)  # type: ignore[arg-type]
+    @dataclasses.dataclass(frozen=True)
+    class Camel:
+        mount_path: str
+
+    @dataclass_json
+    @dataclasses.dataclass(frozen=True)
+    class Renamed:
+        mount_path: str = dataclasses.field(metadata=config(field_name="path"))
+
+    assert to_dict(Camel("/data")) == {"mountPath": "/data"}
+    assert to_dict(Renamed("/data")) == {"path": "/data"}
+
+
+def test_rejects_other_classes():
+    with pytest.raises(TypeError):
+        encoder_of(dict)
+
+
+@pytest.mark.parametrize("sample", SAMPLES, ids=lambda sample: type(sample).__name__)
+def test_cache_matches_dataclasses_json(sample):
+    cache = SerializationCache()
+    codec = StdlibCodec()
+
+    assert cache.to_dict(sample) == sample.to_dict()
+    assert cache.to_bytes(sample, codec) == codec.encode(sample.to_dict())
+
+
+def test_cache_shares_equal_immutable_values():
+    cache = SerializationCache()
+    first, second = deployment().scaling, deployment().scaling
+
+    data = cache.to_dict(first)
+
+    assert cache.to_dict(first) == data
+    assert cache.to_dict(second) == data
+    assert cache.to_dict(first) is not data
+    assert cache.hits == 3
+    assert cache.misses == len(cache)
+
+
+def test_cache_hands_out_copies():
+    cache = SerializationCache()
+    codec = StdlibCodec()
+    sample = deployment().scaling
+
+    data = cache.to_dict(sample)
+    data["scaling_triggers"]["queue_load"]["threshold"] = 99
+
+    assert cache.to_dict(sample) == sample.to_dict()
+    assert cache.encode(data, codec) == codec.encode(data)
+    assert cache.to_bytes(sample, codec) == codec.encode(sample.to_dict())
+
+
+def test_cache_shares_equal_deployments():
+    cache = SerializationCache()
+    codec = StdlibCodec()
+    first, second = deployment(), deployment()
+
+    data = cache.to_dict(first)
+
+    assert cache.to_dict(second) == data == first.to_dict()
+    assert cache.to_bytes(second, codec) is cache.to_bytes(first, codec)
+    assert cache.hits == 3
+    other = dataclasses.replace(first, name="other")
+    assert cache.to_dict(other)["name"] == "other"
+    assert cache.hits == 3
+
+
+def test_cache_follows_lists_of_remembered_sub_objects():
+    cache = SerializationCache()
+    sample = deployment()
+    container = sample.containers[0]
+
+    cache.to_dict(container)
+    cache.to_dict(sample)
+    container.env.append(EnvironmentVariable("DEBUG", "1", "plain"))
+
+    assert cache.to_dict(sample) == sample.to_dict()
+    assert cache.to_dict(container) == container.to_dict()
+
+
+def test_cache_copies_dicts_of_cached_sub_objects():
+    @dataclass_json
+    @dataclasses.dataclass(frozen=True)
+    class Labelled:
+        labels: dict
+        scaling: Scaling
+
+    cache = SerializationCache()
+    sample = deployment()
+    labelled = Labelled({"team": "ml"}, sample.scaling)
+
+    for body in (cache.to_dict(sample), cache.to_dict(labelled)):
+        body["scaling"]["min_replica_count"] = 99
+        body["scaling"]["scaling_triggers"]["queue_load"]["threshold"] = 99
+
+    assert cache.to_dict(deployment()) == sample.to_dict()
+    assert cache.to_dict(labelled) == labelled.to_dict()
+    assert cache.to_dict(sample.scaling) == sample.scaling.to_dict()
+
+
+def test_cache_follows_modified_lists():
+    cache = SerializationCache()
+    sample = deployment()
+    action = VolumeAction(action="detach", id="volume", instance_ids=["a"])
+
+    assert cache.to_dict(sample) == sample.to_dict()
+    assert cache.to_dict(action) == action.to_dict()
+    sample.containers[0].env.clear()
+    action.instance_ids.append("b")  # type: ignore[union-attr]
+
+    assert cache.to_dict(sample) == sample.to_dict()
+    assert cache.to_dict(action) == action.to_dict()
+    assert cache.hits == 0
+
+
+def test_cache_never_keeps_sensitive_values():
+    cache = SerializationCache()
+    codec = StdlibCodec()
+
+    for sample in (Secret(name="token", value="hunter2"), SSHKey("laptop", "ssh-ed")):
+        assert cache.to_dict(sample) == sample.to_dict()
+        assert cache.to_bytes(sample, codec) == codec.encode(sample.to_dict())
+
+    assert len(cache) == 0
+
+
+def test_cache_keeps_values_of_other_types_apart():
+    cache = SerializationCache()
+
+    assert cache.to_dict(QueueLoad(threshold=True)) == {"threshold": True}  # type: ignore
+    assert cache.to_dict(QueueLoad(threshold=1)) == {"threshold": 1}
+    assert cache.to_dict(QueueLoad(threshold=1.0)) == {"threshold": 1.0}  # type: ignore
+    assert len(cache) == 3
+
+
+def test_cache_encodes_once_per_codec_class():
+    cache = SerializationCache()
+    stdlib = StdlibCodec()
+    sample = deployment().scaling
+
+    body = cache.to_dict(sample)
+    encoded = cache.encode(body, stdlib)
+
+    assert encoded == stdlib.encode(sample.to_dict())
+    assert cache.encode(body, StdlibCodec()) is encoded
+    assert cache.to_bytes(deployment().scaling, stdlib) is encoded
+    assert cache.encode(dict(body), stdlib) == encoded
+    assert cache.as_dict()["encode_hits"] == 2
+    assert cache.as_dict()["encode_misses"] == 1
+    body["min_replica_count"] = 7
+    assert cache.encode(body, stdlib) == stdlib.encode(body)
+
+
+def test_cache_is_bounded():
+    cache = SerializationCache(max_entries=2)
+
+    for threshold in range(5):
+        cache.to_dict(QueueLoad(threshold=threshold))
+
+    assert len(cache) == 2
+    assert cache.evictions == 3
+    cache.clear()
+    assert cache.as_dict()["entries"] == cache.as_dict()["misses"] == 0
+
+
+def test_cache_converts_other_values_uncached():
+    @dataclass_json
+    @dataclasses.dataclass
+    class Mutable:
+        name: str
+
+    @dataclass_json
+    @dataclasses.dataclass(frozen=True)
+    class Unhashable:
+        value: object
+
+    class Point:
+        __hash__ = None  # type: ignore[assignment]
+
+    cache = SerializationCache()
+
+    assert cache.to_dict(Mutable("a")) == {"name": "a"}
+    assert isinstance(cache.to_dict(Unhashable(Point()))["value"], Point)
+    assert len(cache) == 0
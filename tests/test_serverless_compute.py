@@ -1,5 +1,10 @@
+import asyncio
+
 import pytest
-from datacrunch_api.v1.serverless_compute import ServerlessCompute
+from datacrunch_api.v1.serverless_compute import (
+    AsyncServerlessCompute,
+    ServerlessCompute,
+)
 
 
 @pytest.fixture
@@ -14,3 +19,15 @@ def test_list_serverless_compute_resources(mocker, serverless_compute):
     response = serverless_compute.list_serverless_compute_resources()
     assert response == [{"name": "1"}, {"name": "2"}]
     mock_session.get.assert_called_once_with("serverless-compute-resources")
+
+
+def test_async_list_serverless_compute_resources(mocker):
+    mocker.patch("datacrunch_api.v1.serverless_compute.AsyncApiSession")
+    serverless_compute = AsyncServerlessCompute(
+        "dummy_client_id", "dummy_client_secret"
+    )
+    mock_session = mocker.patch.object(serverless_compute, "api_session")
+    mock_session.get = mocker.AsyncMock(return_value=[{"name": "H100"}])
+    result = asyncio.run(serverless_compute.list_serverless_compute_resources())
+    assert result == [{"name": "H100"}]
+    mock_session.get.assert_awaited_once_with("serverless-compute-resources")
@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from datacrunch_api.v1 import SingleFlight
+
+
+def test_concurrent_calls_are_coalesced():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return b"body"
+
+    with ThreadPoolExecutor(8) as pool:
+        leader = pool.submit(single_flight.do, "instances", fetch)
+        started.wait(5)
+        followers = [
+            pool.submit(single_flight.do, "instances", fetch) for _ in range(7)
+        ]
+        while single_flight.calls < 8:
+            time.sleep(0.001)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert results == [b"body"] * 8
+    assert len(calls) == 1
+    assert single_flight.as_dict() == {"calls": 8, "shared": 7}
+
+
+def test_different_keys_are_not_coalesced():
+    single_flight = SingleFlight()
+
+    assert single_flight.do("a", lambda: 1) == 1
+    assert single_flight.do("b", lambda: 2) == 2
+    assert single_flight.shared == 0
+
+
+def test_completed_calls_are_not_reused_without_window():
+    single_flight = SingleFlight()
+    results = iter([1, 2])
+
+    assert single_flight.do("a", lambda: next(results)) == 1
+    assert single_flight.do("a", lambda: next(results)) == 2
+
+
+def test_completed_calls_are_reused_within_window(mocker):
+    monotonic = mocker.patch("datacrunch_api.v1._single_flight.time.monotonic")
+    monotonic.return_value = 100.0
+    single_flight = SingleFlight(reuse_window=0.5)
+    results = iter([1, 2])
+
+    assert single_flight.do("a", lambda: next(results)) == 1
+    monotonic.return_value = 100.4
+    assert single_flight.do("a", lambda: next(results)) == 1
+    monotonic.return_value = 100.6
+    assert single_flight.do("a", lambda: next(results)) == 2
+
+
+def test_failures_are_shared_but_not_reused():
+    single_flight = SingleFlight(reuse_window=10)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        single_flight.do("a", fail)
+    assert single_flight.do("a", lambda: 1) == 1
+
+
+def test_async_calls_are_coalesced():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return b"body"
+
+    async def run():
+        return await asyncio.gather(
+            *(single_flight.do_async("instances", fetch) for _ in range(10))
+        )
+
+    assert asyncio.run(run()) == [b"body"] * 10
+    assert len(calls) == 1
+    assert single_flight.shared == 9
+
+
+def test_async_failures_are_shared():
+    single_flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def run():
+        return await asyncio.gather(
+            *(single_flight.do_async("a", fail) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    errors = asyncio.run(run())
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    assert single_flight._async == {}
+
+
+def test_async_followers_run_call_when_leader_is_cancelled():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return b"body"
+
+    async def run():
+        leader = asyncio.create_task(single_flight.do_async("instances", fetch))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(single_flight.do_async("instances", fetch))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return results
+
+    assert asyncio.run(run()) == [b"body"] * 3
+    assert len(calls) == 2
+    assert single_flight.shared == 2
+    assert single_flight._async == {}
+
+
+def test_followers_wait_at_most_their_timeout():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch():
+        started.set()
+        release.wait(5)
+        return b"body"
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(single_flight.do, "instances", fetch)
+        started.wait(5)
+        with pytest.raises(TimeoutError):
+            single_flight.do("instances", fetch, timeout=0.01)
+        release.set()
+        assert leader.result() == b"body"
+
+
+def test_async_followers_wait_at_most_their_timeout():
+    single_flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return b"body"
+
+    async def run():
+        leader = asyncio.create_task(single_flight.do_async("instances", fetch))
+        await asyncio.sleep(0)
+        with pytest.raises(TimeoutError):
+            await single_flight.do_async("instances", fetch, timeout=0.01)
+        return await leader
+
+    assert asyncio.run(run()) == b"body"
@@ -1,5 +1,7 @@
+import asyncio
+
 import pytest
-from datacrunch_api.v1 import SSHKey, SSHKeys
+from datacrunch_api.v1 import AsyncSSHKeys, SSHKey, SSHKeys
 
 
 @pytest.fixture
@@ -67,3 +69,15 @@ def test_list_ssh_keys(mocker, ssh_keys):
 
     assert result == expected_response
     mock_session.get.assert_called_once_with("sshkeys")
+
+
+def test_async_add_ssh_key(mocker):
+    mocker.patch("datacrunch_api.v1.ssh_keys.AsyncApiSession")
+    ssh_keys = AsyncSSHKeys("dummy_client_id", "dummy_client_secret")
+    ssh_key = SSHKey(name="new-ssh-key", key="ssh-key-value")
+    mock_session = mocker.patch.object(ssh_keys, "api_session")
+    mock_session.post_raw = mocker.AsyncMock(return_value=mocker.Mock(status_code=201))
+    mock_session.post_raw.return_value.text = "key-id"
+
+    assert asyncio.run(ssh_keys.add_ssh_key(ssh_key)) == "key-id"
+    mock_session.post_raw.assert_awaited_once_with("sshkeys", json=ssh_key.to_dict())
@@ -1,5 +1,8 @@
+import asyncio
+
 import pytest
-from datacrunch_api.v1 import StartupScript, StartupScripts
+from datacrunch_api.v1 import AsyncStartupScripts, StartupScript, StartupScripts
+from datacrunch_api.v1._workers import Workers
 
 
 @pytest.fixture
@@ -81,3 +84,26 @@ def test_list_startup_scripts(mocker, startup_scripts):
 
     assert result == expected_response
     mock_session.get.assert_called_once_with("scripts")
+
+
+def test_get_many(mocker, startup_scripts):
+    mock_session = mocker.patch.object(startup_scripts, "api_session")
+    mock_session.workers = Workers(2)
+    mock_session.get.side_effect = lambda url: {"id": url.split("/")[1]}
+
+    assert startup_scripts.get_many(["1", "2", "1"]) == [
+        {"id": "1"},
+        {"id": "2"},
+        {"id": "1"},
+    ]
+    assert mock_session.get.call_count == 2
+
+
+def test_async_get_startup_script(mocker):
+    mocker.patch("datacrunch_api.v1.startup_scripts.AsyncApiSession")
+    startup_scripts = AsyncStartupScripts("dummy_client_id", "dummy_client_secret")
+    mock_session = mocker.patch.object(startup_scripts, "api_session")
+    mock_session.get = mocker.AsyncMock(return_value={"id": "123"})
+    result = asyncio.run(startup_scripts.get_startup_script("123"))
+    assert result == {"id": "123"}
+    mock_session.get.assert_awaited_once_with("scripts/123")
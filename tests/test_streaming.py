@@ -0,0 +1,155 @@
+import asyncio
+import json
+
+import pytest
+from datacrunch_api.testing import FakeServer
+from datacrunch_api.v1 import (
+    ApiSession,
+    AsyncApiSession,
+    AsyncInstances,
+    Cassette,
+    Instance,
+    Instances,
+    Interaction,
+    ReplayTransport,
+)
+from datacrunch_api.v1._streaming import JsonArrayParser, next_page
+
+ITEMS = [
+    {"id": "1", "hostname": "é" * 10, "price": 1.5, "volumes": [None, True]},
+    7,
+    -2.5e-3,
+    "text",
+    None,
+    False,
+    [1, [2]],
+]
+PAGE_2 = '</v1/instances?page=2>; rel="next", </v1/instances?page=3>; rel="last"'
+
+
+@pytest.fixture(params=[True, False], ids=["ijson", "json"])
+def use_ijson(request):
+    if request.param:
+        pytest.importorskip("ijson")
+    return request.param
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 1 << 20])
+def test_parser_decodes_any_chunking(use_ijson, size):
+    text = json.dumps(ITEMS, ensure_ascii=False, indent=2).encode()
+    parser = JsonArrayParser(use_ijson)
+    items = []
+    for start in range(0, len(text), size):
+        items += parser.feed(text[start : start + size])
+    items += parser.close()
+
+    assert items == ITEMS
+
+
+def test_parser_yields_complete_elements_early(use_ijson):
+    parser = JsonArrayParser(use_ijson)
+
+    assert parser.feed(b'[{"id": "1"}, {"id"') == [{"id": "1"}]
+    assert parser.feed(b': "2"}, 12') == [{"id": "2"}]
+    assert parser.feed(b"3") == []
+    assert parser.feed(b"]") == [123]
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize(
+    "text", [b'{"code": "x"}', b"[1, 2", b"[1 2]", b"[1] x", b"", b"[1.]"]
+)
+def test_parser_rejects_invalid_arrays(use_ijson, text):
+    parser = JsonArrayParser(use_ijson)
+
+    with pytest.raises(ValueError):
+        parser.feed(text)
+        parser.close()
+
+
+def test_next_page():
+    base_url = "https://api.datacrunch.io/v1"
+
+    assert next_page({"Link": PAGE_2}, base_url, "instances") == "instances?page=2"
+    assert (
+        next_page(
+            {"Link": f'<{base_url}/instances?page=3>; rel="next"'},
+            base_url,
+            "instances?page=2",
+        )
+        == "instances?page=3"
+    )
+    assert next_page({}, base_url, "instances") is None
+    with pytest.raises(ValueError):
+        next_page({"Link": '<https://elsewhere/x>; rel="next"'}, base_url, "x")
+
+
+def paginated() -> ReplayTransport:
+    return ReplayTransport(
+        Cassette(
+            [
+                Interaction(
+                    "GET", "/v1/instances", 200, {"Link": PAGE_2}, '[{"id":"1"}]'
+                ),
+                Interaction("GET", "/v1/instances?page=2", 200, {}, '[{"id":"2"}]'),
+                Interaction(
+                    "GET",
+                    "/v1/volumes",
+                    400,
+                    {},
+                    '{"code":"invalid_request","message":"bad"}',
+                ),
+                Interaction("GET", "/v1/images", 200, {}, '{"id":"1"}'),
+            ]
+        )
+    )
+
+
+def test_iter_items_follows_pagination():
+    api_session = ApiSession("id", "secret", transport=paginated())
+
+    assert list(api_session.iter_items("instances")) == [{"id": "1"}, {"id": "2"}]
+    with pytest.raises(ApiSession.InvalidRequest, match="bad"):
+        list(api_session.iter_items("volumes"))
+    with pytest.raises(ApiSession.RequestFailed):
+        list(api_session.iter_items("images"))
+    api_session.close()
+
+
+def test_async_iter_items_follows_pagination():
+    async def collect(api_session, url):
+        return [item async for item in api_session.iter_items(url)]
+
+    async def run():
+        async with AsyncApiSession("id", "secret", transport=paginated()) as session:
+            assert await collect(session, "instances") == [{"id": "1"}, {"id": "2"}]
+            with pytest.raises(ApiSession.InvalidRequest, match="bad"):
+                await collect(session, "volumes")
+            with pytest.raises(ApiSession.RequestFailed):
+                await collect(session, "images")
+
+    asyncio.run(run())
+
+
+def test_streams_instances_from_server():
+    instance = Instance(
+        description="test",
+        hostname="test",
+        image="ubuntu",
+        instance_type="1H100.80S.30V",
+    )
+    with FakeServer(seed=1) as server:
+        server.populate(instances=2000)
+        instances = Instances("id", "secret", base_url=server.url)
+        listed = instances.list_instances()
+        assert list(instances.iter_instances()) == listed
+        instances.deploy(instance)
+        assert sum(1 for _ in instances.iter_instances()) == 2001
+        instances.api_session.close()
+
+        async def stream():
+            async with AsyncApiSession("id", "secret", base_url=server.url) as session:
+                async_instances = AsyncInstances(api_session=session)
+                return [item async for item in async_instances.iter_instances()]
+
+        assert len(asyncio.run(stream())) == 2001
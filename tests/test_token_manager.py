@@ -0,0 +1,135 @@
+import multiprocessing
+import time
+from typing import Any
+
+import pytest
+from datacrunch_api.v1 import Token, TokenCache, TokenManager
+
+
+def token_response(token: str, expires_in: int | None = 3600) -> dict:
+    response: dict[str, Any] = {"access_token": token, "token_type": "Bearer"}
+    if expires_in is not None:
+        response["expires_in"] = expires_in
+    return response
+
+
+@pytest.fixture
+def fetch(mocker):
+    responses = iter(token_response(f"token-{i}") for i in range(100))
+    return mocker.Mock(side_effect=lambda body: next(responses))
+
+
+def test_token_from_response():
+    token = Token.from_response(token_response("abc", 3600), 60, now=1000.0)
+    assert token.access_token == "abc"
+    assert token.expires_at == 4600.0
+    assert token.refresh_at == 4540.0
+    assert not token.needs_refresh(now=4539.0)
+    assert token.needs_refresh(now=4540.0)
+
+
+def test_token_refresh_margin_capped_to_half_lifetime():
+    token = Token.from_response(token_response("abc", 30), 60, now=1000.0)
+    assert token.refresh_at == 1015.0
+
+
+def test_token_without_expiry_never_needs_refresh():
+    token = Token.from_response(token_response("abc", None))
+    assert token.expires_at is None
+    assert not token.needs_refresh()
+
+
+def test_get_reuses_token(fetch):
+    manager = TokenManager("id", "secret", fetch, background_refresh=False)
+    assert manager.get() == "token-0"
+    assert manager.get() == "token-0"
+    fetch.assert_called_once_with(
+        {
+            "grant_type": "client_credentials",
+            "client_id": "id",
+            "client_secret": "secret",
+        }
+    )
+
+
+def test_get_refreshes_expiring_token(mocker, fetch):
+    manager = TokenManager("id", "secret", fetch, background_refresh=False)
+    manager.get()
+    mocker.patch(
+        "datacrunch_api.v1._token_manager.time.time", return_value=time.time() + 3590
+    )
+    assert manager.get() == "token-1"
+
+
+def test_refresh_replaces_stale_token_once(fetch):
+    manager = TokenManager("id", "secret", fetch, background_refresh=False)
+    stale = manager.get()
+    assert manager.refresh(stale=stale) == "token-1"
+    assert manager.refresh(stale=stale) == "token-1"
+    assert fetch.call_count == 2
+
+
+def test_background_refresh(mocker):
+    fetch = mocker.Mock(
+        side_effect=[token_response("token-0", 1), token_response("token-1")]
+    )
+    manager = TokenManager("id", "secret", fetch, refresh_margin=0.9)
+    assert manager.get() == "token-0"
+    deadline = time.monotonic() + 5
+    while manager.token.access_token == "token-0" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    manager.close()
+    assert manager.token.access_token == "token-1"
+
+
+def test_cache_shares_token_between_managers(tmp_path, fetch):
+    cache = TokenCache(tmp_path)
+    first = TokenManager("id", "secret", fetch, cache=cache, background_refresh=False)
+    second = TokenManager("id", "secret", fetch, cache=cache, background_refresh=False)
+    assert first.get() == second.get() == "token-0"
+    fetch.assert_called_once()
+
+
+def test_cache_is_keyed_by_client_id(tmp_path, fetch):
+    cache = TokenCache(tmp_path)
+    TokenManager("id-1", "secret", fetch, cache=cache, background_refresh=False).get()
+    manager = TokenManager(
+        "id-2", "secret", fetch, cache=cache, background_refresh=False
+    )
+    assert manager.get() == "token-1"
+    assert cache.path("id-1") != cache.path("id-2")
+
+
+def test_cache_file_is_private(tmp_path, fetch):
+    cache = TokenCache(tmp_path)
+    TokenManager("id", "secret", fetch, cache=cache, background_refresh=False).get()
+    assert cache.path("id").stat().st_mode & 0o077 == 0
+    assert cache.load("id").access_token == "token-0"
+
+
+def _fetch_in_process(directory: str, queue) -> None:
+    def fetch(body: dict) -> dict:
+        time.sleep(0.05)
+        queue.put("fetch")
+        return token_response("shared-token")
+
+    manager = TokenManager(
+        "id", "secret", fetch, cache=TokenCache(directory), background_refresh=False
+    )
+    queue.put(manager.get())
+
+
+def test_cache_shares_token_between_processes(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    processes = [
+        context.Process(target=_fetch_in_process, args=(str(tmp_path), queue))
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(30)
+    results = [queue.get(timeout=5) for _ in range(5)]
+    assert results.count("fetch") == 1
+    assert results.count("shared-token") == 4
@@ -0,0 +1,149 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from datacrunch_api.v1 import (
+    ApiSession,
+    AsyncApiSession,
+    AsyncVolumes,
+    Cassette,
+    Interaction,
+    RecordingTransport,
+    ReplayTransport,
+    Volumes,
+)
+
+
+def response(mocker, status_code: int, body, headers=None):
+    return mocker.Mock(
+        status_code=status_code,
+        headers=headers or {},
+        content=json.dumps(body).encode(),
+    )
+
+
+@pytest.fixture
+def cassette() -> Cassette:
+    return Cassette(
+        [
+            Interaction("GET", "/v1/volumes", 200, {}, '[{"id":"1"}]', 0.05),
+            Interaction("GET", "/v1/volumes/1", 200, {}, '{"status":"ordered"}'),
+            Interaction("GET", "/v1/volumes/1", 200, {}, '{"status":"attached"}'),
+        ]
+    )
+
+
+def test_records_responses_without_tokens(mocker, tmp_path):
+    session = mocker.patch("datacrunch_api.v1._api_session.requests.Session")
+    session.return_value.post.return_value.json.return_value = {
+        "access_token": "secret"
+    }
+    session.return_value.get.return_value = response(
+        mocker, 200, [{"id": "1"}], {"ETag": '"v1"', "Set-Cookie": "x"}
+    )
+    path = tmp_path / "volumes.json.gz"
+    api_session = ApiSession(
+        "dummy_client_id",
+        "dummy_client_secret",
+        transport=RecordingTransport(path),
+    )
+
+    assert api_session.get("volumes?status=attached") == [{"id": "1"}]
+    api_session.close()
+
+    (interaction,) = Cassette.load(path).interactions
+    assert interaction.key == "GET /v1/volumes?status=attached"
+    assert interaction.status == 200
+    assert interaction.headers == {"ETag": '"v1"'}
+    assert interaction.content == b'[{"id": "1"}]'
+    assert interaction.latency >= 0
+
+
+def test_replays_responses_in_order(cassette):
+    volumes = Volumes(
+        "dummy_client_id",
+        "dummy_client_secret",
+        transport=ReplayTransport(cassette),
+        background_refresh=False,
+    )
+
+    assert volumes.list_volumes() == [{"id": "1"}]
+    assert volumes.get_volume("1") == {"status": "ordered"}
+    assert volumes.get_volume("1") == {"status": "attached"}
+    assert volumes.get_volume("1") == {"status": "attached"}
+
+
+def test_replay_without_repeat_raises_unrecorded(cassette):
+    transport = ReplayTransport(cassette, repeat=False)
+    api_session = ApiSession(
+        "dummy_client_id", "dummy_client_secret", transport=transport
+    )
+    api_session.get("volumes")
+
+    with pytest.raises(ReplayTransport.Unrecorded):
+        api_session.get("volumes")
+    with pytest.raises(ReplayTransport.Unrecorded):
+        api_session.get("instances")
+    api_session.close()
+
+
+def test_replay_delays_by_recorded_latency(mocker, cassette):
+    sleep = mocker.patch("datacrunch_api.v1._transport.time.sleep")
+    api_session = ApiSession(
+        "dummy_client_id",
+        "dummy_client_secret",
+        transport=ReplayTransport(cassette, latency=2.0),
+    )
+
+    api_session.get("volumes")
+    api_session.get("volumes/1")
+
+    sleep.assert_called_once_with(0.1)
+    api_session.close()
+
+
+def test_cassette_round_trip(tmp_path, cassette):
+    cassette.interactions.append(
+        Interaction("GET", "/v1/blob", 200, {}, "AP8=", binary=True)
+    )
+
+    cassette.save(tmp_path / "cassette.json")
+    loaded = Cassette.load(tmp_path / "cassette.json")
+
+    assert loaded == cassette
+    assert loaded.interactions[-1].content == b"\x00\xff"
+
+
+def test_async_record_then_replay(tmp_path):
+    path = tmp_path / "volumes.json"
+
+    async def handler(request):
+        if request.path == "/v1/oauth2/token":
+            return web.json_response({"access_token": "secret"})
+        return web.json_response([{"id": "1"}])
+
+    async def record():
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handler)
+        async with TestServer(app) as server:
+            async with AsyncApiSession(
+                "dummy_client_id",
+                "dummy_client_secret",
+                base_url=str(server.make_url("/v1")),
+                transport=RecordingTransport(path),
+            ) as api_session:
+                return await AsyncVolumes(api_session=api_session).list_volumes()
+
+    async def replay():
+        async with AsyncApiSession(
+            "dummy_client_id",
+            "dummy_client_secret",
+            transport=ReplayTransport(path),
+        ) as api_session:
+            return await AsyncVolumes(api_session=api_session).list_volumes()
+
+    assert asyncio.run(record()) == [{"id": "1"}]
+    assert "secret" not in path.read_text()
+    assert asyncio.run(replay()) == [{"id": "1"}]
@@ -1,5 +1,8 @@
+import asyncio
+
 import pytest
-from datacrunch_api.v1 import Volume, VolumeAction, Volumes
+from datacrunch_api.v1 import AsyncVolumes, Volume, VolumeAction, VolumeInfo, Volumes
+from datacrunch_api.v1._workers import Workers
 
 
 @pytest.fixture
@@ -58,6 +61,7 @@ def test_create_volume(mocker, volumes):
             "size": 10,
             "type": "test-volume-type",
         },
+        idempotency_key=None,
     )
 
 
@@ -92,3 +96,67 @@ def test_list_trash(mocker, volumes):
         {"id": "456", "name": "volume2"},
     ]
     mock_session.get.assert_called_once_with("volumes/trash")
+
+
+def test_iter_volumes_and_trash(mocker, volumes):
+    mock_session = mocker.patch.object(volumes, "api_session")
+    mock_session.iter_items.side_effect = lambda url: iter([{"url": url}])
+
+    assert list(volumes.iter_volumes()) == [{"url": "volumes"}]
+    assert list(volumes.iter_trash()) == [{"url": "volumes/trash"}]
+
+
+def test_get_many(mocker, volumes):
+    mock_session = mocker.patch.object(volumes, "api_session")
+    mock_session.workers = Workers(2)
+    mock_session.get.return_value = [{"id": "1"}, {"id": "2"}]
+
+    result = volumes.get_many(["2", "3", "1"], concurrency=1)
+
+    assert result == [{"id": "2"}, None, {"id": "1"}]
+    mock_session.get.assert_called_once_with("volumes")
+
+
+@pytest.fixture
+def async_volumes(mocker):
+    mocker.patch("datacrunch_api.v1.volumes.AsyncApiSession")
+    return AsyncVolumes("dummy_client_id", "dummy_client_secret")
+
+
+def test_async_get_volume(mocker, async_volumes):
+    mock_session = mocker.patch.object(async_volumes, "api_session")
+    mock_session.get = mocker.AsyncMock(return_value={"id": "123"})
+    result = asyncio.run(async_volumes.get_volume("123"))
+    assert result == {"id": "123"}
+    mock_session.get.assert_awaited_once_with("volumes/123")
+
+
+def test_async_action(mocker, async_volumes):
+    mock_session = mocker.patch.object(async_volumes, "api_session")
+    mock_session.put_raw = mocker.AsyncMock(return_value=mocker.Mock(status_code=202))
+    asyncio.run(async_volumes.action(VolumeAction(action="delete", id="123")))
+    mock_session.put_raw.assert_awaited_once_with(
+        "volumes", json={"action": "delete", "id": "123"}
+    )
+
+
+def test_async_volume_info(mocker, async_volumes):
+    mock_session = mocker.patch.object(async_volumes, "api_session")
+    mock_session.get = mocker.AsyncMock(return_value={"id": "123", "size": 50})
+    result = asyncio.run(async_volumes.get_volume_info("123"))
+    assert result == VolumeInfo(id="123", size=50)
+    mock_session.get.assert_awaited_once_with("volumes/123")
+    mock_session.get = mocker.AsyncMock(return_value=[{"id": "123"}])
+    result = asyncio.run(async_volumes.list_volumes_info())
+    assert result == [VolumeInfo(id="123")]
+    mock_session.get.assert_awaited_once_with("volumes")
+
+
+def test_async_get_many(mocker, async_volumes):
+    mock_session = mocker.patch.object(async_volumes, "api_session")
+    mock_session.get = mocker.AsyncMock(return_value=[{"id": "1"}, {"id": "2"}])
+
+    result = asyncio.run(async_volumes.get_many(["2", "3"], use_list=True))
+
+    assert result == [{"id": "2"}, None]
+    mock_session.get.assert_awaited_once_with("volumes")
@@ -0,0 +1,304 @@
+import asyncio
+from contextlib import aclosing
+
+import pytest
+from datacrunch_api.v1 import (
+    AsyncGroupWaiter,
+    GroupWaiter,
+    WaitFailed,
+    WaitPolicy,
+    WaitTimeout,
+)
+from datacrunch_api.v1._api_session import ApiSession
+from datacrunch_api.v1._waiters import async_wait_for, wait_for
+
+POLICY = WaitPolicy(base_delay=1.0, max_delay=4.0, timeout=20.0, jitter=0.0)
+
+
+class Clock:
+    """Fake monotonic clock advanced by the sleeps of the waiter"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(mocker):
+    clock = Clock()
+    mocker.patch("datacrunch_api.v1._waiters.time.monotonic", lambda: clock.now)
+    mocker.patch("datacrunch_api.v1._waiters.time.sleep", clock.sleep)
+    return clock
+
+
+def poller(*statuses):
+    states = iter({"status": status} for status in statuses)
+    return lambda: next(states)
+
+
+def is_running(state):
+    return state["status"] == "running"
+
+
+def is_error(state):
+    return state["status"] == "error"
+
+
+def test_policy_backs_off_to_the_ceiling():
+    assert [POLICY.delay(poll) for poll in range(1, 6)] == [1, 2, 4, 4, 4]
+    jittered = WaitPolicy(base_delay=10.0, jitter=0.5)
+    assert all(5.0 <= jittered.delay(1) <= 10.0 for _ in range(100))
+
+
+def test_wait_for_returns_the_awaited_state(clock):
+    poll = poller("ordered", "provisioning", "provisioning", "running")
+
+    state = wait_for(poll, "instance", is_running, is_error, POLICY)
+
+    assert state == {"status": "running"}
+    assert clock.sleeps == [1, 2, 4]
+
+
+def test_wait_for_fails_early(clock):
+    poll = poller("provisioning", "error", "running")
+
+    with pytest.raises(WaitFailed, match="instance failed: error") as error:
+        wait_for(poll, "instance", is_running, is_error, POLICY)
+
+    assert error.value.state == {"status": "error"}
+    assert clock.sleeps == [1]
+    with pytest.raises(WaitFailed):
+        wait_for(
+            lambda: {"code": "not_found"}, "instance", is_running, is_error, POLICY
+        )
+
+
+def test_wait_for_polls_last_at_the_deadline(clock):
+    def poll():
+        return {"status": "provisioning"}
+
+    with pytest.raises(WaitTimeout, match="after 20 s in provisioning") as error:
+        wait_for(poll, "instance", is_running, is_error, POLICY)
+
+    assert clock.sleeps == [1, 2, 4, 4, 4, 4, 1]
+    assert clock.now == 20
+    assert error.value.state == {"status": "provisioning"}
+    with pytest.raises(TimeoutError):
+        wait_for(poll, "instance", is_running, is_error, POLICY, timeout=3)
+
+
+def test_async_wait_for(mocker, clock):
+    async def sleep(seconds):
+        clock.sleep(seconds)
+
+    mocker.patch("datacrunch_api.v1._waiters.asyncio.sleep", sleep)
+    states = poller("ordered", "running")
+
+    async def poll():
+        return states()
+
+    state = asyncio.run(async_wait_for(poll, "instance", is_running, is_error, POLICY))
+
+    assert state == {"status": "running"}
+    assert clock.sleeps == [1]
+
+
+def lister(*ticks):
+    states = iter(
+        [{"id": id, "status": status} for id, status in tick.items()] for tick in ticks
+    )
+    return lambda: next(states)
+
+
+def test_group_waiter_streams_events(clock):
+    list_all = lister(
+        {"1": "ordered", "2": "ordered", "3": "ordered", "4": "ordered"},
+        {"1": "running", "2": "provisioning", "3": "error", "4": "ordered"},
+        {"2": "provisioning", "4": "running"},
+        {"2": "running"},
+    )
+    waiter = GroupWaiter(
+        list_all,
+        ["1", "2", "3", "4", "5"],
+        "Waiting for instance {id} to be running",
+        is_running,
+        is_error,
+        policy=POLICY,
+    )
+    events = iter(waiter)
+
+    assert [(event.id, event.ok) for event in next_tick(events, 1)] == [("5", False)]
+    assert str(waiter.futures["5"].exception()) == (
+        "Waiting for instance 5 to be running failed: not found"
+    )
+    assert [(event.id, event.ok) for event in next_tick(events, 2)] == [
+        ("1", True),
+        ("3", False),
+    ]
+    assert waiter.futures["1"].result() == {"id": "1", "status": "running"}
+    assert not waiter.futures["2"].done()
+    assert isinstance(waiter.futures["3"].exception(), WaitFailed)
+    assert [event.id for event in events] == ["4", "2"]
+
+    results = waiter.wait()
+
+    assert list(results) == ["1", "2", "3", "4", "5"]
+    assert results["4"].state == {"id": "4", "status": "running"}
+    assert [results[id].ok for id in results] == [True, True, False, True, False]
+    assert clock.sleeps == [1, 2, 4]
+
+
+def next_tick(events, count):
+    return [next(events) for _ in range(count)]
+
+
+def test_group_waiter_times_out_and_fails_on_list_errors(clock):
+    waiter = GroupWaiter(
+        lambda: [{"id": "1", "status": "ordered"}],
+        ["1"],
+        "Waiting for instance {id} to be running",
+        is_running,
+        is_error,
+        policy=POLICY,
+        timeout=5,
+    )
+
+    (event,) = list(waiter)
+
+    assert isinstance(event.error, WaitTimeout)
+    assert clock.now == 5
+
+    def failing():
+        raise RuntimeError("unavailable")
+
+    clock.now = 0.0
+    waiter = GroupWaiter(failing, ["1", "2"], "{id}", is_running, is_error, timeout=5)
+    events = list(waiter)
+
+    assert [type(event.error) for event in events] == [WaitTimeout] * 2
+    assert isinstance(events[0].error.__cause__, RuntimeError)
+    assert clock.now == 5
+    with pytest.raises(WaitTimeout, match="listing failed: unavailable"):
+        waiter.futures["2"].result()
+
+
+def test_group_waiter_times_out_from_the_first_poll(clock):
+    waiter = GroupWaiter(
+        lister({"1": "ordered"}, {"1": "running"}),
+        ["1"],
+        "{id}",
+        is_running,
+        is_error,
+        policy=POLICY,
+        timeout=5,
+    )
+    clock.now = 10.0
+
+    (event,) = list(waiter)
+
+    assert event.ok
+    assert waiter.futures["1"].result() == {"id": "1", "status": "running"}
+    assert clock.now == 11
+
+
+def test_group_waiter_retries_error_bodies(clock):
+    list_all = iter(
+        [
+            {"code": "service_unavailable", "message": "Try again"},
+            [{"id": "1", "status": "running"}],
+        ]
+    )
+    waiter = GroupWaiter(
+        lambda: next(list_all), ["1"], "{id}", is_running, is_error, policy=POLICY
+    )
+
+    (event,) = list(waiter)
+
+    assert event.ok and event.state == {"id": "1", "status": "running"}
+    assert clock.sleeps == [1]
+
+
+def test_group_waiter_fails_on_permanent_list_errors(clock):
+    def invalid():
+        raise ApiSession.InvalidRequest("bad filter")
+
+    waiter = GroupWaiter(invalid, ["1", "2"], "{id}", is_running, is_error)
+
+    assert [str(event.error) for event in waiter] == ["bad filter"] * 2
+    assert clock.sleeps == []
+
+
+def test_group_waiter_cancels_futures_when_stopped(clock):
+    waiter = GroupWaiter(
+        lister({"1": "running", "2": "ordered"}),
+        ["1", "2"],
+        "{id}",
+        is_running,
+        is_error,
+        policy=POLICY,
+    )
+
+    for event in waiter:
+        break
+
+    assert waiter.futures["1"].result() == {"id": "1", "status": "running"}
+    assert waiter.futures["2"].cancelled()
+
+
+def test_async_group_waiter(mocker, clock):
+    async def sleep(seconds):
+        clock.sleep(seconds)
+
+    mocker.patch("datacrunch_api.v1._waiters.asyncio.sleep", sleep)
+    ticks = lister({"1": "ordered", "2": "running"}, {"1": "running"})
+
+    async def list_all():
+        return ticks()
+
+    async def scenario():
+        waiter = AsyncGroupWaiter(
+            list_all, ["1", "2"], "{id}", is_running, is_error, policy=POLICY
+        )
+        first = asyncio.wrap_future(waiter.futures["1"])
+        ids = [event.id async for event in waiter]
+        return ids, await first
+
+    ids, state = asyncio.run(scenario())
+
+    assert ids == ["2", "1"]
+    assert state == {"id": "1", "status": "running"}
+
+
+def test_async_group_waiter_retries_and_cancels_when_stopped(mocker, clock):
+    async def sleep(seconds):
+        clock.sleep(seconds)
+
+    mocker.patch("datacrunch_api.v1._waiters.asyncio.sleep", sleep)
+    list_all = mocker.AsyncMock(
+        side_effect=[
+            {"code": "service_unavailable"},
+            [{"id": "1", "status": "running"}, {"id": "2", "status": "ordered"}],
+        ]
+    )
+
+    async def scenario():
+        waiter = AsyncGroupWaiter(
+            list_all, ["1", "2"], "{id}", is_running, is_error, policy=POLICY
+        )
+        second = asyncio.wrap_future(waiter.futures["2"])
+        async with aclosing(aiter(waiter)) as events:
+            async for event in events:
+                break
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        return event
+
+    event = asyncio.run(scenario())
+
+    assert event.id == "1" and event.ok
+    assert list_all.await_count == 2
+    assert clock.sleeps == [1]
@@ -0,0 +1,61 @@
+import threading
+import time
+
+import pytest
+from datacrunch_api.v1._bulk import bounded_map, run_bulk
+from datacrunch_api.v1._workers import Workers
+
+
+class Gauge:
+    """Counts the calls running at the same time"""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, item):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+        return item
+
+
+def test_concurrent_operations_share_the_workers():
+    workers = Workers(2)
+    gauge = Gauge()
+    results = []
+
+    def operation():
+        results.append(bounded_map(gauge, list(range(6)), 4, workers))
+
+    threads = [threading.Thread(target=operation) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    workers.shutdown()
+
+    assert results == [list(range(6))] * 3
+    assert gauge.peak == 2
+
+
+def test_operations_keep_their_own_concurrency():
+    workers = Workers(4)
+    gauge = Gauge()
+
+    results = run_bulk(lambda batch: gauge(batch), "abcdef", 1, 1, workers=workers)
+    workers.shutdown()
+
+    assert list(results) == list("abcdef")
+    assert gauge.peak == 1
+
+
+def test_rejects_empty_pools():
+    with pytest.raises(ValueError):
+        Workers(0)
+    with pytest.raises(ValueError):
+        bounded_map(str, [1, 2], 0, Workers(1))